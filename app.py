@@ -0,0 +1,17 @@
+"""
+Aplicación ASGI del storytelling
+Envuelve storytelling.py en st.App para publicar los recursos compilados de
+static/build/ (nombres con huella) con caché de un año. serve.py arranca esta
+aplicación; `streamlit run storytelling.py` sigue funcionando, pero el
+navegador revalida los recursos estáticos en cada visita.
+
+Uso:
+    streamlit run app.py
+"""
+
+import streamlit as st
+from starlette.middleware import Middleware
+
+from modules.ui.static_assets import ImmutableStaticCache
+
+app = st.App("storytelling.py", middleware=[Middleware(ImmutableStaticCache)])
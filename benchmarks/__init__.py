@@ -0,0 +1,21 @@
+"""
+Benchmarks de rendimiento del storytelling
+- import_time: tiempo de importación de los paquetes de modules/
+- suite: loaders, builders de figuras, render de cada capítulo y render
+  completo, en frío y en caliente, con presupuestos de tiempo (budgets.json)
+- compare: regresiones significativas entre dos ejecuciones de la suite
+  guardadas en history/ (por commit y máquina), en Markdown o HTML
+- payload: tamaño serializado de cada figura, con presupuestos de bytes
+  (payload_budgets.json)
+- cold_start: del lanzamiento de un intérprete nuevo a la primera figura,
+  con la caché de ficheros del sistema fría o caliente
+- load: sesiones concurrentes sin navegador y curva de saturación (latencia,
+  CPU y memoria frente al número de sesiones)
+- synthetic: generador de Excels con la estructura de EUROSTUDENT (cabecera
+  de tres filas y tripletes Value/Unit/Count) con más países o grupos
+- scaling: escalado de loaders y builders de 1x a 1000x con esos Excels
+- memory: memoria retenida por dataset, figura y sesión, y fugas entre
+  reruns repetidos (tracemalloc)
+
+Se ejecutan desde la raíz del proyecto (ej: python -m benchmarks.suite).
+"""
@@ -0,0 +1,338 @@
+"""
+Casos del benchmark de loaders, builders, render de cada capítulo y render completo
+Cada caso prepara sus entradas fuera de la medición (setup) y devuelve la
+llamada a medir. Los nombres siguen el formato de los spans de
+modules/core/tracing.py ('modulo.funcion'), con el miembro del enum entre
+corchetes en los loaders que se miden por dataset.
+"""
+
+import importlib
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos cuyos loaders y builders deben tener caso
+COVERED_PACKAGES = ('modules.charts', 'modules.analysis')
+COVERED_MODULES = ('modules.core.data_loaders',)
+
+# Casos que hoy fallan por un motivo conocido: se ejecutan y se informa de
+# ellos, pero no hacen fallar la suite (caso -> motivo)
+_IMPACT_LAYOUT = "read_work_impact_dataset no reconoce la estructura de este Excel (no lo usa la aplicación)"
+KNOWN_ERRORS = {
+    f"data_loaders.read_work_impact_dataset[{member}]": _IMPACT_LAYOUT
+    for member in (
+        'IMPACT_ON_STUDY_FOR_WORK_TIME_BUDGET_SATISFACTION_JOB_RELATED',
+        'IMPACT_ON_STUDY_ABANDONING_ALL_T__E_SATISFACTION',
+        'IMPACT_ON_STUDY_ABANDONING_ALL_T__S_RELATIONSHIP_JOB_STUDY',
+        'IMPACT_ON_STUDY_ABANDONING_ALL_T__S_NOT_LIVING_WITH_PARENTS',
+        'IMPACT_ON_STUDY_ABANDONING_ALL_T__S_TEACHING_TYPE',
+    )
+}
+
+
+class BenchmarkCase:
+    """
+    Caso del benchmark
+
+    Args:
+        name (str): Nombre único (ej: 'data_loaders.read_work_impact_dataset[...]')
+        group (str): 'loader', 'builder' o 'render'
+        target (str): Función medida, como en los spans ('modulo.funcion')
+        setup (callable): Prepara las entradas (no se mide) y devuelve la
+            llamada sin argumentos que se mide
+        known_error (str): Motivo por el que el caso falla hoy (KNOWN_ERRORS)
+    """
+
+    def __init__(self, name, group, target, setup):
+        self.name = name
+        self.group = group
+        self.target = target
+        self.setup = setup
+        self.known_error = KNOWN_ERRORS.get(name)
+
+    def __repr__(self):
+        return f"BenchmarkCase({self.name!r}, group={self.group!r})"
+
+
+def _function(module, name):
+    """Resuelve 'Clase.metodo' o 'funcion' dentro de un módulo de modules/"""
+    value = importlib.import_module(module)
+    for part in name.split('.'):
+        value = getattr(value, part)
+    return value
+
+
+def _target(module, name):
+    return f"{module.rsplit('.', 1)[-1]}.{name}"
+
+
+def _call(module, name, inputs=None):
+    """Setup que carga las entradas con inputs() y devuelve la llamada a medir"""
+    def setup():
+        func = _function(module, name)
+        args, kwargs = inputs() if inputs is not None else ((), {})
+        return lambda: func(*args, **kwargs)
+    return setup
+
+
+# === ENTRADAS DE LOS BUILDERS ===
+
+def _impact_dataset(member):
+    from modules.core.data_loaders import PreprocessedDatasetsNamesImpactsOnStudyForWork, read_work_impact_dataset
+    return read_work_impact_dataset(PreprocessedDatasetsNamesImpactsOnStudyForWork[member])
+
+
+def _financial_df():
+    return _impact_dataset('IMPACT_ON_STUDY_ABANDONING_ALL_T__E_FINANCIAL_DIFFICULTIES')
+
+
+def _work_afford_df():
+    return _impact_dataset('IMPACT_ON_STUDY_ABANDONING_ALL_T__S_WORK_TO_AFFORD_TO_STUDY')
+
+
+def _work_study_df():
+    from modules.core.data_loaders import read_work_study_relationship_dataset
+    return read_work_study_relationship_dataset()
+
+
+def _demographic_breakdowns():
+    from modules.charts.demographic_charts import DEMOGRAPHIC_BREAKDOWNS, read_demographic_dataset_detailed
+    return {key: read_demographic_dataset_detailed(dataset) for key, (_, _, dataset) in DEMOGRAPHIC_BREAKDOWNS.items()}
+
+
+def _storytelling_method(method):
+    """Setup de un método de WorkStudyStorytellingCharts con el dataset ya cargado"""
+    def setup():
+        from modules.analysis.storytelling_module import WorkStudyStorytellingCharts
+        charts = WorkStudyStorytellingCharts()
+        return getattr(charts, method)
+    return setup
+
+
+def _top_correlated_inputs():
+    from modules.analysis.correlation_analysis import get_indicator_correlations
+    return (get_indicator_correlations().index[0],), {}
+
+
+def _country_significance_inputs():
+    from modules.analysis.significance_analysis import get_significance_table
+    row = get_significance_table().iloc[0]
+    return (row['dataset'], row['group']), {}
+
+
+def _happiness_data():
+    from modules.charts.perception_charts import create_streamlit_happiness_chart
+    return create_streamlit_happiness_chart()[1]
+
+
+def _eu_average_work_relation():
+    from modules.charts.perception_charts import calculate_eu_average, load_happiness_work_relation_data
+    return calculate_eu_average(load_happiness_work_relation_data())
+
+
+def _academic_perception_df():
+    from modules.charts.perception_charts import create_streamlit_academic_perception_chart
+    return create_streamlit_academic_perception_chart()[1]
+
+
+def _age_data():
+    """Porcentajes por edad de España, extraídos como en create_age_isotype_chart"""
+    from modules.analysis.isotype_analysis import load_age_relationship_data
+    row = load_age_relationship_data().iloc[2]
+    columns = {"< 22 años": 'not closely at all', "22-24 años": 'Unnamed: 52',
+               "25-29 años": 'Unnamed: 55', "30+ años": 'Unnamed: 58'}
+    return {age: float(row[column]) for age, column in columns.items()}
+
+
+# (módulo, función o Clase.metodo, entradas) de los builders sin caso por dataset
+BUILDERS = [
+    ('modules.analysis.clustering_analysis', 'get_country_clusters', None),
+    ('modules.analysis.clustering_analysis', 'get_country_families', None),
+    ('modules.analysis.correlation_analysis', 'get_indicator_correlations', None),
+    ('modules.analysis.correlation_analysis', 'get_top_correlated_indicators', _top_correlated_inputs),
+    ('modules.analysis.isotype_analysis', 'create_age_isotype_chart', None),
+    ('modules.analysis.isotype_analysis', 'create_human_isotype', lambda: ((_age_data(),), {})),
+    ('modules.analysis.isotype_analysis', 'create_age_isotype_for_streamlit', None),
+    ('modules.analysis.sankey_analysis', 'create_organized_sankey', None),
+    ('modules.analysis.sankey_analysis', 'get_sankey_for_streamlit', None),
+    ('modules.analysis.significance_analysis', 'get_significance_table', None),
+    ('modules.analysis.significance_analysis', 'get_country_significance', _country_significance_inputs),
+    ('modules.analysis.similarity_analysis', 'get_country_similarity_index', None),
+    ('modules.analysis.similarity_analysis', 'get_most_similar_countries', None),
+    ('modules.analysis.storytelling_module', 'create_work_study_charts', None),
+    ('modules.charts.cluster_charts', 'create_country_families_chart', None),
+    ('modules.charts.correlation_charts', 'create_indicator_correlation_heatmap', None),
+    ('modules.charts.demographic_charts', 'create_gender_comparison_chart', None),
+    ('modules.charts.demographic_charts', 'create_age_comparison_chart', None),
+    ('modules.charts.demographic_charts', 'create_basic_demographic_chart',
+     lambda: (("Análisis demográfico", "Sin datos"), {})),
+    ('modules.charts.demographic_charts', 'create_field_of_study_comparison_chart', None),
+    ('modules.charts.demographic_charts', 'create_financial_difficulties_comparison_chart', None),
+    ('modules.charts.demographic_charts', 'create_living_with_parents_comparison_chart', None),
+    ('modules.charts.demographic_charts', 'create_parents_financial_status_comparison_chart', None),
+    ('modules.charts.demographic_charts', 'create_parents_education_comparison_chart', None),
+    ('modules.charts.demographic_charts', 'create_combined_demographic_chart', lambda: ((_demographic_breakdowns(),), {})),
+    ('modules.charts.demographic_charts', 'create_comprehensive_demographic_dashboard', None),
+    ('modules.charts.geographic_charts', 'generate_europe_cost_heatmap', None),
+    ('modules.charts.geographic_charts', 'get_cost_statistics', None),
+    ('modules.charts.impact_charts', 'create_streamlit_abandoning_chart',
+     lambda: ((_financial_df(), "Abandono", "Por dificultades financieras"), {})),
+    ('modules.charts.impact_charts', 'create_financial_abandoning_chart', lambda: ((_financial_df(),), {})),
+    ('modules.charts.impact_charts', 'create_work_afford_abandoning_chart', lambda: ((_work_afford_df(),), {})),
+    ('modules.charts.impact_charts', 'create_spain_europe_impact_comparison',
+     lambda: ((_financial_df(), _work_afford_df()), {})),
+    ('modules.charts.impact_charts', 'get_work_impact_figures_for_streamlit', None),
+    ('modules.charts.impact_charts', 'create_comprehensive_work_impact_dashboard', None),
+    ('modules.charts.perception_charts', 'create_streamlit_academic_perception_chart', None),
+    ('modules.charts.perception_charts', 'get_academic_perception_insights', lambda: ((_academic_perception_df(),), {})),
+    ('modules.charts.perception_charts', 'create_example_happiness_data', None),
+    ('modules.charts.perception_charts', 'create_streamlit_happiness_chart', None),
+    ('modules.charts.perception_charts', 'create_simple_happiness_chart', lambda: ((_eu_average_work_relation(),), {})),
+    ('modules.charts.perception_charts', 'get_happiness_insights', lambda: ((_happiness_data(),), {})),
+    ('modules.charts.perception_charts', 'generate_academic_perception_analysis', None),
+    ('modules.charts.perception_charts', 'generate_happiness_work_relation_analysis', None),
+    ('modules.charts.similarity_charts', 'create_country_neighbours_chart', None),
+    ('modules.charts.work_study_charts', 'create_storytelling_work_study_charts', lambda: ((_work_study_df(),), {})),
+    ('modules.charts.work_study_charts', 'create_hero_spain_europe_comparison', lambda: ((_work_study_df(),), {})),
+    ('modules.charts.work_study_charts', 'create_european_ranking_chart', lambda: ((_work_study_df(),), {})),
+    ('modules.charts.work_study_charts', 'create_relationship_levels_chart', lambda: ((_work_study_df(),), {})),
+    ('modules.charts.work_study_charts', 'create_gap_analysis_chart', lambda: ((_work_study_df(),), {})),
+    ('modules.charts.work_study_charts', 'generate_storytelling_summary', lambda: ((_work_study_df(),), {})),
+]
+
+# Métodos de WorkStudyStorytellingCharts (la instancia se crea en el setup)
+STORYTELLING_METHODS = ('get_chart_need_vs_no_need', 'get_chart_spain_vs_europe', 'get_key_insights')
+
+
+# === CASOS ===
+
+def _enum_cases(module, name, enum_module, enum_name):
+    """Un caso por miembro del enum cuyo fichero está en data/"""
+    cases = []
+    for member in _function(enum_module, enum_name):
+        if not os.path.exists(os.path.join(ROOT, member.value)):
+            continue
+
+        def setup(member=member):
+            func = _function(module, name)
+            return lambda: func(member)
+        cases.append(BenchmarkCase(f"{_target(module, name)}[{member.name}]", 'loader', _target(module, name), setup))
+    return cases
+
+
+def loader_cases():
+    """Loaders de data_loaders con cada miembro de cada enum, y los loaders de charts/analysis"""
+    dl = 'modules.core.data_loaders'
+    cases = []
+    for enum_name in ('PreprocessedDatasetsNamesImpactsOnStudyForWork',
+                      'PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy',
+                      'PreprocessedDatasetsNamesWorkMotiveAffordStudy',
+                      'CompleteDatasetsName'):
+        cases += _enum_cases(dl, 'read_dataset', dl, enum_name)
+    cases += _enum_cases(dl, 'read_work_study_relationship_dataset', dl,
+                         'PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy')
+    cases += _enum_cases(dl, 'read_work_impact_dataset', dl, 'PreprocessedDatasetsNamesImpactsOnStudyForWork')
+    cases += _enum_cases('modules.charts.demographic_charts', 'read_demographic_dataset_detailed',
+                         'modules.charts.demographic_charts', 'PreprocessedDatasetsNamesWorkMotiveAffordStudy')
+
+    for module, name in (
+        (dl, 'read_work_motive_afford_study_dataset'),
+        ('modules.charts.geographic_charts', 'read_cost_dataset'),
+        ('modules.charts.impact_charts', 'load_work_impact_datasets'),
+        ('modules.charts.perception_charts', 'load_academic_perception_data'),
+        ('modules.charts.perception_charts', 'load_happiness_work_relation_data'),
+        ('modules.charts.perception_charts', 'load_happiness_students_work_data'),
+        ('modules.analysis.isotype_analysis', 'load_age_relationship_data'),
+        ('modules.analysis.country_matrix', 'load_country_datasets'),
+    ):
+        cases.append(BenchmarkCase(_target(module, name), 'loader', _target(module, name), _call(module, name)))
+    return cases
+
+
+def builder_cases():
+    """Builders de modules/charts y modules/analysis con sus entradas ya cargadas"""
+    cases = [
+        BenchmarkCase(_target(module, name), 'builder', _target(module, name), _call(module, name, inputs))
+        for module, name, inputs in BUILDERS
+    ]
+    module = 'modules.analysis.storytelling_module'
+    for method in STORYTELLING_METHODS:
+        target = _target(module, f"WorkStudyStorytellingCharts.{method}")
+        cases.append(BenchmarkCase(target, 'builder', target, _storytelling_method(method)))
+    return cases
+
+
+def _render_storytelling():
+    """Setup del render completo: una sesión nueva recorre todos los capítulos"""
+    from streamlit.testing.v1 import AppTest
+    from modules.ui.layout import CHAPTERS
+
+    def render():
+        at = AppTest.from_file(os.path.join(ROOT, 'storytelling.py'), default_timeout=600)
+        at.run()
+        for chapter in CHAPTERS[1:]:
+            at.switch_page(chapter['path']).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return render
+
+
+def _render_chapter(chapter):
+    """Setup del render de un capítulo: la primera llamada lo abre en una sesión nueva, las siguientes son reruns"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, 'storytelling.py'), default_timeout=600)
+
+    def render():
+        at.switch_page(chapter['path']).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return render
+
+
+def render_cases():
+    """Render de cada capítulo y de la aplicación completa sin navegador (AppTest)"""
+    from modules.ui.layout import CHAPTERS
+
+    cases = [
+        BenchmarkCase(f"storytelling.render[{chapter['slug']}]", 'render', 'storytelling',
+                      lambda chapter=chapter: _render_chapter(chapter))
+        for chapter in CHAPTERS
+    ]
+    return cases + [BenchmarkCase('storytelling.render', 'render', 'storytelling', _render_storytelling)]
+
+
+def all_cases():
+    return loader_cases() + builder_cases() + render_cases()
+
+
+def skipped_datasets():
+    """Miembros de los enums de data_loaders cuyo fichero no está en data/"""
+    from modules.core import data_loaders
+    skipped = []
+    for enum in (data_loaders.PreprocessedDatasetsNamesImpactsOnStudyForWork,
+                 data_loaders.PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy,
+                 data_loaders.PreprocessedDatasetsNamesWorkMotiveAffordStudy,
+                 data_loaders.CompleteDatasetsName):
+        skipped += [f"{enum.__name__}.{member.name}" for member in enum
+                    if not os.path.exists(os.path.join(ROOT, member.value))]
+    return skipped
+
+
+def instrumented_targets():
+    """Loaders y builders instrumentados por tracing (los que deben tener caso)"""
+    import pkgutil
+    module_names = list(COVERED_MODULES)
+    for package in COVERED_PACKAGES:
+        path = importlib.import_module(package).__path__
+        module_names += [f"{package}.{info.name}" for info in pkgutil.iter_modules(path)]
+
+    targets = set()
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for value in vars(module).values():
+            members = vars(value).values() if isinstance(value, type) else (value,)
+            for member in members:
+                if getattr(member, '__traced__', False) and member.__module__ == module_name:
+                    targets.add(_target(module_name, member.__qualname__))
+    return targets
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque en frío: del lanzamiento del proceso a la primera figura
+Lanza un intérprete nuevo que importa los módulos de la aplicación y ejecuta
+sin navegador (AppTest) el primer capítulo de storytelling.py, y mide cada
+fase desde el lanzamiento: intérprete, importaciones, primer dataset cargado,
+primera figura construida y primer capítulo pintado. Es el camino que recorre
+la primera petición de un worker recién escalado.
+
+Con la caché de ficheros del sistema en frío se vacía antes de cada
+repetición: con /proc/sys/vm/drop_caches si se tienen permisos y, si no, con
+posix_fadvise(DONTNEED) sobre los ficheros que carga el proceso (módulos,
+bibliotecas compartidas y data/). Cada ejecución se añade como una línea JSON
+a benchmarks/history/cold_start.jsonl.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --cache cold --repeat 10
+    python -m benchmarks.cold_start --cache warm --no-log
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .history import git_commit, log_result
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'history', 'cold_start.jsonl')
+
+PHASES = ('interpreter', 'imports', 'first_dataset', 'first_figure', 'first_section')
+PHASE_LABELS = {
+    'interpreter': 'Intérprete',
+    'imports': 'Importaciones',
+    'first_dataset': 'Primer dataset',
+    'first_figure': 'Primera figura',
+    'first_section': 'Primer capítulo',
+}
+
+RESULT_MARKER = 'COLD_START_RESULT '
+LAUNCH_ENV = 'STORYTELLING_COLD_START_LAUNCH_NS'
+
+
+# === PROCESO MEDIDO ===
+
+def _loaded_files():
+    """Ficheros que ha cargado este proceso: módulos (.py y .pyc) y bibliotecas mapeadas"""
+    files = set()
+    for module in list(sys.modules.values()):
+        for attribute in ('__file__', '__cached__'):
+            path = getattr(module, attribute, None)
+            if isinstance(path, str) and os.path.isfile(path):
+                files.add(os.path.abspath(path))
+    try:
+        with open('/proc/self/maps') as f:
+            for line in f:
+                parts = line.split(maxsplit=5)
+                if len(parts) == 6 and parts[5].startswith('/') and os.path.isfile(parts[5].strip()):
+                    files.add(parts[5].strip())
+    except OSError:
+        pass
+    return sorted(files)
+
+
+def run_child(report_files=False):
+    """Fases del arranque de este proceso (que debe ser nuevo), en ms desde el lanzamiento"""
+    started_ns = time.time_ns()
+    started_perf = time.perf_counter_ns()
+    launch_ns = int(os.environ[LAUNCH_ENV])
+    interpreter_ms = (started_ns - launch_ns) / 1e6
+
+    def since_launch(perf_ns):
+        return interpreter_ms + (perf_ns - started_perf) / 1e6
+
+    from .import_time import storytelling_imports
+    exec(compile(storytelling_imports(), os.path.join(ROOT, 'storytelling.py'), 'exec'), {})
+    imports_ns = time.perf_counter_ns()
+
+    from streamlit.testing.v1 import AppTest
+    from modules.core import tracing
+
+    # Solo tiempos: los spans de los nodos dicen cuándo terminó el primer dataset y la primera figura
+    tracing.enable_tracing(memory=False)
+    at = AppTest.from_file(os.path.join(ROOT, 'storytelling.py'), default_timeout=600)
+    at.run()
+    section_ns = time.perf_counter_ns()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    spans = tracing.finished_spans()
+
+    def first_end(category):
+        ends = [span.end_ns for span in spans if span.category == category]
+        return since_launch(min(ends)) if ends else None
+
+    result = {
+        'interpreter': interpreter_ms,
+        'imports': since_launch(imports_ns),
+        'first_dataset': first_end('dataset'),
+        'first_figure': first_end('figure'),
+        'first_section': since_launch(section_ns),
+    }
+    if report_files:
+        result['files'] = _loaded_files()
+    print(RESULT_MARKER + json.dumps(result), flush=True)
+
+
+# === CACHÉ DE FICHEROS DEL SISTEMA ===
+
+def _data_files():
+    files = []
+    for directory, _, names in os.walk(os.path.join(ROOT, 'data')):
+        files += [os.path.join(directory, name) for name in names]
+    return files
+
+
+def drop_file_cache(files):
+    """
+    Vacía la caché de ficheros del sistema
+
+    Returns:
+        str: Método usado ('drop_caches' o 'fadvise')
+    """
+    try:
+        os.sync()
+        with open('/proc/sys/vm/drop_caches', 'w') as f:
+            f.write('3\n')
+        return 'drop_caches'
+    except OSError:
+        pass
+    if not hasattr(os, 'posix_fadvise'):
+        raise RuntimeError("No se puede vaciar la caché de ficheros en este sistema (ni drop_caches ni posix_fadvise)")
+    for path in files:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return 'fadvise'
+
+
+# === LANZADOR ===
+
+def launch(report_files=False):
+    """Lanza un intérprete nuevo con una caché en disco de la aplicación vacía y devuelve sus fases"""
+    with tempfile.TemporaryDirectory(prefix='storytelling-cold-') as cache_dir:
+        env = dict(os.environ, STORYTELLING_CACHE_DIR=cache_dir)
+        for variable in ('STORYTELLING_TRACE', 'STORYTELLING_DEBUG'):
+            env.pop(variable, None)
+        command = [sys.executable, '-m', 'benchmarks.cold_start', '--child']
+        if report_files:
+            command.append('--report-files')
+        env[LAUNCH_ENV] = str(time.time_ns())
+        result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, timeout=900)
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    lines = (result.stderr or result.stdout).strip().splitlines()
+    raise RuntimeError(lines[-1] if lines else f"código de salida {result.returncode}")
+
+
+def run_mode(mode, repeat):
+    """
+    Repite el arranque con la caché de ficheros en frío o en caliente
+
+    Returns:
+        dict: {'runs': [fases por repetición], 'cache_method': str o None}
+    """
+    # La primera ejecución (no se mide) calienta la caché y dice qué ficheros carga el proceso
+    files = launch(report_files=True)['files'] + _data_files()
+    runs, method = [], None
+    for _ in range(repeat):
+        if mode == 'cold':
+            method = drop_file_cache(files)
+        runs.append(launch())
+    return {'runs': runs, 'cache_method': method}
+
+
+def summarize(runs):
+    """Mediana y máximo de cada fase (ms desde el lanzamiento)"""
+    summary = {}
+    for phase in PHASES:
+        values = [run[phase] for run in runs if run.get(phase) is not None]
+        if values:
+            summary[phase] = {'median': statistics.median(values), 'max': max(values)}
+    return summary
+
+
+def print_report(mode, summary, method):
+    label = 'fría' if mode == 'cold' else 'caliente'
+    print(f"\nCaché de ficheros {label}" + (f" ({method})" if method else ''))
+    print(f"  {'Fase':<18} {'desde inicio (ms)':>18} {'fase (ms)':>10} {'máx (ms)':>10}")
+    previous = 0.0
+    for phase in PHASES:
+        if phase not in summary:
+            print(f"  {PHASE_LABELS[phase]:<18} {'-':>18}")
+            continue
+        median = summary[phase]['median']
+        print(f"  {PHASE_LABELS[phase]:<18} {median:>18.0f} {median - previous:>10.0f} {summary[phase]['max']:>10.0f}")
+        previous = median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cache', choices=('cold', 'warm', 'both'), default='both',
+                        help='Estado de la caché de ficheros del sistema')
+    parser.add_argument('--repeat', type=int, default=5, help='Arranques medidos por modo')
+    parser.add_argument('--no-log', action='store_true', help=f'No añadir el resultado a {HISTORY_PATH}')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--report-files', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.report_files)
+        return
+
+    modes = ('warm', 'cold') if args.cache == 'both' else (args.cache,)
+    commit = git_commit()
+    for mode in modes:
+        print(f"🔥 {args.repeat} arranques con la caché de ficheros {'fría' if mode == 'cold' else 'caliente'}...")
+        measured = run_mode(mode, args.repeat)
+        summary = summarize(measured['runs'])
+        print_report(mode, summary, measured['cache_method'])
+        if not args.no_log:
+            path = log_result({
+                'benchmark': 'cold_start', 'timestamp': time.time(), 'commit': commit,
+                'host': platform.node(), 'python': platform.python_version(),
+                'cache': mode, 'cache_method': measured['cache_method'],
+                'repeat': args.repeat, 'phases': summary, 'runs': measured['runs'],
+            }, HISTORY_PATH)
+            print(f"📦 Resultado añadido a {os.path.relpath(path, ROOT)}")
+
+
+if __name__ == '__main__':
+    main()
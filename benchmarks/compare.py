@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Comparación de dos ejecuciones de la suite con las regresiones significativas
+Compara, caso a caso y en frío y en caliente, las muestras de dos ejecuciones
+de python -m benchmarks.suite guardadas en benchmarks/history/suite/ (o
+exportadas con --json) y marca como regresión cada loader, builder o
+capítulo cuya mediana empeora más del umbral con una diferencia
+estadísticamente significativa (prueba U de Mann-Whitney unilateral, exacta
+con pocas muestras, con los p-valores de todos los casos corregidos por
+Benjamini-Hochberg como en el análisis de significación). El informe se escribe en Markdown o en HTML para
+adjuntarlo a la revisión de cada cambio en el pipeline de datos.
+
+Por defecto compara las dos últimas ejecuciones de esta máquina con commits
+distintos: solo son comparables los tiempos medidos en la misma máquina.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.compare
+    python -m benchmarks.compare a1b2c3d
+    python -m benchmarks.compare a1b2c3d e4f5a6b-dirty --markdown informe.md --html informe.html
+    python -m benchmarks.compare base.json cambio.json --fail-on-regression
+    python -m benchmarks.compare --list
+"""
+
+import argparse
+import functools
+import html
+import math
+import statistics
+import sys
+import time
+
+from modules.analysis.significance_analysis import benjamini_hochberg
+
+from .history import find_run, list_runs, machine_fingerprint, run_label
+
+# Nivel de significación de la prueba y cambio mínimo de la mediana para marcar un caso
+ALPHA = 0.05
+THRESHOLD = 0.10
+MIN_DELTA_MS = 1.0
+
+# Por encima de tantas muestras entre las dos ejecuciones se usa la aproximación normal
+EXACT_MAX_SAMPLES = 40
+
+MODES = ('cold', 'warm')
+MODE_LABELS = {'cold': 'frío', 'warm': 'caliente'}
+GROUP_LABELS = {'loader': 'Loaders', 'builder': 'Builders', 'render': 'Capítulos'}
+
+STATUS_LABELS = {
+    'regression': '⚠️ regresión',
+    'new_error': '❌ error nuevo',
+    'improvement': '✅ mejora',
+    'fixed': '✅ sin error',
+    'unchanged': 'sin cambios',
+    'underpowered': '⏺ pocas muestras',
+    'added': '🆕 caso nuevo',
+    'removed': '➖ caso retirado',
+    'known_error': '⏩ error conocido',
+}
+# Estados que cuentan como regresión (--fail-on-regression)
+FAILING = ('regression', 'new_error')
+
+
+# === ESTADÍSTICA ===
+
+@functools.lru_cache(maxsize=None)
+def _u_counts(m, n):
+    """
+    Ordenaciones de m + n muestras distintas con cada valor de U, donde U
+    cuenta los pares en que una de las m supera a una de las n
+    """
+    if m == 0 or n == 0:
+        return (1,)
+    counts = [0] * (m * n + 1)
+    # La mayor de todas es de las m (supera a las n) o de las n (no suma)
+    for u, count in enumerate(_u_counts(m - 1, n)):
+        counts[u + n] += count
+    for u, count in enumerate(_u_counts(m, n - 1)):
+        counts[u] += count
+    return tuple(counts)
+
+
+def mann_whitney_greater(sample, reference):
+    """
+    p-valor unilateral de que sample tienda a ser mayor (más lenta) que reference
+
+    Prueba U de Mann-Whitney: exacta si no hay empates y hay pocas muestras;
+    si no, aproximación normal con corrección por empates y por continuidad.
+
+    Returns:
+        float: p-valor (None si alguna de las dos no tiene muestras)
+    """
+    m, n = len(sample), len(reference)
+    if not m or not n:
+        return None
+    u = sum(1.0 if s > r else 0.5 if s == r else 0.0 for s in sample for r in reference)
+    values = list(sample) + list(reference)
+    ties = len(set(values)) < len(values)
+    if not ties and m + n <= EXACT_MAX_SAMPLES:
+        counts = _u_counts(m, n)
+        return sum(counts[int(u):]) / math.comb(m + n, m)
+    total = m + n
+    tie_term = sum(t ** 3 - t for t in (values.count(v) for v in set(values)))
+    variance = m * n / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def min_p_value(m, n):
+    """Menor p-valor unilateral alcanzable con m y n muestras (todas las de una por encima de la otra)"""
+    return 1 / math.comb(m + n, m) if m and n else None
+
+
+def _timing_status(result, q, alpha, threshold, min_delta_ms):
+    """Estado de una comparación de tiempos a partir de su q-valor"""
+    relevant = abs(result['change']) >= threshold and abs(result['delta_ms']) >= min_delta_ms
+    if relevant and q <= alpha:
+        return 'regression' if result['delta_ms'] >= 0 else 'improvement'
+    if relevant and min_p_value(*result['n_samples']) > alpha:
+        return 'underpowered'
+    return 'unchanged'
+
+
+def compare_samples(base, head, alpha=ALPHA, threshold=THRESHOLD, min_delta_ms=MIN_DELTA_MS, q=None):
+    """
+    Compara las muestras (ms) de un caso en un modo
+
+    Args:
+        q (float): p-valor corregido por comparaciones múltiples con el que se
+            decide el estado (None: el propio p, una sola comparación)
+
+    Returns:
+        dict: {'base_ms', 'head_ms' (medianas), 'delta_ms', 'change' (relativo),
+            'p' (de la dirección del cambio), 'q', 'n_samples' (número de muestras
+            de cada ejecución), 'status'}
+    """
+    base_ms, head_ms = statistics.median(base), statistics.median(head)
+    delta = head_ms - base_ms
+    change = delta / base_ms if base_ms else 0.0
+    p = mann_whitney_greater(head, base) if delta >= 0 else mann_whitney_greater(base, head)
+    result = {'base_ms': base_ms, 'head_ms': head_ms, 'delta_ms': delta, 'change': change,
+              'p': p, 'q': p if q is None else q, 'n_samples': (len(base), len(head))}
+    result['status'] = _timing_status(result, result['q'], alpha, threshold, min_delta_ms)
+    return result
+
+
+def _samples(result, mode):
+    """Muestras de un modo; las ejecuciones sin muestras (anteriores al historial) solo tienen su p50"""
+    samples = (result.get('samples') or {}).get(mode)
+    if samples:
+        return samples
+    stats = result.get(mode)
+    return [stats['p50']] if stats else []
+
+
+def compare_runs(base, head, alpha=ALPHA, threshold=THRESHOLD, min_delta_ms=MIN_DELTA_MS):
+    """
+    Compara todos los casos de dos ejecuciones de la suite
+
+    Los p-valores de todas las comparaciones de tiempos (cada caso en frío y en
+    caliente) se corrigen juntos por Benjamini-Hochberg y el estado de cada
+    una se decide con su q-valor: con cientos de casos, alguno saldría
+    significativo por azar con el p-valor sin corregir.
+
+    Returns:
+        list: Filas {'case', 'group', 'mode', 'status', ...} ordenadas por grupo y caso
+    """
+    groups = {**base.get('groups', {}), **head.get('groups', {})}
+    known = {**base.get('known_errors', {}), **head.get('known_errors', {})}
+    rows = []
+    for name in sorted(set(base['results']) | set(head['results'])):
+        row = {'case': name, 'group': groups.get(name, 'otros'), 'mode': None}
+        before, after = base['results'].get(name), head['results'].get(name)
+        if before is None or after is None:
+            rows.append({**row, 'status': 'added' if before is None else 'removed'})
+            continue
+        if after['error'] is not None:
+            status = 'known_error' if name in known or before['error'] is not None else 'new_error'
+            rows.append({**row, 'status': status, 'error': after['error']})
+            continue
+        if before['error'] is not None:
+            rows.append({**row, 'status': 'fixed', 'error': before['error']})
+            continue
+        for mode in MODES:
+            base_samples, head_samples = _samples(before, mode), _samples(after, mode)
+            if base_samples and head_samples:
+                rows.append({**row, 'mode': mode, **compare_samples(
+                    base_samples, head_samples, alpha, threshold, min_delta_ms)})
+
+    timed = [row for row in rows if row.get('p') is not None]
+    for row, q in zip(timed, benjamini_hochberg([row['p'] for row in timed])):
+        row['q'] = float(q)
+        row['status'] = _timing_status(row, row['q'], alpha, threshold, min_delta_ms)
+    group_order = list(GROUP_LABELS)
+    return sorted(rows, key=lambda row: (
+        group_order.index(row['group']) if row['group'] in group_order else len(group_order), row['case']))
+
+
+# === INFORME ===
+
+def _date(run):
+    return time.strftime('%Y-%m-%d %H:%M', time.localtime(run['timestamp']))
+
+
+def _machine(run):
+    machine = run.get('machine') or {}
+    if isinstance(machine, str):
+        return machine
+    return (f"{machine.get('id', '?')} ({machine.get('cpus', '?')} × {machine.get('cpu', '?')}, "
+            f"{machine.get('python', '?')})")
+
+
+def _ms(value):
+    return f"{value:.1f}" if value is not None else '-'
+
+
+def _change(row):
+    return f"{row['change'] * 100:+.0f} %" if 'change' in row else '-'
+
+
+def _p(row, key='p'):
+    p = row.get(key)
+    return '-' if p is None else '<0.001' if p < 0.001 else f"{p:.3f}"
+
+
+def _case(row):
+    """Caso sin el módulo en los capítulos (storytelling.render[impacto] -> impacto)"""
+    name = row['case']
+    if row['group'] == 'render' and name.endswith(']'):
+        return name[name.index('[') + 1:-1]
+    return name
+
+
+def _counts(rows):
+    counts = {}
+    for row in rows:
+        counts[row['status']] = counts.get(row['status'], 0) + 1
+    return counts
+
+
+def _summary(rows):
+    counts = _counts(rows)
+    return ' · '.join(f"{STATUS_LABELS[status]}: {counts[status]}" for status in STATUS_LABELS if status in counts)
+
+
+def _table_rows(rows, with_group=False):
+    """Celdas de cada fila del informe (las mismas en Markdown y en HTML)"""
+    for row in rows:
+        cells = [GROUP_LABELS.get(row['group'], row['group'])] if with_group else []
+        cells += [
+            _case(row), MODE_LABELS.get(row['mode'], '-'), _ms(row.get('base_ms')), _ms(row.get('head_ms')),
+            _change(row), _p(row), _p(row, 'q'), STATUS_LABELS[row['status']] + (f": {row['error']}" if row.get('error') else ''),
+        ]
+        yield row, cells
+
+
+HEADERS = ['Caso', 'Modo', 'Base (ms)', 'Cambio (ms)', 'Δ mediana', 'p', 'q (BH)', 'Estado']
+
+
+def report_sections(rows):
+    """(título, filas, con columna de grupo) de cada tabla: primero las regresiones y después cada grupo"""
+    flagged = [row for row in rows if row['status'] in FAILING]
+    sections = [('Regresiones', flagged, True)] if flagged else []
+    for group in dict.fromkeys(row['group'] for row in rows):
+        sections.append((GROUP_LABELS.get(group, group), [row for row in rows if row['group'] == group], False))
+    return sections
+
+
+def _header(base, head):
+    return [
+        ('Commit', run_label(base), run_label(head)),
+        ('Fecha', _date(base), _date(head)),
+        ('Máquina', _machine(base), _machine(head)),
+        ('Muestras', f"{base.get('cold', '?')} frío / {base.get('warm', '?')} caliente",
+         f"{head.get('cold', '?')} frío / {head.get('warm', '?')} caliente"),
+    ]
+
+
+def _method(alpha, threshold, min_delta_ms):
+    return (f"Prueba U de Mann-Whitney unilateral con los p-valores de todos los casos corregidos por "
+            f"Benjamini-Hochberg (q) y α = {alpha}: un caso cambia si su q-valor no supera α y su mediana "
+            f"varía al menos un {threshold * 100:.0f} % y {min_delta_ms:g} ms.")
+
+
+def _same_machine(base, head):
+    ids = [run.get('machine', {}).get('id') if isinstance(run.get('machine'), dict) else run.get('machine')
+           for run in (base, head)]
+    return ids[0] == ids[1]
+
+
+def markdown_report(base, head, rows, alpha=ALPHA, threshold=THRESHOLD, min_delta_ms=MIN_DELTA_MS):
+    lines = [f"## Benchmark: {run_label(base)} → {run_label(head)}", '', '| | Base | Cambio |', '|---|---|---|']
+    lines += [f"| {label} | {before} | {after} |" for label, before, after in _header(base, head)]
+    lines += ['', _method(alpha, threshold, min_delta_ms)]
+    if not _same_machine(base, head):
+        lines += ['', '> ⚠️ Ejecuciones de máquinas distintas: las diferencias pueden deberse a la máquina.']
+    lines += ['', f"**{_summary(rows)}**"]
+    for title, section, with_group in report_sections(rows):
+        headers = (['Grupo'] if with_group else []) + HEADERS
+        table = ['| ' + ' | '.join(headers) + ' |', '|' + '---|' * len(headers)]
+        table += ['| ' + ' | '.join(cell.replace('|', '\\|') for cell in cells) + ' |'
+                  for _, cells in _table_rows(section, with_group)]
+        lines += ['', f"### {title}", '']
+        if title == 'Regresiones':
+            lines += table
+        else:
+            # Tablas de cada grupo plegadas: en la revisión importan las regresiones
+            cases = len({row['case'] for row in section})
+            lines += [f"<details><summary>{cases} casos · {_summary(section)}</summary>", '', *table, '', '</details>']
+    return '\n'.join(lines) + '\n'
+
+
+HTML_STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #2C3E50; }
+table { border-collapse: collapse; margin: 0.5em 0 1.5em; font-size: 0.9em; }
+th, td { border: 1px solid #DEE2E6; padding: 0.3em 0.6em; text-align: left; }
+td.num { text-align: right; font-variant-numeric: tabular-nums; }
+tr.regression, tr.new_error { background: #FDEDEC; }
+tr.improvement, tr.fixed { background: #EAF7EF; }
+tr.underpowered, tr.known_error { color: #7F8C8D; }
+.warning { color: #C41E3A; }
+"""
+
+NUMERIC_COLUMNS = {'Base (ms)', 'Cambio (ms)', 'Δ mediana', 'p', 'q (BH)'}
+
+
+def html_report(base, head, rows, alpha=ALPHA, threshold=THRESHOLD, min_delta_ms=MIN_DELTA_MS):
+    escape = html.escape
+    title = f"Benchmark: {run_label(base)} → {run_label(head)}"
+    parts = [
+        '<!DOCTYPE html>', '<html lang="es"><head><meta charset="utf-8">', f"<title>{escape(title)}</title>",
+        f"<style>{HTML_STYLE}</style></head><body>", f"<h1>{escape(title)}</h1>",
+        '<table><tr><th></th><th>Base</th><th>Cambio</th></tr>',
+    ]
+    parts += [f"<tr><th>{escape(label)}</th><td>{escape(before)}</td><td>{escape(after)}</td></tr>"
+              for label, before, after in _header(base, head)]
+    parts += ['</table>', f"<p>{escape(_method(alpha, threshold, min_delta_ms))}</p>"]
+    if not _same_machine(base, head):
+        parts.append('<p class="warning">⚠️ Ejecuciones de máquinas distintas: '
+                     'las diferencias pueden deberse a la máquina.</p>')
+    parts.append(f"<p><strong>{escape(_summary(rows))}</strong></p>")
+    for title, section, with_group in report_sections(rows):
+        headers = (['Grupo'] if with_group else []) + HEADERS
+        parts += [f"<h2>{escape(title)}</h2>",
+                  '<table><tr>' + ''.join(f"<th>{escape(header)}</th>" for header in headers) + '</tr>']
+        for row, cells in _table_rows(section, with_group):
+            parts.append(f'<tr class="{row["status"]}">' + ''.join(
+                f'<td class="num">{escape(cell)}</td>' if header in NUMERIC_COLUMNS else f"<td>{escape(cell)}</td>"
+                for header, cell in zip(headers, cells)) + '</tr>')
+        parts.append('</table>')
+    parts.append('</body></html>')
+    return '\n'.join(parts) + '\n'
+
+
+# === SELECCIÓN DE EJECUCIONES ===
+
+def default_pair(runs):
+    """La última ejecución y la más reciente anterior de otro commit (o la anterior, si todas son del mismo)"""
+    if len(runs) < 2:
+        raise LookupError("Hacen falta al menos dos ejecuciones guardadas (python -m benchmarks.suite)")
+    head = runs[-1]
+    older = runs[:-1]
+    different = [run for run in older if run_label(run) != run_label(head)]
+    return (different or older)[-1], head
+
+
+def print_runs(runs):
+    for run in runs:
+        failures = sum(1 for problems in run.get('failures', {}).values() if problems)
+        print(f"{_date(run)}  {run_label(run):<20} {len(run['results']):>4} casos  "
+              f"{failures:>3} fallos  {run['path']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('base', nargs='?',
+                        help='Ejecución de referencia: commit o fichero JSON (por defecto, la anterior)')
+    parser.add_argument('head', nargs='?', help='Ejecución a comparar: commit o fichero JSON (por defecto, la última)')
+    parser.add_argument('--machine', help='Huella de la máquina cuyas ejecuciones se usan (por defecto, esta)')
+    parser.add_argument('--alpha', type=float, default=ALPHA,
+                        help='Nivel de significación (sobre el q-valor de Benjamini-Hochberg)')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='Cambio relativo mínimo de la mediana (0.10 = 10 %%)')
+    parser.add_argument('--min-ms', type=float, default=MIN_DELTA_MS, help='Cambio absoluto mínimo de la mediana')
+    parser.add_argument('--markdown', help='Guarda el informe en Markdown en este fichero')
+    parser.add_argument('--html', help='Guarda el informe en HTML en este fichero')
+    parser.add_argument('--list', action='store_true', help='Lista las ejecuciones guardadas y termina')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Termina con error si hay alguna regresión o error nuevo')
+    args = parser.parse_args()
+
+    runs = list_runs('suite', args.machine or machine_fingerprint()['id'])
+    if args.list:
+        print_runs(runs)
+        return
+    try:
+        if args.base is None:
+            base, head = default_pair(runs)
+        else:
+            base = find_run(args.base, runs)
+            head = find_run(args.head, runs) if args.head else runs[-1] if runs else None
+            if head is None:
+                raise LookupError("No hay ejecuciones guardadas en esta máquina con las que comparar")
+    except LookupError as e:
+        parser.error(str(e))
+
+    options = (args.alpha, args.threshold, args.min_ms)
+    rows = compare_runs(base, head, *options)
+    markdown = markdown_report(base, head, rows, *options)
+    if args.markdown:
+        with open(args.markdown, 'w', encoding='utf-8') as f:
+            f.write(markdown)
+        print(f"📦 Informe en Markdown guardado en {args.markdown}")
+    if args.html:
+        with open(args.html, 'w', encoding='utf-8') as f:
+            f.write(html_report(base, head, rows, *options))
+        print(f"📦 Informe en HTML guardado en {args.html}")
+    if not args.markdown and not args.html:
+        print(markdown)
+    else:
+        print(_summary(rows))
+
+    if args.fail_on_regression and any(row['status'] in FAILING for row in rows):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+Historial de resultados de los benchmarks
+Cada ejecución se guarda con el commit del que se midió y la huella de la
+máquina (sistema, arquitectura, modelo y número de CPUs, memoria y versión de
+Python), porque solo son comparables los tiempos medidos en la misma máquina.
+
+- log_result añade una línea JSON a un fichero .jsonl (cold_start, load, scaling)
+- save_run guarda una ejecución de la suite en su propio fichero,
+  benchmarks/history/<benchmark>/<huella>/<commit>-<fecha>.json, con las
+  muestras de cada caso para poder compararla después (benchmarks/compare.py)
+"""
+
+import glob
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_DIR = os.path.join(ROOT, 'benchmarks', 'history')
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def git_dirty():
+    """True si hay cambios sin confirmar en ficheros versionados (lo medido no es exactamente el commit)"""
+    try:
+        return bool(subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+def _cpu_model():
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _memory_gb():
+    try:
+        return round(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 2**30)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def machine_fingerprint():
+    """
+    Huella de la máquina en la que se mide
+
+    El identificador depende solo de lo que cambia los tiempos (no del nombre
+    del host): dos runners de CI iguales comparten huella.
+
+    Returns:
+        dict: {'id': 12 caracteres hexadecimales, 'host', 'system', 'machine',
+            'cpu', 'cpus', 'memory_gb', 'python'}
+    """
+    info = {
+        'system': platform.system(), 'machine': platform.machine(), 'cpu': _cpu_model(),
+        'cpus': os.cpu_count(), 'memory_gb': _memory_gb(),
+        'python': f"{platform.python_implementation()} {platform.python_version()}",
+    }
+    digest = hashlib.sha1(json.dumps(info, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    return {'id': digest, 'host': platform.node(), **info}
+
+
+def log_result(record, path):
+    """Añade un resultado como una línea JSON (con la huella de la máquina si no la trae)"""
+    record.setdefault('machine', machine_fingerprint()['id'])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    return path
+
+
+# === EJECUCIONES DE LA SUITE ===
+
+def run_record(benchmark, **fields):
+    """Cabecera común de una ejecución: benchmark, fecha, commit, cambios sin confirmar y máquina"""
+    return {
+        'benchmark': benchmark, 'timestamp': time.time(), 'commit': git_commit(),
+        'dirty': git_dirty(), 'machine': machine_fingerprint(), **fields,
+    }
+
+
+def run_label(run):
+    """Commit de una ejecución, con '-dirty' si se midió con cambios sin confirmar"""
+    return (run.get('commit') or 'sin-commit') + ('-dirty' if run.get('dirty') else '')
+
+
+def save_run(record, history_dir=HISTORY_DIR):
+    """
+    Guarda una ejecución en history_dir/<benchmark>/<huella>/<commit>-<fecha>.json
+
+    Returns:
+        str: Ruta del fichero
+    """
+    stamp = time.strftime('%Y%m%dT%H%M%S', time.localtime(record['timestamp']))
+    directory = os.path.join(history_dir, record['benchmark'], record['machine']['id'])
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{run_label(record)}-{stamp}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def load_run(path):
+    with open(path, encoding='utf-8') as f:
+        record = json.load(f)
+    record['path'] = path
+    return record
+
+
+def list_runs(benchmark='suite', machine=None, history_dir=HISTORY_DIR):
+    """
+    Ejecuciones guardadas de un benchmark, de la más antigua a la más reciente
+
+    Args:
+        machine (str): Solo las de esta huella (None: todas las máquinas)
+    """
+    pattern = os.path.join(history_dir, benchmark, machine or '*', '*.json')
+    runs = [load_run(path) for path in glob.glob(pattern)]
+    return sorted(runs, key=lambda run: run['timestamp'])
+
+
+def find_run(reference, runs):
+    """
+    Ejecución a la que se refiere reference: la ruta de un JSON o un commit
+    (o su prefijo; la ejecución más reciente de ese commit, sin cambios sin
+    confirmar salvo que se pida con '<commit>-dirty' o no haya otra)
+
+    Raises:
+        LookupError: Si no hay ninguna ejecución de ese commit
+    """
+    if os.path.isfile(reference):
+        return load_run(reference)
+    dirty = reference.endswith('-dirty')
+    commit = reference[:-len('-dirty')] if dirty else reference
+    # Se aceptan el hash corto con que se guardan las ejecuciones, un prefijo o el hash completo
+    matches = [run for run in runs if run.get('commit') and (
+        run['commit'].startswith(commit) or commit.startswith(run['commit']))]
+    preferred = [run for run in matches if bool(run.get('dirty')) == dirty]
+    if not matches or (dirty and not preferred):
+        raise LookupError(f"No hay ejecuciones guardadas del commit {reference}")
+    return (preferred or matches)[-1]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark de tiempo de importación (python -X importtime)
+Mide, en un proceso limpio por objetivo, cuánto cuesta importar cada paquete
+de modules/ y las importaciones de storytelling.py, y qué módulos pesan más.
+
+Uso (desde la raíz del proyecto):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 7 --top 15
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Objetivo -> código a ejecutar en el proceso medido
+TARGETS = {
+    'modules.core': 'import modules.core',
+    'modules.charts': 'import modules.charts',
+    'modules.analysis': 'import modules.analysis',
+    'modules.core.color_config': 'import modules.core.color_config',
+    'charts: 1 builder': 'from modules.charts import generate_europe_cost_heatmap',
+}
+
+
+def storytelling_imports(path=os.path.join(ROOT, 'storytelling.py')):
+    """Código con las importaciones de nivel superior de storytelling.py (sin ejecutar la app)"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return '\n'.join(ast.unparse(node) for node in nodes)
+
+
+def parse_importtime(stderr):
+    """
+    Interpreta la salida de -X importtime
+
+    Returns:
+        dict: Módulo -> (propio_us, acumulado_us)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure(code):
+    """Ejecuta code en un intérprete nuevo y devuelve los tiempos por módulo"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse_importtime(result.stderr)
+
+
+def run(repeat=5, top=10):
+    targets = dict(TARGETS)
+    targets['storytelling.py (imports)'] = storytelling_imports()
+
+    print(f"{'Objetivo':<30} {'mediana (ms)':>13} {'mín (ms)':>10} {'módulos':>8}")
+    print('-' * 64)
+    heaviest = {}
+    for label, code in targets.items():
+        totals = []
+        for _ in range(repeat):
+            modules = measure(code)
+            # Tiempo total = suma de los tiempos propios de todos los módulos cargados
+            totals.append(sum(self_us for self_us, _ in modules.values()) / 1000)
+        heaviest[label] = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        print(f"{label:<30} {statistics.median(totals):>13.1f} {min(totals):>10.1f} {len(modules):>8}")
+
+    for label, modules in heaviest.items():
+        print(f"\nMódulos con más tiempo propio: {label}")
+        for name, (self_us, cumulative_us) in modules:
+            print(f"  {self_us / 1000:>8.1f} ms  (acumulado {cumulative_us / 1000:>8.1f} ms)  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Repeticiones por objetivo')
+    parser.add_argument('--top', type=int, default=10, help='Módulos más pesados a listar')
+    args = parser.parse_args()
+    run(args.repeat, args.top)
+
+
+if __name__ == '__main__':
+    main()
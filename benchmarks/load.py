@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga: sesiones concurrentes del storytelling sin navegador
+Lanza N sesiones simultáneas de storytelling.py (AppTest, una por hilo, en
+este mismo proceso, como las sesiones de un worker de Streamlit) que siguen
+el recorrido de un lector: abrir la historia, avanzar capítulo a capítulo,
+cambiar de pestaña en Impacto y elegir otro país foco. Para cada N se miden
+los percentiles p50/p95/p99 de la latencia de los reruns, el rendimiento
+(reruns por segundo), la CPU usada (núcleos) y la memoria residente, y se
+busca el número de sesiones a partir del cual la latencia se degrada. La
+curva de saturación se añade a benchmarks/history/load.jsonl con el commit.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.load
+    python -m benchmarks.load --sessions 1,2,4,8,16 --iterations 3
+    python -m benchmarks.load --slo-ms 500 --html saturacion.html
+"""
+
+import argparse
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager
+
+from .history import git_commit, log_result
+from .suite import percentile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'history', 'load.jsonl')
+
+DEFAULT_SESSIONS = (1, 2, 4, 8, 16, 32)
+DEFAULT_COUNTRIES = ('PT', 'FR', 'DE')
+
+# Pausa de lectura entre reruns de una sesión (con 0 cada sesión pide reruns sin parar)
+DEFAULT_THINK_MS = 1000
+
+# La latencia se considera degradada cuando el p95 supera este múltiplo del p95 con una sesión
+DEGRADATION_FACTOR = 2.0
+
+RSS_SAMPLE_SECONDS = 0.1
+
+IMPACT_CHAPTER = 'chapters/impacto.py'
+IMPACT_TABS_KEY = 'impact_tabs'
+
+
+# === RECORRIDO DE UN LECTOR ===
+
+def reader_script(country):
+    """
+    Pasos de una sesión: (acción, argumento)
+
+    Se leen los capítulos en orden (en Streamlit desplazarse dentro de un
+    capítulo no cuesta nada al servidor; cada capítulo sí es un rerun), se
+    abren las pestañas de Impacto y se vuelve a él con otro país foco.
+    """
+    from modules.ui.layout import CHAPTERS
+
+    steps = [('open', None)]
+    for chapter in CHAPTERS[1:]:
+        steps.append(('page', chapter['path']))
+        if chapter['path'] == IMPACT_CHAPTER:
+            steps += [('tab', 1), ('tab', 2)]
+    steps += [('country', country), ('page', IMPACT_CHAPTER)]
+    return steps
+
+
+def run_step(at, action, argument):
+    """Ejecuta un paso de la sesión (un rerun)"""
+    if action == 'open':
+        at.run()
+    elif action == 'page':
+        at.switch_page(argument).run()
+    elif action == 'tab':
+        labels = [tab.label for tab in at.tabs]
+        at.session_state[IMPACT_TABS_KEY] = labels[argument]
+        at.run()
+    elif action == 'country':
+        at.sidebar.selectbox(key='focus_country').set_value(argument).run()
+    else:
+        raise ValueError(f"Acción desconocida: {action}")
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def run_session(script, iterations, think_seconds, samples, errors, delay=0.0):
+    """Una sesión completa: iterations recorridos del lector; anota cada rerun en samples"""
+    from streamlit.testing.v1 import AppTest
+
+    time.sleep(delay)
+    for _ in range(iterations):
+        at = AppTest.from_file(os.path.join(ROOT, 'storytelling.py'), default_timeout=600)
+        for action, argument in script:
+            start = time.perf_counter()
+            try:
+                run_step(at, action, argument)
+            except Exception as e:
+                errors.append(f"{action} {argument or ''}: {e}".strip())
+                break
+            samples.append((action, (time.perf_counter() - start) * 1000))
+            if think_seconds:
+                time.sleep(think_seconds)
+
+
+@contextmanager
+def shared_runtime():
+    """
+    Entorno de Streamlit compartido por las sesiones, como en un servidor
+
+    AppTest instala un Runtime simulado global al empezar cada rerun y lo
+    borra al terminar, y compila el script en cada rerun: con sesiones
+    concurrentes una borraría el Runtime en mitad del rerun de otra. Aquí,
+    como en un servidor real, todas las sesiones comparten el Runtime (el
+    último instalado) y la caché de scripts compilados.
+    """
+    from unittest.mock import patch
+
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+    from streamlit.testing.v1.util import patch_config_options
+
+    last = []
+    script_cache = ScriptCache()
+
+    def instance(cls):
+        if cls._instance is not None:
+            last[:] = [cls._instance]
+            return cls._instance
+        if not last:
+            raise RuntimeError("Runtime hasn't been created!")
+        return last[0]
+
+    def exists(cls):
+        return cls._instance is not None or bool(last)
+
+    with patch.object(Runtime, 'instance', classmethod(instance)), \
+            patch.object(Runtime, 'exists', classmethod(exists)), \
+            patch.object(app_test, 'ScriptCache', lambda: script_cache), \
+            patch.object(local_script_runner, 'ScriptCache', lambda: script_cache), \
+            patch_config_options({'global.appTest': True}):
+        yield
+
+
+# === NIVELES DE CARGA ===
+
+def run_level(sessions, countries, iterations, think_seconds):
+    """
+    Ejecuta sessions sesiones concurrentes y mide latencia, CPU y memoria
+
+    Returns:
+        dict: sessions, reruns, errors, wall_s, throughput (reruns/s),
+            p50/p95/p99 (ms), cpu_cores (CPU del proceso / tiempo real),
+            rss_peak_mb y latencia por acción
+    """
+    from modules.ui.perf_panel import process_rss_bytes
+
+    samples, errors, rss = [], [], [process_rss_bytes() or 0]
+    done = threading.Event()
+
+    def sample_rss():
+        while not done.wait(RSS_SAMPLE_SECONDS):
+            rss.append(process_rss_bytes() or 0)
+
+    threads = [
+        threading.Thread(
+            target=run_session, name=f"load-session-{i}",
+            args=(reader_script(countries[i % len(countries)]), iterations, think_seconds, samples, errors,
+                  # Las sesiones llegan escalonadas durante la primera pausa, no todas a la vez
+                  think_seconds * i / sessions),
+        )
+        for i in range(sessions)
+    ]
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    cpu_start, start = time.process_time(), time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+    done.set()
+    sampler.join()
+
+    latencies = [ms for _, ms in samples]
+    by_action = {}
+    for action, ms in samples:
+        by_action.setdefault(action, []).append(ms)
+    return {
+        'sessions': sessions,
+        'reruns': len(samples),
+        'errors': errors,
+        'wall_s': wall,
+        'throughput': len(samples) / wall if wall else None,
+        **{f"p{p}": percentile(latencies, p) for p in (50, 95, 99)},
+        'cpu_cores': cpu / wall if wall else None,
+        'rss_peak_mb': max(rss) / 2**20,
+        'actions': {action: percentile(values, 50) for action, values in by_action.items()},
+    }
+
+
+def saturation_point(levels, slo_ms=None):
+    """
+    Máximo de sesiones antes de que la latencia se degrade
+
+    Se degrada cuando el p95 supera slo_ms (si se da) o DEGRADATION_FACTOR
+    veces el p95 del primer nivel, o cuando hay errores.
+
+    Returns:
+        int o None: Sesiones del último nivel sano (None si ya el primero se degrada)
+    """
+    if not levels or levels[0]['p95'] is None:
+        return None
+    limit = slo_ms if slo_ms is not None else levels[0]['p95'] * DEGRADATION_FACTOR
+    healthy = None
+    for level in levels:
+        if level['errors'] or level['p95'] is None or level['p95'] > limit:
+            break
+        healthy = level['sessions']
+    return healthy
+
+
+# === INFORME ===
+
+def _number(value, spec):
+    """Valor con el formato dado, o '-' si no se pudo medir (ningún rerun terminó)"""
+    return format(value, spec) if value is not None else '-'
+
+
+def print_report(levels, saturation, slo_ms):
+    print(f"\n{'Sesiones':>8} {'Reruns':>7} {'Reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'CPU (núcleos)':>14} {'RSS pico MB':>12} {'Errores':>8}")
+    print('-' * 92)
+    for level in levels:
+        print(f"{level['sessions']:>8} {level['reruns']:>7} {_number(level['throughput'], '.1f'):>9} "
+              f"{_number(level['p50'], '.0f'):>8} {_number(level['p95'], '.0f'):>8} {_number(level['p99'], '.0f'):>8} "
+              f"{_number(level['cpu_cores'], '.2f'):>14} {level['rss_peak_mb']:>12.0f} {len(level['errors']):>8}")
+    for level in levels:
+        for error in sorted(set(level['errors']))[:3]:
+            print(f"⚠️ {level['sessions']} sesiones: {error}")
+
+    criterion = f"p95 > {slo_ms:.0f} ms" if slo_ms is not None else f"p95 > {DEGRADATION_FACTOR:g} x p95 con 1 sesión"
+    if saturation is None:
+        print(f"\n⚠️ La latencia ya se degrada en el primer nivel ({criterion})")
+    elif saturation == levels[-1]['sessions']:
+        print(f"\n✅ Sin degradación hasta {saturation} sesiones ({criterion}); prueba niveles mayores")
+    else:
+        print(f"\n🔥 Saturación: la latencia se degrada por encima de {saturation} sesiones ({criterion})")
+
+
+def write_html(levels, path, title):
+    """Curva de saturación: percentiles de latencia y reruns/s frente a sesiones"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    sessions = [level['sessions'] for level in levels]
+    fig = make_subplots(specs=[[{'secondary_y': True}]])
+    for key in ('p50', 'p95', 'p99'):
+        fig.add_trace(go.Scatter(x=sessions, y=[level[key] for level in levels], name=f"{key} (ms)",
+                                 mode='lines+markers'))
+    fig.add_trace(go.Scatter(x=sessions, y=[level['throughput'] for level in levels], name='reruns/s',
+                             mode='lines+markers', line={'dash': 'dot'}), secondary_y=True)
+    fig.update_layout(title=title, xaxis_title='Sesiones concurrentes')
+    fig.update_yaxes(title_text='Latencia del rerun (ms)', secondary_y=False)
+    fig.update_yaxes(title_text='Reruns por segundo', secondary_y=True)
+    fig.write_html(path, include_plotlyjs='cdn')
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', default=','.join(map(str, DEFAULT_SESSIONS)),
+                        help='Niveles de sesiones concurrentes, separados por comas')
+    parser.add_argument('--iterations', type=int, default=1, help='Recorridos completos por sesión y nivel')
+    parser.add_argument('--countries', default=','.join(DEFAULT_COUNTRIES),
+                        help='Países foco que eligen las sesiones (por turnos)')
+    parser.add_argument('--think-ms', type=float, default=DEFAULT_THINK_MS,
+                        help='Pausa de lectura entre reruns de una sesión (0: sin pausa)')
+    parser.add_argument('--slo-ms', type=float, help='p95 máximo aceptable (por defecto, relativo a 1 sesión)')
+    parser.add_argument('--no-warmup', action='store_true',
+                        help='No precalentar la caché del proceso antes de medir')
+    parser.add_argument('--html', help='Guarda la curva de saturación en este fichero HTML')
+    parser.add_argument('--no-log', action='store_true', help=f'No añadir el resultado a {HISTORY_PATH}')
+    args = parser.parse_args()
+
+    levels_to_run = [int(value) for value in args.sessions.split(',') if value.strip()]
+    countries = tuple(code.strip().upper() for code in args.countries.split(',') if code.strip())
+    from modules.core.countries import FOCUS_COUNTRIES
+    unknown = [code for code in countries if code not in FOCUS_COUNTRIES]
+    if unknown or not countries:
+        parser.error(f"Países no disponibles en el selector: {', '.join(unknown)} (válidos: {', '.join(FOCUS_COUNTRIES)})")
+    commit = git_commit()
+
+    with shared_runtime():
+        if not args.no_warmup:
+            # Un recorrido por país: las figuras quedan en la caché del proceso como en un worker ya caliente
+            start = time.perf_counter()
+            errors = []
+            for country in countries:
+                run_session(reader_script(country), 1, 0, [], errors)
+            print(f"🔥 Caché del proceso precalentada en {time.perf_counter() - start:.1f}s"
+                  + (f" ({len(errors)} errores)" if errors else ''))
+
+        levels = []
+        for sessions in levels_to_run:
+            level = run_level(sessions, countries, args.iterations, args.think_ms / 1000)
+            levels.append(level)
+            print(f"{'✅' if not level['errors'] else '⚠️'} {sessions} sesiones: {level['reruns']} reruns, "
+                  f"p95 {level['p95'] or 0:.0f} ms", flush=True)
+
+    saturation = saturation_point(levels, args.slo_ms)
+    print_report(levels, saturation, args.slo_ms)
+
+    if args.html:
+        title = f"Saturación del storytelling ({commit or 'sin commit'})"
+        print(f"📦 Curva guardada en {write_html(levels, args.html, title)}")
+    if not args.no_log:
+        path = log_result({
+            'benchmark': 'load', 'timestamp': time.time(), 'commit': commit,
+            'host': platform.node(), 'python': platform.python_version(), 'cpus': os.cpu_count(),
+            'iterations': args.iterations, 'countries': countries, 'think_ms': args.think_ms,
+            'slo_ms': args.slo_ms, 'warmup': not args.no_warmup, 'saturation': saturation, 'levels': levels,
+        }, HISTORY_PATH)
+        print(f"📦 Resultado añadido a {os.path.relpath(path, ROOT)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Informe de memoria por dataset, por figura y por sesión, y fugas entre reruns
+Abre varias sesiones de storytelling.py sin navegador (AppTest) que se
+mantienen vivas, como en un servidor, y las hace recorrer la historia una y
+otra vez. Tras cada ronda toma una instantánea de tracemalloc y al final
+informa de la memoria de cada ronda, de cuánto crece por rerun una vez
+caliente la caché, de los puntos del código que crecen en todas las rondas
+(posibles fugas) y de la memoria retenida por cada dataset, cada figura y
+cada sesión.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.memory
+    python -m benchmarks.memory --sessions 8 --rounds 6 --fail-on-leak
+    python -m benchmarks.memory --json memoria.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from .load import DEFAULT_COUNTRIES, reader_script, run_step, shared_runtime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_rounds(sessions, rounds, countries):
+    """
+    Recorridos repetidos de las mismas sesiones con una instantánea por ronda
+
+    Returns:
+        tuple: (filas por ronda, historial de instantáneas, sesiones AppTest, errores)
+    """
+    from streamlit.testing.v1 import AppTest
+
+    from modules.core.memory import allocation_sites
+    from modules.ui.perf_panel import process_rss_bytes
+
+    apps = [AppTest.from_file(os.path.join(ROOT, 'storytelling.py'), default_timeout=600) for _ in range(sessions)]
+    history, rows, errors, reruns = [], [], [], 0
+    for round_number in range(1, rounds + 1):
+        start = time.perf_counter()
+        for i, at in enumerate(apps):
+            for action, argument in reader_script(countries[i % len(countries)]):
+                try:
+                    run_step(at, action, argument)
+                except Exception as e:
+                    errors.append(f"{action} {argument or ''}: {e}".strip())
+                    break
+                reruns += 1
+        history.append(allocation_sites())
+        # Memoria viva según la instantánea (sin la que retiene el propio perfilado)
+        traced, peak = sum(history[-1].values()), tracemalloc.get_traced_memory()[1]
+        rows.append({
+            'round': round_number, 'reruns': reruns, 'seconds': time.perf_counter() - start,
+            'traced': traced, 'peak': peak, 'rss': process_rss_bytes(),
+        })
+        print(f"🧠 Ronda {round_number}/{rounds}: {traced / 2**20:.1f} MB trazados", flush=True)
+    return rows, history, apps, errors
+
+
+def growth_per_rerun(rows):
+    """Bytes trazados que se acumulan por rerun desde la segunda ronda (la primera llena la caché)"""
+    if len(rows) < 3:
+        return None
+    first, last = rows[1], rows[-1]
+    return (last['traced'] - first['traced']) / max(last['reruns'] - first['reruns'], 1)
+
+
+def print_report(rows, report, per_rerun, limit):
+    from modules.core.memory import format_bytes
+    from modules.ui.memory_profile import format_memory_report
+
+    print(f"\n{'Ronda':>6} {'Reruns':>7} {'Trazada':>11} {'Δ':>11} {'Pico':>11} {'RSS':>11}")
+    previous = None
+    for row in rows:
+        delta = format_bytes(row['traced'] - previous) if previous is not None else '-'
+        print(f"{row['round']:>6} {row['reruns']:>7} {format_bytes(row['traced']):>11} {delta:>11} "
+              f"{format_bytes(row['peak']):>11} {format_bytes(row['rss'] or 0):>11}")
+        previous = row['traced']
+    if per_rerun is not None:
+        print(f"\nCon la caché ya llena se acumulan {format_bytes(per_rerun)} por rerun")
+    print()
+    print(format_memory_report(report, limit))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=4, help='Sesiones abiertas a la vez')
+    parser.add_argument('--rounds', type=int, default=5, help='Recorridos completos de cada sesión')
+    parser.add_argument('--countries', default=','.join(DEFAULT_COUNTRIES),
+                        help='Países foco que eligen las sesiones (por turnos)')
+    parser.add_argument('--frames', type=int, default=1, help='Marcos de pila por asignación en tracemalloc')
+    parser.add_argument('--limit', type=int, default=15, help='Filas de cada tabla del informe')
+    parser.add_argument('--json', help='Guarda el informe en este fichero')
+    parser.add_argument('--fail-on-leak', action='store_true',
+                        help='Termina con error si algún punto del código crece en todas las rondas')
+    args = parser.parse_args()
+
+    from modules.core.memory import deep_sizeof, growing_sites
+    from modules.ui.memory_profile import memory_report, site_rows
+
+    countries = tuple(code.strip().upper() for code in args.countries.split(',') if code.strip())
+    # Solo tracemalloc: el informe por rerun de la aplicación (STORYTELLING_MEMPROFILE) queda desactivado
+    tracemalloc.start(args.frames)
+    start = time.perf_counter()
+    with shared_runtime():
+        rows, history, apps, errors = run_rounds(args.sessions, args.rounds, countries)
+    print(f"🔥 {rows[-1]['reruns']} reruns en {time.perf_counter() - start:.0f}s")
+    for error in sorted(set(errors))[:5]:
+        print(f"⚠️ {error}")
+
+    sessions = sorted(
+        ({'session': f"sesión {i + 1}", 'reruns': rows[-1]['reruns'] // len(apps), 'bytes': deep_sizeof(at.session_state)}
+         for i, at in enumerate(apps)),
+        key=lambda row: -row['bytes'],
+    )
+    report = memory_report(history, sessions)
+    # Fugas: puntos que crecen en todas las rondas salvo la primera (que llena la caché)
+    report['leaks'] = site_rows(growing_sites(history[1:], window=len(history) - 1)) if len(history) > 2 else []
+    per_rerun = growth_per_rerun(rows)
+    print_report(rows, report, per_rerun, args.limit)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'rounds': rows, 'per_rerun_bytes': per_rerun, 'errors': errors, **report},
+                      f, indent=2, ensure_ascii=False)
+
+    if errors:
+        sys.exit(1)
+    if args.fail_on_leak and report['leaks']:
+        print(f"\n⚠️ {len(report['leaks'])} puntos del código crecen en todas las rondas")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
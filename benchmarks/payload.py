@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Benchmark del tamaño de las figuras enviadas al navegador
+Construye todas las figuras del storytelling (el grafo de
+modules/ui/story_spec.py para un país foco), las serializa como lo hace
+st.plotly_chart (plotly.io.to_json sin validar) y mide, por figura, los
+bytes en bruto y comprimidos con gzip, el número de trazas y de puntos. Las
+figuras enlazadas, que viajan como HTML, se miden como HTML. Se compara cada
+figura con su presupuesto de benchmarks/payload_budgets.json y se ordena el
+informe de más a menos pesada.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.payload
+    python -m benchmarks.payload --country PT --detail 5
+    python -m benchmarks.payload --update-budgets --json payload.json
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import sys
+import time
+
+import plotly.io as pio
+from plotly.basedatatypes import BaseFigure
+
+from modules.core.countries import DEFAULT_FOCUS_COUNTRY
+from modules.ui.story_spec import build_story_graph
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'payload_budgets.json')
+
+# Al regenerar: presupuesto = tamaño medido * margen, redondeado al KB
+BUDGET_MARGIN = 1.25
+
+# Atributos de una traza que llevan un valor por punto
+POINT_ATTRIBUTES = ('x', 'y', 'z', 'locations', 'values', 'labels', 'lat', 'lon', 'r', 'theta', 'text')
+
+
+def serialize(fig):
+    """JSON de la figura tal como lo envía st.plotly_chart"""
+    return pio.to_json(fig, validate=False)
+
+
+def gzip_size(text):
+    """Bytes del texto comprimido con gzip (nivel por defecto de zlib, como permessage-deflate)"""
+    return len(gzip.compress(text.encode('utf-8'), compresslevel=6))
+
+
+def trace_points(trace):
+    """Puntos de una traza: el atributo por punto más largo (nodos y enlaces en un Sankey)"""
+    if trace.type == 'sankey':
+        return len(trace.node.label or ()) + len(trace.link.value or ())
+    lengths = [len(value) for value in (getattr(trace, name, None) for name in POINT_ATTRIBUTES)
+               if value is not None and not isinstance(value, str) and hasattr(value, '__len__')]
+    return max(lengths, default=0)
+
+
+def collect_payloads(value, name):
+    """
+    Figuras y HTML dentro del resultado de un nodo del grafo
+
+    Recorre tuplas, listas y diccionarios (ej: (figura, insights) o
+    {'figure': figura, ...}); las cadenas largas son HTML de figuras enlazadas.
+
+    Returns:
+        list: (nombre, figura o HTML)
+    """
+    if isinstance(value, BaseFigure):
+        return [(name, value)]
+    if isinstance(value, str):
+        return [(name, value)] if value.lstrip().startswith('<') and len(value) > 1024 else []
+    if isinstance(value, dict) or hasattr(value, 'items') and hasattr(value, 'keys'):
+        items = value.items()
+    elif isinstance(value, (list, tuple)):
+        items = enumerate(value)
+    else:
+        return []
+    payloads = []
+    for key, item in items:
+        payloads += collect_payloads(item, f"{name}[{key}]")
+    return payloads
+
+
+def budget_key(name, country):
+    """Nombre del presupuesto: sin el sufijo de país, para que valga para todos"""
+    return name.replace(f"@{country}", '')
+
+
+def measure_payloads(country=DEFAULT_FOCUS_COUNTRY, max_workers=4):
+    """
+    Construye las figuras de un país y mide su tamaño serializado
+
+    Returns:
+        list: Una fila por figura con name, kind ('figure' o 'html'),
+            raw_bytes, gzip_bytes, traces, points y, para las figuras,
+            layout_bytes y trace_bytes (tamaño de cada traza)
+    """
+    graph = build_story_graph(countries=(country,))
+    results, errors = graph.run(max_workers=max_workers)
+    for name, error in errors.items():
+        print(f"⚠️ Error construyendo {name}: {error}")
+
+    rows = []
+    for name in graph.country_nodes(None) + graph.country_nodes(country):
+        if graph.nodes[name].kind == 'dataset' or name not in results:
+            continue
+        for label, payload in collect_payloads(results[name], budget_key(name, country)):
+            if isinstance(payload, str):
+                rows.append({
+                    'name': label, 'kind': 'html', 'raw_bytes': len(payload.encode('utf-8')),
+                    'gzip_bytes': gzip_size(payload), 'traces': None, 'points': None,
+                })
+                continue
+            spec = serialize(payload)
+            rows.append({
+                'name': label, 'kind': 'figure', 'raw_bytes': len(spec.encode('utf-8')),
+                'gzip_bytes': gzip_size(spec), 'traces': len(payload.data),
+                'points': sum(trace_points(trace) for trace in payload.data),
+                'layout_bytes': len(pio.to_json(payload.layout, validate=False)),
+                'trace_bytes': [
+                    (f"{trace.type} {trace.name or i}", len(pio.to_json(trace, validate=False)))
+                    for i, trace in enumerate(payload.data)
+                ],
+            })
+    return sorted(rows, key=lambda row: -row['raw_bytes']), errors
+
+
+# === PRESUPUESTOS ===
+
+def load_budgets(path=BUDGETS_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def update_budgets(rows, path=BUDGETS_PATH):
+    """Fija el presupuesto de las figuras medidas (conserva el resto)"""
+    budgets = load_budgets(path)
+    for row in rows:
+        budgets[row['name']] = {
+            key: int(math.ceil(row[key] * BUDGET_MARGIN / 1024) * 1024)
+            for key in ('raw_bytes', 'gzip_bytes')
+        }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(budgets.items())), f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    return path
+
+
+def check_budgets(rows, budgets):
+    """Figura -> lista de fallos (sin presupuesto o algún tamaño por encima)"""
+    failures = {}
+    for row in rows:
+        budget = budgets.get(row['name'])
+        if budget is None:
+            failures[row['name']] = ["sin presupuesto"]
+            continue
+        failures[row['name']] = [
+            f"{key} {row[key] / 1024:.1f} KB > {budget[key] / 1024:.0f} KB"
+            for key in ('raw_bytes', 'gzip_bytes') if row[key] > budget[key]
+        ]
+    return failures
+
+
+# === INFORME ===
+
+def print_report(rows, failures, budgets, detail=3):
+    print(f"\n{'#':>3} {'Figura':<44} {'Bruto KB':>9} {'gzip KB':>8} {'Trazas':>7} {'Puntos':>7} "
+          f"{'B/punto':>8} {'Presup. KB':>11}  Estado")
+    print('-' * 120)
+    for i, row in enumerate(rows, 1):
+        budget = budgets.get(row['name'])
+        limits = f"{budget['raw_bytes'] / 1024:.0f}/{budget['gzip_bytes'] / 1024:.0f}" if budget else '-'
+        per_point = f"{row['raw_bytes'] / row['points']:>8.0f}" if row.get('points') else f"{'-':>8}"
+        traces = row['traces'] if row['traces'] is not None else '-'
+        points = row['points'] if row['points'] is not None else '-'
+        status = '✅' if not failures[row['name']] else '⚠️ ' + '; '.join(failures[row['name']])
+        print(f"{i:>3} {row['name'][:44]:<44} {row['raw_bytes'] / 1024:>9.1f} {row['gzip_bytes'] / 1024:>8.1f} "
+              f"{traces:>7} {points:>7} {per_point} {limits:>11}  {status}")
+
+    total_raw = sum(row['raw_bytes'] for row in rows)
+    total_gzip = sum(row['gzip_bytes'] for row in rows)
+    print(f"\nTotal: {len(rows)} figuras, {total_raw / 1024:.0f} KB en bruto, {total_gzip / 1024:.0f} KB con gzip")
+
+    figures = [row for row in rows if row['kind'] == 'figure']
+    for row in figures[:detail]:
+        print(f"\n📦 {row['name']}: layout {row['layout_bytes'] / 1024:.1f} KB")
+        for label, size in sorted(row['trace_bytes'], key=lambda item: -item[1]):
+            print(f"    {size / 1024:>7.1f} KB  {label}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--country', default=DEFAULT_FOCUS_COUNTRY, help='País foco de las figuras')
+    parser.add_argument('--detail', type=int, default=3, help='Figuras más pesadas a desglosar por traza')
+    parser.add_argument('--json', help='Guarda los resultados en este fichero')
+    parser.add_argument('--update-budgets', action='store_true',
+                        help=f'Fija el presupuesto de cada figura (tamaño x {BUDGET_MARGIN})')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows, errors = measure_payloads(args.country)
+    print(f"🔥 {len(rows)} figuras construidas y serializadas en {time.perf_counter() - start:.1f}s")
+
+    if args.update_budgets:
+        print(f"📦 Presupuestos actualizados en {update_budgets(rows)}")
+
+    budgets = load_budgets()
+    failures = check_budgets(rows, budgets)
+    print_report(rows, failures, budgets, args.detail)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'timestamp': time.time(), 'country': args.country, 'figures': rows,
+                'failures': failures, 'errors': {name: str(error) for name, error in errors.items()},
+            }, f, indent=2, ensure_ascii=False)
+
+    failed = [name for name, problems in failures.items() if problems]
+    if failed or errors:
+        print(f"\n⚠️ {len(failed)} figuras fuera de presupuesto, {len(errors)} nodos con error")
+        sys.exit(1)
+    print("\n✅ Todas las figuras dentro de presupuesto")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalado de loaders y builders con Excels sintéticos
+Los Excels de data/ tienen unas 30 filas de países y hasta 46 columnas. Este
+benchmark genera (benchmarks/synthetic.py) versiones con la misma estructura
+y 10x, 100x y 1000x más países (filas: regiones, instituciones) o grupos
+(columnas: desgloses), mide el loader y los builders que consumen cada una y
+estima el orden de crecimiento entre tamaños (pendiente log-log: 1 es lineal,
+2 cuadrático). Los tamaños que superan el límite de columnas de Excel se
+omiten.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.scaling
+    python -m benchmarks.scaling --sizes 1,10,100 -k relationship
+    python -m benchmarks.scaling --keep /tmp/excels --json escalado.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import re
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from .history import git_commit, log_result
+from .synthetic import EXCEL_MAX_COLUMNS, TRIPLET, read_layout, scaled_workbook
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'history', 'scaling.jsonl')
+
+DEFAULT_SIZES = (1, 10, 100, 1000)
+
+# Repeticiones por medida, hasta este tiempo acumulado (los tamaños grandes se miden una vez)
+MAX_REPEAT_SECONDS = 10
+
+# Pendiente log-log a partir de la cual el crecimiento se marca como superlineal
+SUPERLINEAR_SLOPE = 1.3
+
+
+class ScalingCase:
+    """
+    Caso del benchmark de escalado
+
+    Args:
+        name (str): Nombre del caso
+        template (str): Excel de data/ cuya estructura se escala (ruta relativa a la raíz)
+        dimension (str): 'countries' (filas) o 'groups' (columnas)
+        loader (callable): Lee el Excel; recibe un objeto con .value (la ruta), como los enums
+        builders (list): (nombre, callable) que reciben lo que devuelve el loader
+    """
+
+    def __init__(self, name, template, dimension, loader, builders):
+        self.name = name
+        self.template = template
+        self.dimension = dimension
+        self.loader = loader
+        self.builders = builders
+
+
+def _cases():
+    from modules.charts import demographic_charts, impact_charts, work_study_charts
+    from modules.core import data_loaders
+
+    return [
+        ScalingCase(
+            'impact_abandoning', 'data/preprocessed_impact_by_job/'
+            'E8_assess_study_abandoning_all_t__e_financial_difficulties__all_contries.xlsx',
+            'countries', data_loaders.read_work_impact_dataset,
+            [('create_financial_abandoning_chart', impact_charts.create_financial_abandoning_chart)],
+        ),
+        ScalingCase(
+            'work_study_relationship', 'data/preprocessed_relationship_study_job/'
+            'E8_work_related_study5__all_students__all_contries.xlsx',
+            'countries', data_loaders.read_work_study_relationship_dataset,
+            [('create_european_ranking_chart', work_study_charts.create_european_ranking_chart),
+             ('create_gap_analysis_chart', work_study_charts.create_gap_analysis_chart)],
+        ),
+        ScalingCase(
+            'demographic_sex', 'data/preprocessed_excels/E8_work_motive_afford_study_5__e_sex__all_contries.xlsx',
+            'countries', demographic_charts.read_demographic_dataset_detailed,
+            [('create_gender_comparison_chart', demographic_charts.create_gender_comparison_chart)],
+        ),
+        ScalingCase(
+            'demographic_field_of_study',
+            'data/preprocessed_excels/E8_work_motive_afford_study_5__e_field_of_study__all_contries.xlsx',
+            'groups', demographic_charts.read_demographic_dataset_detailed,
+            [('create_field_of_study_comparison_chart', demographic_charts.create_field_of_study_comparison_chart)],
+        ),
+    ]
+
+
+def time_call(func, *args):
+    """
+    Mediana en ms de varias llamadas (hasta 3 o MAX_REPEAT_SECONDS acumulados)
+
+    Returns:
+        tuple: (ms, resultado de la última llamada)
+    """
+    samples, result = [], None
+    while len(samples) < 3 and sum(samples) < MAX_REPEAT_SECONDS * 1000:
+        start = time.perf_counter()
+        result = func(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def run_case(case, sizes, directory):
+    """
+    Mide un caso en cada tamaño
+
+    Returns:
+        list: Una fila por tamaño con size, rows, columns, file_mb, load_ms,
+            builders (nombre -> ms), error o skipped
+    """
+    template = os.path.join(ROOT, case.template)
+    layout = read_layout(template)
+    columns_per_group = len(layout['levels']) * len(TRIPLET)
+    rows = []
+    for size in sizes:
+        row = {'size': size}
+        if case.dimension == 'groups' and 1 + len(layout['groups']) * size * columns_per_group > EXCEL_MAX_COLUMNS:
+            row['skipped'] = f"más de {EXCEL_MAX_COLUMNS} columnas (límite de Excel)"
+            rows.append(row)
+            continue
+
+        # Mismo nombre que el original: read_work_impact_dataset elige el parser por el nombre del fichero
+        folder = os.path.join(directory, f"{case.name}-{size}x")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, os.path.basename(template))
+        if not os.path.exists(path):
+            factors = {'countries_factor': size} if case.dimension == 'countries' else {'groups_factor': size}
+            scaled_workbook(path, template, **factors)
+        sheet_rows, sheet_columns = _sheet_shape(path)
+        row.update(rows=sheet_rows - 3, columns=sheet_columns, file_mb=os.path.getsize(path) / 2**20)
+
+        try:
+            row['load_ms'], data = time_call(case.loader, SimpleNamespace(value=path, name=case.name))
+            row['builders'] = {name: time_call(builder, data)[0] for name, builder in case.builders}
+        except Exception as e:
+            row['error'] = f"{type(e).__name__}: {e}"
+        rows.append(row)
+    return rows
+
+
+def _sheet_shape(path):
+    """(filas, columnas) de la hoja sin leer las celdas"""
+    from openpyxl import load_workbook
+    sheet = load_workbook(path, read_only=True).active
+    return sheet.max_row, sheet.max_column
+
+
+def growth_slope(rows, key):
+    """
+    Pendiente log-log del tiempo frente al tamaño entre los dos últimos tamaños medidos
+
+    Returns:
+        float o None: 1 es crecimiento lineal, 2 cuadrático
+    """
+    points = [(row['size'], value) for row in rows if (value := _value(row, key))]
+    if len(points) < 2:
+        return None
+    (size_a, time_a), (size_b, time_b) = points[-2], points[-1]
+    if size_a == size_b:
+        return None
+    return math.log(time_b / time_a) / math.log(size_b / size_a)
+
+
+def _value(row, key):
+    if key == 'load_ms':
+        return row.get('load_ms')
+    return row.get('builders', {}).get(key)
+
+
+# === INFORME ===
+
+def print_report(case, rows):
+    keys = ['load_ms'] + [name for name, _ in case.builders]
+    labels = ['loader'] + [name.replace('create_', '').replace('_chart', '') for name, _ in case.builders]
+    print(f"\n📦 {case.name} ({'países' if case.dimension == 'countries' else 'grupos'} x tamaño; {case.template})")
+    print(f"  {'Tamaño':>7} {'Filas':>7} {'Columnas':>9} {'MB':>6} " + ' '.join(f"{label[:28]:>28}" for label in labels))
+    for row in rows:
+        if 'skipped' in row:
+            print(f"  {row['size']:>6}x ⏩ {row['skipped']}")
+            continue
+        values = ' '.join(
+            f"{_value(row, key):>25.0f} ms" if _value(row, key) is not None else f"{'-':>28}" for key in keys
+        )
+        print(f"  {row['size']:>6}x {row['rows']:>7} {row['columns']:>9} {row['file_mb']:>6.1f} {values}")
+        if 'error' in row:
+            print(f"  ⚠️ {row['error']}")
+    slopes = []
+    for key, label in zip(keys, labels):
+        slope = growth_slope(rows, key)
+        if slope is not None:
+            marker = '⚠️ ' if slope > SUPERLINEAR_SLOPE else ''
+            slopes.append(f"{marker}{label} {slope:.2f}")
+    if slopes:
+        print(f"  Crecimiento (pendiente log-log, último tramo): {', '.join(slopes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Factores de escala respecto a los Excels de data/, separados por comas')
+    parser.add_argument('-k', dest='pattern', help='Solo los casos cuyo nombre contiene este patrón (regex)')
+    parser.add_argument('--keep', help='Genera los Excels en este directorio y los reutiliza entre ejecuciones')
+    parser.add_argument('--json', help='Guarda los resultados en este fichero')
+    parser.add_argument('--no-log', action='store_true', help=f'No añadir el resultado a {HISTORY_PATH}')
+    args = parser.parse_args()
+
+    sizes = sorted({int(value) for value in args.sizes.split(',') if value.strip()})
+    cases = [case for case in _cases() if not args.pattern or re.search(args.pattern, case.name)]
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='storytelling-scaling-') as temporary:
+        directory = args.keep or temporary
+        for case in cases:
+            start = time.perf_counter()
+            results[case.name] = run_case(case, sizes, directory)
+            print(f"🔥 {case.name} medido en {time.perf_counter() - start:.0f}s", flush=True)
+    for case in cases:
+        print_report(case, results[case.name])
+
+    slopes = {
+        case.name: {key: growth_slope(results[case.name], key)
+                    for key in ['load_ms'] + [name for name, _ in case.builders]}
+        for case in cases
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'timestamp': time.time(), 'sizes': sizes, 'results': results, 'slopes': slopes},
+                      f, indent=2, ensure_ascii=False)
+    if not args.no_log:
+        path = log_result({
+            'benchmark': 'scaling', 'timestamp': time.time(), 'commit': git_commit(),
+            'host': platform.node(), 'python': platform.python_version(),
+            'sizes': sizes, 'results': results, 'slopes': slopes,
+        }, HISTORY_PATH)
+        print(f"\n📦 Resultado añadido a {os.path.relpath(path, ROOT)}")
+
+    errors = [name for name, rows in results.items() if any('error' in row for row in rows)]
+    if errors:
+        print(f"\n⚠️ Errores en: {', '.join(errors)}")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
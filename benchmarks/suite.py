@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Benchmark de loaders, builders de figuras y render completo con presupuestos
+Cada caso se mide en frío (primera llamada en un intérprete nuevo, con la
+caché en disco vacía; una repetición por proceso) y en caliente (llamadas
+siguientes en el mismo proceso), se informa de sus percentiles y se compara
+con su presupuesto de benchmarks/budgets.json: la ejecución falla si algún
+caso lo supera, no tiene presupuesto o da error. Funciona sin red contra el
+directorio data/ del repositorio.
+
+Cada ejecución se guarda, con sus muestras, el commit y la huella de la
+máquina, en benchmarks/history/suite/ para compararla con otra
+(python -m benchmarks.compare).
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.suite
+    python -m benchmarks.suite -k impact --cold 5 --warm 20
+    python -m benchmarks.suite --group loader --json resultados.json
+    python -m benchmarks.suite --update-budgets
+    python -m benchmarks.suite --no-log
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from .cases import ROOT, all_cases, instrumented_targets, skipped_datasets
+from .history import run_record, save_run
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'budgets.json')
+
+# Percentil que se compara con el presupuesto
+BUDGET_PERCENTILE = 50
+
+# Al regenerar: presupuesto = p95 medido * margen, con un mínimo en ms
+BUDGET_MARGIN = 2.0
+BUDGET_FLOOR_MS = 10
+
+PERCENTILES = (50, 90, 95)
+
+RESULT_MARKER = 'BENCHMARK_RESULT '
+WORKER_TIMEOUT = 1800
+
+
+def percentile(values, p):
+    """Percentil p (0-100) con interpolación lineal entre muestras"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples):
+    """Percentiles, mínimo y máximo de unas muestras en ms"""
+    if not samples:
+        return None
+    stats = {f"p{p}": percentile(samples, p) for p in PERCENTILES}
+    stats.update(min=min(samples), max=max(samples), n=len(samples))
+    return stats
+
+
+# === PROCESO DE MEDIDA ===
+
+def run_worker(name, warm):
+    """
+    Mide un caso en este proceso (que debe ser nuevo): una llamada en frío y
+    warm llamadas en caliente, e imprime el resultado en una línea JSON
+    """
+    case = next((case for case in all_cases() if case.name == name), None)
+    if case is None:
+        raise SystemExit(f"Caso desconocido: {name}")
+
+    call = case.setup()
+    start = time.perf_counter()
+    call()
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    warm_ms = []
+    for _ in range(warm):
+        start = time.perf_counter()
+        call()
+        warm_ms.append((time.perf_counter() - start) * 1000)
+
+    print(RESULT_MARKER + json.dumps({'cold_ms': cold_ms, 'warm_ms': warm_ms}), flush=True)
+
+
+def measure(case, warm):
+    """Ejecuta un caso en un intérprete nuevo con una caché en disco vacía"""
+    with tempfile.TemporaryDirectory(prefix='storytelling-bench-') as cache_dir:
+        env = dict(os.environ, STORYTELLING_CACHE_DIR=cache_dir)
+        for variable in ('STORYTELLING_TRACE', 'STORYTELLING_DEBUG'):
+            env.pop(variable, None)
+        result = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.suite', '--worker', case.name, '--warm', str(warm)],
+            cwd=ROOT, env=env, capture_output=True, text=True, timeout=WORKER_TIMEOUT,
+        )
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    lines = (result.stderr or result.stdout).strip().splitlines()
+    raise RuntimeError(lines[-1] if lines else f"código de salida {result.returncode}")
+
+
+def run_case(case, cold, warm):
+    """
+    Mide un caso: cold procesos nuevos; el primero hace además warm llamadas en caliente
+
+    Returns:
+        dict: {'cold': estadísticas, 'warm': estadísticas, 'error': str o None,
+            'samples': {'cold': [ms], 'warm': [ms]}}
+    """
+    cold_ms, warm_ms, error = [], [], None
+    try:
+        for repetition in range(cold):
+            result = measure(case, warm if repetition == 0 else 0)
+            cold_ms.append(result['cold_ms'])
+            warm_ms += result['warm_ms']
+    except (RuntimeError, subprocess.TimeoutExpired) as e:
+        error = str(e)
+    return {
+        'cold': summarize(cold_ms), 'warm': summarize(warm_ms), 'error': error,
+        'samples': {'cold': cold_ms, 'warm': warm_ms},
+    }
+
+
+# === PRESUPUESTOS ===
+
+def load_budgets(path=BUDGETS_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'percentile': BUDGET_PERCENTILE, 'cases': {}}
+
+
+def _budget_from(stats):
+    """Presupuesto holgado a partir de las estadísticas medidas (redondeado hacia arriba)"""
+    if stats is None:
+        return None
+    value = max(stats['p95'] * BUDGET_MARGIN, BUDGET_FLOOR_MS)
+    step = 10 if value < 1000 else 100
+    return int(math.ceil(value / step) * step)
+
+
+def update_budgets(results, path=BUDGETS_PATH):
+    """Fija el presupuesto de los casos medidos sin error (conserva el resto)"""
+    budgets = load_budgets(path)
+    budgets.setdefault('percentile', BUDGET_PERCENTILE)
+    cases = budgets.setdefault('cases', {})
+    for name, result in results.items():
+        if result['error'] is None:
+            cases[name] = {'cold_ms': _budget_from(result['cold']), 'warm_ms': _budget_from(result['warm'])}
+    budgets['cases'] = dict(sorted(cases.items()))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(budgets, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    return path
+
+
+def check_budgets(results, budgets, known_errors=None):
+    """
+    Compara cada caso con su presupuesto
+
+    Los errores de known_errors (caso -> motivo) no cuentan como fallo.
+
+    Returns:
+        dict: Caso -> lista de fallos (vacía si cumple)
+    """
+    key = f"p{budgets.get('percentile', BUDGET_PERCENTILE)}"
+    failures = {}
+    for name, result in results.items():
+        problems = []
+        budget = budgets.get('cases', {}).get(name)
+        if result['error'] is not None:
+            if name not in (known_errors or {}):
+                problems.append(f"error: {result['error']}")
+        elif budget is None:
+            problems.append("sin presupuesto")
+        else:
+            for mode in ('cold', 'warm'):
+                stats, limit = result[mode], budget.get(f"{mode}_ms")
+                if stats is not None and limit is not None and stats[key] > limit:
+                    problems.append(f"{mode} {key} {stats[key]:.0f} ms > {limit} ms")
+        failures[name] = problems
+    return failures
+
+
+# === INFORME ===
+
+def _fmt(stats, key):
+    return f"{stats[key]:>8.1f}" if stats is not None else f"{'-':>8}"
+
+
+def print_report(cases, results, failures, budgets):
+    key = f"p{budgets.get('percentile', BUDGET_PERCENTILE)}"
+    print(f"\n{'Caso':<78} {'Grupo':<8} {'frío p50':>8} {'frío p95':>8} {'cal. p50':>8} {'cal. p95':>8} "
+          f"{'presup.':>15}  Estado")
+    print('-' * 150)
+    for case in cases:
+        result = results[case.name]
+        budget = budgets.get('cases', {}).get(case.name, {})
+        limits = f"{budget.get('cold_ms', '-')}/{budget.get('warm_ms', '-')}" if budget else '-'
+        if failures[case.name]:
+            status = '⚠️ ' + '; '.join(failures[case.name])
+        elif result['error'] is not None:
+            status = f"⏩ error conocido: {case.known_error}"
+        else:
+            status = '✅'
+        print(f"{case.name[:78]:<78} {case.group:<8} {_fmt(result['cold'], 'p50')} {_fmt(result['cold'], 'p95')} "
+              f"{_fmt(result['warm'], 'p50')} {_fmt(result['warm'], 'p95')} {limits:>15}  {status}")
+    print(f"\nTiempos en ms; presupuesto frío/caliente en ms sobre el {key}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-k', dest='pattern', help='Solo los casos cuyo nombre contiene este patrón (regex)')
+    parser.add_argument('--group', choices=('loader', 'builder', 'render'), help='Solo un grupo de casos')
+    parser.add_argument('--cold', type=int, default=3, help='Repeticiones en frío (un proceso nuevo cada una)')
+    parser.add_argument('--warm', type=int, default=5, help='Repeticiones en caliente')
+    parser.add_argument('--json', help='Guarda los resultados en este fichero')
+    parser.add_argument('--no-log', action='store_true', help='No guardar la ejecución en benchmarks/history/suite/')
+    parser.add_argument('--update-budgets', action='store_true',
+                        help=f'Fija el presupuesto de los casos medidos (p95 x {BUDGET_MARGIN})')
+    parser.add_argument('--list', action='store_true', help='Lista los casos y termina')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.warm)
+        return
+
+    cases = all_cases()
+    if args.group:
+        cases = [case for case in cases if case.group == args.group]
+    if args.pattern:
+        cases = [case for case in cases if re.search(args.pattern, case.name)]
+    if args.list:
+        for case in cases:
+            print(f"{case.group:<8} {case.name}")
+        return
+
+    filtered = bool(args.group or args.pattern)
+    if not filtered:
+        uncovered = sorted(instrumented_targets() - {case.target for case in cases})
+        if uncovered:
+            print(f"⚠️ Loaders o builders sin caso de benchmark: {', '.join(uncovered)}")
+            sys.exit(1)
+    skipped = skipped_datasets()
+    if skipped:
+        print(f"⏩ {len(skipped)} datasets de los enums no están en data/ y no se miden")
+
+    print(f"🔥 {len(cases)} casos: {args.cold} repeticiones en frío y {args.warm} en caliente")
+    results = {}
+    start = time.perf_counter()
+    for i, case in enumerate(cases, 1):
+        results[case.name] = run_case(case, args.cold, args.warm)
+        cold = results[case.name]['cold']
+        marker = ('⏩' if case.known_error else '⚠️') if results[case.name]['error'] else '✅'
+        print(f"{marker} [{i}/{len(cases)}] {case.name}"
+              + (f" ({cold['p50']:.0f} ms en frío)" if cold else ''), flush=True)
+    print(f"Medido en {time.perf_counter() - start:.0f}s")
+
+    if args.update_budgets:
+        print(f"📦 Presupuestos actualizados en {update_budgets(results)}")
+
+    budgets = load_budgets()
+    known_errors = {case.name: case.known_error for case in cases if case.known_error}
+    failures = check_budgets(results, budgets, known_errors)
+    print_report(cases, results, failures, budgets)
+
+    record = run_record(
+        'suite', cold=args.cold, warm=args.warm, groups={case.name: case.group for case in cases},
+        known_errors=known_errors, results=results, failures=failures,
+    )
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2, ensure_ascii=False)
+    if not args.no_log:
+        print(f"📦 Ejecución guardada en {os.path.relpath(save_run(record), ROOT)}")
+
+    failed = [name for name, problems in failures.items() if problems]
+    if failed:
+        print(f"\n⚠️ {len(failed)} casos fuera de presupuesto o con error")
+        sys.exit(1)
+    print(f"\n✅ Todos los casos dentro de presupuesto")
+
+
+if __name__ == '__main__':
+    main()
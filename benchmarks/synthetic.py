@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Generador de Excels sintéticos con la estructura de EUROSTUDENT
+Escribe ficheros con la misma cabecera de tres filas que leen
+read_work_impact_dataset, read_work_study_relationship_dataset,
+read_demographic_dataset_detailed y compañía: fila 0 con 'Country' y la
+etiqueta de cada grupo (ej: 'Female') al inicio de sus columnas, fila 1 con
+la etiqueta de cada nivel de respuesta y fila 2 con los tripletes
+Value/Unit/Count; después una fila por país. El número de países (filas) y
+de grupos es configurable para medir cómo escalan loaders y builders.
+
+Con --template se copian las etiquetas de grupos y niveles y los países de
+un Excel de data/: a tamaño 1x el fichero es equivalente al original, y al
+escalar se añaden regiones sintéticas y grupos numerados.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.synthetic salida.xlsx --countries 300 --groups 3
+    python -m benchmarks.synthetic salida.xlsx --template data/preprocessed_excels/E8_work_motive_afford_study_5__e_sex__all_contries.xlsx --countries 2000
+"""
+
+import argparse
+import random
+
+import pandas as pd
+
+# Límite de columnas de una hoja de Excel (XFD)
+EXCEL_MAX_COLUMNS = 16384
+
+# Columnas por nivel de respuesta y marca de dato no disponible de EUROSTUDENT
+TRIPLET = ('Value', 'Unit', 'Count')
+MISSING_VALUE = 'n. a.'
+
+DEFAULT_LEVELS = ('Applies totally', 2, 3, 4, 'Does not apply at all')
+
+
+def read_layout(path):
+    """
+    Estructura de un Excel de EUROSTUDENT
+
+    Returns:
+        dict: countries (códigos de la columna 0), groups (etiquetas de la
+            fila 0) y levels (etiquetas de nivel del primer grupo, fila 1)
+    """
+    df = pd.read_excel(path, header=None)
+    groups = [label for label in df.iloc[0, 1:].tolist() if not pd.isna(label)]
+    columns_per_group = (df.shape[1] - 1) // max(len(groups), 1)
+    levels = df.iloc[1, 1:1 + columns_per_group:len(TRIPLET)].tolist()
+    countries = [code for code in df.iloc[3:, 0].tolist() if not pd.isna(code)]
+    return {'countries': countries, 'groups': groups, 'levels': levels}
+
+
+def scale_labels(labels, count, synthetic):
+    """Las etiquetas originales y, hasta count, etiquetas sintéticas numeradas (synthetic.format(i))"""
+    labels = list(labels[:count])
+    i = 1
+    while len(labels) < count:
+        label = synthetic.format(i)
+        if label not in labels:
+            labels.append(label)
+        i += 1
+    return labels
+
+
+def synthetic_rows(countries, groups, levels, seed=0, missing_rate=0.02):
+    """
+    Filas de datos: por país y grupo, porcentajes de cada nivel que suman 100
+    (Value), la unidad ('%') y el recuento de respuestas (Count)
+
+    Una fracción missing_rate de los tripletes se marca como no disponible,
+    como en los Excels reales.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for country in countries:
+        row = [country]
+        for _ in groups:
+            respondents = rng.randint(100, 12000)
+            weights = [rng.random() + 0.05 for _ in levels]
+            total = sum(weights)
+            for weight in weights:
+                if rng.random() < missing_rate:
+                    row += [MISSING_VALUE, '%', MISSING_VALUE]
+                    continue
+                value = round(100 * weight / total, 1)
+                row += [value, '%', round(respondents * value / 100)]
+        rows.append(row)
+    return rows
+
+
+def write_workbook(path, countries, groups, levels=DEFAULT_LEVELS, seed=0, missing_rate=0.02):
+    """
+    Escribe un Excel con la cabecera de tres filas de EUROSTUDENT
+
+    Args:
+        path (str): Fichero .xlsx de salida
+        countries (list): Códigos de país (una fila de datos cada uno)
+        groups (list): Etiquetas de los grupos (ej: ['Female', 'Male'])
+        levels (list): Etiquetas de los niveles de respuesta de cada grupo
+        seed (int): Semilla de los valores (mismo fichero con la misma semilla)
+        missing_rate (float): Fracción de tripletes no disponibles ('n. a.')
+
+    Returns:
+        tuple: (filas, columnas) de la hoja
+    """
+    columns = 1 + len(groups) * len(levels) * len(TRIPLET)
+    if columns > EXCEL_MAX_COLUMNS:
+        raise ValueError(f"{columns} columnas superan el límite de Excel ({EXCEL_MAX_COLUMNS})")
+
+    group_row, level_row, triplet_row = ['Country'], [None], [None]
+    for group in groups:
+        for i, level in enumerate(levels):
+            group_row += [group if i == 0 else None, None, None]
+            level_row += [level, None, None]
+            triplet_row += list(TRIPLET)
+
+    rows = [group_row, level_row, triplet_row] + synthetic_rows(countries, groups, levels, seed, missing_rate)
+    pd.DataFrame(rows).to_excel(path, header=False, index=False)
+    return len(rows), columns
+
+
+def scaled_workbook(path, template, countries_factor=1, groups_factor=1, seed=0):
+    """
+    Escribe un Excel con la estructura de template y factor veces más países o grupos
+
+    Las filas añadidas son regiones sintéticas ('R00001', ...) y los grupos
+    añadidos repiten la etiqueta del primero numerada.
+
+    Returns:
+        tuple: (filas, columnas) de la hoja
+    """
+    layout = read_layout(template)
+    countries = scale_labels(layout['countries'], len(layout['countries']) * countries_factor, 'R{:05d}')
+    groups = scale_labels(layout['groups'], len(layout['groups']) * groups_factor,
+                          f"{layout['groups'][0]} {{}}")
+    return write_workbook(path, countries, groups, layout['levels'], seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output', help='Fichero .xlsx de salida')
+    parser.add_argument('--template', help='Excel de data/ del que copiar grupos, niveles y países')
+    parser.add_argument('--countries', type=int, help='Número de países (filas de datos)')
+    parser.add_argument('--groups', type=int, help='Número de grupos (bloques de niveles)')
+    parser.add_argument('--seed', type=int, default=0, help='Semilla de los valores')
+    parser.add_argument('--missing-rate', type=float, default=0.02, help="Fracción de tripletes 'n. a.'")
+    args = parser.parse_args()
+
+    layout = read_layout(args.template) if args.template else {
+        'countries': [], 'groups': ['All students'], 'levels': list(DEFAULT_LEVELS),
+    }
+    countries = scale_labels(layout['countries'], args.countries or len(layout['countries']) or 30, 'R{:05d}')
+    groups = scale_labels(layout['groups'], args.groups or len(layout['groups']), f"{layout['groups'][0]} {{}}")
+    try:
+        rows, columns = write_workbook(args.output, countries, groups, layout['levels'], args.seed, args.missing_rate)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"✅ {args.output}: {rows} filas x {columns} columnas ({len(countries)} países, {len(groups)} grupos)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Compilación de los recursos estáticos
+Genera en static/build/ las variantes redimensionadas AVIF/WebP/PNG de las
+imágenes de assets/, la hoja de estilos global y la copia de plotly.js de las
+vistas enlazadas, con la huella del contenido en el nombre, y el manifiesto
+que usa la aplicación para los srcset.
+
+Uso (desde la raíz del proyecto):
+    python build_assets.py
+    python build_assets.py --force
+"""
+
+import argparse
+import time
+
+from modules.core.logging_config import configure_logging
+from modules.ui.static_assets import BUILD_DIR, asset_report, build_assets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--force', action='store_true', help='Regenerar todas las imágenes')
+    args = parser.parse_args()
+
+    configure_logging()
+    start = time.perf_counter()
+    manifest = build_assets(force=args.force)
+    print(asset_report(manifest))
+    print(f"✅ Recursos compilados en {BUILD_DIR} en {time.perf_counter() - start:.1f}s "
+          f"(hoja de estilos: {manifest['stylesheet']})")
+
+
+if __name__ == '__main__':
+    main()
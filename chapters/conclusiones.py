@@ -0,0 +1,349 @@
+"""
+Capítulo 5: Conclusiones y reflexiones
+"""
+
+import streamlit as st
+
+from modules.ui.static_assets import render_image
+
+st.markdown(
+    '<h2 class="section-header" id="conclusiones-y-reflexiones">Conclusiones y Reflexiones</h2>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    '<h3 class="subsection-header">💡 Hallazgos principales</h3>',
+    unsafe_allow_html=True,
+)
+
+
+st.markdown("#### 1. Presión económica generalizada en Europa")
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    try:
+        img_col1, img_col2, img_col3 = st.columns([1, 0.5, 1])
+        with img_col1:
+            render_image(
+                "assets/images/1_of_2_students_work.png",
+                width=500,
+                caption="1 de cada 2 estudiantes trabaja",
+            )
+    except Exception as e:
+        st.warning("No se pudo cargar la imagen: images/1_of_2_students_work.png")
+
+
+    st.markdown(
+        """
+            <div class="stat-label" style="text-align: center; font-size: 1.2rem; margin-top: 1rem;">
+            <span class="stat-number stat-europe" style="font-size: 4rem; text-align: center;">57%</span>
+                 de estudiantes españoles necesitan trabajar para costear estudios
+            </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+with col2:
+    st.markdown(
+        """
+        <div class="warning-box">
+            <h4>Problemática identificada</h4>
+            <p>Más de la <strong>mitad de los estudiantes europeos</strong> necesita trabajar para costear estudios. En España, aunque ligeramente menor que la media europea, esto implica que <strong>millones de jóvenes no pueden dedicarse exclusivamente a su formación</strong>.</p>
+            <ul>
+                <li>La falta de becas suficientes obliga a trabajar</li>
+                <li>Alto coste de emancipación estudiantil</li>
+                <li>Desigualdad en el acceso a la educación</li>
+            </ul>
+        </div>
+        
+        <div class="conclusion-box">
+            <h4>Soluciones propuestas</h4>
+            <ul>
+                <li><strong>Ampliar sistemas de becas:</strong> Cobertura más universal y montos más altos</li>
+                <li><strong>Apoyo para emancipación:</strong> Residencias estudiantiles subvencionadas</li>
+                <li><strong>Políticas coordinadas EU:</strong> Estándares mínimos de apoyo estudiantil</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+st.markdown('<div style="height: 2rem;"></div>', unsafe_allow_html=True)
+
+st.markdown(
+    "#### 2. Desigualdades por perfil demográfico y beneficios del trabajo especializado"
+)
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    try:
+        img_col1, img_col2, img_col3 = st.columns([1, 0.5, 1])
+        with img_col1:
+            render_image(
+                "assets/images/oldest_students_help.png",
+                width=600,
+                caption="Estudiantes mayores necesitan más apoyo",
+            )
+    except Exception as e:
+        st.warning("No se pudo cargar la imagen: images/oldest_students_help.png")
+
+
+with col2:
+    st.markdown(
+        """
+        <div class="warning-box">
+            <h4>Problemática identificada</h4>
+            <p><strong>Grandes desigualdades según perfil del estudiante:</strong></p>
+            <ul>
+                <li><strong>Por campo:</strong> Ciencias Naturales 75.3% vs Salud con menor necesidad</li>
+                <li><strong>Por edad:</strong> Mayores de 25 años con 91.2% de necesidad en España</li>
+                <li><strong>Acceso desigual:</strong> Pocos estudiantes acceden a trabajo relacionado con estudios</li>
+            </ul>
+            <p>Esto perpetúa desigualdades estructurales en el sistema educativo.</p>
+        </div>
+        
+        <div class="conclusion-box">
+            <h4>Soluciones propuestas</h4>
+            <ul>
+                <li><strong>Becas específicas por área:</strong> Apoyo especial para campos más vulnerables</li>
+                <li><strong>Programas trabajo-estudio:</strong> Fomentar empleos relacionados con la formación</li>
+                <li><strong>Apoyo estudiantes adultos:</strong> Flexibilidad y ayudas para mayores de 25</li>
+                <li><strong>Colaboración universidad-empresa:</strong> Crear más oportunidades formativas</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+st.markdown('<div style="height: 2rem;"></div>', unsafe_allow_html=True)
+
+st.markdown("#### 3. Igualdad de género en la necesidad de trabajar")
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    try:
+        img_col1, img_col2, img_col3 = st.columns([1, 0.5, 1])
+        with img_col1:
+            render_image(
+                "assets/images/equality_gender_students.png",
+                width=500,
+                caption="Igualdad de género en necesidad de trabajar",
+            )
+    except Exception as e:
+        st.warning("No se pudo cargar la imagen: images/equality_gender_students.png")
+    
+
+with col2:
+    st.markdown(
+        """
+        <div class="insight-box">
+            <h4>Hallazgo positivo</h4>
+            <p><strong>La necesidad económica trasciende las diferencias de género.</strong> Tanto hombres como mujeres enfrentan presiones similares para trabajar mientras estudian.</p>
+            <ul>
+                <li>No hay brecha de género en necesidad económica</li>
+                <li>Ambos géneros igualmente vulnerables</li>
+            </ul>
+        </div>
+
+        """,
+        unsafe_allow_html=True,
+    )
+
+st.markdown('<div style="height: 2rem;"></div>', unsafe_allow_html=True)
+
+st.markdown("#### 4. Crisis de la emancipación estudiantil")
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    try:
+        img_col1, img_col2, img_col3 = st.columns([1, 0.5, 1])
+        with img_col1:
+            render_image(
+                "assets/images/rent_problem_student.png",
+                width=500,
+                caption="Crisis de emancipación estudiantil",
+            )
+    except Exception as e:
+        st.warning("No se pudo cargar la imagen: images/rent_problem_student.png")
+    
+ 
+
+with col2:
+    st.markdown(
+        """
+        <div class="danger-box">
+            <h4>Crisis crítica identificada</h4>
+            <p><strong>La emancipación se ha vuelto un lujo inaccesible</strong> para muchos estudiantes españoles:</p>
+            <ul>
+                <li><strong>Costes prohibitivos:</strong> Alquiler + manutención + tasas universitarias</li>
+                <li><strong>Becas insuficientes:</strong> No cubren gastos reales de vida independiente</li>
+                <li><strong>Geografía penaliza:</strong> Estudiantes de provincias forzados a emigrar</li>
+                <li><strong>Desigualdad territorial:</strong> Especialmente grave en comunidades insulares</li>
+            </ul>
+        </div>
+        
+        <div class="conclusion-box">
+            <h4>Soluciones urgentes</h4>
+            <ul>
+                <li><strong>Residencias estudiantiles públicas:</strong> Inversión masiva en alojamiento universitario</li>
+                <li><strong>Becas de emancipación:</strong> Ayudas específicas para gastos de vivienda</li>
+                <li><strong>Descentralización universitaria:</strong> Más centros en provincias</li>
+                <li><strong>Regulación alquileres:</strong> Control de precios en zonas universitarias</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+st.markdown('<div style="height: 2rem;"></div>', unsafe_allow_html=True)
+
+st.markdown("#### 5. Desconexión entre trabajo y formación")
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    try:
+        img_col1, img_col2, img_col3 = st.columns([1, 0.5, 1])
+        with img_col1:
+            render_image(
+                "assets/images/not_related_jobs_student.png",
+                width=500,
+                caption="Trabajos no relacionados con estudios",
+            )
+    except Exception as e:
+        st.warning("No se pudo cargar la imagen: images/not_related_jobs_student.png")
+    
+    st.markdown(
+        """
+            <div class="stat-label" style="text-align: center; font-size: 1.1rem; margin-top: 1rem;">
+                <span class="stat-number stat-warning" style="font-size: 3.5rem;">45.4%</span> de estudiantes españoles que trabajan lo hacen en empleos NO relacionados
+                vs. 37.7% promedio europeo
+            </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+with col2:
+    st.markdown(
+        """
+        <div class="warning-box">
+            <h4>Oportunidad perdida masiva</h4>
+            <p><strong>Casi la mitad del trabajo estudiantil en España es "supervivencia" en lugar de "formación":</strong></p>
+            <ul>
+                <li><strong>Pérdida de valor formativo:</strong> Trabajo no aporta a desarrollo profesional</li>
+                <li><strong>Competitividad futura:</strong> Graduados con menos experiencia relevante</li>
+                <li><strong>Desmotivación académica:</strong> Desconexión entre realidad laboral y estudios</li>
+                <li><strong>Círculo vicioso:</strong> Necesidad económica impide elegir trabajos formativos</li>
+            </ul>
+        </div>
+        
+        <div class="conclusion-box">
+            <h4>Transformación necesaria</h4>
+            <ul>
+                <li><strong>Programas de prácticas remuneradas:</strong> Expandir oportunidades formativas pagadas</li>
+                <li><strong>Colaboración universidad-empresa:</strong> Crear más empleos alineados con estudios</li>
+                <li><strong>Flexibilidad académica:</strong> Horarios compatibles con trabajo formativo</li>
+                <li><strong>Incentivos empresariales:</strong> Beneficios fiscales por contratar estudiantes</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+st.markdown('<div style="height: 2rem;"></div>', unsafe_allow_html=True)
+
+st.markdown("#### 6. El coste del trabajo no relacionado en bienestar y rendimiento")
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    try:
+        img_col1, img_col2, img_col3 = st.columns([1, 0.5, 1])
+        with img_col1:
+            render_image(
+                "assets/images/health_problems_student.png",
+                width=500,
+                caption="Problemas de salud y bienestar estudiantil",
+            )
+    except Exception as e:
+        st.warning("No se pudo cargar la imagen: images/health_problems_student.png")
+    
+ 
+with col2:
+    st.markdown(
+        """
+        <div class="danger-box">
+            <h4>Impacto grave en bienestar</h4>
+            <p><strong>El trabajo no relacionado con estudios tiene consecuencias serias:</strong></p>
+            <ul>
+                <li><strong>Menor felicidad:</strong> 3.47 vs 3.79 en trabajos relacionados</li>
+                <li><strong>Riesgo de abandono:</strong> Consideran dejar estudios por presión económica</li>
+                <li><strong>Peor rendimiento percibido:</strong> Se sienten menos competentes académicamente</li>
+                <li><strong>Estrés y fatiga:</strong> Doble carga sin beneficio formativo</li>
+            </ul>
+        </div>
+        
+        <div class="conclusion-box">
+            <h4>Mejora integral necesaria</h4>
+            <ul>
+                <li><strong>Conexión universidad-empresa:</strong> Puentes efectivos para empleos formativos</li>
+                <li><strong>Apoyo psicológico:</strong> Servicios de bienestar estudiantil</li>
+                <li><strong>Flexibilidad académica:</strong> Adaptación a estudiantes trabajadores</li>
+                <li><strong>Indicadores de calidad:</strong> Medir impacto del trabajo en experiencia educativa</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+st.markdown('<div style="height: 2rem;"></div>', unsafe_allow_html=True)
+
+st.markdown("#### 7. Desigualdad estructural en el acceso a la educación")
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    try:
+        img_col1, img_col2, img_col3 = st.columns([1, 0.5, 1])
+        with img_col1:
+            render_image(
+                "assets/images/general_problems_students.png",
+                width=500,
+                caption="Problemas estructurales del sistema educativo",
+            )
+    except Exception as e:
+        st.warning("No se pudo cargar la imagen: images/general_problems_students.png")
+    
+    
+
+with col2:
+    st.markdown(
+        """
+        <div class="danger-box">
+            <h4>Inequidad sistémica</h4>
+            <p><strong>El sistema perpetúa desigualdades profundas:</strong></p>
+            <ul>
+                <li><strong>Por edad:</strong> Estudiantes adultos casi abandonados por el sistema</li>
+                <li><strong>Por campo:</strong> Áreas científicas penalizadas vs áreas de salud</li>
+                <li><strong>Por origen:</strong> Clase socioeconómica determina oportunidades</li>
+                <li><strong>Por geografía:</strong> Estudiantes rurales/insulares más vulnerables</li>
+            </ul>
+            <p><em>La meritocracia se ve comprometida por factores estructurales.</em></p>
+        </div>
+        
+        <div class="conclusion-box">
+            <h4>Reforma estructural</h4>
+            <ul>
+                <li><strong>Universalidad del derecho:</strong> Educación superior como derecho garantizado</li>
+                <li><strong>Discriminación positiva:</strong> Apoyos específicos para grupos vulnerables</li>
+                <li><strong>Inversión pública masiva:</strong> Financiación adecuada del sistema</li>
+                <li><strong>Coordinación europea:</strong> Estándares mínimos de equidad educativa</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
@@ -0,0 +1,181 @@
+"""
+Capítulo 1: Introducción y contexto europeo
+"""
+
+import streamlit as st
+
+from modules.core.countries import country_name
+from modules.ui.layout import create_stats_display, focus_country, show_chart_placeholder
+from modules.ui.warm_cache import get_shared
+
+country = focus_country()
+
+st.markdown(
+    '<h1 class="main-header">Trabajar y estudiar en Europa:<br>¿Oportunidad, sacrificio o desigualdad?</h1>',
+    unsafe_allow_html=True,
+)
+st.markdown(
+    '<h2 class="section-header" id="introduccion-y-contexto-europeo">Introducción y Contexto Europeo</h2>',
+    unsafe_allow_html=True,
+)
+intro_stats = [
+    {
+        "number": "50%",
+        "label": "Estudiantes europeos que trabajan mientras estudian",
+        "color": "stat-europe",
+    },
+    {"number": "25", "label": "Países europeos analizados", "color": "stat-europe"},
+    {
+        "number": "9,072",
+        "label": "Estudiantes españoles en el estudio",
+        "color": "stat-spain",
+    },
+]
+
+create_stats_display(intro_stats)
+
+st.markdown(
+    """
+La Unión Europea es considerada un referente internacional en educación superior, con más de 17,5 millones de estudiantes universitarios y numerosos programas de movilidad e innovación educativa. Sin embargo, detrás de estas cifras positivas, existen retos importantes que afectan la experiencia y el futuro académico de miles de jóvenes. Factores como la necesidad de trabajar para costearse los estudios, las diferencias socioeconómicas y la modalidad de enseñanza pueden marcar una diferencia crucial en el rendimiento, la salud y las oportunidades de los estudiantes.
+
+En este análisis, exploramos el equilibrio entre trabajo y estudios en Europa, teniendo como foco principal España: ¿es una oportunidad para crecer profesionalmente, o una barrera que limita el acceso y el éxito académico? A través de datos comparativos de diferentes países, identificamos tendencias, desigualdades y áreas de mejora clave para lograr una educación realmente inclusiva y competitiva."""
+)
+
+st.markdown(
+    """
+<div class="insight-box">
+    <h4>Lo que descubrirás en este análisis</h4>
+    <ul>
+        <li><strong>¿Quiénes trabajan y por qué?</strong> Perfil demográfico y motivos de los estudiantes que compaginan empleo y estudios en 25 países europeos.</li>
+        <li><strong>¿Es igual para todos?</strong> Diferencias por género, edad, situación económica y campo de estudio, con foco en las desigualdades.</li>
+        <li><strong>¿Qué supone trabajar?</strong> Impacto en el rendimiento académico, el bienestar y la felicidad.</li>
+        <li><strong>¿Trabajo útil o solo por necesidad?</strong> Relación entre el empleo de los estudiantes y sus estudios, con el caso especial de España.</li>
+        <li><strong>¿Qué riesgos y oportunidades existen?</strong> Factores de abandono, beneficios y desventajas según los datos.</li>
+        <li><strong>¿Cómo mejorar?</strong> Recomendaciones y reflexiones finales para estudiantes, instituciones y responsables políticos.</li>
+    </ul>
+</div>
+""",
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    '<h3 class="subsection-header">Panorama Europeo: ¿Quiénes necesitan trabajar?</h3>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+Antes de profundizar en las características específicas, veamos el panorama general europeo de la 
+**necesidad de trabajar para costear estudios** por país. Este gráfico muestra la proporción de 
+estudiantes que necesitan vs. no necesitan trabajar en cada país europeo.
+"""
+)
+
+try:
+    st.markdown("#### Necesidad de Trabajar para Costear Estudios por País")
+
+    fig_need_work = get_shared("chart_need_vs_no_need", country)
+
+    if fig_need_work:
+        st.plotly_chart(
+            fig_need_work, use_container_width=True, key="chart_need_vs_no_need"
+        )
+
+        insights = get_shared("key_insights", country)
+
+        if "error" not in insights:
+            work_necessity_stats = [
+                {
+                    "number": f"{insights['spain_need_work']:.1f}%",
+                    "label": f"Estudiantes de {country_name(country)} necesitan trabajar",
+                    "color": "stat-spain",
+                },
+                {
+                    "number": f"{insights['europe_need_work']:.1f}%",
+                    "label": "Promedio europeo necesita trabajar",
+                    "color": "stat-europe",
+                },
+                {
+                    "number": f"{insights['difference']:+.1f}pp",
+                    "label": f"Diferencia {country_name(country)} vs Europa",
+                    "color": (
+                        "stat-warning"
+                        if insights["difference"] > 0
+                        else "stat-positive"
+                    ),
+                },
+            ]
+
+            create_stats_display(work_necessity_stats)
+            st.markdown(
+                f"""
+            <div class="insight-box">
+                <h4>🔍 Análisis del panorama europeo</h4>
+                <ul>
+                    <li><strong>País con menor necesidad:</strong> {insights['min_country']} ({insights['min_percentage']:.1f}%)</li>
+                    <li><strong>País con mayor necesidad:</strong> {insights['max_country']} ({insights['max_percentage']:.1f}%)</li>
+                </ul>
+                <p>El 57% de los estudiantes españoles necesita trabajar para costear sus estudios, una cifra ligeramente inferior al promedio europeo (59.1%). Aunque esta diferencia parece pequeña, implica que <strong>más de la mitad de los universitarios en España compaginan trabajo y estudios</strong>, lo que puede tener un impacto en su rendimiento académico y bienestar personal.
+
+La realidad europea es muy heterogénea: en países como Azerbaiyán, solo un 30.7% de estudiantes necesita trabajar, probablemente por un mayor apoyo estatal o un menor coste de vida. En el otro extremo, en Islandia el 83% debe hacerlo, reflejando posiblemente una menor cobertura de becas o costes de vida elevados.
+
+¿Qué implicaciones tiene para la equidad y la calidad educativa esta gran disparidad? ¿Podría España aspirar a reducir todavía más la necesidad de trabajar entre sus estudiantes, acercándose a los países más "protegidos"? ¿Cómo afecta esto a la experiencia universitaria y al futuro profesional de los jóvenes? Estas preguntas nos invitan a reflexionar sobre el papel de las políticas públicas y el apoyo institucional en la vida del estudiantado.</p>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
+        else:
+            st.warning("No se pudieron obtener insights automáticos del gráfico")
+    else:
+        show_chart_placeholder(
+            "Necesidad de Trabajar por País", "Error generando gráfico principal"
+        )
+
+except Exception as e:
+    st.error(f"Error cargando gráfico principal de necesidad de trabajar: {e}")
+    show_chart_placeholder(
+        "Error: Necesidad de Trabajar por País",
+        "Error cargando datos del storytelling_module",
+    )
+
+st.markdown(
+    f'<h3 class="subsection-header">{country_name(country)} vs Europa: Comparación Directa de Motivos para Trabajar</h3>',
+    unsafe_allow_html=True,
+)
+
+try:
+    fig_spain_europe = get_shared("chart_spain_vs_europe", country)
+
+    if fig_spain_europe:
+        st.plotly_chart(
+            fig_spain_europe,
+            use_container_width=True,
+            key="chart_spain_vs_europe_detailed",
+        )
+
+        st.markdown(
+            """
+        <div class="insight-box">
+            <h3>Puntos clave España vs Europa</h3>
+            <ul>
+                <li><strong>42,4%</strong> de los alumnos españoles se plantean seriamente tener que trabajar para poder pagar sus estudios, una cifra superior al <strong>38%</strong> del promedio europeo.</li>
+                <li>Por otro lado, <strong>34,8%</strong> consideran que no necesitarán trabajar para costearse sus estudios, lo cual también supera al promedio europeo del <strong>30%</strong>.</li>
+                <li><strong>Dato relevante:</strong> cerca del <strong>57%</strong> de los estudiantes españoles trabajan, y uno de los motivos principales es poder costear sus estudios. Esto refleja que, aunque existen ayudas gubernamentales, una parte considerable de los estudiantes no recibe el apoyo suficiente.</li>
+            </ul>
+            <p>
+                <em>Estudiar, para muchos, deja de ser una elección libre y pasa a depender del trabajo como única vía para hacerlo posible.</em>
+            </p>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+    else:
+        show_chart_placeholder(
+            "España vs Europa - Detallado", "Error generando comparación detallada"
+        )
+
+except Exception as e:
+    st.error(f"Error cargando comparación España vs Europa: {e}")
+    show_chart_placeholder(
+        "Error: Comparación España vs Europa", "Error cargando datos detallados"
+    )
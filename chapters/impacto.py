@@ -0,0 +1,296 @@
+"""
+Capítulo 4: Impacto real, consecuencias del trabajo
+"""
+
+import streamlit as st
+
+from modules.core.countries import country_flag, country_name
+from modules.ui.layout import create_stats_display, focus_country, show_chart_placeholder
+from modules.ui.tabbed_figures import render_figure_tabs
+from modules.ui.warm_cache import get_shared
+
+country = focus_country()
+
+st.markdown(
+    '<h2 class="section-header" id="impacto-real-consecuencias-del-trabajo">Impacto Real: Consecuencias del Trabajo</h2>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+**¿Cómo afecta trabajar al rendimiento académico y la experiencia universitaria?**
+
+Esta sección examina el impacto real del trabajo en la vida estudiantil, incluyendo la **consideración de abandono** de estudios y otros efectos sobre el bienestar académico.
+"""
+)
+
+render_figure_tabs(
+    [
+        {
+            "label": "💸 Presión Financiera",
+            "figure": "impact_abandono_financiero",
+            "title": "Abandono por Dificultades Financieras",
+            "description": """
+**¿Con qué frecuencia consideran los estudiantes abandonar sus estudios debido a dificultades económicas?**
+
+Este gráfico muestra la realidad de la presión financiera en la educación europea.
+""",
+            "placeholder": "Abandono por Dificultades Financieras",
+        },
+        {
+            "label": "👔 Conflicto Trabajo-Estudio",
+            "figure": "impact_abandono_trabajo",
+            "title": "Abandono por Necesidad de Trabajar",
+            "description": """
+**¿Consideran los estudiantes abandonar sus estudios para poder trabajar más tiempo?**
+
+Este análisis revela el conflicto directo entre supervivencia económica y continuidad académica.
+""",
+            "placeholder": "Abandono por Necesidad de Trabajar",
+        },
+        {
+            "label": f"{country_flag(country)} {country_name(country)} vs Europa",
+            "figure": "impact_espana_vs_europa",
+            "title": f"{country_name(country)} vs Europa: Comparación Directa",
+            "description": f"""
+**¿Cómo se posiciona {country_name(country)} específicamente en términos de impacto del trabajo en los estudios?**
+
+Comparación directa con el promedio europeo en ambos tipos de consideración de abandono.
+""",
+            "placeholder": f"{country_name(country)} vs Europa - Impacto",
+        },
+    ],
+    key="impact_tabs",
+    country=country,
+)
+
+
+st.markdown(
+    '<h3 class="subsection-header">Percepción Académica Personal</h3>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+**¿Cómo perciben los propios estudiantes que su trabajo afecta su rendimiento académico?**
+
+Se les preguntó a los estudiantes españoles si sentían que tenían un **rendimiento mejor, igual o peor** en comparación con sus **compañeros de clase**.  
+Observamos que, según la **relación con el esfuerzo que dedican al estudio**, las respuestas **difieren drásticamente**.
+"""
+)
+
+try:
+    fig_academic_perception, insights_academic = get_shared("academic_perception")
+
+    if fig_academic_perception and insights_academic:
+        st.plotly_chart(
+            fig_academic_perception,
+            use_container_width=True,
+            key="chart_academic_perception",
+        )
+
+        academic_perception_stats = [
+            {
+                "number": f"{insights_academic['very_closely_better']:.1f}%",
+                "label": "Mejor rendimiento - Trabajo muy relacionado",
+                "color": "stat-positive",
+            },
+            {
+                "number": f"{insights_academic['not_at_all_better']:.1f}%",
+                "label": "Mejor rendimiento - Trabajo nada relacionado",
+                "color": "stat-warning",
+            },
+            {
+                "number": f"+{insights_academic['difference_very_vs_none']:.1f}pp",
+                "label": "Diferencia favorable al trabajo relacionado",
+                "color": "stat-positive",
+            },
+        ]
+
+        create_stats_display(academic_perception_stats)
+
+        st.markdown(
+            f"""
+        <div class="insight-box">
+    <h4>Factores que explican la percepción académica positiva</h4>
+    <p><strong>¿Por qué los estudiantes que trabajan en su sector perciben mejor rendimiento académico?</strong></p>
+    <ul>
+        <li><strong>Aplicación práctica:</strong> Usan lo aprendido en contextos reales, lo que refuerza el conocimiento teórico.</li>
+        <li><strong>Mayor motivación:</strong> Al ver la utilidad directa de los contenidos, aumentan su interés y esfuerzo.</li>
+        <li><strong>Feedback constante:</strong> El trabajo les da retroalimentación continua sobre sus competencias.</li>
+        <li><strong>Habilidades transversales:</strong> Desarrollan comunicación, organización y trabajo en equipo.</li>
+        <li><strong>Red profesional:</strong> El entorno laboral les aporta referentes y apoyo que refuerzan su confianza.</li>
+    </ul>
+    <p><em>Estos factores contribuyen a que quienes trabajan en el sector de lo que estudian se sientan más competentes y seguros en su desempeño académico.</em></p>
+</div>
+        """,
+            unsafe_allow_html=True,
+        )
+
+    else:
+        show_chart_placeholder(
+            "Percepción Académica Personal",
+            "Error cargando datos de percepción académica",
+        )
+
+except Exception as e:
+    st.error(f"Error cargando análisis de percepción académica: {e}")
+    show_chart_placeholder(
+        "Error: Percepción Académica Personal", "Error cargando datos específicos"
+    )
+
+
+st.markdown(
+    '<h3 class="subsection-header">Felicidad y Bienestar: El Factor Emocional</h3>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+**¿Afecta la relación entre trabajo y estudios al bienestar emocional de los estudiantes?**
+
+Se les preguntó a los estudiantes por su **grado de felicidad** en una escala del **1 al 5**.  
+A continuación, observamos los resultados en relación con **cuán relacionado está su trabajo actual con lo que estudiaron**.
+"""
+)
+
+try:
+    fig_happiness, insights_happiness = get_shared("happiness_work_relation")
+
+    if fig_happiness and insights_happiness:
+        st.plotly_chart(
+            fig_happiness, use_container_width=True, key="chart_happiness_work_relation"
+        )
+
+
+        happiness_stats = [
+            {
+                "number": f"{insights_happiness['very_closely_score']:.2f}",
+                "label": "Felicidad promedio - Trabajo muy relacionado",
+                "color": "stat-positive",
+            },
+            {
+                "number": f"{insights_happiness['no_work_score']:.2f}",
+                "label": "Felicidad promedio - Sin trabajo",
+                "color": "stat-warning",
+            },
+            {
+                "number": f"+{insights_happiness['work_vs_no_work_diff']:.2f}",
+                "label": "Diferencia trabajo relacionado vs sin trabajo (1-5)",
+                "color": "stat-positive",
+            },
+        ]
+
+        create_stats_display(happiness_stats)
+
+        st.markdown(
+            f"""
+        <div class="insight-box">
+  <h4>Análisis Impactante</h4>
+  <ul>
+    <li><strong>Los estudiantes con trabajos muy relacionados con sus estudios alcanzan el mayor nivel de felicidad promedio (3.79)</strong>, superando incluso a quienes no trabajan (3.53).</li>
+    <li><strong>A medida que el trabajo se aleja del área de estudio, el nivel de satisfacción disminuye progresivamente</strong>, alcanzando su punto más bajo (3.47) cuando el empleo no está nada relacionado.</li>
+    <li><strong>La diferencia de felicidad entre trabajar en algo muy relacionado y no trabajar es de +0.26 puntos</strong>, lo que indica un impacto positivo notable.</li>
+    <li><strong>No cualquier trabajo aporta bienestar al estudiante; el tipo de empleo importa tanto como su existencia.</strong></li>
+    <li><strong>Conclusión clave:</strong> Integrar el trabajo con la carrera académica no solo enriquece la experiencia formativa, sino que <strong>aumenta el bienestar emocional de los estudiantes</strong>.</li>
+  </ul>
+</div>
+        """,
+            unsafe_allow_html=True,
+        )
+
+    else:
+        show_chart_placeholder(
+            "Felicidad según Relación Trabajo-Estudio",
+            "Error cargando datos de felicidad",
+        )
+
+except Exception as e:
+    st.error(f"Error cargando análisis de felicidad trabajo-estudio: {e}")
+    show_chart_placeholder(
+        "Error: Felicidad según Relación Trabajo-Estudio",
+        "Error cargando datos específicos",
+    )
+
+
+
+st.markdown(
+    '<h3 class="subsection-header">Análisis Visual por Edad: Estudiantes con Trabajos No Relacionados</h3>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+**¿Cómo se distribuye por edad el problema de los trabajos no relacionados con los estudios?**
+"""
+)
+
+try:
+    isotype_result = get_shared("age_isotype")
+
+    if isotype_result["success"] and isotype_result["figure"]:
+        st.plotly_chart(
+            isotype_result["figure"], use_container_width=True, key="age_isotype_chart"
+        )
+
+        insights = isotype_result["insights"]
+
+        if insights and "error" not in insights:
+            isotype_stats = [
+                {
+                    "number": f"{insights['age_data']['< 22 años']:.1f}%",
+                    "label": "Estudiantes < 22 años con trabajo no relacionado",
+                    "color": "stat-danger",
+                },
+                {
+                    "number": f"{insights['age_data']['25-29 años']:.1f}%",
+                    "label": "Estudiantes 25-29 años (menor impacto)",
+                    "color": "stat-positive",
+                },
+                {
+                    "number": f"{insights['age_data']['30+ años']:.1f}%",
+                    "label": "Estudiantes 30+ años",
+                    "color": "stat-warning",
+                },
+            ]
+
+            create_stats_display(isotype_stats)
+            st.markdown(
+                f"""
+            <div class="danger-box">
+                <h4>Patrón Preocupante: Los Más Jóvenes, Más Desconectados y en Mayor Riesgo</h4>
+                <p><strong>¿Por qué los estudiantes más jóvenes trabajan en empleos no relacionados?</strong></p>
+                <ul>
+                    <li>Menor experiencia laboral para encontrar trabajos relacionados</li>
+                    <li>Presión económica inmediata los lleva a aceptar cualquier empleo</li>
+                    <li>Falta de redes profesionales en su campo de estudio</li>
+                    <li>Menor valoración por parte de empleadores de su formación incompleta</li>
+                </ul>
+                <p><strong>Consecuencias en cadena altamente preocupantes:</strong></p>
+                <p>Recordemos que en nuestros análisis anteriores identificamos que <strong>las personas con trabajos menos relacionados con sus estudios se perciben menos felices</strong> (3.47 vs 3.79) y además <strong>se perciben peor académicamente</strong> comparado con sus compañeros de clase.</p>
+                <p><strong>Esto significa que los estudiantes más jóvenes tienen mayor riesgo de:</strong></p>
+                <ul>
+                    <li>Ser infelices durante sus estudios</li>
+                    <li>Percibir peor rendimiento académico</li>
+                    <li>Abandonar prematuramente la educación superior</li>
+                </ul>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
+
+        else:
+            st.warning("No se pudieron generar insights automáticos del isotype")
+
+    else:
+        error_msg = isotype_result.get("error", "Error desconocido")
+        st.error(f"❌ Error cargando isotype de edad: {error_msg}")
+        show_chart_placeholder(
+            "Isotype: Impacto por Edad", "Error cargando datos para el gráfico isotype"
+        )
+
+except Exception as e:
+    st.error(f"Error crítico en sección isotype: {e}")
+    show_chart_placeholder(
+        "Error: Isotype de Edad", "Error crítico cargando el módulo de isotype"
+    )
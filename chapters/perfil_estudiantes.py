@@ -0,0 +1,385 @@
+"""
+Capítulo 2: Perfil completo de los estudiantes que trabajan
+"""
+
+import streamlit as st
+
+from modules.core.countries import country_name
+from modules.ui.layout import create_stats_display, create_text_stats_display, focus_country, show_chart_placeholder
+from modules.ui.warm_cache import get_shared
+
+country = focus_country()
+
+st.markdown(
+    '<h2 class="section-header" id="perfil-completo-de-los-estudiantes-que-trabajan">Perfil Completo de los Estudiantes que Trabajan</h2>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+**¿Quiénes son realmente los estudiantes que necesitan trabajar mientras estudian?** 
+
+No todos los estudiantes tienen la misma probabilidad de trabajar. La realidad europea revela diferencias significativas 
+por país, edad, género, situación familiar y campo de estudio. Esta sección explora el perfil completo de estos estudiantes, 
+desde la perspectiva europea general hasta las características específicas de España.
+"""
+)
+
+col1, col2 = st.columns([1, 2])
+
+with col1:
+    st.markdown("#### Distribución por País")
+    st.markdown(
+        """
+        <div class="insight-box">
+    <h4>Análisis por País</h4>
+    <p>
+        Los costes mensuales de los estudiantes universitarios en Europa varían mucho según el país, influyendo en la necesidad de trabajar para financiar los estudios. Por ejemplo, países como Hungría o Polonia tienen gastos bajos, mientras que Islandia e Irlanda presentan costes elevados. 
+    </p>
+    <p>
+        <strong>España</strong> se sitúa ligeramente por encima de la media europea en gasto mensual (<strong>1.228 €</strong>), pero las becas públicas solo cubren una parte reducida de estos costes, lo que obliga a muchos estudiantes a trabajar.
+    </p>
+    <p>
+        <strong>Conclusión:</strong> La necesidad de trabajar no depende solo del coste de vida, sino también del nivel de apoyo público y las becas disponibles. Países con mejores ayudas permiten que más estudiantes se dediquen plenamente a sus estudios.
+    </p>
+</div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+with col2:
+    try:
+        fig_cost_map = get_shared("cost_heatmap", country)
+
+        if fig_cost_map:
+            st.plotly_chart(
+                fig_cost_map, use_container_width=True, key="chart_europe_cost_heatmap"
+            )
+
+            cost_stats = get_shared("cost_statistics", country)
+
+            if "error" not in cost_stats:
+                cost_display_stats = [
+                    {
+                        "number": f"€{cost_stats['promedio_europa']:,.0f}",
+                        "label": "Promedio Europeo",
+                        "color": "stat-europe",
+                    },
+                    {
+                        "number": f"€{cost_stats.get('coste_espana', 0):,.0f}",
+                        "label": country_name(country),
+                        "color": "stat-spain",
+                    },
+                    {
+                        "number": f"#{cost_stats.get('ranking_espana', 'N/A')}/{cost_stats['total_paises']}",
+                        "label": f"Ranking {country_name(country)}",
+                        "color": "stat-warning",
+                    },
+                ]
+
+                create_stats_display(cost_display_stats)
+
+        else:
+            show_chart_placeholder("Mapa de Costes Europeos", "Error generando mapa")
+
+    except Exception as e:
+        st.error(f"Error cargando mapa de costes: {e}")
+        show_chart_placeholder(
+            "Error en Mapa de Costes", "Error cargando datos de costes"
+        )
+
+st.markdown("<br><br>", unsafe_allow_html=True)
+
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.markdown("#### Distribución por Género")
+    try:
+        fig_gender = get_shared("gender_chart", country)
+        st.plotly_chart(
+            fig_gender, use_container_width=True, key="chart_gender_comparison"
+        )
+    except Exception as e:
+        st.error(f"Error cargando gráfico de género: {e}")
+        show_chart_placeholder(
+            "Error en Distribución por Género", "Error cargando datos"
+        )
+
+with col2:
+    st.markdown(
+        """
+    <div class="insight-box">
+        <h4>Diferencias de género en la necesidad de trabajar</h4>
+        <ul>
+            <li>En terminos generales no se evidencia una diferencia significativa entre hombres y mujeres en la necesidad de trabajar mientras estudian.</li>
+        </ul>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+st.markdown("<br><br>", unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 2])
+
+with col1:
+    st.markdown("#### Distribución por Edad")
+
+    st.markdown(
+        """
+    <div class="insight-box">
+        <h4>Necesidad de Trabajar por Edad (España vs Europa)</h4>
+  <p>
+    El gráfico por edades muestra una tendencia clara: a mayor edad, mayor presión económica sobre los estudiantes, especialmente en España:
+  </p>
+  <ul>
+    <li><strong>Menores de 22 años:</strong> España 21,2 % vs Europa 40,1 %.</li>
+    <li><strong>De 22 a 24 años:</strong> España 38,6 % vs Europa 49,1 %.</li>
+    <li><strong>De 25 a 29 años:</strong> España 75,4 % vs Europa 68,3 %.</li>
+    <li><strong>30 años o más:</strong> España 91,2 % vs Europa 82,0 %.</li>
+  </ul>
+  <p>
+    Esta evolución indica que los <strong>estudiantes adultos en España</strong> enfrentan mayores obstáculos económicos, probablemente debido a la pérdida de acceso a ayudas o el aumento de responsabilidades económicas personales.
+  </p>
+
+</div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+with col2:
+    try:
+        fig_age = get_shared("age_chart", country)
+        st.plotly_chart(fig_age, use_container_width=True, key="chart_age_comparison")
+    except Exception as e:
+        st.error(f"Error cargando gráfico de edad: {e}")
+        show_chart_placeholder("Error en Distribución por Edad", "Error cargando datos")
+
+st.markdown("<br><br>", unsafe_allow_html=True)
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.markdown("#### Situación de Convivencia")
+    try:
+        fig_living = get_shared("living_with_parents_chart", country)
+        st.plotly_chart(
+            fig_living, use_container_width=True, key="chart_living_situation"
+        )
+    except Exception as e:
+        st.error(f"Error cargando gráfico de convivencia: {e}")
+        show_chart_placeholder("Error en Tipo de Convivencia", "Error cargando datos")
+
+with col2:
+    st.markdown(
+        """
+    <div class="insight-box">
+        <h4>Necesidad de Trabajar según la Situación de Vivienda</h4>
+        <p>
+            Esta gráfica muestra claramente cómo la necesidad de trabajar se ve influida por el hecho de vivir o no con los padres, comparando a <strong>España</strong> con el <strong>promedio europeo</strong>:
+        </p>
+        <ul>
+            <li>
+            Entre quienes <strong>viven con sus padres</strong>, la necesidad de trabajar es menor en España (≈36 %) que en Europa (≈43 %), lo que sugiere un mayor grado de apoyo familiar directo en el contexto español.
+            </li>
+            <li>
+            Sin embargo, para los estudiantes que <strong>no viven con sus padres</strong>, la diferencia se invierte y se amplía: en España, el porcentaje que necesita trabajar supera el <strong>75 %</strong>, frente a alrededor del <strong>65 %</strong> en la media europea.
+            </li>
+        </ul>
+        
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+
+st.markdown(
+    """
+<div
+  class="context-box"
+  style="
+    background: #f8f9fa;
+    border-left: 4px solid #007bff;
+    padding: 15px;
+    margin: 20px 0;
+    border-radius: 8px;
+  "
+>
+  <p>
+    Esta diferencia puede explicarse por el
+    <strong>alto coste de la emancipación estudiantil</strong> en España y la
+    limitada cobertura de becas. Además, en muchas regiones, los estudiantes se
+    ven obligados a abandonar su hogar para acceder a estudios superiores.
+  </p>
+  <strong>Ejemplo contextual – Canarias:</strong><br />
+  En comunidades como <strong>Canarias</strong>, numerosos estudiantes se ven
+  forzados a dejar sus islas natales para estudiar en universidades que se
+  ubican únicamente en <strong>Tenerife</strong> o
+  <strong>Gran Canaria</strong>, o incluso en la península. Esta situación
+  implica gastos de alojamiento y manutención que no tendrían si pudieran
+  estudiar desde casa, lo cual incrementa drásticamente su necesidad de ingresos
+  y los obliga a trabajar mientras cursan sus estudios.
+</div>
+
+""",
+    unsafe_allow_html=True,
+)
+
+st.markdown("<br><br>", unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 2])
+
+with col1:
+    st.markdown("#### Necesidad de Trabajar por Área de Estudios")
+
+    st.markdown(
+        """
+    <div class="insight-box">
+    <h4>Campo de estudio</h4>
+    <p>
+        En los campos de estudio, vemos que en España se presenta una clara disparidad en el área de ciencias naturales, matemáticas y estadísticas, donde el 75,3 % de las personas necesitan trabajar, frente al 43,3 % del promedio europeo en la misma área.
+    También se observa una disminución en la necesidad de trabajar entre los estudiantes del ámbito de la salud.
+    </p>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+with col2:
+    try:
+        fig_field = get_shared("field_of_study_chart", country)
+        st.plotly_chart(fig_field, use_container_width=True, key="chart_field_of_study")
+    except Exception as e:
+        st.error(f"Error cargando gráfico de campo de estudio: {e}")
+        show_chart_placeholder("Error en Campo de Estudio", "Error cargando datos")
+
+
+
+st.markdown("<br><br>", unsafe_allow_html=True)
+
+st.markdown("#### Todos los Desgloses")
+st.markdown(
+    f"""
+Elige un desglose en el selector del gráfico para comparar {country_name(country)} con el promedio europeo por género, edad, área de estudios, convivencia, dificultades financieras o situación económica de los padres.
+"""
+)
+
+try:
+    fig_combined = get_shared("combined_demographic_chart", country)
+    st.plotly_chart(
+        fig_combined, use_container_width=True, key="chart_combined_demographics"
+    )
+except Exception as e:
+    st.error(f"Error cargando gráfico de desgloses demográficos: {e}")
+    show_chart_placeholder("Error en Desgloses Demográficos", "Error cargando datos")
+
+st.markdown("<br><br>", unsafe_allow_html=True)
+
+st.markdown(
+    '<h3 class="subsection-header">Trayectoria Académica y Perfil Socioeconómico en España</h3>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+**¿Cómo se conectan las características demográficas de los estudiantes españoles con su situación académica y económica?**
+"""
+)
+
+try:
+    sankey_result = get_shared("sankey")
+
+    if sankey_result["success"] and sankey_result["figure"]:
+        st.plotly_chart(
+            sankey_result["figure"],
+            use_container_width=True,
+            key="sankey_student_journey",
+        )
+
+        insights = sankey_result["insights"]
+
+        if insights and "error" not in insights:
+            sankey_stats = [
+                {
+                    "title": "Perfil Edad",
+                    "text": "Mayoría ≤ 22 años",
+                    "subtext": "Concentrados en Ingeniería y Ciencias Sociales",
+                    "color": "stat-europe",
+                },
+                {
+                    "title": "Perfil Género",
+                    "text": "Ingeniería: Más masculina",
+                    "subtext": "Salud y Sociales: Más femenina",
+                    "color": "stat-spain",
+                },
+                {
+                    "title": "Perfil Ingresos",
+                    "text": "Negocios/Ingeniería → Altos",
+                    "subtext": "Salud/Sociales → Medios/Bajos",
+                    "color": "stat-positive",
+                },
+            ]
+
+            create_text_stats_display(sankey_stats)
+            st.markdown(
+                """
+            <div class="conclusion-box">
+                <h4>Reflexiones clave sobre el perfil del estudiante español</h4>
+                <ul>
+                    <li><strong>Diversidad de edad:</strong> Los estudiantes más jóvenes (≤22) dominan, pero también hay participación significativa de mayores de 23.</li>
+                    <li><strong>Segregación por género:</strong> Persisten patrones tradicionales en la elección de carrera.</li>
+                    <li><strong>Campo de estudio y oportunidades económicas:</strong> Ingeniería y Negocios se asocian con niveles de ingresos más altos.</li>
+                    <li><strong>Implicaciones para políticas públicas:</strong> Los datos revelan brechas estructurales que requieren atención.</li>
+                </ul>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
+
+        else:
+            st.warning("No se pudieron generar insights automáticos del Sankey")
+
+    else:
+        error_msg = sankey_result.get("error", "Error desconocido")
+        st.error(f"❌ Error cargando diagrama de Sankey: {error_msg}")
+        show_chart_placeholder(
+            "Diagrama de Sankey - Trayectoria del Estudiante Español",
+            "Error cargando datos para el diagrama interactivo",
+        )
+
+except Exception as e:
+    st.error(f"Error crítico en sección Sankey: {e}")
+    show_chart_placeholder(
+        "Error: Diagrama de Sankey", "Error crítico cargando el módulo de Sankey"
+    )
+
+
+
+st.markdown(
+    """
+<div class="insight-box">
+    <h4>Síntesis del Perfil Completo de Estudiantes</h4>
+    <ul>
+        <li><strong>Gran variabilidad del coste de estudios en Europa:</strong> <br>
+            <span>España destaca por la <strong>presión económica</strong> sobre sus estudiantes, según el nivel de gasto y ayudas públicas.</span>
+        </li>
+        <li><strong>No hay diferencias significativas por género:</strong> <br>
+            <span><strong>Hombres y mujeres</strong> comparten una necesidad similar de trabajar mientras estudian.</span>
+        </li>
+        <li><strong>La edad influye mucho en la necesidad de trabajar en España:</strong> <br>
+            <span>Aumenta con la edad y <strong>supera la media europea</strong> en los tramos más altos.</span>
+        </li>
+        <li><strong>Vivir fuera del hogar familiar aumenta la necesidad de trabajar:</strong> <br>
+            <span>En España es especialmente grave por el <strong>alto coste de emancipación</strong> y las <strong>becas limitadas</strong>.</span>
+        </li>
+        <li><strong>Diferencias marcadas por campo de estudio:</strong> <br>
+            <span>Alta necesidad de trabajar en <strong>ciencias naturales, matemáticas y estadísticas</strong>; menor en el <strong>área de salud</strong>.</span>
+        </li>
+        <li><strong>Trayectoria socioeconómica:</strong> <br>
+            <span>El perfil demográfico determina fuertemente las <strong>oportunidades económicas futuras</strong> de los estudiantes.</span>
+        </li>
+    </ul>
+</div>
+""",
+    unsafe_allow_html=True,
+)
@@ -0,0 +1,111 @@
+"""
+Capítulo 3: Tipos de trabajo, ¿relacionado o supervivencia?
+"""
+
+import streamlit as st
+
+from modules.core.countries import country_name
+from modules.ui.layout import create_stats_display, focus_country, show_chart_placeholder
+from modules.ui.linked_figures import render_linked_figures
+from modules.ui.warm_cache import get_shared
+
+country = focus_country()
+
+st.markdown(
+    '<h2 class="section-header" id="tipos-de-trabajo-relacionado-o-supervivencia">Tipos de Trabajo: ¿Relacionado o Supervivencia?</h2>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+Una distinción fundamental es si el trabajo que realizan los estudiantes está relacionado con su área de estudios 
+o no. Esta diferencia puede tener implicaciones significativas tanto para el desarrollo profesional como para el 
+rendimiento académico.
+
+**España se encuentra en una posición intermedia** en cuanto a la relación entre trabajo y estudios, pero existe 
+margen de mejora comparado con otros países europeos.
+"""
+)
+
+
+st.markdown(
+    f'<h3 class="subsection-header">{country_name(country)} vs Europa: Relación Trabajo-Estudio</h3>',
+    unsafe_allow_html=True,
+)
+
+try:
+    charts = get_shared("work_study_charts", country)[0]
+
+    st.plotly_chart(
+        charts["hero_chart"], use_container_width=True, key="hero_work_study_chart"
+    )
+
+    summary = get_shared("work_study_summary", country)
+    work_study_stats = [
+        {
+            "number": f"{summary['focus_percentage']:.1f}%",
+            "label": f"Trabajo relacionado con estudios en {country_name(country)}",
+            "color": "stat-spain",
+        },
+        {
+            "number": f"{summary['europe_percentage']:.1f}%",
+            "label": "Promedio europeo",
+            "color": "stat-europe",
+        },
+        {
+            "number": f"{summary['focus_rank']}/{summary['total_countries']}",
+            "label": f"Posición de {country_name(country)} en Europa",
+            "color": "stat-warning",
+        },
+    ]
+
+    create_stats_display(work_study_stats)
+
+    st.markdown(
+        f"""
+    <div class="spain-box">
+    <h4>Problemática del empleo no relacionado en estudiantes en España</h4>
+    <p>
+        En España, un preocupante <strong>45,4% de los estudiantes que trabajan lo hacen en empleos poco o nada relacionados</strong> con sus estudios. 
+        Esta cifra supera notablemente el <strong>promedio europeo del 37,7%</strong>, lo que evidencia una <strong>desconexión estructural</strong> entre el mundo académico y el laboral.
+    </p>
+    <ul>
+        <li>Este alto porcentaje indica una <strong>falta de oportunidades laborales alineadas con la formación</strong> de los jóvenes.</li>
+        <li>Puede provocar <strong>desmotivación y pérdida de valor práctico</strong> de los estudios universitarios.</li>
+        <li>Limita el desarrollo de experiencia profesional relevante antes de graduarse.</li>
+        <li>España necesita <strong>mejorar los vínculos entre universidades y el mercado laboral</strong> para reducir esta brecha.</li>
+    </ul>
+</div>
+
+    """,
+        unsafe_allow_html=True,
+    )
+
+except Exception as e:
+    st.error(f"Error cargando datos de relación trabajo-estudio: {e}")
+    show_chart_placeholder(
+        f"Error: {country_name(country)} vs Europa", "Error cargando datos principales"
+    )
+
+
+st.markdown(
+    '<h3 class="subsection-header">Explora por País: Relación con los Estudios y Coste de Vida</h3>',
+    unsafe_allow_html=True,
+)
+
+st.markdown(
+    """
+**¿Coinciden los países con más trabajo relacionado con los de menor coste de vida?**
+
+Haz clic en un país del ranking o del mapa para resaltarlo en ambos gráficos.
+"""
+)
+
+try:
+    render_linked_figures(get_shared("linked_country_views", country))
+
+except Exception as e:
+    st.error(f"Error cargando vistas por país: {e}")
+    show_chart_placeholder(
+        "Ranking Europeo y Mapa de Costes", "Error cargando datos por país"
+    )
@@ -1,3 +1,5 @@
+import logging
+
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -19,6 +21,8 @@ class PreprocessedDatasetsNamesWorkMotiveAffordStudy(Enum):
 # Importar configuración unificada de colores
 from .color_config import STORYTELLING_COLORS, COLOR_PALETTES, apply_standard_layout
 
+logger = logging.getLogger(__name__)
+
 def translate_age_category(category):
     """
     Traduce las categorías de edad del inglés al español
@@ -1154,57 +1158,57 @@ def create_comprehensive_demographic_dashboard():
     # Gráfico por género
     try:
         dashboard_charts['gender'] = create_gender_comparison_chart()
-        print("✅ Gráfico por género creado exitosamente")
+        logger.debug("✅ Gráfico por género creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por género: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por género: {e}")
         dashboard_charts['gender'] = create_basic_demographic_chart("Análisis por Género", "Error al cargar datos")
     
     # Gráfico por edad
     try:
         dashboard_charts['age'] = create_age_comparison_chart()
-        print("✅ Gráfico por edad creado exitosamente")
+        logger.debug("✅ Gráfico por edad creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por edad: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por edad: {e}")
         dashboard_charts['age'] = create_basic_demographic_chart("Análisis por Edad", "Error al cargar datos")
     
     # Gráfico por campo de estudio
     try:
         dashboard_charts['field_of_study'] = create_field_of_study_comparison_chart()
-        print("✅ Gráfico por campo de estudio creado exitosamente")
+        logger.debug("✅ Gráfico por campo de estudio creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por campo de estudio: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por campo de estudio: {e}")
         dashboard_charts['field_of_study'] = create_basic_demographic_chart("Análisis por Campo de Estudio", "Error al cargar datos")
     
     # Gráfico por dificultades financieras
     try:
         dashboard_charts['financial_difficulties'] = create_financial_difficulties_comparison_chart()
-        print("✅ Gráfico por dificultades financieras creado exitosamente")
+        logger.debug("✅ Gráfico por dificultades financieras creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por dificultades financieras: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por dificultades financieras: {e}")
         dashboard_charts['financial_difficulties'] = create_basic_demographic_chart("Análisis por Dificultades Financieras", "Error al cargar datos")
     
     # Gráfico por situación de vivienda con padres
     try:
         dashboard_charts['living_with_parents'] = create_living_with_parents_comparison_chart()
-        print("✅ Gráfico por situación de vivienda creado exitosamente")
+        logger.debug("✅ Gráfico por situación de vivienda creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por situación de vivienda: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por situación de vivienda: {e}")
         dashboard_charts['living_with_parents'] = create_basic_demographic_chart("Análisis por Situación de Vivienda", "Error al cargar datos")
     
     # Gráfico por estado financiero de los padres
     try:
         dashboard_charts['parents_financial_status'] = create_parents_financial_status_comparison_chart()
-        print("✅ Gráfico por estado financiero de padres creado exitosamente")
+        logger.debug("✅ Gráfico por estado financiero de padres creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por estado financiero de padres: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por estado financiero de padres: {e}")
         dashboard_charts['parents_financial_status'] = create_basic_demographic_chart("Análisis por Estado Financiero de Padres", "Error al cargar datos")
     
     # Gráfico por nivel educativo de los padres
     try:
         dashboard_charts['parents_education'] = create_parents_education_comparison_chart()
-        print("✅ Gráfico por nivel educativo de padres creado exitosamente")
+        logger.debug("✅ Gráfico por nivel educativo de padres creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por nivel educativo de padres: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por nivel educativo de padres: {e}")
         dashboard_charts['parents_education'] = create_basic_demographic_chart("Análisis por Nivel Educativo de Padres", "Error al cargar datos")
     
     return dashboard_charts
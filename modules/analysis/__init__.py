@@ -3,13 +3,48 @@ Módulo analysis: Análisis específicos y especializados
 - Storytelling y narrativa
 - Análisis Sankey
 - Análisis isotype
+- Matriz país × indicador y correlaciones
+- Similitud entre países
+- Significación estadística (chi-cuadrado) por país
+- Familias de países (k-means y clustering jerárquico)
+
+Los nombres públicos se cargan de forma diferida (ver modules.charts).
 """
 
-# Storytelling
-from .storytelling_module import WorkStudyStorytellingCharts
+from ..core.lazy_imports import lazy_package
+
+_EXPORTS = {
+    # Storytelling
+    'WorkStudyStorytellingCharts': '.storytelling_module',
+
+    # Análisis Sankey
+    'get_sankey_for_streamlit': '.sankey_analysis',
+
+    # Análisis isotype
+    'create_age_isotype_for_streamlit': '.isotype_analysis',
+
+    # Matriz país × indicador
+    'build_country_indicator_matrix': '.country_matrix',
+    'KEY_INDICATORS': '.country_matrix',
+
+    # Correlaciones entre indicadores
+    'get_indicator_correlations': '.correlation_analysis',
+    'get_top_correlated_indicators': '.correlation_analysis',
+
+    # Similitud entre países
+    'get_country_similarity_index': '.similarity_analysis',
+    'get_most_similar_countries': '.similarity_analysis',
+
+    # Significación estadística por país
+    'get_significance_table': '.significance_analysis',
+    'get_country_significance': '.significance_analysis',
+    'dataset_significance': '.significance_analysis',
+
+    # Familias de países
+    'get_country_clusters': '.clustering_analysis',
+    'get_country_families': '.clustering_analysis',
+}
 
-# Análisis Sankey
-from .sankey_analysis import get_sankey_for_streamlit
+__all__ = list(_EXPORTS)
 
-# Análisis isotype
-from .isotype_analysis import create_age_isotype_for_streamlit 
\ No newline at end of file
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS)
@@ -0,0 +1,294 @@
+"""
+Agrupación de países en "familias" según su perfil de respuestas
+K-means y clustering jerárquico (Ward) sobre los perfiles combinados de
+motivo de trabajo, relación trabajo-estudio, impacto y coste, cacheados en
+disco junto con los centroides
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..core.tracing import trace_module
+from ..core.data_cache import cached_on_disk
+from .country_matrix import build_country_indicator_matrix, country_data_fingerprint
+from .similarity_analysis import build_country_profiles
+
+# Datasets que forman el perfil de cada país (sin los desgloses demográficos)
+CLUSTER_DATASETS = (
+    'work_motive',
+    'work_study',
+    'time_budget_notrelated',
+    'abandoning_financial',
+    'abandoning_work_afford',
+    'cost',
+)
+
+# Número de familias por defecto
+DEFAULT_CLUSTERS = 4
+
+# Fracción mínima del perfil que debe tener un país para agruparse
+MIN_COUNTRY_COVERAGE = 0.5
+
+CLUSTER_METHODS = ('kmeans', 'hierarchical')
+
+# Semilla fija: las asignaciones deben ser reproducibles entre ejecuciones
+RANDOM_SEED = 42
+
+
+def build_cluster_profiles(matrix, datasets=CLUSTER_DATASETS):
+    """
+    Perfiles normalizados de los datasets indicados, con igual peso por dataset
+
+    Cada bloque se divide por la raíz de su número de indicadores para que un
+    dataset con muchas columnas (ej: motivo de trabajo) no anule a uno con una
+    sola (coste). Los huecos se rellenan con 0, la media europea.
+
+    Returns:
+        pd.DataFrame: Perfiles país × indicador sin NaN
+    """
+    columns = [col for col in matrix.columns if col.split(':', 1)[0] in datasets]
+    profiles = build_country_profiles(matrix[columns])
+
+    coverage = profiles.notna().mean(axis=1)
+    profiles = profiles.loc[coverage >= MIN_COUNTRY_COVERAGE]
+
+    block = profiles.columns.str.split(':', n=1).str[0]
+    weights = 1.0 / np.sqrt(pd.Series(block).map(pd.Series(block).value_counts()).to_numpy(dtype=float))
+    return profiles.fillna(0.0) * weights
+
+
+def _squared_distances(points, centroids):
+    """Distancias euclídeas al cuadrado punto × centroide"""
+    return np.maximum(
+        (points ** 2).sum(axis=1)[:, None] - 2.0 * points @ centroids.T + (centroids ** 2).sum(axis=1)[None, :],
+        0.0
+    )
+
+
+def kmeans(points, k, n_init=10, max_iter=100, seed=RANDOM_SEED):
+    """
+    K-means con inicialización k-means++ y varios reinicios
+
+    Args:
+        points (np.ndarray): Matriz n × d
+        k (int): Número de clusters
+        n_init (int): Reinicios (se conserva el de menor inercia)
+        max_iter (int): Iteraciones máximas por reinicio
+        seed (int): Semilla del generador aleatorio
+
+    Returns:
+        tuple: (etiquetas, centroides, inercia)
+    """
+    rng = np.random.default_rng(seed)
+    n = len(points)
+    k = min(k, n)
+    best = None
+
+    for _ in range(n_init):
+        # k-means++: cada centro nuevo con probabilidad proporcional a D²
+        centroids = points[[rng.integers(n)]]
+        for _ in range(1, k):
+            closest = _squared_distances(points, centroids).min(axis=1)
+            total = closest.sum()
+            probabilities = closest / total if total > 0 else np.full(n, 1.0 / n)
+            centroids = np.vstack([centroids, points[rng.choice(n, p=probabilities)]])
+
+        labels = None
+        for _ in range(max_iter):
+            new_labels = _squared_distances(points, centroids).argmin(axis=1)
+            if labels is not None and np.array_equal(labels, new_labels):
+                break
+            labels = new_labels
+            # Media de cada cluster con una sola multiplicación de matrices
+            one_hot = np.eye(k)[labels]
+            sizes = one_hot.sum(axis=0)
+            sums = one_hot.T @ points
+            empty = sizes == 0
+            centroids = np.where(empty[:, None], centroids, sums / np.maximum(sizes, 1)[:, None])
+
+        inertia = _squared_distances(points, centroids)[np.arange(n), labels].sum()
+        if best is None or inertia < best[2]:
+            best = (labels, centroids, inertia)
+
+    return best
+
+
+def ward_linkage(points):
+    """
+    Clustering jerárquico aglomerativo con el criterio de Ward
+
+    Actualiza las distancias entre clusters con la fórmula de Lance-Williams,
+    una fila vectorizada por fusión.
+
+    Returns:
+        np.ndarray: Matriz de enlace (n - 1) × 4 con el formato de scipy
+            [cluster_a, cluster_b, distancia, tamaño]
+    """
+    n = len(points)
+    distances = np.sqrt(_squared_distances(points, points))
+    np.fill_diagonal(distances, np.inf)
+    sizes = np.ones(n)
+    ids = np.arange(n)
+    active = np.ones(n, dtype=bool)
+    linkage = np.zeros((max(n - 1, 0), 4))
+
+    for step in range(n - 1):
+        masked = np.where(active[:, None] & active[None, :], distances, np.inf)
+        a, b = np.unravel_index(np.argmin(masked), masked.shape)
+        a, b = min(a, b), max(a, b)
+        d_ab = distances[a, b]
+        linkage[step] = [min(ids[a], ids[b]), max(ids[a], ids[b]), d_ab, sizes[a] + sizes[b]]
+
+        # Lance-Williams para Ward: distancia del cluster fusionado (en a) al resto
+        s_a, s_b, s_c = sizes[a], sizes[b], sizes
+        total = s_a + s_b + s_c
+        merged = np.sqrt(np.maximum(
+            ((s_a + s_c) * distances[a] ** 2 + (s_b + s_c) * distances[b] ** 2 - s_c * d_ab ** 2) / total,
+            0.0
+        ))
+        distances[a, :] = merged
+        distances[:, a] = merged
+        distances[a, a] = np.inf
+        sizes[a] = s_a + s_b
+        ids[a] = n + step
+        active[b] = False
+
+    return linkage
+
+
+def cut_linkage(linkage, n, k):
+    """Etiquetas de cluster al cortar el árbol en k grupos"""
+    parent = np.arange(2 * n - 1)
+
+    def root(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for step in range(max(n - k, 0)):
+        a, b = int(linkage[step, 0]), int(linkage[step, 1])
+        parent[root(a)] = n + step
+        parent[root(b)] = n + step
+
+    roots = np.array([root(i) for i in range(n)])
+    _, labels = np.unique(roots, return_inverse=True)
+    return labels
+
+
+class CountryClusters:
+    """
+    Asignación de países a familias con ambos métodos
+
+    Las etiquetas se numeran de menor a mayor necesidad media de trabajar
+    para que "Familia 1" tenga el mismo significado con cualquier método.
+    """
+
+    def __init__(self, countries, labels, centroids, linkage, indicators):
+        self.countries = list(countries)
+        self.indicators = list(indicators)
+        self.linkage = linkage
+        self._labels = labels
+        self._centroids = centroids
+        self._row = {country: i for i, country in enumerate(self.countries)}
+
+    @property
+    def n_clusters(self):
+        return len(self._centroids['kmeans'])
+
+    def labels(self, method='kmeans'):
+        """Diccionario país -> número de familia (empezando en 1)"""
+        if method not in self._labels:
+            raise ValueError(f"Método no soportado: {method}")
+        return {country: int(label) + 1 for country, label in zip(self.countries, self._labels[method])}
+
+    def cluster_of(self, country, method='kmeans'):
+        """Familia de un país (None si no se ha agrupado)"""
+        row = self._row.get(country)
+        return None if row is None else int(self._labels[method][row]) + 1
+
+    def members(self, cluster, method='kmeans'):
+        """Países de una familia"""
+        return [country for country, label in zip(self.countries, self._labels[method]) if label + 1 == cluster]
+
+    def centroids(self, method='kmeans'):
+        """Centroides de cada familia en el espacio de perfiles normalizados"""
+        return pd.DataFrame(self._centroids[method], columns=self.indicators,
+                            index=pd.RangeIndex(1, self.n_clusters + 1, name='Familia'))
+
+    def to_frame(self):
+        """DataFrame país × método con la familia asignada"""
+        return pd.DataFrame({method: self.labels(method) for method in self._labels}).rename_axis('Country')
+
+
+def _relabel(labels, order_values, k):
+    """Renumera clusters por el valor medio de order_values (ascendente)"""
+    means = np.array([np.nanmean(order_values[labels == c]) if (labels == c).any() else np.inf for c in range(k)])
+    means = np.where(np.isnan(means), np.inf, means)
+    mapping = np.empty(k, dtype=int)
+    mapping[np.argsort(means, kind='stable')] = np.arange(k)
+    return mapping[labels], mapping
+
+
+def compute_country_clusters(matrix, k=DEFAULT_CLUSTERS):
+    """
+    Agrupa los países con k-means y con Ward
+
+    Args:
+        matrix (pd.DataFrame): Matriz país × indicador
+        k (int): Número de familias
+
+    Returns:
+        CountryClusters: Asignaciones, centroides y árbol jerárquico
+    """
+    profiles = build_cluster_profiles(matrix)
+    points = profiles.to_numpy(dtype=float)
+    n = len(points)
+    k = min(k, n)
+
+    order_col = 'work_motive:Need_Work_Total'
+    order_values = matrix.loc[profiles.index, order_col].to_numpy(dtype=float) \
+        if order_col in matrix.columns else np.zeros(n)
+
+    labels, centroids, _ = kmeans(points, k)
+    labels, mapping = _relabel(labels, order_values, k)
+    kmeans_centroids = np.empty_like(centroids)
+    kmeans_centroids[mapping] = centroids
+
+    linkage = ward_linkage(points)
+    hierarchical, _ = _relabel(cut_linkage(linkage, n, k), order_values, k)
+    one_hot = np.eye(k)[hierarchical]
+    hierarchical_centroids = (one_hot.T @ points) / np.maximum(one_hot.sum(axis=0), 1)[:, None]
+
+    return CountryClusters(
+        profiles.index.tolist(),
+        {'kmeans': labels, 'hierarchical': hierarchical},
+        {'kmeans': kmeans_centroids, 'hierarchical': hierarchical_centroids},
+        linkage,
+        profiles.columns.tolist()
+    )
+
+
+def get_country_clusters(k=DEFAULT_CLUSTERS, use_cache=True):
+    """
+    Familias de países (cacheadas en disco por huella de datos y k)
+
+    Returns:
+        CountryClusters: Asignaciones de ambos métodos
+    """
+    if not use_cache:
+        return compute_country_clusters(build_country_indicator_matrix(), k)
+
+    return cached_on_disk(
+        f'country_clusters_k{k}',
+        country_data_fingerprint(extra=f"{','.join(CLUSTER_DATASETS)}:{MIN_COUNTRY_COVERAGE}:{RANDOM_SEED}"),
+        lambda: compute_country_clusters(build_country_indicator_matrix(), k)
+    )
+
+
+def get_country_families(k=DEFAULT_CLUSTERS, method='kmeans'):
+    """Atajo: diccionario país -> familia"""
+    return get_country_clusters(k).labels(method)
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
@@ -0,0 +1,169 @@
+"""
+Correlaciones entre indicadores a nivel de país
+Calcula matrices de Pearson y Spearman sobre la matriz país × indicador de
+forma vectorizada, ignorando los valores faltantes par a par
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..core.tracing import trace_module
+from ..core.data_cache import cached_on_disk
+from .country_matrix import build_country_indicator_matrix, country_data_fingerprint
+
+# Mínimo de países con dato en ambos indicadores para calcular una correlación
+MIN_COMMON_COUNTRIES = 5
+
+
+def pairwise_correlation(values, min_periods=MIN_COMMON_COUNTRIES):
+    """
+    Correlación de Pearson entre todas las columnas con eliminación de NaN par a par
+
+    Todas las sumas necesarias se obtienen con productos de matrices sobre la
+    máscara de valores presentes, sin bucles por par de columnas.
+
+    Args:
+        values (np.ndarray): Matriz n_filas × n_columnas con NaN
+        min_periods (int): Mínimo de filas comunes para dar un resultado
+
+    Returns:
+        np.ndarray: Matriz n_columnas × n_columnas (NaN si no hay datos suficientes)
+    """
+    values = np.asarray(values, dtype=float)
+    present = (~np.isnan(values)).astype(float)
+    filled = np.where(present > 0, values, 0.0)
+
+    # n[i, j] = filas donde i y j tienen dato; sum_x[i, j] = suma de i en esas filas
+    n = present.T @ present
+    sum_x = filled.T @ present
+    sum_y = sum_x.T
+    sum_xx = (filled ** 2).T @ present
+    sum_yy = sum_xx.T
+    sum_xy = filled.T @ filled
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_xy - sum_x * sum_y / n
+        var_x = sum_xx - sum_x ** 2 / n
+        var_y = sum_yy - sum_y ** 2 / n
+        corr = cov / np.sqrt(var_x * var_y)
+
+    # Varianzas ~0 (indicador constante en las filas comunes) no tienen correlación
+    scale = np.maximum(np.abs(sum_xx), 1.0)
+    degenerate = (var_x <= 1e-12 * scale) | (var_y <= 1e-12 * scale.T)
+    corr[(n < min_periods) | degenerate] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def rank_columns(values):
+    """Rangos medios por columna (los NaN se mantienen como NaN)"""
+    return pd.DataFrame(values).rank(method='average', na_option='keep').to_numpy(dtype=float)
+
+
+def _complete_block_correlation(a, b):
+    """Pearson entre las columnas de dos bloques sin NaN con las mismas filas"""
+    a = a - a.mean(axis=0)
+    b = b - b.mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a = a / np.linalg.norm(a, axis=0)
+        b = b / np.linalg.norm(b, axis=0)
+        return np.clip(a.T @ b, -1.0, 1.0)
+
+
+def pairwise_spearman(values, min_periods=MIN_COMMON_COUNTRIES):
+    """
+    Correlación de Spearman con eliminación de NaN par a par
+
+    Los rangos deben calcularse sobre las filas comunes de cada par. Las
+    columnas se agrupan por patrón de valores faltantes (los datasets comparten
+    conjuntos de países), así que basta con un cálculo matricial por cada par
+    de patrones en lugar de uno por cada par de indicadores.
+
+    Returns:
+        np.ndarray: Matriz n_columnas × n_columnas
+    """
+    values = np.asarray(values, dtype=float)
+    present = ~np.isnan(values)
+    patterns, group_of = np.unique(present.T, axis=0, return_inverse=True)
+    group_of = np.asarray(group_of).ravel()
+    columns_of = [np.flatnonzero(group_of == g) for g in range(len(patterns))]
+
+    corr = np.full((values.shape[1], values.shape[1]), np.nan)
+    for a in range(len(patterns)):
+        for b in range(a, len(patterns)):
+            rows = patterns[a] & patterns[b]
+            if rows.sum() < min_periods:
+                continue
+            cols_a, cols_b = columns_of[a], columns_of[b]
+            ranks_a = rank_columns(values[np.ix_(rows, cols_a)])
+            ranks_b = ranks_a if a == b else rank_columns(values[np.ix_(rows, cols_b)])
+            block = _complete_block_correlation(ranks_a, ranks_b)
+            corr[np.ix_(cols_a, cols_b)] = block
+            corr[np.ix_(cols_b, cols_a)] = block.T
+    return corr
+
+
+def compute_indicator_correlations(matrix, method='pearson', min_periods=MIN_COMMON_COUNTRIES):
+    """
+    Matriz de correlación indicador × indicador
+
+    Args:
+        matrix (pd.DataFrame): Matriz país × indicador
+        method (str): 'pearson' o 'spearman'
+        min_periods (int): Mínimo de países comunes por par
+
+    Returns:
+        pd.DataFrame: Correlaciones con los indicadores como índice y columnas
+    """
+    if method not in ('pearson', 'spearman'):
+        raise ValueError(f"Método de correlación no soportado: {method}")
+
+    values = matrix.to_numpy(dtype=float)
+    if method == 'spearman':
+        corr = pairwise_spearman(values, min_periods=min_periods)
+    else:
+        corr = pairwise_correlation(values, min_periods=min_periods)
+    return pd.DataFrame(corr, index=matrix.columns, columns=matrix.columns)
+
+
+def get_indicator_correlations(method='pearson', use_cache=True):
+    """
+    Correlaciones entre todos los indicadores de todos los datasets por país
+
+    El resultado se cachea en disco con la huella de los ficheros de datos.
+
+    Args:
+        method (str): 'pearson' o 'spearman'
+        use_cache (bool): Usar la caché en disco
+
+    Returns:
+        pd.DataFrame: Matriz de correlación indicador × indicador
+    """
+    def build():
+        return compute_indicator_correlations(build_country_indicator_matrix(use_cache=use_cache), method)
+
+    if not use_cache:
+        return build()
+
+    return cached_on_disk(
+        f'indicator_correlations_{method}',
+        country_data_fingerprint(extra=f"{method}:{MIN_COMMON_COUNTRIES}"),
+        build
+    )
+
+
+def get_top_correlated_indicators(indicator, k=10, method='pearson'):
+    """
+    Indicadores más correlacionados (en valor absoluto) con uno dado
+
+    Returns:
+        pd.Series: Correlaciones ordenadas por |r| descendente
+    """
+    corr = get_indicator_correlations(method)
+    if indicator not in corr.index:
+        raise KeyError(f"Indicador no encontrado: {indicator}")
+    row = corr.loc[indicator].drop(indicator).dropna()
+    return row.reindex(row.abs().sort_values(ascending=False).index[:k])
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
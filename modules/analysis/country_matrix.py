@@ -0,0 +1,178 @@
+"""
+Matriz país × indicador construida a partir de todos los datasets EUROSTUDENT
+Alinea cada dataset por código de país y la cachea en disco según la huella
+de los ficheros de datos
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from ..core.tracing import trace_module
+from ..core.data_cache import cached_on_disk, data_fingerprint
+from ..core.data_loaders import (
+    ABANDONING_ALIASES,
+    read_work_motive_afford_study_dataset,
+    read_work_study_relationship_dataset,
+    read_work_impact_dataset,
+    PreprocessedDatasetsNamesWorkMotiveAffordStudy,
+    PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy,
+    PreprocessedDatasetsNamesImpactsOnStudyForWork
+)
+from ..core.ranking_index import get_ranking_index
+from ..charts.demographic_charts import (
+    read_demographic_dataset_detailed,
+    PreprocessedDatasetsNamesWorkMotiveAffordStudy as DemographicDatasetsNames
+)
+from ..charts.geographic_charts import COST_DATASET_PATH, read_cost_dataset, prepare_cost_dataframe
+
+logger = logging.getLogger(__name__)
+
+# === CATÁLOGO DE DATASETS POR PAÍS ===
+
+# Datasets de impacto con una fila por país (los de sufijo __ES solo traen España)
+IMPACT_COUNTRY_DATASETS = [
+    PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_FOR_WORK_TIME_BUDGET_SATISFACTION_JOB_NOTRELATED,
+    PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__E_FINANCIAL_DIFFICULTIES,
+    PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__S_WORK_TO_AFFORD_TO_STUDY,
+]
+
+# Indicadores principales para las vistas resumidas (etiqueta -> id de indicador)
+KEY_INDICATORS = {
+    'Necesitan trabajar': 'work_motive:Need_Work_Total',
+    'Trabajo relacionado': 'work_study:Related_Total',
+    'Trabajo nada relacionado': 'work_study:Not_At_All_Value',
+    'Coste mensual': 'cost:Monthly_Cost',
+    'Abandono (dif. financieras)': 'abandoning_financial:Abandoning_High_Total',
+    'Abandono (para trabajar)': 'abandoning_work_afford:Abandoning_High_Total',
+    'Más tiempo en trabajo': 'time_budget_notrelated:More_Time_Value',
+}
+
+# Claves cortas de los datasets de impacto
+_IMPACT_KEYS = {
+    PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_FOR_WORK_TIME_BUDGET_SATISFACTION_JOB_NOTRELATED: 'time_budget_notrelated',
+    PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__E_FINANCIAL_DIFFICULTIES: 'abandoning_financial',
+    PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__S_WORK_TO_AFFORD_TO_STUDY: 'abandoning_work_afford',
+}
+
+
+def country_dataset_paths():
+    """Rutas de todos los ficheros que alimentan la matriz país × indicador"""
+    paths = [
+        PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY.value,
+        PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy.RELATIONSHIP_BETWEEN_WORK_AND_STUDY.value,
+        COST_DATASET_PATH,
+    ]
+    paths.extend(dataset_enum.value for dataset_enum in IMPACT_COUNTRY_DATASETS)
+    paths.extend(dataset_enum.value for dataset_enum in DemographicDatasetsNames
+                 if dataset_enum != DemographicDatasetsNames.WORK_MOTIVE_AFFORD_STUDY)
+    return paths
+
+
+def country_data_fingerprint(extra=None):
+    """Huella del contenido de todos los datasets por país"""
+    return data_fingerprint(country_dataset_paths(), extra)
+
+
+def load_country_datasets():
+    """
+    Carga todos los datasets con una fila por país
+
+    Returns:
+        dict: Clave del dataset -> (DataFrame, columna de país)
+    """
+    datasets = {}
+
+    datasets['work_motive'] = (read_work_motive_afford_study_dataset(), 'Country')
+    datasets['work_study'] = (read_work_study_relationship_dataset(), 'Country')
+
+    for dataset_enum in IMPACT_COUNTRY_DATASETS:
+        try:
+            datasets[_IMPACT_KEYS[dataset_enum]] = (read_work_impact_dataset(dataset_enum), 'Country')
+        except Exception as e:
+            logger.warning(f"⚠️ Error cargando {dataset_enum.value}: {e}")
+
+    # Desgloses demográficos: un dataset por subcategoría
+    for dataset_enum in DemographicDatasetsNames:
+        if dataset_enum == DemographicDatasetsNames.WORK_MOTIVE_AFFORD_STUDY:
+            continue
+        try:
+            groups = read_demographic_dataset_detailed(dataset_enum)
+        except Exception as e:
+            logger.warning(f"⚠️ Error cargando {dataset_enum.value}: {e}")
+            continue
+        prefix = dataset_enum.name.lower().replace('work_motive_afford_study_', 'work_motive_')
+        for group_name, group_df in groups.items():
+            datasets[f"{prefix}/{group_name}"] = (group_df, 'Country')
+
+    cost_df = read_cost_dataset()
+    if cost_df is not None:
+        datasets['cost'] = (prepare_cost_dataframe(cost_df), 'Country_Code')
+
+    return {key: value for key, value in datasets.items() if value[0] is not None}
+
+
+def _alias_columns(df):
+    """Columnas de df que son alias de compatibilidad de otra columna del mismo dataset"""
+    return {alias for aliases in ABANDONING_ALIASES.values() for alias, source in aliases.items()
+            if alias in df.columns and source in df.columns}
+
+
+def _build_country_indicator_matrix(datasets):
+    """
+    Construye la matriz a partir de los índices de ranking de cada dataset
+
+    Los alias de compatibilidad de los loaders (ABANDONING_ALIASES) no entran
+    en la matriz: repetirían su columna de origen. Dos indicadores distintos
+    con los mismos valores se conservan.
+    """
+    blocks = []
+    for key, (df, country_col) in datasets.items():
+        ranking = get_ranking_index(df, country_col=country_col)
+        aliases = _alias_columns(df)
+        indicators = [indicator for indicator in ranking.indicators if indicator not in aliases]
+        names = [f"{key}:{indicator}" for indicator in indicators]
+        block = np.column_stack([ranking.indicator_values(indicator) for indicator in indicators]) \
+            if names else np.empty((len(ranking.countries), 0))
+        blocks.append((ranking.countries, names, block))
+
+    countries = sorted({country for dataset_countries, _, _ in blocks for country in dataset_countries})
+    row_of = {country: i for i, country in enumerate(countries)}
+    columns = [name for _, names, _ in blocks for name in names]
+
+    # Rellenar la matriz por bloques de dataset (NaN donde el país no aparece)
+    values = np.full((len(countries), len(columns)), np.nan)
+    start = 0
+    for dataset_countries, names, block in blocks:
+        rows = np.array([row_of[country] for country in dataset_countries], dtype=int)
+        values[rows, start:start + len(names)] = block
+        start += len(names)
+
+    return pd.DataFrame(values, index=pd.Index(countries, name='Country'), columns=columns)
+
+
+def build_country_indicator_matrix(use_cache=True):
+    """
+    Matriz país × indicador con todos los datasets alineados por código de país
+
+    Los indicadores se nombran 'dataset:columna' (ej: 'work_study:Related_Total').
+
+    Args:
+        use_cache (bool): Leer/escribir la matriz en la caché de disco
+
+    Returns:
+        pd.DataFrame: Filas = países, columnas = indicadores (NaN si falta el dato)
+    """
+    if not use_cache:
+        return _build_country_indicator_matrix(load_country_datasets())
+
+    return cached_on_disk(
+        'country_indicator_matrix',
+        country_data_fingerprint(),
+        lambda: _build_country_indicator_matrix(load_country_datasets())
+    )
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
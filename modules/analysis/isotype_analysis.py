@@ -1,11 +1,16 @@
+import logging
+
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import numpy as np
 # Importar configuración unificada de colores
+from ..core.tracing import trace_module
 from ..core.color_config import STORYTELLING_COLORS, apply_standard_layout
 
+logger = logging.getLogger(__name__)
+
 def load_age_relationship_data():
     """
     Cargar y procesar datos de relación trabajo-estudio por edad en España
@@ -14,17 +19,13 @@ def load_age_relationship_data():
         # Cargar el archivo Excel
         df = pd.read_excel("data/preprocessed_relationship_study_job/E8_age__relationship_job_study__ES.xlsx")
         
-        print("Columnas disponibles:")
-        print(df.columns.tolist())
-        print("\nPrimeras filas:")
-        print(df.head())
-        print("\nForma del dataset:")
-        print(df.shape)
+        logger.debug("Columnas disponibles: %s\nPrimeras filas:\n%s\nForma del dataset: %s",
+                     df.columns.tolist(), df.head(), df.shape)
         
         return df
         
     except Exception as e:
-        print(f"Error cargando datos: {e}")
+        logger.error(f"Error cargando datos: {e}")
         return None
 
 def create_age_isotype_chart():
@@ -50,9 +51,8 @@ def create_age_isotype_chart():
             "30+ años": float(data_row['Unnamed: 58'])           # 27%
         }
         
-        print("Datos extraídos (trabajo nada relacionado por edad):")
-        for age, pct in age_data.items():
-            print(f"{age}: {pct}%")
+        logger.debug("Datos extraídos (trabajo nada relacionado por edad): %s",
+                     ', '.join(f"{age}: {pct}%" for age, pct in age_data.items()))
         
         # Crear isotype con figuras humanas
         fig = create_human_isotype(age_data)
@@ -68,7 +68,7 @@ def create_age_isotype_chart():
         return fig, insights
         
     except Exception as e:
-        print(f"Error creando isotype: {e}")
+        logger.error(f"Error creando isotype: {e}")
         return None, {"error": str(e)}
 
 def create_human_isotype(age_data):
@@ -209,6 +209,11 @@ def create_age_isotype_for_streamlit():
         'success': fig is not None
     }
 
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
+
+
 if __name__ == "__main__":
     # Test de la función
     result = create_age_isotype_for_streamlit()
@@ -1,11 +1,16 @@
+import logging
+
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import numpy as np
 import streamlit as st
+from ..core.tracing import trace_module
 from ..core.color_config import STORYTELLING_COLORS, apply_standard_layout
 
+logger = logging.getLogger(__name__)
+
 
 def process_excel_for_sankey(file_path, connection_type):
     """
@@ -15,7 +20,7 @@ def process_excel_for_sankey(file_path, connection_type):
         df = pd.read_excel(file_path)
 
         if df.shape[0] < 3:
-            print(f"❌ {file_path}: No suficientes filas")
+            logger.warning(f"❌ {file_path}: No suficientes filas")
             return []
 
         # Extraer las tres filas clave
@@ -160,13 +165,13 @@ def process_excel_for_sankey(file_path, connection_type):
                 }
             )
 
-        print(
+        logger.debug(
             f"✅ Procesado {file_path}: {len(processed_data)} conexiones para {connection_type}"
         )
         return processed_data
 
     except Exception as e:
-        print(f"❌ Error procesando {file_path}: {e}")
+        logger.error(f"❌ Error procesando {file_path}: {e}")
         return []
 
 
@@ -174,8 +179,7 @@ def create_organized_sankey():
     """
     Crea un Sankey de 4 capas: Edad → Campo de Estudio → Género → Ingresos
     """
-    print("🎨 CREANDO SANKEY ORGANIZADO EN 4 CAPAS")
-    print("=" * 60)
+    logger.debug("🎨 Creando Sankey organizado en 4 capas")
 
     # Procesar cada tipo de conexión
     all_data = []
@@ -206,7 +210,7 @@ def create_organized_sankey():
     all_data.extend(costs_housing_data)
 
     if not all_data:
-        print("❌ No se pudieron procesar datos")
+        logger.error("❌ No se pudieron procesar datos")
         return None, {}
 
     # Crear DataFrame con todas las conexiones
@@ -536,12 +540,12 @@ def create_organized_sankey():
         ],
     }
 
-    print(
+    logger.debug(
         f"✅ Sankey de 4 capas creado: {len(all_nodes)} nodos, {len(all_connections)} flujos"
     )
-    print(f"📊 Total estudiantes representados: {total_estudiantes:,}")
-    print(f"🎯 Distribución por género: {insights['distribucion_genero']}")
-    print(f"📈 Distribución por edad: {insights['distribucion_edad']}")
+    logger.debug(f"📊 Total estudiantes representados: {total_estudiantes:,}")
+    logger.debug(f"🎯 Distribución por género: {insights['distribucion_genero']}")
+    logger.debug(f"📈 Distribución por edad: {insights['distribucion_edad']}")
 
     return fig, insights
 
@@ -550,8 +554,7 @@ def get_sankey_for_streamlit():
     """
     Función principal para cargar en Streamlit con información interactiva mejorada
     """
-    print("🚀 GENERANDO SANKEY INTERACTIVO MEJORADO PARA STREAMLIT")
-    print("=" * 70)
+    logger.debug("🚀 Generando Sankey interactivo para Streamlit")
 
     try:
         fig, insights = create_organized_sankey()
@@ -585,10 +588,7 @@ def get_sankey_for_streamlit():
             "insights_principales": insights["hallazgos_clave"],
         }
 
-        print("✅ Sankey interactivo mejorado creado exitosamente")
-        print(
-            f"🎯 Características añadidas: hover personalizado, estadísticas detalladas, mejor espaciado"
-        )
+        logger.debug("✅ Sankey interactivo mejorado creado exitosamente")
 
         return {
             "success": True,
@@ -599,7 +599,7 @@ def get_sankey_for_streamlit():
         }
 
     except Exception as e:
-        print(f"❌ Error crítico creando Sankey: {e}")
+        logger.error(f"❌ Error crítico creando Sankey: {e}")
         return {
             "success": False,
             "error": str(e),
@@ -609,6 +609,10 @@ def get_sankey_for_streamlit():
         }
 
 
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
+
+
 # Para testing directo
 if __name__ == "__main__":
     result = get_sankey_for_streamlit()
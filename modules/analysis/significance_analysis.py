@@ -0,0 +1,245 @@
+"""
+Tests chi-cuadrado de las distribuciones de respuesta por país
+Compara, para cada dataset y grupo, la distribución de cada país con la del
+resto de Europa usando las columnas Count, con todos los países a la vez
+"""
+
+import logging
+import math
+
+import numpy as np
+import pandas as pd
+
+from ..core.tracing import trace_module
+from ..core.data_cache import cached_on_disk
+from .country_matrix import load_country_datasets, country_data_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Nivel de significación por defecto
+SIGNIFICANCE_LEVEL = 0.05
+
+# Escalas de respuesta conocidas (grupo -> niveles en orden); cada dataset
+# se testea con todas las escalas cuyas columnas '<nivel>_Count' contenga
+LIKERT_GROUPS = {
+    'applies': ['Applies_Totally', 'Applies_Rather', 'Applies_Partially', 'Applies_Rather_Not', 'Does_Not_Apply'],
+    'relationship': ['Very_Closely', 'Closely', 'Somewhat', 'Not_Closely', 'Not_At_All'],
+    'time_budget': ['Less_Time', 'Same_Time', 'More_Time'],
+    'with_fin_diff': ['With_Fin_Diff_Very_Often', 'With_Fin_Diff_Often', 'With_Fin_Diff_Sometimes',
+                      'With_Fin_Diff_Rarely', 'With_Fin_Diff_Never'],
+    'somewhat_fin_diff': ['Somewhat_Fin_Diff_Very_Often', 'Somewhat_Fin_Diff_Often', 'Somewhat_Fin_Diff_Sometimes',
+                          'Somewhat_Fin_Diff_Rarely', 'Somewhat_Fin_Diff_Never'],
+    'without_fin_diff': ['Without_Fin_Diff_Very_Often', 'Without_Fin_Diff_Often', 'Without_Fin_Diff_Sometimes',
+                         'Without_Fin_Diff_Rarely', 'Without_Fin_Diff_Never'],
+    'partly_applies': ['Partly_Strongly_Agree', 'Partly_Agree_2', 'Partly_Agree_3', 'Partly_Agree_4',
+                       'Partly_Disagree_All'],
+    'totally_applies': ['Totally_Strongly_Agree', 'Totally_Agree_2', 'Totally_Agree_3', 'Totally_Agree_4',
+                        'Totally_Disagree_All'],
+    'abandoning': ['Very_Often', 'Often', 'Sometimes', 'Rarely', 'Never'],
+}
+
+
+def chi2_sf(statistic, dof):
+    """
+    Función de supervivencia de la chi-cuadrado para grados de libertad enteros
+
+    Usa la forma cerrada de la gamma incompleta regularizada con la recurrencia
+    Q(x; k + 2) = Q(x; k) + (x/2)^(k/2) e^(-x/2) / Γ(k/2 + 1).
+
+    Args:
+        statistic (np.ndarray): Estadísticos chi-cuadrado
+        dof (np.ndarray): Grados de libertad (enteros >= 1)
+
+    Returns:
+        np.ndarray: p-valores
+    """
+    statistic = np.asarray(statistic, dtype=float)
+    dof = np.broadcast_to(np.asarray(dof, dtype=int), statistic.shape)
+    half = statistic / 2.0
+    p_values = np.full(statistic.shape, np.nan)
+
+    for k in np.unique(dof[np.isfinite(statistic)]):
+        mask = (dof == k) & np.isfinite(statistic)
+        x = half[mask]
+        if k % 2 == 0:
+            q = np.exp(-x)
+            start = 2
+        else:
+            q = np.array([math.erfc(math.sqrt(v)) for v in x])
+            start = 1
+        for j in range(start, int(k), 2):
+            # Término en log para evitar desbordamientos con estadísticos grandes
+            q = q + np.exp((j / 2.0) * np.log(np.maximum(x, 1e-300)) - x - math.lgamma(j / 2.0 + 1))
+        p_values[mask] = np.clip(q, 0.0, 1.0)
+
+    return p_values
+
+
+def chi_square_vs_rest(counts):
+    """
+    Chi-cuadrado de cada fila (país) frente a la suma del resto de filas
+
+    Para n países y L niveles se construyen las n tablas de contingencia 2 × L
+    como un único tensor y se evalúan a la vez.
+
+    Args:
+        counts (np.ndarray): Matriz n_países × n_niveles de recuentos (NaN = sin dato)
+
+    Returns:
+        tuple: (estadístico, grados de libertad, tamaño muestral) por país
+    """
+    counts = np.asarray(counts, dtype=float)
+    valid = ~np.isnan(counts).any(axis=1)
+    counts = np.where(valid[:, None], counts, 0.0)
+
+    rest = counts.sum(axis=0, keepdims=True) - counts
+    table = np.stack([counts, rest], axis=1)                    # n × 2 × L
+
+    row_totals = table.sum(axis=2, keepdims=True)               # n × 2 × 1
+    col_totals = table.sum(axis=1, keepdims=True)               # n × 1 × L
+    grand_total = row_totals.sum(axis=1, keepdims=True)         # n × 1 × 1
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = row_totals * col_totals / grand_total
+        cells = np.where(expected > 0, (table - expected) ** 2 / expected, 0.0)
+
+    statistic = cells.sum(axis=(1, 2))
+    # Niveles vacíos en ambas filas no aportan grados de libertad
+    dof = (col_totals[:, 0, :] > 0).sum(axis=1) - 1
+
+    sample_size = counts.sum(axis=1)
+    invalid = ~valid | (dof < 1) | (sample_size == 0) | (rest.sum(axis=1) == 0)
+    statistic[invalid] = np.nan
+    dof = np.where(invalid, 1, dof)
+    return statistic, dof, sample_size
+
+
+def benjamini_hochberg(p_values):
+    """q-valores de Benjamini-Hochberg (los NaN se mantienen)"""
+    p_values = np.asarray(p_values, dtype=float)
+    q_values = np.full(p_values.shape, np.nan)
+    finite = np.flatnonzero(np.isfinite(p_values))
+    if finite.size == 0:
+        return q_values
+    order = finite[np.argsort(p_values[finite], kind='stable')]
+    ranked = p_values[order] * finite.size / np.arange(1, finite.size + 1)
+    q_values[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q_values
+
+
+def _count_matrix(df, levels):
+    return np.column_stack([
+        pd.to_numeric(df[f'{level}_Count'], errors='coerce').to_numpy(dtype=float) for level in levels
+    ])
+
+
+def compute_significance_table(datasets, alpha=SIGNIFICANCE_LEVEL):
+    """
+    Tabla de p-valores para todos los países × grupos × datasets
+
+    Args:
+        datasets (dict): Clave -> (DataFrame, columna de país), como en load_country_datasets
+        alpha (float): Nivel de significación para la columna 'significant'
+
+    Returns:
+        pd.DataFrame: Columnas dataset, group, country, chi2, dof, n, p_value,
+            q_value (Benjamini-Hochberg sobre toda la tabla) y significant
+    """
+    frames = []
+    for key, (df, country_col) in datasets.items():
+        for group, levels in LIKERT_GROUPS.items():
+            if not all(f'{level}_Count' in df.columns for level in levels):
+                continue
+            statistic, dof, sample_size = chi_square_vs_rest(_count_matrix(df, levels))
+            frames.append(pd.DataFrame({
+                'dataset': key,
+                'group': group,
+                'country': df[country_col].to_numpy(),
+                'chi2': statistic,
+                'dof': dof,
+                'n': sample_size,
+            }))
+
+    if not frames:
+        return pd.DataFrame(columns=['dataset', 'group', 'country', 'chi2', 'dof', 'n',
+                                     'p_value', 'q_value', 'significant'])
+
+    table = pd.concat(frames, ignore_index=True)
+    table['p_value'] = chi2_sf(table['chi2'].to_numpy(), table['dof'].to_numpy())
+    table['q_value'] = benjamini_hochberg(table['p_value'].to_numpy())
+    table['significant'] = table['q_value'] < alpha
+    return table
+
+
+def get_significance_table(use_cache=True):
+    """
+    Tabla de significación de todos los datasets, cacheada por huella de datos
+
+    Returns:
+        pd.DataFrame: Ver compute_significance_table
+    """
+    if not use_cache:
+        return compute_significance_table(load_country_datasets())
+
+    return cached_on_disk(
+        'significance_table',
+        country_data_fingerprint(extra=f"chi2:{SIGNIFICANCE_LEVEL}"),
+        lambda: compute_significance_table(load_country_datasets())
+    )
+
+
+def get_country_significance(dataset, group, country='ES'):
+    """
+    Resultado del test para un país concreto
+
+    Args:
+        dataset (str): Clave del dataset (ej: 'work_motive', 'work_study')
+        group (str): Escala de respuesta (ej: 'applies', 'relationship')
+        country (str): Código de país
+
+    Returns:
+        dict: Fila de la tabla (p_value, q_value, significant, ...) o None
+    """
+    try:
+        table = get_significance_table()
+    except Exception as e:
+        # La marca de significación es opcional: los gráficos se generan igual
+        logger.warning(f"⚠️ No se pudo calcular la significación: {e}")
+        return None
+    rows = table[(table['dataset'] == dataset) & (table['group'] == group) & (table['country'] == country)]
+    if rows.empty:
+        return None
+    return rows.iloc[0].to_dict()
+
+
+def dataset_significance(df, group, country='ES', country_col='Country', alpha=SIGNIFICANCE_LEVEL):
+    """
+    Resultado del test para un país calculado solo con el dataset que se pasa
+
+    Lo usan los builders de figuras con el DataFrame que ya reciben, sin leer
+    el resto de datasets por país; la corrección de Benjamini-Hochberg se
+    aplica sobre los tests de ese dataset.
+
+    Args:
+        df (pd.DataFrame): Dataset con una fila por país y columnas '<nivel>_Count'
+        group (str): Escala de respuesta (ej: 'applies', 'relationship')
+        country (str): Código de país
+        country_col (str): Columna con el código de país
+
+    Returns:
+        dict: Fila de la tabla (p_value, q_value, significant, ...) o None
+    """
+    try:
+        table = compute_significance_table({'dataset': (df, country_col)}, alpha)
+    except Exception as e:
+        # La marca de significación es opcional: los gráficos se generan igual
+        logger.warning(f"⚠️ No se pudo calcular la significación: {e}")
+        return None
+    rows = table[(table['group'] == group) & (table['country'] == country)]
+    if rows.empty:
+        return None
+    return rows.iloc[0].to_dict()
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
@@ -0,0 +1,173 @@
+"""
+Similitud entre países a partir de sus perfiles de respuesta
+Construye un perfil normalizado por país con todos los indicadores y precalcula
+las distancias entre todos los pares para responder "¿qué países se parecen a X?"
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..core.tracing import trace_module
+from ..core.data_cache import cached_on_disk
+from .country_matrix import build_country_indicator_matrix, country_data_fingerprint
+
+# Fracción mínima de países con dato para que un indicador entre en el perfil
+MIN_INDICATOR_COVERAGE = 0.6
+
+# Mínimo de indicadores comunes para comparar dos países
+MIN_COMMON_INDICATORS = 10
+
+DISTANCE_METRICS = ('cosine', 'euclidean')
+
+# Huella de los datos del índice, calculada una vez por proceso
+_FINGERPRINT = {}
+
+
+def build_country_profiles(matrix, min_coverage=MIN_INDICATOR_COVERAGE):
+    """
+    Normaliza la matriz país × indicador (z-score por indicador)
+
+    Los indicadores con poca cobertura o sin varianza se descartan para que no
+    dominen la distancia.
+
+    Returns:
+        pd.DataFrame: Perfiles normalizados (NaN donde falta el dato)
+    """
+    coverage = matrix.notna().mean()
+    profiles = matrix.loc[:, coverage >= min_coverage]
+    std = profiles.std(ddof=0)
+    profiles = profiles.loc[:, std > 0]
+    return (profiles - profiles.mean()) / profiles.std(ddof=0)
+
+
+def pairwise_country_distances(profiles, min_common=MIN_COMMON_INDICATORS):
+    """
+    Distancias coseno y euclídea entre todos los pares de países, ignorando NaN
+
+    Cada par usa solo los indicadores presentes en ambos países; la euclídea se
+    reescala a la dimensión completa para que pares con distinta cobertura
+    sean comparables.
+
+    Returns:
+        dict: 'cosine' y 'euclidean' -> np.ndarray n_países × n_países
+    """
+    values = profiles.to_numpy(dtype=float)
+    present = (~np.isnan(values)).astype(float)
+    filled = np.where(present > 0, values, 0.0)
+    squared = filled ** 2
+
+    common = present @ present.T
+    dot = filled @ filled.T
+    # norm_a[i, j] = suma de x_i² sobre los indicadores comunes con j
+    norm_a = squared @ present.T
+    norm_b = norm_a.T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cosine = 1.0 - dot / np.sqrt(norm_a * norm_b)
+        squared_distance = np.maximum(norm_a + norm_b - 2.0 * dot, 0.0)
+        euclidean = np.sqrt(squared_distance * values.shape[1] / common)
+
+    insufficient = common < min_common
+    distances = {}
+    for name, matrix in (('cosine', cosine), ('euclidean', euclidean)):
+        matrix[insufficient] = np.nan
+        np.fill_diagonal(matrix, 0.0)
+        distances[name] = matrix
+    return distances
+
+
+class CountrySimilarityIndex:
+    """
+    Índice de vecinos más cercanos entre países
+
+    Guarda las matrices de distancia y, para cada país, el orden de sus
+    vecinos ya calculado, de modo que una consulta top-k es un slice.
+    """
+
+    def __init__(self, countries, distances, n_indicators):
+        self.countries = list(countries)
+        self.n_indicators = n_indicators
+        self._row = {country: i for i, country in enumerate(self.countries)}
+        self._distances = distances
+        self._neighbours = {}
+
+        for metric, matrix in distances.items():
+            ordered = np.where(np.isnan(matrix), np.inf, matrix)
+            np.fill_diagonal(ordered, np.inf)
+            order = np.argsort(ordered, axis=1, kind='stable')
+            valid = np.isfinite(np.take_along_axis(ordered, order, axis=1)).sum(axis=1)
+            self._neighbours[metric] = (order, valid)
+
+    def distance(self, country_a, country_b, metric='cosine'):
+        """Distancia entre dos países (None si no se puede comparar o alguno no está en el índice)"""
+        if metric not in self._distances:
+            raise ValueError(f"Métrica no soportada: {metric}")
+        row_a, row_b = self._row.get(country_a), self._row.get(country_b)
+        if row_a is None or row_b is None:
+            return None
+        value = self._distances[metric][row_a, row_b]
+        return None if np.isnan(value) else float(value)
+
+    def nearest(self, country, k=5, metric='cosine'):
+        """
+        Los k países más parecidos a uno dado
+
+        Args:
+            country (str): Código de país (ej: 'ES')
+            k (int): Número de vecinos
+            metric (str): 'cosine' o 'euclidean'
+
+        Returns:
+            list: Tuplas (país, distancia) de menor a mayor distancia
+        """
+        if metric not in self._neighbours:
+            raise ValueError(f"Métrica no soportada: {metric}")
+        row = self._row.get(country)
+        if row is None:
+            return []
+        order, valid = self._neighbours[metric]
+        neighbours = order[row, :min(k, valid[row])]
+        distances = self._distances[metric][row]
+        return [(self.countries[i], float(distances[i])) for i in neighbours]
+
+    def distance_frame(self, metric='cosine'):
+        """Matriz de distancias como DataFrame país × país"""
+        return pd.DataFrame(self._distances[metric], index=self.countries, columns=self.countries)
+
+
+def _build_similarity_index():
+    profiles = build_country_profiles(build_country_indicator_matrix())
+    distances = pairwise_country_distances(profiles)
+    return CountrySimilarityIndex(profiles.index.tolist(), distances, profiles.shape[1])
+
+
+def _similarity_fingerprint():
+    """Huella de los ~20 ficheros por país; no se recalcula en cada consulta"""
+    if 'value' not in _FINGERPRINT:
+        _FINGERPRINT['value'] = country_data_fingerprint(extra=f"{MIN_INDICATOR_COVERAGE}:{MIN_COMMON_INDICATORS}")
+    return _FINGERPRINT['value']
+
+
+def get_country_similarity_index(use_cache=True):
+    """
+    Índice de similitud entre países (cacheado en disco por huella de datos)
+
+    La huella se calcula una vez por proceso: los datos no cambian mientras
+    la aplicación está en marcha.
+
+    Returns:
+        CountrySimilarityIndex: Índice con distancias precalculadas
+    """
+    if not use_cache:
+        return _build_similarity_index()
+
+    return cached_on_disk('country_similarity_index', _similarity_fingerprint(), _build_similarity_index)
+
+
+def get_most_similar_countries(country='ES', k=5, metric='cosine'):
+    """Atajo: los k países más parecidos a uno dado"""
+    return get_country_similarity_index().nearest(country, k=k, metric=metric)
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
@@ -3,24 +3,37 @@ Módulo para generar gráficos interactivos para storytelling sobre
 la necesidad de trabajar para costear estudios universitarios
 """
 
+import logging
+
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from ..core.tracing import trace_module
 from ..core.data_loaders import read_work_motive_afford_study_dataset
+from ..core.ranking_index import get_ranking_index
+from ..core.countries import DEFAULT_FOCUS_COUNTRY, country_label, country_name
+
+logger = logging.getLogger(__name__)
 
 class WorkStudyStorytellingCharts:
     """
     Clase para generar gráficos de storytelling sobre trabajo y estudios
     """
     
-    def __init__(self):
-        """Inicializa la clase cargando los datos"""
-        self.df = read_work_motive_afford_study_dataset()
+    def __init__(self, df=None):
+        """
+        Inicializa la clase cargando los datos
+        
+        Args:
+            df (pd.DataFrame): Dataset de motivos para trabajar ya cargado
+                (si es None se lee del fichero)
+        """
+        self.df = read_work_motive_afford_study_dataset() if df is None else df
         # Importar configuración unificada de colores
         from ..core.color_config import STORYTELLING_COLORS
         self.colors = STORYTELLING_COLORS
         
-    def get_chart_need_vs_no_need(self, height=600, width=1200):
+    def get_chart_need_vs_no_need(self, height=600, width=1200, focus_country=DEFAULT_FOCUS_COUNTRY):
         """
         Retorna el gráfico interactivo de "Necesitan Trabajar" vs "No Necesitan Trabajar"
         para poder costear sus estudios
@@ -28,6 +41,7 @@ class WorkStudyStorytellingCharts:
         Args:
             height (int): Altura del gráfico en píxeles
             width (int): Ancho del gráfico en píxeles
+            focus_country (str): País destacado en el gráfico
             
         Returns:
             plotly.graph_objects.Figure: Gráfico interactivo
@@ -46,7 +60,7 @@ class WorkStudyStorytellingCharts:
 
         # calcular la media que necesitan trabajar
         mean_need_to_work = need_to_work.mean()
-        print(f"Media de necesitan trabajar: {mean_need_to_work}")  
+        logger.debug(f"Media de necesitan trabajar: {mean_need_to_work}")
 
         # Crear el gráfico
         fig = go.Figure()
@@ -87,22 +101,22 @@ class WorkStudyStorytellingCharts:
             textfont=dict(color='white', size=10, family='Arial')
         ))
         
-        # Destacar España
-        spain_idx = countries.index('ES') if 'ES' in countries else None
-        if spain_idx is not None:
+        # Destacar el país foco
+        focus_idx = countries.index(focus_country) if focus_country in countries else None
+        if focus_idx is not None:
             fig.add_shape(
                 type="rect",
-                x0=spain_idx-0.4, y0=0,
-                x1=spain_idx+0.4, y1=100,
+                x0=focus_idx-0.4, y0=0,
+                x1=focus_idx+0.4, y1=100,
                 line=dict(color=self.colors['spain'], width=4),
                 fillcolor="rgba(0,0,0,0)"
             )
             
-            spain_need = need_to_work.iloc[spain_idx]
+            focus_need = need_to_work.iloc[focus_idx]
             fig.add_annotation(
-                x=spain_idx,
-                y=spain_need + 5,
-                text="🇪🇸 España",
+                x=focus_idx,
+                y=focus_need + 5,
+                text=country_label(focus_country),
                 showarrow=True,
                 arrowhead=2,
                 arrowsize=1,
@@ -151,26 +165,29 @@ class WorkStudyStorytellingCharts:
         
         return fig
     
-    def get_chart_spain_vs_europe(self, height=600, width=1000):
+    def get_chart_spain_vs_europe(self, height=600, width=1000, focus_country=DEFAULT_FOCUS_COUNTRY):
         """
-        Retorna el gráfico interactivo comparando España vs Promedio Europeo
-        sobre la necesidad de trabajar para poder costear los estudios
+        Retorna el gráfico interactivo comparando el país foco (España por
+        defecto) vs Promedio Europeo sobre la necesidad de trabajar para poder
+        costear los estudios
         
         Args:
             height (int): Altura del gráfico en píxeles
             width (int): Ancho del gráfico en píxeles
+            focus_country (str): País comparado con el promedio europeo
             
         Returns:
             plotly.graph_objects.Figure: Gráfico interactivo
         """
-        spain_data = self.df[self.df['Country'] == 'ES'].iloc[0] if 'ES' in self.df['Country'].values else None
+        name = country_name(focus_country)
+        spain_data = self.df[self.df['Country'] == focus_country].iloc[0] if focus_country in self.df['Country'].values else None
         
         if spain_data is None:
-            print("España no encontrada en los datos")
+            logger.warning(f"{name} no encontrado en los datos")
             return None
         
-        # Promedio europeo (excluyendo España y CH)
-        df_no_spain = self.df[(self.df['Country'] != 'ES') & (self.df['Country'] != 'CH')]
+        # Promedio europeo (excluyendo el país foco y CH)
+        df_no_spain = self.df[(self.df['Country'] != focus_country) & (self.df['Country'] != 'CH')]
         
         # Categorías más claras que explican la necesidad de trabajar para pagar estudios
         categories = [
@@ -205,12 +222,12 @@ class WorkStudyStorytellingCharts:
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
-            name='🇪🇸 España',
+            name=country_label(focus_country),
             x=categories,
             y=spain_values,
             marker_color=spain_color,
             opacity=0.9,
-            hovertemplate='<b>España</b><br>' + 
+            hovertemplate=f'<b>{name}</b><br>' + 
                          '%{x}: %{y:.1f}%<br>' +
                          '<extra></extra>',
             text=[f'{val:.1f}%' for val in spain_values],
@@ -237,7 +254,7 @@ class WorkStudyStorytellingCharts:
         fig = apply_standard_layout(
             fig,
             title='<b>¿Qué tan necesario es trabajar para poder pagar los estudios?</b><br>' +
-                  '<sub>Comparación: España vs Promedio Europeo | Porcentaje de estudiantes por nivel de necesidad</sub>',
+                  f'<sub>Comparación: {name} vs Promedio Europeo | Porcentaje de estudiantes por nivel de necesidad</sub>',
             height=height,
             width=width
         )
@@ -278,19 +295,19 @@ class WorkStudyStorytellingCharts:
         
         # Determinar el mensaje según la diferencia
         if difference > 5:
-            comparison_text = f"España supera a Europa en {difference:.1f} puntos porcentuales"
+            comparison_text = f"{name} supera a Europa en {difference:.1f} puntos porcentuales"
             comparison_color = self.colors['need_work']  # NEGATIVE color
         elif difference < -5:
-            comparison_text = f"España está {abs(difference):.1f} puntos por debajo de Europa"
+            comparison_text = f"{name} está {abs(difference):.1f} puntos por debajo de Europa"
             comparison_color = self.colors['dont_need_work']  # POSITIVE color
         else:
-            comparison_text = f"España y Europa están muy similares (diferencia: {difference:+.1f}pp)"
+            comparison_text = f"{name} y Europa están muy similares (diferencia: {difference:+.1f}pp)"
             comparison_color = self.colors['text_light']  # Neutral color
         
         fig.add_annotation(
             x=2, y=max(max(spain_values), max(europe_values)) + 3,
             text=f"<b>Interpretación:</b><br>" +
-                 f"• España: <b>{spain_high_need:.1f}%</b> necesitan trabajar para pagar estudios<br>" +
+                 f"• {name}: <b>{spain_high_need:.1f}%</b> necesitan trabajar para pagar estudios<br>" +
                  f"• Europa: <b>{europe_high_need:.1f}%</b> necesitan trabajar para pagar estudios<br>" +
                  f"• <span style='color: {comparison_color}'><b>{comparison_text}</b></span>",
             showarrow=False,
@@ -301,41 +318,43 @@ class WorkStudyStorytellingCharts:
             align="left"
         )
         
+        # Destacar las barras del país foco si su distribución difiere de la europea
+        from .significance_analysis import dataset_significance
+        from ..core.color_config import apply_significance_marker
+        fig = apply_significance_marker(fig, 0, dataset_significance(self.df, 'applies', focus_country))
+        
         return fig
     
-    def get_key_insights(self):
+    def get_key_insights(self, focus_country=DEFAULT_FOCUS_COUNTRY):
         """
         Retorna los insights clave para storytelling
         
+        Args:
+            focus_country (str): País foco; las claves 'spain_*' contienen sus
+                valores (se conservan los nombres por compatibilidad)
+        
         Returns:
             dict: Diccionario con insights y estadísticas clave
         """
-        spain_data = self.df[self.df['Country'] == 'ES'].iloc[0] if 'ES' in self.df['Country'].values else None
+        spain_data = self.df[self.df['Country'] == focus_country].iloc[0] if focus_country in self.df['Country'].values else None
         
         if spain_data is None:
-            return {"error": "España no encontrada en los datos"}
+            return {"error": f"{country_name(focus_country)} no encontrado en los datos"}
         
         spain_need_work = (spain_data['Applies_Totally_Value'] + 
                           spain_data['Applies_Rather_Value'] + 
                           spain_data['Applies_Partially_Value'])
         
-        # Excluir España y CH del cálculo del promedio europeo
-        df_no_spain = self.df[(self.df['Country'] != 'ES') & (self.df['Country'] != 'CH')]
+        # Excluir el país foco y CH del cálculo del promedio europeo
+        df_no_spain = self.df[(self.df['Country'] != focus_country) & (self.df['Country'] != 'CH')]
         europe_need_work = (df_no_spain['Applies_Totally_Value'].fillna(0) + 
                            df_no_spain['Applies_Rather_Value'].fillna(0) + 
                            df_no_spain['Applies_Partially_Value'].fillna(0)).mean()
         
-        # Encontrar extremos (excluyendo CH)
-        df_stats = self.df[self.df['Country'] != 'CH'].copy()
-        df_stats['Need_Work_Total'] = (df_stats['Applies_Totally_Value'].fillna(0) + 
-                                      df_stats['Applies_Rather_Value'].fillna(0) + 
-                                      df_stats['Applies_Partially_Value'].fillna(0))
-        
-        max_country = df_stats.loc[df_stats['Need_Work_Total'].idxmax(), 'Country']
-        max_percentage = df_stats['Need_Work_Total'].max()
-        
-        min_country = df_stats.loc[df_stats['Need_Work_Total'].idxmin(), 'Country']
-        min_percentage = df_stats['Need_Work_Total'].min()
+        # Encontrar extremos (excluyendo CH) con el ranking precalculado al cargar
+        ranking = get_ranking_index(self.df)
+        max_country, max_percentage = ranking.max_country('Need_Work_Total', exclude=('CH',))
+        min_country, min_percentage = ranking.min_country('Need_Work_Total', exclude=('CH',))
         
         return {
             'spain_need_work': spain_need_work,
@@ -368,9 +387,8 @@ class WorkStudyStorytellingCharts:
         chart1.write_html(f"{save_path}grafico_necesidad_trabajar.html")
         chart2.write_html(f"{save_path}grafico_espana_vs_europa.html")
         
-        print("✅ Gráficos guardados:")
-        print(f"   • {save_path}grafico_necesidad_trabajar.html")
-        print(f"   • {save_path}grafico_espana_vs_europa.html")
+        logger.info(f"✅ Gráficos guardados: {save_path}grafico_necesidad_trabajar.html, "
+                    f"{save_path}grafico_espana_vs_europa.html")
 
 
 # Función de conveniencia para uso rápido
@@ -389,6 +407,11 @@ def create_work_study_charts():
     
     return chart1, chart2, insights
 
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
+
+
 # Demo cuando se ejecuta directamente
 if __name__ == "__main__":
     storytelling = WorkStudyStorytellingCharts()
@@ -5,33 +5,49 @@ Módulo charts: Gráficos organizados por categoría
 - Gráficos de impacto
 - Gráficos de percepción
 - Gráficos geográficos
+- Gráficos de correlación entre indicadores
+- Gráficos de similitud entre países
+- Gráficos de familias de países (clustering)
+
+Los nombres públicos se cargan de forma diferida: cada submódulo (y plotly,
+numpy, ...) se importa la primera vez que se accede a uno de sus nombres.
 """
 
-# Gráficos demográficos
-from .demographic_charts import (
-    create_gender_comparison_chart,
-    create_age_comparison_chart,
-    create_field_of_study_comparison_chart,
-    create_living_with_parents_comparison_chart
-)
-
-# Gráficos de trabajo-estudio
-from .work_study_charts import (
-    create_storytelling_work_study_charts,
-    generate_storytelling_summary
-)
-
-# Gráficos de impacto
-from .impact_charts import get_work_impact_figures_for_streamlit
-
-# Gráficos de percepción
-from .perception_charts import (
-    generate_academic_perception_analysis,
-    generate_happiness_work_relation_analysis
-)
-
-# Gráficos geográficos
-from .geographic_charts import (
-    generate_europe_cost_heatmap,
-    get_cost_statistics
-) 
\ No newline at end of file
+from ..core.lazy_imports import lazy_package
+
+_EXPORTS = {
+    # Gráficos demográficos
+    'create_gender_comparison_chart': '.demographic_charts',
+    'create_age_comparison_chart': '.demographic_charts',
+    'create_field_of_study_comparison_chart': '.demographic_charts',
+    'create_living_with_parents_comparison_chart': '.demographic_charts',
+    'create_combined_demographic_chart': '.demographic_charts',
+
+    # Gráficos de trabajo-estudio
+    'create_storytelling_work_study_charts': '.work_study_charts',
+    'generate_storytelling_summary': '.work_study_charts',
+
+    # Gráficos de impacto
+    'get_work_impact_figures_for_streamlit': '.impact_charts',
+
+    # Gráficos de percepción
+    'generate_academic_perception_analysis': '.perception_charts',
+    'generate_happiness_work_relation_analysis': '.perception_charts',
+
+    # Gráficos geográficos
+    'generate_europe_cost_heatmap': '.geographic_charts',
+    'get_cost_statistics': '.geographic_charts',
+
+    # Gráficos de correlación
+    'create_indicator_correlation_heatmap': '.correlation_charts',
+
+    # Gráficos de similitud
+    'create_country_neighbours_chart': '.similarity_charts',
+
+    # Gráficos de familias de países
+    'create_country_families_chart': '.cluster_charts',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_package(__name__, globals(), _EXPORTS)
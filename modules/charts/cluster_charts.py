@@ -0,0 +1,107 @@
+"""
+Módulo de gráficos de familias de países
+Sitúa cada país según necesidad de trabajar y coste mensual, coloreado por la
+familia a la que pertenece según el clustering de perfiles
+"""
+
+import logging
+
+import plotly.graph_objects as go
+
+# Importar configuración unificada de colores
+from ..core.tracing import trace_module
+from ..core.color_config import STORYTELLING_COLORS, COLOR_PALETTES, apply_standard_layout
+
+logger = logging.getLogger(__name__)
+
+
+def family_color(cluster):
+    """Color de una familia (numeradas desde 1)"""
+    palette = COLOR_PALETTES['country_families']
+    return palette[(cluster - 1) % len(palette)]
+
+
+def create_country_families_chart(k=4, method='kmeans', x_indicator='cost:Monthly_Cost',
+                                  y_indicator='work_motive:Need_Work_Total', height=600, width=900):
+    """
+    Crea un gráfico de dispersión con los países coloreados por familia
+
+    Args:
+        k (int): Número de familias
+        method (str): 'kmeans' o 'hierarchical'
+        x_indicator (str): Indicador del eje X ('dataset:columna')
+        y_indicator (str): Indicador del eje Y ('dataset:columna')
+        height (int): Altura del gráfico en píxeles
+        width (int): Ancho del gráfico en píxeles
+
+    Returns:
+        plotly.graph_objects.Figure: Gráfico de familias, o None si no hay datos
+    """
+    # Importación diferida: el módulo de análisis carga a su vez los módulos de gráficos
+    from ..analysis.country_matrix import build_country_indicator_matrix, KEY_INDICATORS
+    from ..analysis.clustering_analysis import get_country_clusters
+
+    clusters = get_country_clusters(k)
+    matrix = build_country_indicator_matrix()
+    if x_indicator not in matrix.columns or y_indicator not in matrix.columns:
+        logger.warning(f"Indicadores no disponibles: {x_indicator}, {y_indicator}")
+        return None
+
+    labels = {key: label for label, key in KEY_INDICATORS.items()}
+    x_title = labels.get(x_indicator, x_indicator)
+    y_title = labels.get(y_indicator, y_indicator)
+
+    fig = go.Figure()
+
+    for cluster in range(1, clusters.n_clusters + 1):
+        members = [c for c in clusters.members(cluster, method) if c in matrix.index]
+        points = matrix.loc[members, [x_indicator, y_indicator]].dropna()
+        if points.empty:
+            continue
+
+        is_spain = points.index == 'ES'
+        fig.add_trace(go.Scatter(
+            x=points[x_indicator],
+            y=points[y_indicator],
+            mode='markers+text',
+            name=f'Familia {cluster} ({len(members)} países)',
+            text=points.index,
+            textposition='top center',
+            marker=dict(
+                size=[22 if spain else 14 for spain in is_spain],
+                color=family_color(cluster),
+                line=dict(
+                    color=[STORYTELLING_COLORS['spain'] if spain else 'white' for spain in is_spain],
+                    width=[4 if spain else 1.5 for spain in is_spain]
+                )
+            ),
+            hovertemplate='<b>%{text}</b><br>' +
+                          f'{x_title}: ' + '%{x:.1f}<br>' +
+                          f'{y_title}: ' + '%{y:.1f}<br>' +
+                          f'Familia {cluster}<extra></extra>'
+        ))
+
+    method_label = 'k-means' if method == 'kmeans' else 'clustering jerárquico (Ward)'
+    spain_family = clusters.cluster_of('ES', method)
+    subtitle = f'{clusters.n_clusters} familias por {method_label} sobre {len(clusters.indicators)} indicadores'
+    if spain_family is not None:
+        subtitle += f' | España en la familia {spain_family}'
+
+    fig = apply_standard_layout(
+        fig,
+        title=f'<b>Familias de países europeos según el perfil de sus estudiantes</b><br><sub>{subtitle}</sub>',
+        height=height,
+        width=width
+    )
+
+    fig.update_layout(
+        xaxis_title=x_title,
+        yaxis_title=y_title,
+        legend=dict(orientation='h', yanchor='bottom', y=-0.25, xanchor='center', x=0.5)
+    )
+
+    return fig
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
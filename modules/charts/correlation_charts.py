@@ -0,0 +1,88 @@
+"""
+Módulo de gráficos de correlación entre indicadores
+Muestra qué indicadores de los distintos datasets se mueven juntos entre países
+"""
+
+import logging
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Importar configuración unificada de colores
+from ..core.tracing import trace_module
+from ..core.color_config import STORYTELLING_COLORS, apply_standard_layout
+
+logger = logging.getLogger(__name__)
+
+
+def create_indicator_correlation_heatmap(method='spearman', indicators=None, height=650, width=850):
+    """
+    Crea un mapa de calor con la correlación entre indicadores a nivel de país
+
+    Args:
+        method (str): 'pearson' o 'spearman'
+        indicators (dict): Etiqueta -> id de indicador ('dataset:columna');
+            por defecto KEY_INDICATORS
+        height (int): Altura del gráfico en píxeles
+        width (int): Ancho del gráfico en píxeles
+
+    Returns:
+        plotly.graph_objects.Figure: Mapa de calor, o None si no hay datos
+    """
+    # Importación diferida: el módulo de análisis carga a su vez los módulos de gráficos
+    from ..analysis.country_matrix import KEY_INDICATORS
+    from ..analysis.correlation_analysis import get_indicator_correlations
+
+    if indicators is None:
+        indicators = KEY_INDICATORS
+
+    corr = get_indicator_correlations(method)
+    available = {label: key for label, key in indicators.items() if key in corr.index}
+    if len(available) < 2:
+        logger.warning("No hay suficientes indicadores para el mapa de correlación")
+        return None
+
+    labels = list(available.keys())
+    keys = list(available.values())
+    values = corr.loc[keys, keys].to_numpy()
+
+    # Solo el triángulo inferior: la matriz es simétrica
+    mask = np.triu(np.ones_like(values, dtype=bool), k=1)
+    z = np.where(mask, np.nan, values)
+    text = [['' if np.isnan(v) else f'{v:.2f}' for v in row] for row in z]
+
+    fig = go.Figure(data=go.Heatmap(
+        z=z,
+        x=labels,
+        y=labels,
+        text=text,
+        texttemplate='%{text}',
+        zmin=-1,
+        zmax=1,
+        colorscale=[
+            [0.0, STORYTELLING_COLORS['europe']],
+            [0.5, '#FFFFFF'],
+            [1.0, STORYTELLING_COLORS['need_work']]
+        ],
+        hovertemplate='<b>%{y}</b> vs <b>%{x}</b><br>r = %{z:.2f}<extra></extra>',
+        colorbar=dict(title=dict(text='r', font=dict(size=14)), tickfont=dict(size=12))
+    ))
+
+    method_label = 'Spearman' if method == 'spearman' else 'Pearson'
+    fig = apply_standard_layout(
+        fig,
+        title='<b>¿Qué indicadores se mueven juntos entre países?</b><br>' +
+              f'<sub>Correlación de {method_label} entre indicadores por país europeo</sub>',
+        height=height,
+        width=width
+    )
+
+    fig.update_layout(margin=dict(t=120, b=120, l=180, r=60))
+    fig.update_xaxes(tickangle=45, showgrid=False)
+    fig.update_yaxes(autorange='reversed', showgrid=False)
+
+    return fig
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
@@ -1,3 +1,5 @@
+import logging
+
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -17,7 +19,12 @@ class PreprocessedDatasetsNamesWorkMotiveAffordStudy(Enum):
     WORK_MOTIVE_AFFORD_STUDY_S_PARENTS_FINANCIAL_STATUS = 'data/preprocessed_excels/E8_work_motive_afford_study_5__s_parents_financial_status__all_contries.xlsx'
 
 # Importar configuración unificada de colores
+from ..core.tracing import trace_module
 from ..core.color_config import STORYTELLING_COLORS, COLOR_PALETTES, apply_standard_layout
+from ..core.ranking_index import attach_ranking_index
+from ..core.countries import DEFAULT_FOCUS_COUNTRY, country_name
+
+logger = logging.getLogger(__name__)
 
 def translate_age_category(category):
     """
@@ -216,7 +223,7 @@ def read_demographic_dataset_detailed(dataset_enum):
             current_category = h1
             subcategories.append((i, current_category))
     
-    # Para cada subcategoría, extraer los datos de España vs promedio europeo
+    # Para cada subcategoría, extraer los datos por país (foco vs promedio europeo)
     results = {}
     
     for start_col, category_name in subcategories:
@@ -245,41 +252,48 @@ def read_demographic_dataset_detailed(dataset_enum):
                 if value_col in category_data.columns:
                     category_data[value_col] = pd.to_numeric(category_data[value_col], errors='coerce')
             
-            results[category_name] = category_data
+            # Rankings precalculados por grupo demográfico
+            results[category_name] = attach_ranking_index(category_data)
     
     return results
 
-def create_gender_comparison_chart():
+def create_gender_comparison_chart(gender_data=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico comparativo específico por género
+    
+    Args:
+        gender_data (dict): Grupos ya cargados con read_demographic_dataset_detailed
+            (si es None se leen del fichero)
+        focus_country (str): País comparado con el promedio europeo
     """
-    gender_data = read_demographic_dataset_detailed(
-        PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_SEX
-    )
+    if gender_data is None:
+        gender_data = read_demographic_dataset_detailed(
+            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_SEX
+        )
     
     if 'Female' not in gender_data or 'Male' not in gender_data:
         # Si no tenemos datos separados por género, crear un gráfico básico
         return create_basic_demographic_chart("Análisis por Género", "No se encontraron datos separados por género")
     
-    # Extraer datos de España para hombres y mujeres
-    female_spain = gender_data['Female'][gender_data['Female']['Country'] == 'ES']
-    male_spain = gender_data['Male'][gender_data['Male']['Country'] == 'ES']
+    # Extraer datos del país foco para hombres y mujeres
+    female_focus = gender_data['Female'][gender_data['Female']['Country'] == focus_country]
+    male_focus = gender_data['Male'][gender_data['Male']['Country'] == focus_country]
     
-    if female_spain.empty or male_spain.empty:
-        return create_basic_demographic_chart("Análisis por Género", "No se encontraron datos de España")
+    if female_focus.empty or male_focus.empty:
+        return create_basic_demographic_chart("Análisis por Género", f"No se encontraron datos de {country_name(focus_country)}")
     
     # Calcular necesidad total de trabajar
-    female_spain_need = (female_spain.iloc[0]['Applies_Totally_Value'] + 
-                        female_spain.iloc[0]['Applies_Rather_Value'] + 
-                        female_spain.iloc[0]['Applies_Partially_Value'])
+    female_focus_need = (female_focus.iloc[0]['Applies_Totally_Value'] + 
+                        female_focus.iloc[0]['Applies_Rather_Value'] + 
+                        female_focus.iloc[0]['Applies_Partially_Value'])
     
-    male_spain_need = (male_spain.iloc[0]['Applies_Totally_Value'] + 
-                      male_spain.iloc[0]['Applies_Rather_Value'] + 
-                      male_spain.iloc[0]['Applies_Partially_Value'])
+    male_focus_need = (male_focus.iloc[0]['Applies_Totally_Value'] + 
+                      male_focus.iloc[0]['Applies_Rather_Value'] + 
+                      male_focus.iloc[0]['Applies_Partially_Value'])
     
     # Promedios europeos por género
-    female_europe = gender_data['Female'][gender_data['Female']['Country'] != 'ES']
-    male_europe = gender_data['Male'][gender_data['Male']['Country'] != 'ES']
+    female_europe = gender_data['Female'][gender_data['Female']['Country'] != focus_country]
+    male_europe = gender_data['Male'][gender_data['Male']['Country'] != focus_country]
     
     female_europe_need = (female_europe['Applies_Totally_Value'].fillna(0) + 
                          female_europe['Applies_Rather_Value'].fillna(0) + 
@@ -293,21 +307,21 @@ def create_gender_comparison_chart():
     fig = go.Figure()
     
     categories = ['Mujeres', 'Hombres']
-    spain_values = [female_spain_need, male_spain_need]
+    focus_values = [female_focus_need, male_focus_need]
     europe_values = [female_europe_need, male_europe_need]
     
     x = np.arange(len(categories))
     width = 0.35
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=country_name(focus_country),
         x=[x[0] - width/2, x[1] - width/2],
-        y=spain_values,
+        y=focus_values,
         marker_color=COLORS['spain'],
         marker_line=dict(color='white', width=2),
-        hovertemplate='<b>España - %{x}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
-        text=[f'{val:.1f}%' for val in spain_values],
+        hovertemplate='<b>' + country_name(focus_country) + ' - %{x}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
+        text=[f'{val:.1f}%' for val in focus_values],
         textposition='outside',
         width=width
     ))
@@ -328,7 +342,7 @@ def create_gender_comparison_chart():
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig, 
-        title='<b>Necesidad de Trabajar por Género</b><br><i>España vs Promedio Europeo</i>',
+        title=f'<b>Necesidad de Trabajar por Género</b><br><i>{country_name(focus_country)} vs Promedio Europeo</i>',
         height=600,
         width=800
     )
@@ -368,13 +382,19 @@ def create_gender_comparison_chart():
     
     return fig
 
-def create_age_comparison_chart():
+def create_age_comparison_chart(age_data=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico comparativo específico por edad
+    
+    Args:
+        age_data (dict): Grupos ya cargados con read_demographic_dataset_detailed
+            (si es None se leen del fichero)
+        focus_country (str): País comparado con el promedio europeo
     """
-    age_data = read_demographic_dataset_detailed(
-        PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_AGE
-    )
+    if age_data is None:
+        age_data = read_demographic_dataset_detailed(
+            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_AGE
+        )
     
     if not age_data:
         return create_basic_demographic_chart("Análisis por Edad", "No se encontraron datos de edad")
@@ -382,20 +402,20 @@ def create_age_comparison_chart():
     # Obtener las categorías de edad disponibles
     age_categories = list(age_data.keys())
     
-    spain_data = []
+    focus_data = []
     europe_data = []
     category_names = []
     
     for category in age_categories:
-        spain_row = age_data[category][age_data[category]['Country'] == 'ES']
-        if not spain_row.empty:
-            spain_need = (spain_row.iloc[0]['Applies_Totally_Value'] + 
-                         spain_row.iloc[0]['Applies_Rather_Value'] + 
-                         spain_row.iloc[0]['Applies_Partially_Value'])
-            spain_data.append(spain_need)
+        focus_row = age_data[category][age_data[category]['Country'] == focus_country]
+        if not focus_row.empty:
+            focus_need = (focus_row.iloc[0]['Applies_Totally_Value'] + 
+                         focus_row.iloc[0]['Applies_Rather_Value'] + 
+                         focus_row.iloc[0]['Applies_Partially_Value'])
+            focus_data.append(focus_need)
             
             # Promedio europeo para esta categoría
-            europe_rows = age_data[category][age_data[category]['Country'] != 'ES']
+            europe_rows = age_data[category][age_data[category]['Country'] != focus_country]
             europe_need = (europe_rows['Applies_Totally_Value'].fillna(0) + 
                           europe_rows['Applies_Rather_Value'].fillna(0) + 
                           europe_rows['Applies_Partially_Value'].fillna(0)).mean()
@@ -405,8 +425,8 @@ def create_age_comparison_chart():
             translated_category = translate_age_category(category)
             category_names.append(translated_category)
     
-    if not spain_data:
-        return create_basic_demographic_chart("Análisis por Edad", "No se encontraron datos de España por edad")
+    if not focus_data:
+        return create_basic_demographic_chart("Análisis por Edad", f"No se encontraron datos de {country_name(focus_country)} por edad")
     
     # Crear el gráfico
     fig = go.Figure()
@@ -414,15 +434,15 @@ def create_age_comparison_chart():
     x = np.arange(len(category_names))
     width = 0.35
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=country_name(focus_country),
         x=[i - width/2 for i in x],
-        y=spain_data,
+        y=focus_data,
         marker_color=COLORS['spain'],
         marker_line=dict(color='white', width=2),
-        hovertemplate='<b>España - %{x}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
-        text=[f'{val:.1f}%' for val in spain_data],
+        hovertemplate='<b>' + country_name(focus_country) + ' - %{x}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
+        text=[f'{val:.1f}%' for val in focus_data],
         textposition='outside',
         width=width
     ))
@@ -443,7 +463,7 @@ def create_age_comparison_chart():
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig, 
-        title='<b>Necesidad de Trabajar por Edad</b><br><i>España vs Promedio Europeo</i>',
+        title=f'<b>Necesidad de Trabajar por Edad</b><br><i>{country_name(focus_country)} vs Promedio Europeo</i>',
         height=600,
         width=1000
     )
@@ -501,13 +521,19 @@ def create_basic_demographic_chart(title, message):
     
     return fig
 
-def create_field_of_study_comparison_chart():
+def create_field_of_study_comparison_chart(field_data=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico comparativo específico por campo de estudio
+    
+    Args:
+        field_data (dict): Grupos ya cargados con read_demographic_dataset_detailed
+            (si es None se leen del fichero)
+        focus_country (str): País comparado con el promedio europeo
     """
-    field_data = read_demographic_dataset_detailed(
-        PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_FIELD_OF_STUDY
-    )
+    if field_data is None:
+        field_data = read_demographic_dataset_detailed(
+            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_FIELD_OF_STUDY
+        )
     
     if not field_data:
         return create_basic_demographic_chart("Análisis por Campo de Estudio", "No se encontraron datos de campo de estudio")
@@ -515,20 +541,20 @@ def create_field_of_study_comparison_chart():
     # Obtener las categorías de campo de estudio disponibles
     field_categories = list(field_data.keys())
     
-    spain_data = []
+    focus_data = []
     europe_data = []
     category_names = []
     
     for category in field_categories:
-        spain_row = field_data[category][field_data[category]['Country'] == 'ES']
-        if not spain_row.empty:
-            spain_need = (spain_row.iloc[0]['Applies_Totally_Value'] + 
-                         spain_row.iloc[0]['Applies_Rather_Value'] + 
-                         spain_row.iloc[0]['Applies_Partially_Value'])
-            spain_data.append(spain_need)
+        focus_row = field_data[category][field_data[category]['Country'] == focus_country]
+        if not focus_row.empty:
+            focus_need = (focus_row.iloc[0]['Applies_Totally_Value'] + 
+                         focus_row.iloc[0]['Applies_Rather_Value'] + 
+                         focus_row.iloc[0]['Applies_Partially_Value'])
+            focus_data.append(focus_need)
             
             # Promedio europeo para esta categoría
-            europe_rows = field_data[category][field_data[category]['Country'] != 'ES']
+            europe_rows = field_data[category][field_data[category]['Country'] != focus_country]
             europe_need = (europe_rows['Applies_Totally_Value'].fillna(0) + 
                           europe_rows['Applies_Rather_Value'].fillna(0) + 
                           europe_rows['Applies_Partially_Value'].fillna(0)).mean()
@@ -541,8 +567,8 @@ def create_field_of_study_comparison_chart():
                 translated_name = translated_name[:22] + "..."
             category_names.append(translated_name)
     
-    if not spain_data:
-        return create_basic_demographic_chart("Análisis por Campo de Estudio", "No se encontraron datos de España")
+    if not focus_data:
+        return create_basic_demographic_chart("Análisis por Campo de Estudio", f"No se encontraron datos de {country_name(focus_country)}")
     
     # Crear el gráfico
     fig = go.Figure()
@@ -553,14 +579,14 @@ def create_field_of_study_comparison_chart():
     # Preparar textos para hover (nombres traducidos completos)
     translated_full_names = [translate_field_of_study_category(cat) for cat in field_categories]
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=country_name(focus_country),
         x=[i - width/2 for i in x],
-        y=spain_data,
+        y=focus_data,
         marker_color=COLORS['spain'],
         marker_line=dict(color='white', width=2),
-        hovertemplate='<b>España - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
+        hovertemplate='<b>' + country_name(focus_country) + ' - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
         text=translated_full_names,  # Nombres traducidos completos en hover
         textposition='outside',
         width=width
@@ -582,7 +608,7 @@ def create_field_of_study_comparison_chart():
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig, 
-        title='<b>Necesidad de Trabajar por Campo de Estudio</b><br><i>España vs Promedio Europeo</i>',
+        title=f'<b>Necesidad de Trabajar por Campo de Estudio</b><br><i>{country_name(focus_country)} vs Promedio Europeo</i>',
         height=700,
         width=1200
     )
@@ -614,13 +640,19 @@ def create_field_of_study_comparison_chart():
     
     return fig
 
-def create_financial_difficulties_comparison_chart():
+def create_financial_difficulties_comparison_chart(financial_data=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico comparativo específico por dificultades financieras
+    
+    Args:
+        financial_data (dict): Grupos ya cargados con read_demographic_dataset_detailed
+            (si es None se leen del fichero)
+        focus_country (str): País comparado con el promedio europeo
     """
-    financial_data = read_demographic_dataset_detailed(
-        PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_FINANCIAL_DIFFICULTIES
-    )
+    if financial_data is None:
+        financial_data = read_demographic_dataset_detailed(
+            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_FINANCIAL_DIFFICULTIES
+        )
     
     if not financial_data:
         return create_basic_demographic_chart("Análisis por Dificultades Financieras", "No se encontraron datos")
@@ -628,20 +660,20 @@ def create_financial_difficulties_comparison_chart():
     # Obtener las categorías de dificultades financieras
     financial_categories = list(financial_data.keys())
     
-    spain_data = []
+    focus_data = []
     europe_data = []
     category_names = []
     
     for category in financial_categories:
-        spain_row = financial_data[category][financial_data[category]['Country'] == 'ES']
-        if not spain_row.empty:
-            spain_need = (spain_row.iloc[0]['Applies_Totally_Value'] + 
-                         spain_row.iloc[0]['Applies_Rather_Value'] + 
-                         spain_row.iloc[0]['Applies_Partially_Value'])
-            spain_data.append(spain_need)
+        focus_row = financial_data[category][financial_data[category]['Country'] == focus_country]
+        if not focus_row.empty:
+            focus_need = (focus_row.iloc[0]['Applies_Totally_Value'] + 
+                         focus_row.iloc[0]['Applies_Rather_Value'] + 
+                         focus_row.iloc[0]['Applies_Partially_Value'])
+            focus_data.append(focus_need)
             
             # Promedio europeo para esta categoría
-            europe_rows = financial_data[category][financial_data[category]['Country'] != 'ES']
+            europe_rows = financial_data[category][financial_data[category]['Country'] != focus_country]
             europe_need = (europe_rows['Applies_Totally_Value'].fillna(0) + 
                           europe_rows['Applies_Rather_Value'].fillna(0) + 
                           europe_rows['Applies_Partially_Value'].fillna(0)).mean()
@@ -649,8 +681,8 @@ def create_financial_difficulties_comparison_chart():
             
             category_names.append(category)
     
-    if not spain_data:
-        return create_basic_demographic_chart("Análisis por Dificultades Financieras", "No se encontraron datos de España")
+    if not focus_data:
+        return create_basic_demographic_chart("Análisis por Dificultades Financieras", f"No se encontraron datos de {country_name(focus_country)}")
     
     # Crear el gráfico
     fig = go.Figure()
@@ -659,19 +691,19 @@ def create_financial_difficulties_comparison_chart():
     width = 0.35
     
     # Colores especiales para dificultades financieras
-    colors_spain = [COLORS['high_difficulty'] if 'high' in cat.lower() or 'severe' in cat.lower() 
+    colors_focus = [COLORS['high_difficulty'] if 'high' in cat.lower() or 'severe' in cat.lower() 
                    else COLORS['spain'] for cat in category_names]
     colors_europe = [COLORS['high_difficulty'] if 'high' in cat.lower() or 'severe' in cat.lower() 
                     else COLORS['europe'] for cat in category_names]
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=country_name(focus_country),
         x=[i - width/2 for i in x],
-        y=spain_data,
-        marker_color=colors_spain,
+        y=focus_data,
+        marker_color=colors_focus,
         marker_line=dict(color='white', width=2),
-        hovertemplate='<b>España - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
+        hovertemplate='<b>' + country_name(focus_country) + ' - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
         text=category_names,
         textposition='outside',
         width=width
@@ -692,7 +724,7 @@ def create_financial_difficulties_comparison_chart():
     
     fig.update_layout(
         title={
-            'text': '<b>Necesidad de Trabajar por Dificultades Financieras</b><br><i>España vs Promedio Europeo</i>',
+            'text': f'<b>Necesidad de Trabajar por Dificultades Financieras</b><br><i>{country_name(focus_country)} vs Promedio Europeo</i>',
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 18, 'color': '#2c3e50'}
@@ -735,13 +767,19 @@ def create_financial_difficulties_comparison_chart():
     
     return fig
 
-def create_living_with_parents_comparison_chart():
+def create_living_with_parents_comparison_chart(living_data=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico comparativo específico por situación de vivienda con padres
+    
+    Args:
+        living_data (dict): Grupos ya cargados con read_demographic_dataset_detailed
+            (si es None se leen del fichero)
+        focus_country (str): País comparado con el promedio europeo
     """
-    living_data = read_demographic_dataset_detailed(
-        PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_NOTLIVINGWITHPARENTS
-    )
+    if living_data is None:
+        living_data = read_demographic_dataset_detailed(
+            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_NOTLIVINGWITHPARENTS
+        )
     
     if not living_data:
         return create_basic_demographic_chart("Análisis por Situación de Vivienda", "No se encontraron datos")
@@ -749,20 +787,20 @@ def create_living_with_parents_comparison_chart():
     # Obtener las categorías disponibles
     living_categories = list(living_data.keys())
     
-    spain_data = []
+    focus_data = []
     europe_data = []
     category_names = []
     
     for category in living_categories:
-        spain_row = living_data[category][living_data[category]['Country'] == 'ES']
-        if not spain_row.empty:
-            spain_need = (spain_row.iloc[0]['Applies_Totally_Value'] + 
-                         spain_row.iloc[0]['Applies_Rather_Value'] + 
-                         spain_row.iloc[0]['Applies_Partially_Value'])
-            spain_data.append(spain_need)
+        focus_row = living_data[category][living_data[category]['Country'] == focus_country]
+        if not focus_row.empty:
+            focus_need = (focus_row.iloc[0]['Applies_Totally_Value'] + 
+                         focus_row.iloc[0]['Applies_Rather_Value'] + 
+                         focus_row.iloc[0]['Applies_Partially_Value'])
+            focus_data.append(focus_need)
             
             # Promedio europeo para esta categoría
-            europe_rows = living_data[category][living_data[category]['Country'] != 'ES']
+            europe_rows = living_data[category][living_data[category]['Country'] != focus_country]
             europe_need = (europe_rows['Applies_Totally_Value'].fillna(0) + 
                           europe_rows['Applies_Rather_Value'].fillna(0) + 
                           europe_rows['Applies_Partially_Value'].fillna(0)).mean()
@@ -782,8 +820,8 @@ def create_living_with_parents_comparison_chart():
                 simplified_name = category.replace('parents', 'padres').replace('living', 'viviendo')
             category_names.append(simplified_name)
     
-    if not spain_data:
-        return create_basic_demographic_chart("Análisis por Situación de Vivienda", "No se encontraron datos de España")
+    if not focus_data:
+        return create_basic_demographic_chart("Análisis por Situación de Vivienda", f"No se encontraron datos de {country_name(focus_country)}")
     
     # Crear el gráfico
     fig = go.Figure()
@@ -791,14 +829,14 @@ def create_living_with_parents_comparison_chart():
     x = np.arange(len(category_names))
     width = 0.35
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=country_name(focus_country),
         x=[i - width/2 for i in x],
-        y=spain_data,
+        y=focus_data,
         marker_color=COLORS['spain'],
         marker_line=dict(color='white', width=2),
-        hovertemplate='<b>España - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
+        hovertemplate='<b>' + country_name(focus_country) + ' - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
         text=category_names,
         textposition='outside',
         width=width
@@ -820,7 +858,7 @@ def create_living_with_parents_comparison_chart():
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig, 
-        title='<b>Necesidad de Trabajar por Situación de Vivienda</b><br><i>España vs Promedio Europeo</i>',
+        title=f'<b>Necesidad de Trabajar por Situación de Vivienda</b><br><i>{country_name(focus_country)} vs Promedio Europeo</i>',
         height=600,
         width=800
     )
@@ -860,13 +898,19 @@ def create_living_with_parents_comparison_chart():
     
     return fig
 
-def create_parents_financial_status_comparison_chart():
+def create_parents_financial_status_comparison_chart(parents_data=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico comparativo específico por estado financiero de los padres
+    
+    Args:
+        parents_data (dict): Grupos ya cargados con read_demographic_dataset_detailed
+            (si es None se leen del fichero)
+        focus_country (str): País comparado con el promedio europeo
     """
-    parents_data = read_demographic_dataset_detailed(
-        PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_S_PARENTS_FINANCIAL_STATUS
-    )
+    if parents_data is None:
+        parents_data = read_demographic_dataset_detailed(
+            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_S_PARENTS_FINANCIAL_STATUS
+        )
     
     if not parents_data:
         return create_basic_demographic_chart("Análisis por Estado Financiero de Padres", "No se encontraron datos")
@@ -874,20 +918,20 @@ def create_parents_financial_status_comparison_chart():
     # Obtener las categorías disponibles
     parents_categories = list(parents_data.keys())
     
-    spain_data = []
+    focus_data = []
     europe_data = []
     category_names = []
     
     for category in parents_categories:
-        spain_row = parents_data[category][parents_data[category]['Country'] == 'ES']
-        if not spain_row.empty:
-            spain_need = (spain_row.iloc[0]['Applies_Totally_Value'] + 
-                         spain_row.iloc[0]['Applies_Rather_Value'] + 
-                         spain_row.iloc[0]['Applies_Partially_Value'])
-            spain_data.append(spain_need)
+        focus_row = parents_data[category][parents_data[category]['Country'] == focus_country]
+        if not focus_row.empty:
+            focus_need = (focus_row.iloc[0]['Applies_Totally_Value'] + 
+                         focus_row.iloc[0]['Applies_Rather_Value'] + 
+                         focus_row.iloc[0]['Applies_Partially_Value'])
+            focus_data.append(focus_need)
             
             # Promedio europeo para esta categoría
-            europe_rows = parents_data[category][parents_data[category]['Country'] != 'ES']
+            europe_rows = parents_data[category][parents_data[category]['Country'] != focus_country]
             europe_need = (europe_rows['Applies_Totally_Value'].fillna(0) + 
                           europe_rows['Applies_Rather_Value'].fillna(0) + 
                           europe_rows['Applies_Partially_Value'].fillna(0)).mean()
@@ -909,8 +953,8 @@ def create_parents_financial_status_comparison_chart():
                 simplified_name = category.replace('financial status', 'Situación Financiera').replace('parents', 'Padres').strip()
             category_names.append(simplified_name)
     
-    if not spain_data:
-        return create_basic_demographic_chart("Análisis por Estado Financiero de Padres", "No se encontraron datos de España")
+    if not focus_data:
+        return create_basic_demographic_chart("Análisis por Estado Financiero de Padres", f"No se encontraron datos de {country_name(focus_country)}")
     
     # Crear el gráfico
     fig = go.Figure()
@@ -919,27 +963,27 @@ def create_parents_financial_status_comparison_chart():
     width = 0.35
     
     # Colores según el nivel financiero
-    colors_spain = []
+    colors_focus = []
     colors_europe = []
     for cat in category_names:
         if any(word in cat.lower() for word in ['low', 'poor', 'bajo']):
-            colors_spain.append(COLORS['high_difficulty'])
+            colors_focus.append(COLORS['high_difficulty'])
             colors_europe.append(COLORS['high_difficulty'])
         elif any(word in cat.lower() for word in ['high', 'wealthy', 'alto']):
-            colors_spain.append(COLORS['low_difficulty'])
+            colors_focus.append(COLORS['low_difficulty'])
             colors_europe.append(COLORS['low_difficulty'])
         else:
-            colors_spain.append(COLORS['spain'])
+            colors_focus.append(COLORS['spain'])
             colors_europe.append(COLORS['europe'])
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=country_name(focus_country),
         x=[i - width/2 for i in x],
-        y=spain_data,
-        marker_color=colors_spain,
+        y=focus_data,
+        marker_color=colors_focus,
         marker_line=dict(color='white', width=2),
-        hovertemplate='<b>España - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
+        hovertemplate='<b>' + country_name(focus_country) + ' - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
         text=category_names,
         textposition='outside',
         width=width
@@ -961,7 +1005,7 @@ def create_parents_financial_status_comparison_chart():
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig, 
-        title='<b>Necesidad de Trabajar por Estado Financiero de los Padres</b><br><i>España vs Promedio Europeo</i>',
+        title=f'<b>Necesidad de Trabajar por Estado Financiero de los Padres</b><br><i>{country_name(focus_country)} vs Promedio Europeo</i>',
         height=600,
         width=1000
     )
@@ -999,9 +1043,12 @@ def create_parents_financial_status_comparison_chart():
     
     return fig
 
-def create_parents_education_comparison_chart():
+def create_parents_education_comparison_chart(focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico comparativo específico por nivel educativo de los padres
+    
+    Args:
+        focus_country (str): País comparado con el promedio europeo
     """
     parents_education_data = read_demographic_dataset_detailed(
         PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_EDUPAR
@@ -1013,20 +1060,20 @@ def create_parents_education_comparison_chart():
     # Obtener las categorías disponibles
     education_categories = list(parents_education_data.keys())
     
-    spain_data = []
+    focus_data = []
     europe_data = []
     category_names = []
     
     for category in education_categories:
-        spain_row = parents_education_data[category][parents_education_data[category]['Country'] == 'ES']
-        if not spain_row.empty:
-            spain_need = (spain_row.iloc[0]['Applies_Totally_Value'] + 
-                         spain_row.iloc[0]['Applies_Rather_Value'] + 
-                         spain_row.iloc[0]['Applies_Partially_Value'])
-            spain_data.append(spain_need)
+        focus_row = parents_education_data[category][parents_education_data[category]['Country'] == focus_country]
+        if not focus_row.empty:
+            focus_need = (focus_row.iloc[0]['Applies_Totally_Value'] + 
+                         focus_row.iloc[0]['Applies_Rather_Value'] + 
+                         focus_row.iloc[0]['Applies_Partially_Value'])
+            focus_data.append(focus_need)
             
             # Promedio europeo para esta categoría
-            europe_rows = parents_education_data[category][parents_education_data[category]['Country'] != 'ES']
+            europe_rows = parents_education_data[category][parents_education_data[category]['Country'] != focus_country]
             europe_need = (europe_rows['Applies_Totally_Value'].fillna(0) + 
                           europe_rows['Applies_Rather_Value'].fillna(0) + 
                           europe_rows['Applies_Partially_Value'].fillna(0)).mean()
@@ -1052,8 +1099,8 @@ def create_parents_education_comparison_chart():
                 simplified_name = category.replace('education', 'Educación').replace('level', 'Nivel').strip()
             category_names.append(simplified_name)
     
-    if not spain_data:
-        return create_basic_demographic_chart("Análisis por Nivel Educativo de Padres", "No se encontraron datos de España")
+    if not focus_data:
+        return create_basic_demographic_chart("Análisis por Nivel Educativo de Padres", f"No se encontraron datos de {country_name(focus_country)}")
     
     # Crear el gráfico
     fig = go.Figure()
@@ -1062,30 +1109,30 @@ def create_parents_education_comparison_chart():
     width = 0.35
     
     # Colores según el nivel educativo (correlación inversa con necesidad de trabajar)
-    colors_spain = []
+    colors_focus = []
     colors_europe = []
     for cat in category_names:
         if any(word in cat.lower() for word in ['primaria', 'sin educación', 'none', 'basic']):
-            colors_spain.append(COLORS['high_difficulty'])  # Rojo para educación baja
+            colors_focus.append(COLORS['high_difficulty'])  # Rojo para educación baja
             colors_europe.append(COLORS['high_difficulty'])
         elif any(word in cat.lower() for word in ['doctorado', 'máster', 'phd', 'postgraduate']):
-            colors_spain.append(COLORS['low_difficulty'])   # Verde para educación alta
+            colors_focus.append(COLORS['low_difficulty'])   # Verde para educación alta
             colors_europe.append(COLORS['low_difficulty'])
         elif any(word in cat.lower() for word in ['universitaria', 'bachelor', 'university']):
-            colors_spain.append(STORYTELLING_COLORS['europe']) # Azul para educación universitaria
+            colors_focus.append(STORYTELLING_COLORS['europe']) # Azul para educación universitaria
             colors_europe.append(STORYTELLING_COLORS['europe'])
         else:
-            colors_spain.append(COLORS['spain'])  # Color por defecto
+            colors_focus.append(COLORS['spain'])  # Color por defecto
             colors_europe.append(COLORS['europe'])
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=country_name(focus_country),
         x=[i - width/2 for i in x],
-        y=spain_data,
-        marker_color=colors_spain,
+        y=focus_data,
+        marker_color=colors_focus,
         marker_line=dict(color='white', width=2),
-        hovertemplate='<b>España - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
+        hovertemplate='<b>' + country_name(focus_country) + ' - %{text}</b><br>Necesidad de trabajar: %{y:.1f}%<extra></extra>',
         text=category_names,
         textposition='outside',
         width=width
@@ -1107,7 +1154,7 @@ def create_parents_education_comparison_chart():
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig, 
-        title='<b>Necesidad de Trabajar por Nivel Educativo de los Padres</b><br><i>España vs Promedio Europeo</i>',
+        title=f'<b>Necesidad de Trabajar por Nivel Educativo de los Padres</b><br><i>{country_name(focus_country)} vs Promedio Europeo</i>',
         height=600,
         width=1000
     )
@@ -1145,6 +1192,119 @@ def create_parents_education_comparison_chart():
     
     return fig
 
+# Desgloses de la figura combinada: clave -> (etiqueta del botón, builder, dataset)
+DEMOGRAPHIC_BREAKDOWNS = {
+    'gender': ('Género', create_gender_comparison_chart,
+               PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_SEX),
+    'age': ('Edad', create_age_comparison_chart,
+            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_AGE),
+    'field_of_study': ('Área de estudios', create_field_of_study_comparison_chart,
+                       PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_FIELD_OF_STUDY),
+    'living_with_parents': ('Convivencia', create_living_with_parents_comparison_chart,
+                            PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_NOTLIVINGWITHPARENTS),
+    'financial_difficulties': ('Dificultades financieras', create_financial_difficulties_comparison_chart,
+                               PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_E_FINANCIAL_DIFFICULTIES),
+    'parents_financial_status': ('Situación de los padres', create_parents_financial_status_comparison_chart,
+                                 PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY_S_PARENTS_FINANCIAL_STATUS),
+}
+
+# Tamaño máximo del JSON de la figura combinada que se envía al navegador
+COMBINED_PAYLOAD_BUDGET_BYTES = 64 * 1024
+
+def report_payload_size(fig, budget_bytes=COMBINED_PAYLOAD_BUDGET_BYTES, label='Figura'):
+    """
+    Mide el tamaño del JSON que Streamlit envía al navegador para una figura
+    
+    Returns:
+        dict: bytes, budget_bytes y within_budget
+    """
+    size = len(fig.to_json().encode('utf-8'))
+    within_budget = size <= budget_bytes
+    marker = '📦' if within_budget else '⚠️'
+    (logger.info if within_budget else logger.warning)(f"{marker} {label}: {size / 1024:.1f} KB (presupuesto {budget_bytes / 1024:.0f} KB)")
+    return {'bytes': size, 'budget_bytes': budget_bytes, 'within_budget': within_budget}
+
+def create_combined_demographic_chart(breakdown_data=None, focus_country=DEFAULT_FOCUS_COUNTRY):
+    """
+    Crea una única figura con todos los desgloses demográficos
+    
+    Las trazas de cada desglose se calculan aquí una sola vez y viajan juntas
+    al navegador; el selector (updatemenus) cambia de desglose alternando la
+    visibilidad de las trazas y los ejes, sin volver a ejecutar el script.
+    
+    Args:
+        breakdown_data (dict): Clave de DEMOGRAPHIC_BREAKDOWNS -> grupos ya
+            cargados con read_demographic_dataset_detailed (los que falten se
+            leen del fichero)
+        focus_country (str): País comparado con el promedio europeo
+    
+    Returns:
+        plotly.graph_objects.Figure: Figura combinada
+    """
+    breakdown_data = breakdown_data or {}
+    
+    # Figuras individuales de cada desglose (mismos builders que el capítulo)
+    figures = {}
+    for key, (label, builder, dataset_enum) in DEMOGRAPHIC_BREAKDOWNS.items():
+        data = breakdown_data.get(key)
+        if data is None:
+            data = read_demographic_dataset_detailed(dataset_enum)
+        figures[key] = builder(data, focus_country=focus_country)
+    
+    fig = go.Figure()
+    trace_owner = []
+    for key, breakdown_fig in figures.items():
+        for trace in breakdown_fig.data:
+            fig.add_trace(trace)
+            trace_owner.append(key)
+    
+    buttons = []
+    for key, breakdown_fig in figures.items():
+        layout = breakdown_fig.layout
+        buttons.append(dict(
+            label=DEMOGRAPHIC_BREAKDOWNS[key][0],
+            method='update',
+            args=[
+                {'visible': [owner == key for owner in trace_owner]},
+                {
+                    'title.text': layout.title.text,
+                    'xaxis.title.text': layout.xaxis.title.text,
+                    'xaxis.tickvals': layout.xaxis.tickvals,
+                    'xaxis.ticktext': layout.xaxis.ticktext,
+                    'height': layout.height,
+                },
+            ],
+        ))
+    
+    # El layout de partida es el del primer desglose, con solo sus trazas visibles
+    first_key = next(iter(figures))
+    first_layout = figures[first_key].layout
+    fig.update_layout(first_layout)
+    for trace, owner in zip(fig.data, trace_owner):
+        trace.visible = owner == first_key
+    
+    fig.update_layout(
+        width=None,
+        # Selector a la izquierda, sobre el gráfico (la leyenda queda a la derecha)
+        updatemenus=[dict(
+            type='dropdown',
+            direction='down',
+            buttons=buttons,
+            active=0,
+            showactive=True,
+            x=0,
+            xanchor='left',
+            y=1.02,
+            yanchor='bottom',
+            bgcolor='white',
+            bordercolor=STORYTELLING_COLORS['border'],
+            font=dict(size=12, color='#000000')
+        )]
+    )
+    
+    report_payload_size(fig, label='Figura demográfica combinada')
+    return fig
+
 def create_comprehensive_demographic_dashboard():
     """
     Crea un dashboard completo con múltiples análisis demográficos
@@ -1154,61 +1314,66 @@ def create_comprehensive_demographic_dashboard():
     # Gráfico por género
     try:
         dashboard_charts['gender'] = create_gender_comparison_chart()
-        print("✅ Gráfico por género creado exitosamente")
+        logger.debug("✅ Gráfico por género creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por género: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por género: {e}")
         dashboard_charts['gender'] = create_basic_demographic_chart("Análisis por Género", "Error al cargar datos")
     
     # Gráfico por edad
     try:
         dashboard_charts['age'] = create_age_comparison_chart()
-        print("✅ Gráfico por edad creado exitosamente")
+        logger.debug("✅ Gráfico por edad creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por edad: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por edad: {e}")
         dashboard_charts['age'] = create_basic_demographic_chart("Análisis por Edad", "Error al cargar datos")
     
     # Gráfico por campo de estudio
     try:
         dashboard_charts['field_of_study'] = create_field_of_study_comparison_chart()
-        print("✅ Gráfico por campo de estudio creado exitosamente")
+        logger.debug("✅ Gráfico por campo de estudio creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por campo de estudio: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por campo de estudio: {e}")
         dashboard_charts['field_of_study'] = create_basic_demographic_chart("Análisis por Campo de Estudio", "Error al cargar datos")
     
     # Gráfico por dificultades financieras
     try:
         dashboard_charts['financial_difficulties'] = create_financial_difficulties_comparison_chart()
-        print("✅ Gráfico por dificultades financieras creado exitosamente")
+        logger.debug("✅ Gráfico por dificultades financieras creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por dificultades financieras: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por dificultades financieras: {e}")
         dashboard_charts['financial_difficulties'] = create_basic_demographic_chart("Análisis por Dificultades Financieras", "Error al cargar datos")
     
     # Gráfico por situación de vivienda con padres
     try:
         dashboard_charts['living_with_parents'] = create_living_with_parents_comparison_chart()
-        print("✅ Gráfico por situación de vivienda creado exitosamente")
+        logger.debug("✅ Gráfico por situación de vivienda creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por situación de vivienda: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por situación de vivienda: {e}")
         dashboard_charts['living_with_parents'] = create_basic_demographic_chart("Análisis por Situación de Vivienda", "Error al cargar datos")
     
     # Gráfico por estado financiero de los padres
     try:
         dashboard_charts['parents_financial_status'] = create_parents_financial_status_comparison_chart()
-        print("✅ Gráfico por estado financiero de padres creado exitosamente")
+        logger.debug("✅ Gráfico por estado financiero de padres creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por estado financiero de padres: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por estado financiero de padres: {e}")
         dashboard_charts['parents_financial_status'] = create_basic_demographic_chart("Análisis por Estado Financiero de Padres", "Error al cargar datos")
     
     # Gráfico por nivel educativo de los padres
     try:
         dashboard_charts['parents_education'] = create_parents_education_comparison_chart()
-        print("✅ Gráfico por nivel educativo de padres creado exitosamente")
+        logger.debug("✅ Gráfico por nivel educativo de padres creado exitosamente")
     except Exception as e:
-        print(f"⚠️ Error creando gráfico por nivel educativo de padres: {e}")
+        logger.warning(f"⚠️ Error creando gráfico por nivel educativo de padres: {e}")
         dashboard_charts['parents_education'] = create_basic_demographic_chart("Análisis por Nivel Educativo de Padres", "Error al cargar datos")
     
     return dashboard_charts
 
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
+
+
 if __name__ == "__main__":
     print("🎯 Generando análisis demográfico avanzado...")
     
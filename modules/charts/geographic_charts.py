@@ -1,141 +1,218 @@
+import logging
+
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from ..core.tracing import trace_module
 from ..core.color_config import STORYTELLING_COLORS, apply_standard_layout
+from ..core.ranking_index import attach_ranking_index, get_ranking_index
+from ..core.countries import DEFAULT_FOCUS_COUNTRY, country_name
+from .cluster_charts import family_color
+
+logger = logging.getLogger(__name__)
+
+COST_DATASET_PATH = "data/preprocessed_excels/E8_costs_all_total__all_students__all_contries.xlsx"
+
+# Mapeo de códigos de países de 2 letras a códigos ISO-3 para el mapa
+COUNTRY_ISO_MAPPING = {
+    'AT': 'AUT',  # Austria
+    'BE': 'BEL',  # Belgium
+    'BG': 'BGR',  # Bulgaria
+    'HR': 'HRV',  # Croatia
+    'CY': 'CYP',  # Cyprus
+    'CZ': 'CZE',  # Czech Republic
+    'DK': 'DNK',  # Denmark
+    'EE': 'EST',  # Estonia
+    'FI': 'FIN',  # Finland
+    'FR': 'FRA',  # France
+    'DE': 'DEU',  # Germany
+    'GR': 'GRC',  # Greece
+    'HU': 'HUN',  # Hungary
+    'IS': 'ISL',  # Iceland
+    'IE': 'IRL',  # Ireland
+    'IT': 'ITA',  # Italy
+    'LV': 'LVA',  # Latvia
+    'LT': 'LTU',  # Lithuania
+    'LU': 'LUX',  # Luxembourg
+    'MT': 'MLT',  # Malta
+    'NL': 'NLD',  # Netherlands
+    'NO': 'NOR',  # Norway
+    'PL': 'POL',  # Poland
+    'PT': 'PRT',  # Portugal
+    'RO': 'ROU',  # Romania
+    'SK': 'SVK',  # Slovakia
+    'SI': 'SVN',  # Slovenia
+    'ES': 'ESP',  # Spain
+    'SE': 'SWE',  # Sweden
+    'CH': 'CHE',  # Switzerland
+    'GB': 'GBR',  # United Kingdom
+    'TR': 'TUR',  # Turkey
+    'AZ': 'AZE',  # Azerbaijan
+    'GE': 'GEO',  # Georgia
+    'AM': 'ARM'   # Armenia
+}
+
+# Mapeo de códigos ISO-3 a nombres completos para display
+ISO_TO_COUNTRY_NAMES = {
+    'AUT': 'Austria', 'BEL': 'Belgium', 'BGR': 'Bulgaria', 'HRV': 'Croatia',
+    'CYP': 'Cyprus', 'CZE': 'Czech Republic', 'DNK': 'Denmark', 'EST': 'Estonia',
+    'FIN': 'Finland', 'FRA': 'France', 'DEU': 'Germany', 'GRC': 'Greece',
+    'HUN': 'Hungary', 'ISL': 'Iceland', 'IRL': 'Ireland', 'ITA': 'Italy',
+    'LVA': 'Latvia', 'LTU': 'Lithuania', 'LUX': 'Luxembourg', 'MLT': 'Malta',
+    'NLD': 'Netherlands', 'NOR': 'Norway', 'POL': 'Poland', 'PRT': 'Portugal',
+    'ROU': 'Romania', 'SVK': 'Slovakia', 'SVN': 'Slovenia', 'ESP': 'Spain',
+    'SWE': 'Sweden', 'CHE': 'Switzerland', 'GBR': 'United Kingdom', 'TUR': 'Turkey',
+    'AZE': 'Azerbaijan', 'GEO': 'Georgia', 'ARM': 'Armenia'
+}
+
+
+def _country_name(country_code):
+    """Nombre completo de un país a partir de su código de 2 letras"""
+    return ISO_TO_COUNTRY_NAMES.get(COUNTRY_ISO_MAPPING.get(country_code))
 
 
 def read_cost_dataset():
     """Lee el dataset de costes mensuales por país"""
     try:
         # Leer el archivo Excel de costes
-        df = pd.read_excel("data/preprocessed_excels/E8_costs_all_total__all_students__all_contries.xlsx")
+        df = pd.read_excel(COST_DATASET_PATH)
         return df
     except Exception as e:
-        print(f"Error leyendo dataset de costes: {e}")
+        logger.error(f"Error leyendo dataset de costes: {e}")
         return None
 
 
-def generate_europe_cost_heatmap():
+def prepare_cost_dataframe(df):
+    """
+    Procesa el dataset de costes (una fila por país con código ISO-3) y
+    precalcula el ranking de coste mensual
+    
+    Returns:
+        pd.DataFrame: Columnas Country_Code, Monthly_Cost, ISO3 y Country_Name
+    """
+    # El archivo tiene las primeras 2 filas como headers, empezar desde la fila 2
+    df_data = df.iloc[2:].copy()  # Saltar las filas de encabezado
+    
+    # Usar las columnas 'Country' (códigos de país) y 'All students' (costes)
+    df_processed = df_data[['Country', 'All students']].copy()
+    df_processed.columns = ['Country_Code', 'Monthly_Cost']
+    
+    # Limpiar datos nulos y convertir costes a numérico
+    df_processed = df_processed.dropna()
+    df_processed['Monthly_Cost'] = pd.to_numeric(df_processed['Monthly_Cost'], errors='coerce')
+    df_processed = df_processed.dropna()  # Eliminar filas con costes no numéricos
+    
+    # Agregar códigos ISO-3 basado en los códigos de 2 letras
+    df_processed['ISO3'] = df_processed['Country_Code'].map(COUNTRY_ISO_MAPPING)
+    df_processed['Country_Name'] = df_processed['ISO3'].map(ISO_TO_COUNTRY_NAMES)
+    
+    # Filtrar países que tienen código ISO (países europeos principalmente)
+    df_processed = df_processed.dropna(subset=['ISO3'])
+    
+    return attach_ranking_index(df_processed, country_col='Country_Code', value_cols=['Monthly_Cost'])
+
+
+def _family_colorscale(n_clusters):
+    """Escala de colores discreta: un tramo de color por familia (z = 1..n)"""
+    colorscale = []
+    for cluster in range(1, n_clusters + 1):
+        low = (cluster - 1) / n_clusters
+        high = cluster / n_clusters
+        colorscale.extend([[low, family_color(cluster)], [high, family_color(cluster)]])
+    return colorscale
+
+
+def generate_europe_cost_heatmap(color_by='cost', n_clusters=4, cluster_method='kmeans', df=None,
+                                 focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Genera un mapa de calor interactivo de Europa mostrando los costes mensuales por país
     
+    Args:
+        color_by (str): 'cost' colorea por coste mensual; 'cluster' colorea por
+            familia de países (clustering precalculado y cacheado)
+        n_clusters (int): Número de familias si color_by='cluster'
+        cluster_method (str): 'kmeans' o 'hierarchical'
+        df (pd.DataFrame): Dataset de costes ya leído con read_cost_dataset
+            (si es None se lee del fichero)
+        focus_country (str): Código ISO-2 del país cuyo coste se anota
+    
     Returns:
         plotly.graph_objects.Figure: Mapa de calor interactivo de Europa
     """
     
     # Leer datos
-    df = read_cost_dataset()
+    if df is None:
+        df = read_cost_dataset()
     
     if df is None or df.empty:
-        print("No se pudieron cargar los datos de costes")
+        logger.warning("No se pudieron cargar los datos de costes")
         return None
     
     try:
-        # Mapeo de códigos de países de 2 letras a códigos ISO-3 para el mapa
-        country_iso_mapping = {
-            'AT': 'AUT',  # Austria
-            'BE': 'BEL',  # Belgium
-            'BG': 'BGR',  # Bulgaria
-            'HR': 'HRV',  # Croatia
-            'CY': 'CYP',  # Cyprus
-            'CZ': 'CZE',  # Czech Republic
-            'DK': 'DNK',  # Denmark
-            'EE': 'EST',  # Estonia
-            'FI': 'FIN',  # Finland
-            'FR': 'FRA',  # France
-            'DE': 'DEU',  # Germany
-            'GR': 'GRC',  # Greece
-            'HU': 'HUN',  # Hungary
-            'IS': 'ISL',  # Iceland
-            'IE': 'IRL',  # Ireland
-            'IT': 'ITA',  # Italy
-            'LV': 'LVA',  # Latvia
-            'LT': 'LTU',  # Lithuania
-            'LU': 'LUX',  # Luxembourg
-            'MT': 'MLT',  # Malta
-            'NL': 'NLD',  # Netherlands
-            'NO': 'NOR',  # Norway
-            'PL': 'POL',  # Poland
-            'PT': 'PRT',  # Portugal
-            'RO': 'ROU',  # Romania
-            'SK': 'SVK',  # Slovakia
-            'SI': 'SVN',  # Slovenia
-            'ES': 'ESP',  # Spain
-            'SE': 'SWE',  # Sweden
-            'CH': 'CHE',  # Switzerland
-            'GB': 'GBR',  # United Kingdom
-            'TR': 'TUR',  # Turkey
-            'AZ': 'AZE',  # Azerbaijan
-            'GE': 'GEO',  # Georgia
-            'AM': 'ARM'   # Armenia
-        }
-        
-        # Mapeo de códigos ISO-3 a nombres completos para display
-        iso_to_country_names = {
-            'AUT': 'Austria', 'BEL': 'Belgium', 'BGR': 'Bulgaria', 'HRV': 'Croatia',
-            'CYP': 'Cyprus', 'CZE': 'Czech Republic', 'DNK': 'Denmark', 'EST': 'Estonia',
-            'FIN': 'Finland', 'FRA': 'France', 'DEU': 'Germany', 'GRC': 'Greece',
-            'HUN': 'Hungary', 'ISL': 'Iceland', 'IRL': 'Ireland', 'ITA': 'Italy',
-            'LVA': 'Latvia', 'LTU': 'Lithuania', 'LUX': 'Luxembourg', 'MLT': 'Malta',
-            'NLD': 'Netherlands', 'NOR': 'Norway', 'POL': 'Poland', 'PRT': 'Portugal',
-            'ROU': 'Romania', 'SVK': 'Slovakia', 'SVN': 'Slovenia', 'ESP': 'Spain',
-            'SWE': 'Sweden', 'CHE': 'Switzerland', 'GBR': 'United Kingdom', 'TUR': 'Turkey',
-            'AZE': 'Azerbaijan', 'GEO': 'Georgia', 'ARM': 'Armenia'
-        }
-        
-        # Preparar los datos según la estructura real del archivo
-        # El archivo tiene las primeras 2 filas como headers, empezar desde la fila 2
-        df_data = df.iloc[2:].copy()  # Saltar las filas de encabezado
-        
-        # Usar las columnas 'Country' (códigos de país) y 'All students' (costes)
-        df_processed = df_data[['Country', 'All students']].copy()
-        df_processed.columns = ['Country_Code', 'Monthly_Cost']
-        
-        # Limpiar datos nulos y convertir costes a numérico
-        df_processed = df_processed.dropna()
-        df_processed['Monthly_Cost'] = pd.to_numeric(df_processed['Monthly_Cost'], errors='coerce')
-        df_processed = df_processed.dropna()  # Eliminar filas con costes no numéricos
+        df_processed = prepare_cost_dataframe(df)
         
-        # Agregar códigos ISO-3 basado en los códigos de 2 letras
-        df_processed['ISO3'] = df_processed['Country_Code'].map(country_iso_mapping)
-        df_processed['Country_Name'] = df_processed['ISO3'].map(iso_to_country_names)
+        logger.debug("Países procesados: %d. Muestra de datos procesados:\n%s", len(df_processed), df_processed.head())
         
-        # Filtrar países que tienen código ISO (países europeos principalmente)
-        df_processed = df_processed.dropna(subset=['ISO3'])
-        
-        print(f"Países procesados: {len(df_processed)}")
-        print("Muestra de datos procesados:")
-        print(df_processed.head())
-        
-        # Crear el mapa de calor
-        fig = go.Figure(data=go.Choropleth(
-            locations=df_processed['ISO3'],
-            z=df_processed['Monthly_Cost'],
-            locationmode='ISO-3',
-            colorscale=[
-                [0.0, '#d0f0c0'],   # Verde muy claro
-                [0.2, '#a8e6a3'],   # Verde claro
-                [0.4, '#fddc9b'],   # Amarillo suave
-                [0.6, '#ffb347'],   # Naranja medio
-                [0.8, '#ff8c00'],   # Naranja fuerte
-                [1.0, '#ff4500']    # Rojo intenso
-            ],
-            text=df_processed['Country_Name'],
-            hovertemplate='<b>%{text}</b><br>' +
-                         'Coste mensual: €%{z:,.0f}<br>' +
-                         '<extra></extra>',
-            colorbar=dict(
-                title=dict(text="Coste Mensual (€)", font=dict(size=14)),
-                tickfont=dict(size=12)
-            )
-        ))
+        if color_by == 'cluster':
+            # Importación diferida: el módulo de análisis carga a su vez los módulos de gráficos
+            from ..analysis.clustering_analysis import get_country_clusters
+            
+            clusters = get_country_clusters(n_clusters)
+            df_processed = df_processed.assign(
+                Family=df_processed['Country_Code'].map(clusters.labels(cluster_method))
+            ).dropna(subset=['Family'])
+            
+            # Crear el mapa de familias
+            fig = go.Figure(data=go.Choropleth(
+                locations=df_processed['ISO3'],
+                z=df_processed['Family'],
+                locationmode='ISO-3',
+                zmin=0.5,
+                zmax=clusters.n_clusters + 0.5,
+                colorscale=_family_colorscale(clusters.n_clusters),
+                text=df_processed['Country_Name'],
+                customdata=df_processed['Monthly_Cost'],
+                hovertemplate='<b>%{text}</b><br>' +
+                             'Familia %{z}<br>' +
+                             'Coste mensual: €%{customdata:,.0f}<br>' +
+                             '<extra></extra>',
+                colorbar=dict(
+                    title=dict(text="Familia", font=dict(size=14)),
+                    tickvals=list(range(1, clusters.n_clusters + 1)),
+                    tickfont=dict(size=12)
+                )
+            ))
+        else:
+            # Crear el mapa de calor
+            fig = go.Figure(data=go.Choropleth(
+                locations=df_processed['ISO3'],
+                z=df_processed['Monthly_Cost'],
+                locationmode='ISO-3',
+                colorscale=[
+                    [0.0, '#d0f0c0'],   # Verde muy claro
+                    [0.2, '#a8e6a3'],   # Verde claro
+                    [0.4, '#fddc9b'],   # Amarillo suave
+                    [0.6, '#ffb347'],   # Naranja medio
+                    [0.8, '#ff8c00'],   # Naranja fuerte
+                    [1.0, '#ff4500']    # Rojo intenso
+                ],
+                text=df_processed['Country_Name'],
+                hovertemplate='<b>%{text}</b><br>' +
+                             'Coste mensual: €%{z:,.0f}<br>' +
+                             '<extra></extra>',
+                colorbar=dict(
+                    title=dict(text="Coste Mensual (€)", font=dict(size=14)),
+                    tickfont=dict(size=12)
+                )
+            ))
         
         # Configurar el layout para enfocar Europa
         fig.update_layout(
             title={
-                'text': 'Costes Mensuales de Estudiantes Universitarios en Europa',
+                'text': 'Costes Mensuales de Estudiantes Universitarios en Europa' if color_by != 'cluster'
+                        else 'Familias de Países y Costes Mensuales de Estudiantes en Europa',
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 18, 'family': 'Arial, sans-serif', 'color': '#2C3E50'}
@@ -161,13 +238,13 @@ def generate_europe_cost_heatmap():
         )
         
         # Añadir anotación con información clave
-        spain_data = df_processed[df_processed['Country_Code'] == 'ES']
-        spain_cost = spain_data['Monthly_Cost'].iloc[0] if not spain_data.empty else None
+        focus_data = df_processed[df_processed['Country_Code'] == focus_country]
+        focus_cost = focus_data['Monthly_Cost'].iloc[0] if not focus_data.empty else None
         avg_cost = df_processed['Monthly_Cost'].mean()
         
         annotation_text = f"Promedio Europeo: €{avg_cost:,.0f}"
-        if spain_cost:
-            annotation_text += f"<br>España: €{spain_cost:,.0f}"
+        if focus_cost:
+            annotation_text += f"<br>{country_name(focus_country)}: €{focus_cost:,.0f}"
         
         fig.add_annotation(
             text=annotation_text,
@@ -183,60 +260,34 @@ def generate_europe_cost_heatmap():
         return fig
         
     except Exception as e:
-        print(f"Error creando mapa de costes: {e}")
+        logger.error(f"Error creando mapa de costes: {e}")
         return None
 
 
-def get_cost_statistics():
+def get_cost_statistics(df=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Obtiene estadísticas clave de los costes mensuales
     
+    Las claves 'coste_espana' y 'ranking_espana' se refieren al país foco
+    (se mantienen los nombres por compatibilidad).
+    
+    Args:
+        df (pd.DataFrame): Dataset de costes ya leído con read_cost_dataset
+            (si es None se lee del fichero)
+        focus_country (str): Código ISO-2 del país foco
+    
     Returns:
         dict: Diccionario con estadísticas clave
     """
-    df = read_cost_dataset()
+    if df is None:
+        df = read_cost_dataset()
     
     if df is None or df.empty:
         return {"error": "No se pudieron cargar los datos"}
     
     try:
-        # Mapeo de códigos ISO-3 a nombres completos
-        iso_to_country_names = {
-            'AUT': 'Austria', 'BEL': 'Belgium', 'BGR': 'Bulgaria', 'HRV': 'Croatia',
-            'CYP': 'Cyprus', 'CZE': 'Czech Republic', 'DNK': 'Denmark', 'EST': 'Estonia',
-            'FIN': 'Finland', 'FRA': 'France', 'DEU': 'Germany', 'GRC': 'Greece',
-            'HUN': 'Hungary', 'ISL': 'Iceland', 'IRL': 'Ireland', 'ITA': 'Italy',
-            'LVA': 'Latvia', 'LTU': 'Lithuania', 'LUX': 'Luxembourg', 'MLT': 'Malta',
-            'NLD': 'Netherlands', 'NOR': 'Norway', 'POL': 'Poland', 'PRT': 'Portugal',
-            'ROU': 'Romania', 'SVK': 'Slovakia', 'SVN': 'Slovenia', 'ESP': 'Spain',
-            'SWE': 'Sweden', 'CHE': 'Switzerland', 'GBR': 'United Kingdom', 'TUR': 'Turkey',
-            'AZE': 'Azerbaijan', 'GEO': 'Georgia', 'ARM': 'Armenia'
-        }
-        
-        country_iso_mapping = {
-            'AT': 'AUT', 'BE': 'BEL', 'BG': 'BGR', 'HR': 'HRV', 'CY': 'CYP', 'CZ': 'CZE',
-            'DK': 'DNK', 'EE': 'EST', 'FI': 'FIN', 'FR': 'FRA', 'DE': 'DEU', 'GR': 'GRC',
-            'HU': 'HUN', 'IS': 'ISL', 'IE': 'IRL', 'IT': 'ITA', 'LV': 'LVA', 'LT': 'LTU',
-            'LU': 'LUX', 'MT': 'MLT', 'NL': 'NLD', 'NO': 'NOR', 'PL': 'POL', 'PT': 'PRT',
-            'RO': 'ROU', 'SK': 'SVK', 'SI': 'SVN', 'ES': 'ESP', 'SE': 'SWE', 'CH': 'CHE',
-            'GB': 'GBR', 'TR': 'TUR', 'AZ': 'AZE', 'GE': 'GEO', 'AM': 'ARM'
-        }
-        
-        # Usar la misma lógica de procesamiento que en generate_europe_cost_heatmap
-        df_data = df.iloc[2:].copy()  # Saltar las filas de encabezado
-        
-        df_processed = df_data[['Country', 'All students']].copy()
-        df_processed.columns = ['Country_Code', 'Monthly_Cost']
-        
-        # Limpiar datos nulos y convertir costes a numérico
-        df_processed = df_processed.dropna()
-        df_processed['Monthly_Cost'] = pd.to_numeric(df_processed['Monthly_Cost'], errors='coerce')
-        df_processed = df_processed.dropna()
-        
-        # Agregar nombres de países
-        df_processed['ISO3'] = df_processed['Country_Code'].map(country_iso_mapping)
-        df_processed['Country_Name'] = df_processed['ISO3'].map(iso_to_country_names)
-        df_processed = df_processed.dropna(subset=['ISO3'])
+        df_processed = prepare_cost_dataframe(df)
+        ranking = get_ranking_index(df_processed, country_col='Country_Code', value_cols=['Monthly_Cost'])
         
         # Estadísticas generales
         stats = {
@@ -244,24 +295,26 @@ def get_cost_statistics():
             'mediana_europa': df_processed['Monthly_Cost'].median(),
             'coste_minimo': df_processed['Monthly_Cost'].min(),
             'coste_maximo': df_processed['Monthly_Cost'].max(),
-            'pais_mas_barato': df_processed.loc[df_processed['Monthly_Cost'].idxmin(), 'Country_Name'],
-            'pais_mas_caro': df_processed.loc[df_processed['Monthly_Cost'].idxmax(), 'Country_Name'],
+            'pais_mas_barato': _country_name(ranking.min_country('Monthly_Cost')[0]),
+            'pais_mas_caro': _country_name(ranking.max_country('Monthly_Cost')[0]),
             'total_paises': len(df_processed)
         }
         
-        # Estadísticas específicas de España si está disponible
-        spain_data = df_processed[df_processed['Country_Code'] == 'ES']
-        if not spain_data.empty:
-            spain_cost = spain_data['Monthly_Cost'].iloc[0]
-            stats['coste_espana'] = spain_cost
-            stats['diferencia_con_promedio'] = spain_cost - stats['promedio_europa']
+        # Estadísticas específicas del país foco si está disponible
+        focus_cost = ranking.value('Monthly_Cost', focus_country)
+        if focus_cost is not None:
+            stats['coste_espana'] = focus_cost
+            stats['diferencia_con_promedio'] = focus_cost - stats['promedio_europa']
             
-            # Ranking de España
-            spain_rank = (df_processed['Monthly_Cost'] > spain_cost).sum() + 1
-            stats['ranking_espana'] = spain_rank
+            # Ranking del país foco (1 = más caro)
+            stats['ranking_espana'] = ranking.position('Monthly_Cost', focus_country)
         
         return stats
         
     except Exception as e:
-        print(f"Error calculando estadísticas: {e}")
-        return {"error": str(e)} 
\ No newline at end of file
+        logger.error(f"Error calculando estadísticas: {e}")
+        return {"error": str(e)}
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
@@ -3,6 +3,8 @@ Módulo de gráficos de impacto del trabajo en los estudios
 Contiene análisis de abandono, rendimiento y efectos en la salud estudiantil
 """
 
+import logging
+
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -10,25 +12,30 @@ from plotly.subplots import make_subplots
 import numpy as np
 
 # Importar configuración unificada de colores
+from ..core.tracing import trace_module
 from ..core.color_config import STORYTELLING_COLORS, apply_standard_layout
+from ..core.countries import DEFAULT_FOCUS_COUNTRY, country_name
 from ..core.data_loaders import (
     read_work_impact_dataset,
     PreprocessedDatasetsNamesImpactsOnStudyForWork
 )
 
-def create_streamlit_abandoning_chart(df, title, subtitle):
+logger = logging.getLogger(__name__)
+
+def create_streamlit_abandoning_chart(df, title, subtitle, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un gráfico de barras específico para análisis de abandono optimizado para Streamlit
     """
     if df is None or df.empty:
         return None
     
-    # Filtrar datos de España y calcular promedio europeo
-    spain_data = df[df['Country'] == 'ES']
-    europe_data = df[df['Country'] != 'ES']
+    # Filtrar datos del país foco y calcular promedio europeo
+    focus_data = df[df['Country'] == focus_country]
+    europe_data = df[df['Country'] != focus_country]
+    focus_name = country_name(focus_country)
     
-    if spain_data.empty:
-        print("No se encontraron datos de España")
+    if focus_data.empty:
+        logger.warning(f"No se encontraron datos de {focus_name}")
         return None
     
     # Categorías de frecuencia de consideración de abandono
@@ -40,13 +47,13 @@ def create_streamlit_abandoning_chart(df, title, subtitle):
         'Nunca'
     ]
     
-    # Extraer valores para España
-    spain_values = [
-        spain_data['Very_Often_Value'].iloc[0] if not spain_data['Very_Often_Value'].isna().iloc[0] else 0,
-        spain_data['Often_Value'].iloc[0] if not spain_data['Often_Value'].isna().iloc[0] else 0,
-        spain_data['Sometimes_Value'].iloc[0] if not spain_data['Sometimes_Value'].isna().iloc[0] else 0,
-        spain_data['Rarely_Value'].iloc[0] if not spain_data['Rarely_Value'].isna().iloc[0] else 0,
-        spain_data['Never_Value'].iloc[0] if not spain_data['Never_Value'].isna().iloc[0] else 0
+    # Extraer valores para el país foco
+    focus_values = [
+        focus_data['Very_Often_Value'].iloc[0] if not focus_data['Very_Often_Value'].isna().iloc[0] else 0,
+        focus_data['Often_Value'].iloc[0] if not focus_data['Often_Value'].isna().iloc[0] else 0,
+        focus_data['Sometimes_Value'].iloc[0] if not focus_data['Sometimes_Value'].isna().iloc[0] else 0,
+        focus_data['Rarely_Value'].iloc[0] if not focus_data['Rarely_Value'].isna().iloc[0] else 0,
+        focus_data['Never_Value'].iloc[0] if not focus_data['Never_Value'].isna().iloc[0] else 0
     ]
     
     # Calcular promedio europeo
@@ -64,16 +71,16 @@ def create_streamlit_abandoning_chart(df, title, subtitle):
     x = np.arange(len(categories))
     width = 0.35
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=focus_name,
         x=[i - width/2 for i in x],
-        y=spain_values,
+        y=focus_values,
         marker_color=STORYTELLING_COLORS['spain'],
         marker_line=dict(color='white', width=2),
-        text=[f'{val:.1f}%' for val in spain_values],
+        text=[f'{val:.1f}%' for val in focus_values],
         textposition='outside',
-        hovertemplate='<b>España - %{text}</b><br>Porcentaje: %{y:.1f}%<extra></extra>',
+        hovertemplate='<b>' + focus_name + ' - %{text}</b><br>Porcentaje: %{y:.1f}%<extra></extra>',
         width=width
     ))
     
@@ -124,34 +131,54 @@ def create_streamlit_abandoning_chart(df, title, subtitle):
     
     return fig
 
-def create_spain_europe_impact_comparison(df_financial, df_work_afford):
+def create_financial_abandoning_chart(df, focus_country=DEFAULT_FOCUS_COUNTRY):
+    """Abandono por dificultades financieras (dataset IMPACT_ON_STUDY_ABANDONING_ALL_T__E_FINANCIAL_DIFFICULTIES)"""
+    return create_streamlit_abandoning_chart(
+        df,
+        "Abandono por Dificultades Financieras",
+        "Frecuencia con la que los estudiantes consideran abandonar por motivos económicos",
+        focus_country
+    )
+
+def create_work_afford_abandoning_chart(df, focus_country=DEFAULT_FOCUS_COUNTRY):
+    """Abandono por necesidad de trabajar (dataset IMPACT_ON_STUDY_ABANDONING_ALL_T__S_WORK_TO_AFFORD_TO_STUDY)"""
+    return create_streamlit_abandoning_chart(
+        df,
+        "Abandono por Necesidad de Trabajar",
+        "Frecuencia con la que los estudiantes consideran abandonar para trabajar más tiempo",
+        focus_country
+    )
+
+def create_spain_europe_impact_comparison(df_financial, df_work_afford, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
-    Crea un gráfico comparativo específico España vs Europa para diferentes tipos de impacto
+    Crea un gráfico comparativo específico país foco vs Europa para diferentes tipos de impacto
     """
-    # Datos para España
-    spain_financial = df_financial[df_financial['Country'] == 'ES'] if df_financial is not None and not df_financial.empty else None
-    spain_work = df_work_afford[df_work_afford['Country'] == 'ES'] if df_work_afford is not None and not df_work_afford.empty else None
+    focus_name = country_name(focus_country)
+    
+    # Datos para el país foco
+    focus_financial = df_financial[df_financial['Country'] == focus_country] if df_financial is not None and not df_financial.empty else None
+    focus_work = df_work_afford[df_work_afford['Country'] == focus_country] if df_work_afford is not None and not df_work_afford.empty else None
     
     # Datos para Europa (promedio)
-    europe_financial = df_financial[df_financial['Country'] != 'ES'] if df_financial is not None and not df_financial.empty else None
-    europe_work = df_work_afford[df_work_afford['Country'] != 'ES'] if df_work_afford is not None and not df_work_afford.empty else None
+    europe_financial = df_financial[df_financial['Country'] != focus_country] if df_financial is not None and not df_financial.empty else None
+    europe_work = df_work_afford[df_work_afford['Country'] != focus_country] if df_work_afford is not None and not df_work_afford.empty else None
     
     categories = ['Por Dificultades Financieras', 'Por Necesidad de Trabajar']
-    spain_values = []
+    focus_values = []
     europe_values = []
     
-    # Calcular porcentajes de "frecuentemente + muy frecuentemente" para España
-    if spain_financial is not None and not spain_financial.empty:
-        spain_fin_high = (spain_financial['Very_Often_Value'].iloc[0] + spain_financial['Often_Value'].iloc[0])
-        spain_values.append(spain_fin_high)
+    # Calcular porcentajes de "frecuentemente + muy frecuentemente" para el país foco
+    if focus_financial is not None and not focus_financial.empty:
+        focus_fin_high = (focus_financial['Very_Often_Value'].iloc[0] + focus_financial['Often_Value'].iloc[0])
+        focus_values.append(focus_fin_high)
     else:
-        spain_values.append(0)
+        focus_values.append(0)
     
-    if spain_work is not None and not spain_work.empty:
-        spain_work_high = (spain_work['Very_Often_Value'].iloc[0] + spain_work['Often_Value'].iloc[0])
-        spain_values.append(spain_work_high)
+    if focus_work is not None and not focus_work.empty:
+        focus_work_high = (focus_work['Very_Often_Value'].iloc[0] + focus_work['Often_Value'].iloc[0])
+        focus_values.append(focus_work_high)
     else:
-        spain_values.append(0)
+        focus_values.append(0)
     
     # Calcular promedios europeos
     if europe_financial is not None and not europe_financial.empty:
@@ -172,16 +199,16 @@ def create_spain_europe_impact_comparison(df_financial, df_work_afford):
     x = np.arange(len(categories))
     width = 0.35
     
-    # Barras España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='España',
+        name=focus_name,
         x=[i - width/2 for i in x],
-        y=spain_values,
+        y=focus_values,
         marker_color=STORYTELLING_COLORS['spain'],
         marker_line=dict(color='white', width=2),
-        text=[f'{val:.1f}%' for val in spain_values],
+        text=[f'{val:.1f}%' for val in focus_values],
         textposition='outside',
-        hovertemplate='<b>España - %{x}</b><br>Considera abandono: %{y:.1f}%<extra></extra>',
+        hovertemplate='<b>' + focus_name + ' - %{x}</b><br>Considera abandono: %{y:.1f}%<extra></extra>',
         width=width
     ))
     
@@ -201,7 +228,7 @@ def create_spain_europe_impact_comparison(df_financial, df_work_afford):
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig,
-        title='<b>Consideración de Abandono de Estudios</b><br><i>España vs Promedio Europeo - Porcentaje que considera frecuentemente</i>',
+        title=f'<b>Consideración de Abandono de Estudios</b><br><i>{focus_name} vs Promedio Europeo - Porcentaje que considera frecuentemente</i>',
         height=600,
         width=800
     )
@@ -232,19 +259,18 @@ def create_spain_europe_impact_comparison(df_financial, df_work_afford):
     
     return fig
 
-def get_work_impact_figures_for_streamlit():
-    """
-    Función específica para obtener las figuras de impacto del trabajo 
-    optimizadas para uso en Streamlit scrollytelling
+def load_work_impact_datasets():
     """
-    print("🔄 Cargando figuras de impacto del trabajo para Streamlit...")
+    Carga los datasets de abandono usados por las figuras de impacto
     
-    # Cargar datasets de impacto
+    Returns:
+        dict: Nombre -> DataFrame ({} si falla la carga)
+    """
     datasets = {}
     
     try:
         # Cargar solo los datasets esenciales para evitar errores
-        print("📥 Cargando datasets de impacto...")
+        logger.debug("📥 Cargando datasets de impacto...")
         
         # Dataset de abandono por dificultades financieras
         datasets['abandoning_financial'] = read_work_impact_dataset(
@@ -256,10 +282,29 @@ def get_work_impact_figures_for_streamlit():
             PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__S_WORK_TO_AFFORD_TO_STUDY
         )
         
-        print("✅ Datasets de impacto cargados exitosamente")
+        logger.debug("✅ Datasets de impacto cargados exitosamente")
         
     except Exception as e:
-        print(f"⚠️ Error cargando datasets de impacto: {e}")
+        logger.warning(f"⚠️ Error cargando datasets de impacto: {e}")
+        return {}
+    
+    return datasets
+
+def get_work_impact_figures_for_streamlit(datasets=None):
+    """
+    Función específica para obtener las figuras de impacto del trabajo 
+    optimizadas para uso en Streamlit scrollytelling
+    
+    Args:
+        datasets (dict): Datasets de load_work_impact_datasets ya cargados
+            (si es None se cargan aquí)
+    """
+    logger.debug("🔄 Cargando figuras de impacto del trabajo para Streamlit...")
+    
+    # Cargar datasets de impacto
+    if datasets is None:
+        datasets = load_work_impact_datasets()
+    if not datasets:
         return {}
     
     # Crear figuras optimizadas para Streamlit
@@ -268,21 +313,13 @@ def get_work_impact_figures_for_streamlit():
     try:
         # 1. Figura de abandono por dificultades financieras
         if 'abandoning_financial' in datasets and datasets['abandoning_financial'] is not None:
-            figures['abandono_financiero'] = create_streamlit_abandoning_chart(
-                datasets['abandoning_financial'],
-                "Abandono por Dificultades Financieras",
-                "Frecuencia con la que los estudiantes consideran abandonar por motivos económicos"
-            )
-            print("✅ Figura de abandono financiero creada")
+            figures['abandono_financiero'] = create_financial_abandoning_chart(datasets['abandoning_financial'])
+            logger.debug("✅ Figura de abandono financiero creada")
         
         # 2. Figura de abandono por necesidad de trabajar
         if 'abandoning_work_afford' in datasets and datasets['abandoning_work_afford'] is not None:
-            figures['abandono_trabajo'] = create_streamlit_abandoning_chart(
-                datasets['abandoning_work_afford'],
-                "Abandono por Necesidad de Trabajar",
-                "Frecuencia con la que los estudiantes consideran abandonar para trabajar más tiempo"
-            )
-            print("✅ Figura de abandono por trabajo creada")
+            figures['abandono_trabajo'] = create_work_afford_abandoning_chart(datasets['abandoning_work_afford'])
+            logger.debug("✅ Figura de abandono por trabajo creada")
         
         # 3. Comparación España vs Europa
         if 'abandoning_financial' in datasets and 'abandoning_work_afford' in datasets:
@@ -290,12 +327,12 @@ def get_work_impact_figures_for_streamlit():
                 datasets['abandoning_financial'],
                 datasets['abandoning_work_afford']
             )
-            print("✅ Figura comparativa España vs Europa creada")
+            logger.debug("✅ Figura comparativa España vs Europa creada")
         
     except Exception as e:
-        print(f"⚠️ Error creando figuras de impacto: {e}")
+        logger.warning(f"⚠️ Error creando figuras de impacto: {e}")
     
-    print(f"🎯 Total de figuras de impacto preparadas: {len(figures)}")
+    logger.debug(f"🎯 Total de figuras de impacto preparadas: {len(figures)}")
     return figures
 
 # Función para mantener compatibilidad con código existente
@@ -303,22 +340,14 @@ def create_comprehensive_work_impact_dashboard():
     """
     Función principal que crea un dashboard completo del impacto del trabajo en los estudios
     """
-    print("📊 Cargando datos de impacto del trabajo en los estudios...")
+    logger.debug("📊 Cargando datos de impacto del trabajo en los estudios...")
     
-    # Utilizar la nueva función optimizada
-    figures = get_work_impact_figures_for_streamlit()
-    datasets = {}
+    # Cargar los datasets una sola vez y reutilizarlos para las figuras
+    datasets = load_work_impact_datasets()
+    figures = get_work_impact_figures_for_streamlit(datasets)
     
-    try:
-        # Cargar datasets principales
-        datasets['abandoning_financial'] = read_work_impact_dataset(
-            PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__E_FINANCIAL_DIFFICULTIES
-        )
-        datasets['abandoning_work_afford'] = read_work_impact_dataset(
-            PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__S_WORK_TO_AFFORD_TO_STUDY
-        )
-        
-    except Exception as e:
-        print(f"⚠️ Error cargando datasets: {e}")
-    
-    return datasets, figures 
\ No newline at end of file
+    return datasets, figures
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
@@ -4,6 +4,8 @@ Combina análisis de percepción académica y relación trabajo-felicidad
 """
 
 # Importaciones de percepción académica
+import logging
+
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -11,12 +13,15 @@ import numpy as np
 from enum import Enum
 
 # Importar configuración unificada de colores
+from ..core.tracing import trace_module
 from ..core.color_config import STORYTELLING_COLORS, apply_standard_layout
 from ..core.data_loaders import (
     read_work_impact_dataset,
     PreprocessedDatasetsNamesImpactsOnStudyForWork
 )
 
+logger = logging.getLogger(__name__)
+
 # === ANÁLISIS DE PERCEPCIÓN ACADÉMICA ===
 
 class PreprocessedDatasetsNamesAcademicPerception(Enum):
@@ -33,7 +38,7 @@ def load_academic_perception_data():
         # Filtrar solo datos de España
         spain_data = df[df['Country'] == 'ES']
         if spain_data.empty:
-            print("No se encontraron datos de España")
+            logger.warning("No se encontraron datos de España")
             return None
             
         # El dataset ya viene procesado con las columnas estándar de autoevaluación
@@ -85,7 +90,7 @@ def load_academic_perception_data():
         return pd.DataFrame(processed_data)
         
     except Exception as e:
-        print(f"Error cargando datos de percepción académica: {e}")
+        logger.error(f"Error cargando datos de percepción académica: {e}")
         return None
 
 def create_streamlit_academic_perception_chart():
@@ -282,14 +287,14 @@ def load_happiness_work_relation_data(file_path="data/preprocessed_relationship_
         processed_df = pd.DataFrame(processed_data)
         
         if processed_df.empty:
-            print("No se pudieron procesar datos válidos, usando datos de ejemplo")
+            logger.warning("No se pudieron procesar datos válidos, usando datos de ejemplo")
             return create_example_happiness_data()
         
-        print(f"Datos procesados: {len(processed_df)} registros")
+        logger.debug(f"Datos procesados: {len(processed_df)} registros")
         return processed_df
         
     except Exception as e:
-        print(f"Error procesando datos: {e}")
+        logger.error(f"Error procesando datos: {e}")
         return create_example_happiness_data()
 
 def load_happiness_students_work_data(file_path="data/preprocessed_relationship_study_job/E8_happiness_5__studients_work_or_not__all_contries.xlsx"):
@@ -346,14 +351,14 @@ def load_happiness_students_work_data(file_path="data/preprocessed_relationship_
         processed_df = pd.DataFrame(processed_data)
         
         if processed_df.empty:
-            print("No se pudieron procesar datos de estudiantes que trabajan/no trabajan")
+            logger.warning("No se pudieron procesar datos de estudiantes que trabajan/no trabajan")
             return None
         
-        print(f"Datos de trabajo/no trabajo procesados: {len(processed_df)} registros")
+        logger.debug(f"Datos de trabajo/no trabajo procesados: {len(processed_df)} registros")
         return processed_df
         
     except Exception as e:
-        print(f"Error procesando datos de trabajo: {e}")
+        logger.error(f"Error procesando datos de trabajo: {e}")
         return None
 
 def create_example_happiness_data():
@@ -508,7 +513,7 @@ def create_streamlit_happiness_chart():
     df_work_categories = load_happiness_students_work_data()
     
     if df_work_categories is None:
-        print("No se pudieron cargar datos de trabajo/no trabajo, usando solo datos de relación trabajo-estudio")
+        logger.warning("No se pudieron cargar datos de trabajo/no trabajo, usando solo datos de relación trabajo-estudio")
         # Crear gráfico simple solo con relación trabajo-estudio
         return create_simple_happiness_chart(eu_avg_work_relation)
     
@@ -749,7 +754,7 @@ def generate_academic_perception_analysis():
         insights = get_academic_perception_insights(df)
         return fig, insights
     except Exception as e:
-        print(f"Error generando análisis de percepción académica: {e}")
+        logger.error(f"Error generando análisis de percepción académica: {e}")
         return None, None
 
 def generate_happiness_work_relation_analysis():
@@ -759,5 +764,9 @@ def generate_happiness_work_relation_analysis():
         insights = get_happiness_insights(data)
         return fig, insights
     except Exception as e:
-        print(f"Error generando análisis de felicidad trabajo-estudio: {e}")
-        return None, None 
\ No newline at end of file
+        logger.error(f"Error generando análisis de felicidad trabajo-estudio: {e}")
+        return None, None
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
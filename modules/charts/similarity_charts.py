@@ -0,0 +1,84 @@
+"""
+Módulo de gráficos de similitud entre países
+Muestra los países cuyo perfil de respuestas más se parece al de un país foco
+"""
+
+import logging
+
+import plotly.graph_objects as go
+
+# Importar configuración unificada de colores
+from ..core.tracing import trace_module
+from ..core.color_config import STORYTELLING_COLORS, apply_standard_layout
+
+logger = logging.getLogger(__name__)
+
+
+def create_country_neighbours_chart(focus_country='ES', k=8, metric='cosine', height=550, width=800):
+    """
+    Crea un gráfico de barras con los k países más parecidos al país foco
+
+    Args:
+        focus_country (str): Código del país foco
+        k (int): Número de vecinos a mostrar
+        metric (str): 'cosine' (se muestra como similitud 1 - distancia) o 'euclidean'
+        height (int): Altura del gráfico en píxeles
+        width (int): Ancho del gráfico en píxeles
+
+    Returns:
+        plotly.graph_objects.Figure: Gráfico de vecinos, o None si no hay datos
+    """
+    # Importación diferida: el módulo de análisis carga a su vez los módulos de gráficos
+    from ..analysis.similarity_analysis import get_country_similarity_index
+
+    index = get_country_similarity_index()
+    neighbours = index.nearest(focus_country, k=k, metric=metric)
+    if not neighbours:
+        logger.warning(f"No hay vecinos disponibles para {focus_country}")
+        return None
+
+    # El más parecido arriba
+    countries = [country for country, _ in reversed(neighbours)]
+    if metric == 'cosine':
+        scores = [1.0 - distance for _, distance in reversed(neighbours)]
+        axis_title = 'Similitud del perfil (coseno)'
+        hover = '<b>%{y}</b><br>Similitud: %{x:.2f}<extra></extra>'
+        text = [f'{s:.2f}' for s in scores]
+    else:
+        scores = [distance for _, distance in reversed(neighbours)]
+        axis_title = 'Distancia del perfil (euclídea, menor = más parecido)'
+        hover = '<b>%{y}</b><br>Distancia: %{x:.2f}<extra></extra>'
+        text = [f'{s:.1f}' for s in scores]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        y=countries,
+        x=scores,
+        orientation='h',
+        marker_color=STORYTELLING_COLORS['europe'],
+        marker_line=dict(color='white', width=2),
+        hovertemplate=hover,
+        text=text,
+        textposition='outside'
+    ))
+
+    fig = apply_standard_layout(
+        fig,
+        title=f'<b>Países con un perfil de estudiantes similar a {focus_country}</b><br>' +
+              f'<sub>{len(neighbours)} vecinos más cercanos sobre {index.n_indicators} indicadores normalizados</sub>',
+        height=height,
+        width=width
+    )
+
+    fig.update_layout(
+        xaxis_title=axis_title,
+        yaxis_title='Países',
+        showlegend=False
+    )
+
+    return fig
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
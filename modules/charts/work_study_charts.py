@@ -1,19 +1,26 @@
 #!/usr/bin/env python3
 """
 Módulo especializado para crear gráficos interactivos de relación trabajo-estudio
-Optimizado para uso en storytelling con España como foco principal
+Optimizado para uso en storytelling con un país foco (España por defecto)
 """
 
+import logging
+
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.io as pio
 import numpy as np
+from ..core.tracing import trace_module
 from ..core.data_loaders import read_work_study_relationship_dataset, PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy
+from ..core.ranking_index import get_ranking_index
+from ..core.countries import DEFAULT_FOCUS_COUNTRY, FOCUS_COUNTRIES, country_flag, country_label, country_name
 
 # Importar configuración unificada de colores
-from ..core.color_config import STORYTELLING_COLORS, COLOR_PALETTES, apply_standard_layout
+from ..core.color_config import STORYTELLING_COLORS, COLOR_PALETTES, apply_standard_layout, apply_significance_marker
+
+logger = logging.getLogger(__name__)
 
 # Configuración de colores para storytelling
 SPAIN_COLOR = STORYTELLING_COLORS['spain']
@@ -22,46 +29,56 @@ NEUTRAL_COLOR = STORYTELLING_COLORS['text_light']
 SUCCESS_COLOR = STORYTELLING_COLORS['dont_need_work']
 WARNING_COLOR = STORYTELLING_COLORS['warning']
 
-def create_storytelling_work_study_charts():
+# Países comparables que acompañan al país foco en el análisis de brechas
+GAP_COMPARABLE_COUNTRIES = 6
+
+def create_storytelling_work_study_charts(df=None, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Crea un conjunto de gráficos interactivos optimizados para storytelling
-    con España como protagonista
+    con el país foco como protagonista
+    
+    Args:
+        df (pd.DataFrame): Dataset de relación trabajo-estudio ya cargado
+            (si es None se lee del fichero)
+        focus_country (str): Código ISO-2 del país foco
     """
     # Cargar datos
-    df = read_work_study_relationship_dataset()
+    if df is None:
+        df = read_work_study_relationship_dataset()
     
     charts = {}
     
-    # 1. Hero Chart: España vs Europa - Comparación Principal
-    charts['hero_chart'] = create_hero_spain_europe_comparison(df)
+    # 1. Hero Chart: País foco vs Europa - Comparación Principal
+    charts['hero_chart'] = create_hero_spain_europe_comparison(df, focus_country)
     
-    # 2. Context Chart: Ranking Europeo con España destacada
-    charts['ranking_chart'] = create_european_ranking_chart(df)
+    # 2. Context Chart: Ranking Europeo con el país foco destacado
+    charts['ranking_chart'] = create_european_ranking_chart(df, focus_country)
     
     # 3. Detail Chart: Desglose por niveles de relación
-    charts['detail_chart'] = create_relationship_levels_chart(df)
+    charts['detail_chart'] = create_relationship_levels_chart(df, focus_country)
     
     # 4. Insight Chart: Análisis de brechas
-    charts['insight_chart'] = create_gap_analysis_chart(df)
+    charts['insight_chart'] = create_gap_analysis_chart(df, focus_country)
     
     return charts, df
 
 
-def create_hero_spain_europe_comparison(df):
+def create_hero_spain_europe_comparison(df, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
-    Gráfico principal: España vs Europa - Hero chart para storytelling
+    Gráfico principal: País foco vs Europa - Hero chart para storytelling
     """
-    # Calcular datos de España vs Europa
-    spain_data = df[df['Country'] == 'ES'].iloc[0]
-    europe_data = df[df['Country'] != 'ES']
-    
-    # Datos de España
-    spain_values = {
-        'Muy Relacionado': spain_data['Very_Closely_Value'],
-        'Bastante Relacionado': spain_data['Closely_Value'],
-        'Algo Relacionado': spain_data['Somewhat_Value'],
-        'Poco Relacionado': spain_data['Not_Closely_Value'],
-        'Nada Relacionado': spain_data['Not_At_All_Value']
+    # Calcular datos del país foco vs Europa
+    focus_data = df[df['Country'] == focus_country].iloc[0]
+    europe_data = df[df['Country'] != focus_country]
+    focus_name = country_name(focus_country)
+    
+    # Datos del país foco
+    focus_values = {
+        'Muy Relacionado': focus_data['Very_Closely_Value'],
+        'Bastante Relacionado': focus_data['Closely_Value'],
+        'Algo Relacionado': focus_data['Somewhat_Value'],
+        'Poco Relacionado': focus_data['Not_Closely_Value'],
+        'Nada Relacionado': focus_data['Not_At_All_Value']
     }
     
     # Promedio europeo
@@ -73,20 +90,20 @@ def create_hero_spain_europe_comparison(df):
         'Nada Relacionado': europe_data['Not_At_All_Value'].mean()
     }
     
-    categories = list(spain_values.keys())
-    spain_vals = list(spain_values.values())
+    categories = list(focus_values.keys())
+    focus_vals = list(focus_values.values())
     europe_vals = list(europe_values.values())
     
     fig = go.Figure()
     
-    # Barras de España
+    # Barras del país foco
     fig.add_trace(go.Bar(
-        name='🇪🇸 España',
+        name=country_label(focus_country),
         x=categories,
-        y=spain_vals,
+        y=focus_vals,
         marker_color=SPAIN_COLOR,
-        hovertemplate='<b>España</b><br>%{x}: %{y:.1f}%<extra></extra>',
-        text=[f'{v:.1f}%' for v in spain_vals],
+        hovertemplate='<b>' + focus_name + '</b><br>%{x}: %{y:.1f}%<extra></extra>',
+        text=[f'{v:.1f}%' for v in focus_vals],
         textposition='outside'
     ))
     
@@ -102,15 +119,15 @@ def create_hero_spain_europe_comparison(df):
     ))
     
     # Calcular el total relacionado para el insight
-    spain_related = sum(spain_vals[:3])  # Muy + Bastante + Algo relacionado
+    focus_related = sum(focus_vals[:3])  # Muy + Bastante + Algo relacionado
     europe_related = sum(europe_vals[:3])
-    gap = europe_related - spain_related
+    gap = europe_related - focus_related
     
     # Aplicar layout estándar
     fig = apply_standard_layout(
         fig,
-        title=f'🇪🇸 España vs 🇪🇺 Europa: Relación Trabajo-Estudio<br>' +
-              f'<sub>España: {spain_related:.1f}% | Europa: {europe_related:.1f}% | Brecha: {gap:.1f} puntos</sub>',
+        title=f'{country_label(focus_country)} vs 🇪🇺 Europa: Relación Trabajo-Estudio<br>' +
+              f'<sub>{focus_name}: {focus_related:.1f}% | Europa: {europe_related:.1f}% | Brecha: {gap:.1f} puntos</sub>',
         height=500,
         width=800
     )
@@ -140,8 +157,9 @@ def create_hero_spain_europe_comparison(df):
     # Añadir anotación con insight clave
     fig.add_annotation(
         x=2,  # Posición central
-        y=max(max(spain_vals), max(europe_vals)) + 5,
-        text=f"<b>Gap de {gap:.1f} puntos</b><br>España por debajo del promedio europeo",
+        y=max(max(focus_vals), max(europe_vals)) + 5,
+        text=f"<b>Gap de {abs(gap):.1f} puntos</b><br>{focus_name} "
+             f"{'por debajo' if gap > 0 else 'por encima'} del promedio europeo",
         showarrow=False,
         bgcolor=WARNING_COLOR,
         bordercolor='white',
@@ -149,32 +167,28 @@ def create_hero_spain_europe_comparison(df):
         borderwidth=2
     )
     
+    # Destacar las barras del país foco si su distribución difiere de la europea
+    # (importación diferida: el módulo de análisis carga los módulos de gráficos)
+    from ..analysis.significance_analysis import dataset_significance
+    fig = apply_significance_marker(fig, 0, dataset_significance(df, 'relationship', focus_country))
+    
     return fig
 
 
-def create_european_ranking_chart(df):
+def create_european_ranking_chart(df, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
-    Ranking europeo con España destacada - Para mostrar posición relativa
+    Ranking europeo con el país foco destacado - Para mostrar posición relativa
     """
-    # Calcular score de relación para cada país
-    df_rank = df.copy()
-    df_rank['Related_Total'] = (
-        df_rank['Very_Closely_Value'].fillna(0) + 
-        df_rank['Closely_Value'].fillna(0) + 
-        df_rank['Somewhat_Value'].fillna(0)
-    )
+    # Score de relación ya ordenado en el ranking precalculado al cargar
+    ranking = get_ranking_index(df)
+    countries = ranking.ranked_countries('Related_Total', ascending=True)
+    scores = ranking.ranked_values('Related_Total', ascending=True)
     
-    # Ordenar por score
-    df_rank = df_rank.sort_values('Related_Total', ascending=True)
+    # Crear colores destacando el país foco
+    colors = [SPAIN_COLOR if country == focus_country else NEUTRAL_COLOR for country in countries]
     
-    countries = df_rank['Country'].tolist()
-    scores = df_rank['Related_Total'].tolist()
-    
-    # Crear colores destacando España
-    colors = [SPAIN_COLOR if country == 'ES' else NEUTRAL_COLOR for country in countries]
-    
-    # Encontrar posición de España
-    spain_position = countries.index('ES') + 1 if 'ES' in countries else None
+    # Posición del país foco
+    focus_position = ranking.position('Related_Total', focus_country, ascending=True)
     total_countries = len(countries)
     
     fig = go.Figure()
@@ -193,7 +207,7 @@ def create_european_ranking_chart(df):
     fig = apply_standard_layout(
         fig,
         title=f'Ranking Europeo: Relación Trabajo-Estudio<br>' +
-              f'<sub>España en posición {spain_position}/{total_countries}</sub>',
+              f'<sub>{country_name(focus_country)} en posición {focus_position}/{total_countries}</sub>',
         height=700,
         width=800
     )
@@ -225,7 +239,7 @@ def create_european_ranking_chart(df):
     return fig
 
 
-def create_relationship_levels_chart(df):
+def create_relationship_levels_chart(df, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Gráfico de barras apiladas mostrando distribución de niveles
     """
@@ -313,13 +327,13 @@ def create_relationship_levels_chart(df):
         tickfont=dict(color='#000000', size=11, family='Arial, sans-serif')
     )
     
-    # Destacar España
-    spain_idx = countries.index('ES') if 'ES' in countries else None
-    if spain_idx is not None:
+    # Destacar el país foco
+    focus_idx = countries.index(focus_country) if focus_country in countries else None
+    if focus_idx is not None:
         fig.add_annotation(
-            x=spain_idx,
+            x=focus_idx,
             y=105,
-            text="🇪🇸",
+            text=country_flag(focus_country),
             showarrow=True,
             arrowhead=2,
             arrowcolor=SPAIN_COLOR,
@@ -329,13 +343,16 @@ def create_relationship_levels_chart(df):
     return fig
 
 
-def create_gap_analysis_chart(df):
+def create_gap_analysis_chart(df, focus_country=DEFAULT_FOCUS_COUNTRY, n_comparable=GAP_COMPARABLE_COUNTRIES):
     """
-    Análisis de brechas: España vs otros países similares
+    Análisis de brechas: País foco vs otros países similares
+
+    Los países comparables son los n_comparable países elegibles como foco
+    (FOCUS_COUNTRIES) más próximos al país foco en el ranking de trabajo
+    relacionado, repartidos por encima y por debajo de él; el país foco
+    aparece siempre, esté o no en FOCUS_COUNTRIES.
     """
-    # Seleccionar países comparables (sur de Europa + algunos centrales)
-    comparable_countries = ['ES', 'PT', 'IT', 'FR', 'DE', 'AT', 'CH']
-    df_comp = df[df['Country'].isin(comparable_countries)].copy()
+    df_comp = df[df['Country'].isin(FOCUS_COUNTRIES) | (df['Country'] == focus_country)].copy()
     
     # Calcular trabajo relacionado total
     df_comp['Related_Total'] = (
@@ -344,14 +361,18 @@ def create_gap_analysis_chart(df):
         df_comp['Somewhat_Value'].fillna(0)
     )
     
-    # Ordenar por score
-    df_comp = df_comp.sort_values('Related_Total', ascending=False)
+    # Ordenar por score y quedarse con la ventana centrada en el país foco
+    df_comp = df_comp.sort_values('Related_Total', ascending=False).reset_index(drop=True)
+    focus_rows = df_comp.index[df_comp['Country'] == focus_country]
+    if len(focus_rows):
+        start = max(0, min(focus_rows[0] - n_comparable // 2, len(df_comp) - n_comparable - 1))
+        df_comp = df_comp.iloc[start:start + n_comparable + 1]
     
     countries = df_comp['Country'].tolist()
     scores = df_comp['Related_Total'].tolist()
     
     # Colores especiales
-    colors = [SPAIN_COLOR if country == 'ES' else NEUTRAL_COLOR for country in countries]
+    colors = [SPAIN_COLOR if country == focus_country else NEUTRAL_COLOR for country in countries]
     
     fig = go.Figure()
     
@@ -364,19 +385,19 @@ def create_gap_analysis_chart(df):
         textposition='outside'
     ))
     
-    # Línea de España para comparación
-    spain_score = df_comp[df_comp['Country'] == 'ES']['Related_Total'].iloc[0]
+    # Línea del país foco para comparación
+    focus_score = df_comp[df_comp['Country'] == focus_country]['Related_Total'].iloc[0]
     fig.add_hline(
-        y=spain_score,
+        y=focus_score,
         line_dash="dash",
         line_color=SPAIN_COLOR,
-        annotation_text=f"España: {spain_score:.1f}%",
+        annotation_text=f"{country_name(focus_country)}: {focus_score:.1f}%",
         annotation_position="right"
     )
     
     fig.update_layout(
         title={
-            'text': 'España vs Países Comparables: Trabajo Relacionado con Estudios',
+            'text': f'{country_name(focus_country)} vs Países Comparables: Trabajo Relacionado con Estudios',
             'x': 0.5,
             'font': {'size': 18}
         },
@@ -420,58 +441,59 @@ def export_charts_for_storytelling(charts, output_dir='storytelling_charts'):
         for format_name, export_func in formats.items():
             try:
                 export_func(fig, chart_name)
-                print(f"✅ Exported {chart_name}.{format_name}")
+                logger.info(f"✅ Exported {chart_name}.{format_name}")
             except Exception as e:
-                print(f"❌ Error exporting {chart_name}.{format_name}: {e}")
+                logger.error(f"❌ Error exporting {chart_name}.{format_name}: {e}")
 
 
-def generate_storytelling_summary(df):
+def generate_storytelling_summary(df, focus_country=DEFAULT_FOCUS_COUNTRY):
     """
     Genera un resumen narrativo para storytelling
+    
+    Las claves 'focus_*' (porcentaje de trabajo relacionado, posición en el
+    ranking y niveles extremos) son las del país foco; 'europe_percentage' y
+    'gap' lo comparan con el promedio del resto de países.
     """
-    # Datos de España
-    spain_data = df[df['Country'] == 'ES'].iloc[0]
-    spain_related = (spain_data['Very_Closely_Value'] +
-                     spain_data['Closely_Value'] +
-                     spain_data['Somewhat_Value'])
+    # Datos del país foco
+    focus_data = df[df['Country'] == focus_country].iloc[0]
+    focus_name = country_name(focus_country)
+    focus_related = (focus_data['Very_Closely_Value'] +
+                     focus_data['Closely_Value'] +
+                     focus_data['Somewhat_Value'])
     
     # Promedio europeo
-    europe_data = df[df['Country'] != 'ES']
+    europe_data = df[df['Country'] != focus_country]
     europe_related = (europe_data['Very_Closely_Value'].mean() +
                       europe_data['Closely_Value'].mean() +
                       europe_data['Somewhat_Value'].mean())
     
-    # Ranking calculado
-    df_rank = df.copy()
-    df_rank['Related_Total'] = (df_rank['Very_Closely_Value'].fillna(0) +
-                                df_rank['Closely_Value'].fillna(0) +
-                                df_rank['Somewhat_Value'].fillna(0))
-    df_rank = df_rank.sort_values('Related_Total', ascending=False)
-    spain_position = df_rank[df_rank['Country'] == 'ES'].index[0] + 1
+    # Posición del país foco en el ranking precalculado (1 = más relacionado)
+    focus_position = get_ranking_index(df).position('Related_Total', focus_country)
+    gap = europe_related - focus_related
     
     summary = {
-        'spain_percentage': spain_related,
+        'focus_percentage': focus_related,
         'europe_percentage': europe_related,
-        'gap': europe_related - spain_related,
-        'spain_rank': spain_position,
+        'gap': gap,
+        'focus_rank': focus_position,
         'total_countries': len(df),
-        'spain_very_closely': spain_data['Very_Closely_Value'],
-        'spain_not_at_all': spain_data['Not_At_All_Value'],
+        'focus_very_closely': focus_data['Very_Closely_Value'],
+        'focus_not_at_all': focus_data['Not_At_All_Value'],
         'narrative': f"""
-        📊 HISTORIA DE LOS DATOS: RELACIÓN TRABAJO-ESTUDIO EN ESPAÑA
+        📊 HISTORIA DE LOS DATOS: RELACIÓN TRABAJO-ESTUDIO EN {focus_name.upper()}
 
-        🇪🇸 En España, el {spain_related:.1f}% de los estudiantes tienen un trabajo 
+        {country_flag(focus_country)} En {focus_name}, el {focus_related:.1f}% de los estudiantes tienen un trabajo 
         relacionado con sus estudios, comparado con el {europe_related:.1f}% del promedio europeo.
 
-        📉 BRECHA IDENTIFICADA: España está {europe_related - spain_related:.1f} puntos 
-        por debajo del promedio europeo, ocupando la posición {spain_position} de {len(df)} países.
+        📉 BRECHA IDENTIFICADA: {focus_name} está {abs(gap):.1f} puntos 
+        {'por debajo' if gap > 0 else 'por encima'} del promedio europeo, ocupando la posición {focus_position} de {len(df)} países.
 
         🔍 ANÁLISIS DETALLADO:
-        • Solo el {spain_data['Very_Closely_Value']:.1f}% tiene trabajo muy relacionado
-        • El {spain_data['Not_At_All_Value']:.1f}% tiene trabajo nada relacionado con sus estudios
+        • Solo el {focus_data['Very_Closely_Value']:.1f}% tiene trabajo muy relacionado
+        • El {focus_data['Not_At_All_Value']:.1f}% tiene trabajo nada relacionado con sus estudios
 
         💡 OPORTUNIDAD: Existe margen para mejorar la conexión entre 
-        formación académica y experiencia laboral de los estudiantes españoles.
+        formación académica y experiencia laboral de los estudiantes de {focus_name}.
         """
     }
     
@@ -502,5 +524,9 @@ def main():
     return charts, df, summary
 
 
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
+
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,8 +2,17 @@
 Módulo core: Funcionalidades centrales del proyecto
 - Carga de datos
 - Configuración de colores y estilos
+- Índices de rankings por país
+- Países (país foco, nombres y banderas)
 - Utilidades compartidas
+
+Los nombres de los submódulos se exponen como con `from .x import *`, pero
+de forma diferida: importar modules.core.color_config ya no carga pandas.
 """
 
-from .color_config import *
-from .data_loaders import * 
\ No newline at end of file
+from .lazy_imports import lazy_package
+
+__getattr__, __dir__ = lazy_package(
+    __name__, globals(),
+    star_modules=('.color_config', '.data_loaders', '.ranking_index', '.countries')
+)
@@ -67,7 +67,9 @@ COLOR_PALETTES = {
         STORYTELLING_COLORS['dont_need_work'],
         STORYTELLING_COLORS['warning'], 
         STORYTELLING_COLORS['danger']
-    ]
+    ],
+    # Familias de países (ordenadas de menor a mayor necesidad de trabajar)
+    'country_families': ['#43A047', '#1E88E5', '#8E24AA', '#EF6C00', '#B71C1C', '#00897B', '#6D4C41', '#546E7A']
 }
 
 # Configuración de layout estándar para todas las gráficas
@@ -154,4 +156,38 @@ def apply_standard_layout(fig, title=None, height=600, width=800):
     fig.update_xaxes(**STANDARD_AXES)
     fig.update_yaxes(**STANDARD_AXES)
     
-    return fig 
\ No newline at end of file
+    return fig
+
+
+def apply_significance_marker(fig, trace_index, significance):
+    """
+    Destaca una traza cuya diferencia con Europa es estadísticamente significativa
+
+    Las barras se remarcan con borde oscuro y texto en negrita, y la leyenda y
+    el hover indican el q-valor (p-valor del test chi-cuadrado corregido por
+    Benjamini-Hochberg), que es el que decide la significación.
+
+    Args:
+        fig: Figura de Plotly
+        trace_index (int): Índice de la traza a destacar (ej: barras de España)
+        significance (dict): Resultado del test (q_value, significant), o None
+
+    Returns:
+        fig: Figura actualizada (sin cambios si no hay significación)
+    """
+    if not significance or not significance.get('significant'):
+        return fig
+
+    q_value = significance['q_value']
+    p_text = 'q (BH) < 0.001' if q_value < 0.001 else f'q (BH) = {q_value:.3f}'
+
+    trace = fig.data[trace_index]
+    trace.marker.line = dict(color=STORYTELLING_COLORS['text'], width=3)
+    if trace.text is not None:
+        trace.text = [f'<b>{t}</b>' for t in trace.text]
+    trace.name = f'{trace.name} * (χ² {p_text})'
+    if trace.hovertemplate:
+        trace.hovertemplate = trace.hovertemplate.replace(
+            '<extra>', f'<br><i>Diferencia significativa vs Europa ({p_text})</i><extra>'
+        )
+    return fig
@@ -0,0 +1,61 @@
+"""
+Países del storytelling
+País foco por defecto, nombres en español y banderas de los países de la
+ronda 8 de EUROSTUDENT
+"""
+
+# País en el que se centra la historia si no se elige otro
+DEFAULT_FOCUS_COUNTRY = 'ES'
+
+# Código de país (ISO-2, como en los excels) -> nombre en español
+COUNTRY_NAMES_ES = {
+    'AT': 'Austria',
+    'AZ': 'Azerbaiyán',
+    'CH': 'Suiza',
+    'CZ': 'Chequia',
+    'DE': 'Alemania',
+    'DK': 'Dinamarca',
+    'EE': 'Estonia',
+    'ES': 'España',
+    'FI': 'Finlandia',
+    'FR': 'Francia',
+    'GE': 'Georgia',
+    'HR': 'Croacia',
+    'HU': 'Hungría',
+    'IE': 'Irlanda',
+    'IS': 'Islandia',
+    'LT': 'Lituania',
+    'LV': 'Letonia',
+    'MT': 'Malta',
+    'NL': 'Países Bajos',
+    'NO': 'Noruega',
+    'PL': 'Polonia',
+    'PT': 'Portugal',
+    'RO': 'Rumanía',
+    'SE': 'Suecia',
+    'SK': 'Eslovaquia',
+}
+
+# Países que pueden elegirse como foco: todos salvo CH, que no tiene datos
+# de motivos para trabajar (y se excluye también de los promedios europeos)
+FOCUS_COUNTRIES = tuple(sorted(
+    (code for code in COUNTRY_NAMES_ES if code != 'CH'),
+    key=lambda code: COUNTRY_NAMES_ES[code]
+))
+
+
+def country_name(code):
+    """Nombre en español de un país (el propio código si no se conoce)"""
+    return COUNTRY_NAMES_ES.get(code, code)
+
+
+def country_flag(code):
+    """Emoji de la bandera de un país a partir de su código ISO-2"""
+    # EUROSTUDENT usa EL para Grecia y UK para Reino Unido
+    code = {'EL': 'GR', 'UK': 'GB'}.get(code, code)
+    return ''.join(chr(0x1F1E6 + ord(letter) - ord('A')) for letter in code.upper())
+
+
+def country_label(code):
+    """Bandera y nombre (ej: '🇪🇸 España')"""
+    return f"{country_flag(code)} {country_name(code)}"
@@ -0,0 +1,145 @@
+"""
+Caché en disco de resultados derivados de los datasets
+Cada resultado se guarda con la huella (fingerprint) de los ficheros de los
+que depende, de modo que se recalcula solo cuando cambian los datos.
+Los resultados también se conservan en memoria para el resto del proceso.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+
+from .metrics import record_cache, record_eviction
+
+logger = logging.getLogger(__name__)
+
+# Directorio de caché (relativo al directorio de ejecución, como 'data/')
+CACHE_DIR = os.environ.get('STORYTELLING_CACHE_DIR', '.cache')
+
+# Se incrementa cuando cambia el formato de los resultados cacheados
+CACHE_VERSION = 1
+
+# Hash del contenido por fichero, reutilizado mientras no cambie (mtime, tamaño)
+_FILE_HASHES = {}
+
+# Último resultado por nombre: name -> (fingerprint, value)
+_MEMORY_CACHE = {}
+
+# Resultados servidos por cached_on_disk según su origen
+_STATS = {'memoria': 0, 'disco': 0, 'calculado': 0}
+
+
+def _file_hash(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return '<missing>'
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILE_HASHES.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, 'rb') as f:
+        file_hash = hashlib.sha1(f.read()).hexdigest()
+    _FILE_HASHES[path] = (key, file_hash)
+    return file_hash
+
+
+def data_fingerprint(paths, extra=None):
+    """
+    Calcula la huella SHA-1 del contenido de una lista de ficheros
+
+    Args:
+        paths (iterable): Rutas de los ficheros de datos
+        extra (str): Texto adicional a incluir (ej: parámetros del cálculo)
+
+    Returns:
+        str: Huella hexadecimal
+    """
+    digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    for path in sorted(paths):
+        digest.update(path.encode())
+        digest.update(_file_hash(path).encode())
+    if extra:
+        digest.update(str(extra).encode())
+    return digest.hexdigest()
+
+
+def _cache_path(name, fingerprint):
+    return os.path.join(CACHE_DIR, f"{name}-{fingerprint[:16]}.pkl")
+
+
+def load_cached(name, fingerprint):
+    """Devuelve el resultado cacheado para (name, fingerprint), o None"""
+    path = _cache_path(name, fingerprint)
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+    if payload.get('fingerprint') != fingerprint:
+        return None
+    return payload['value']
+
+
+def save_cached(name, fingerprint, value):
+    """Guarda un resultado en la caché, eliminando versiones anteriores"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(name, fingerprint)
+
+    # Escritura atómica para que otro proceso nunca lea un fichero a medias
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'fingerprint': fingerprint, 'value': value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+    for filename in os.listdir(CACHE_DIR):
+        if filename.startswith(f"{name}-") and filename.endswith('.pkl') and \
+                os.path.join(CACHE_DIR, filename) != path:
+            try:
+                os.remove(os.path.join(CACHE_DIR, filename))
+            except OSError:
+                continue
+            record_eviction('derived_disk')
+
+
+def cached_on_disk(name, fingerprint, builder):
+    """
+    Devuelve el resultado cacheado o lo calcula con builder() y lo guarda
+
+    Args:
+        name (str): Nombre del resultado (prefijo del fichero)
+        fingerprint (str): Huella de los datos de entrada
+        builder (callable): Función sin argumentos que calcula el resultado
+
+    Returns:
+        object: Resultado cacheado o recién calculado
+    """
+    cached = _MEMORY_CACHE.get(name)
+    if cached is not None and cached[0] == fingerprint:
+        _STATS['memoria'] += 1
+        record_cache('derived_memory', True)
+        return cached[1]
+    record_cache('derived_memory', False)
+
+    value = load_cached(name, fingerprint)
+    record_cache('derived_disk', value is not None)
+    if value is not None:
+        _STATS['disco'] += 1
+    else:
+        _STATS['calculado'] += 1
+        value = builder()
+        try:
+            save_cached(name, fingerprint, value)
+        except OSError as e:
+            logger.warning(f"⚠️ No se pudo guardar la caché {name}: {e}")
+    if cached is not None:
+        # La versión anterior (otra huella) deja de estar en memoria
+        record_eviction('derived_memory')
+    _MEMORY_CACHE[name] = (fingerprint, value)
+    return value
+
+
+def cache_stats():
+    """Resultados servidos por cached_on_disk desde memoria, desde disco o recalculados"""
+    return dict(_STATS)
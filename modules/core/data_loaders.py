@@ -3,9 +3,16 @@ Módulo centralizado para carga de datos
 Contiene todas las funciones de lectura y procesamiento de datasets
 """
 
+import logging
+
 import pandas as pd
 from enum import Enum
 
+from .tracing import trace_module
+from .ranking_index import attach_ranking_index
+
+logger = logging.getLogger(__name__)
+
 # === DEFINICIÓN DE ENUMS ===
 
 class PreprocessedDatasetsNamesImpactsOnStudyForWork(Enum):
@@ -60,6 +67,26 @@ class CompleteDatasetsName(Enum):
 
 NUM_SPANISH_PARTICIPANTS = 9072
 
+# Alias de compatibilidad de los datasets de abandono (columna de frecuencia
+# -> columna de origen), según la estructura del excel: 46 columnas (tres
+# grupos de dificultades financieras) o 31 (dos grupos de escala de acuerdo)
+ABANDONING_ALIASES = {
+    46: {
+        'Very_Often_Value': 'With_Fin_Diff_Very_Often_Value',
+        'Often_Value': 'With_Fin_Diff_Often_Value',
+        'Sometimes_Value': 'With_Fin_Diff_Sometimes_Value',
+        'Rarely_Value': 'With_Fin_Diff_Rarely_Value',
+        'Never_Value': 'With_Fin_Diff_Never_Value',
+    },
+    31: {
+        'Very_Often_Value': 'Partly_Strongly_Agree_Value',  # Strongly agree = Very often
+        'Often_Value': 'Partly_Agree_2_Value',              # Level 2 = Often
+        'Sometimes_Value': 'Partly_Agree_3_Value',          # Level 3 = Sometimes
+        'Rarely_Value': 'Partly_Agree_4_Value',             # Level 4 = Rarely
+        'Never_Value': 'Partly_Disagree_All_Value',         # Disagree all = Never
+    },
+}
+
 # === FUNCIONES DE CARGA DE DATOS ===
 
 def read_dataset(dataset_name):
@@ -113,7 +140,8 @@ def read_work_motive_afford_study_dataset():
         if count_col in data_df.columns:
             data_df[count_col] = pd.to_numeric(data_df[count_col], errors='coerce').astype('Int64')
     
-    return data_df
+    # Precalcular rankings por indicador una sola vez al cargar
+    return attach_ranking_index(data_df)
 
 def read_work_study_relationship_dataset(dataset_enum=None):
     """
@@ -166,15 +194,16 @@ def read_work_study_relationship_dataset(dataset_enum=None):
         
         # Verificar que España esté en los datos
         if 'ES' not in data_df['Country'].values:
-            print(f"⚠️ España no encontrada en {dataset_enum.value}")
+            logger.warning(f"⚠️ España no encontrada en {dataset_enum.value}")
         
-        return data_df
+        # Precalcular rankings por indicador una sola vez al cargar
+        return attach_ranking_index(data_df)
         
     except FileNotFoundError:
-        print(f"❌ Archivo no encontrado: {dataset_enum.value}")
+        logger.error(f"❌ Archivo no encontrado: {dataset_enum.value}")
         return None
     except Exception as e:
-        print(f"❌ Error cargando {dataset_enum.value}: {e}")
+        logger.error(f"❌ Error cargando {dataset_enum.value}: {e}")
         return None
 
 def read_work_impact_dataset(dataset_enum):
@@ -192,16 +221,19 @@ def read_work_impact_dataset(dataset_enum):
     filename = dataset_enum.value.lower()
     
     if 'time_budget_satisf' in filename:
-        return _process_time_budget_satisfaction_dataset(data_df)
+        data_df = _process_time_budget_satisfaction_dataset(data_df)
     elif 'abandoning' in filename or 'assess' in filename:
-        return _process_study_abandoning_dataset(data_df)
+        data_df = _process_study_abandoning_dataset(data_df)
     elif 'selfevaluation' in filename:
-        return _process_self_evaluation_dataset(data_df)
+        data_df = _process_self_evaluation_dataset(data_df)
     elif 'health' in filename:
-        return _process_health_relationship_dataset(data_df)
+        data_df = _process_health_relationship_dataset(data_df)
     else:
         # Estructura genérica para otros datasets
         return _process_generic_impact_dataset(data_df)
+    
+    # Precalcular rankings por indicador una sola vez al cargar
+    return attach_ranking_index(data_df)
 
 # === FUNCIONES DE PROCESAMIENTO ESPECÍFICO ===
 
@@ -278,11 +310,8 @@ def _process_study_abandoning_dataset(data_df):
                 data_df[count_col] = pd.to_numeric(data_df[count_col], errors='coerce').astype('Int64')
         
         # Crear aliases para compatibilidad
-        data_df['Very_Often_Value'] = data_df['With_Fin_Diff_Very_Often_Value']
-        data_df['Often_Value'] = data_df['With_Fin_Diff_Often_Value']
-        data_df['Sometimes_Value'] = data_df['With_Fin_Diff_Sometimes_Value']
-        data_df['Rarely_Value'] = data_df['With_Fin_Diff_Rarely_Value']
-        data_df['Never_Value'] = data_df['With_Fin_Diff_Never_Value']
+        for alias, source in ABANDONING_ALIASES[46].items():
+            data_df[alias] = data_df[source]
         
     elif num_cols == 31:
         # Estructura con 2 grupos de escalas Likert (como "work to afford study")
@@ -316,11 +345,8 @@ def _process_study_abandoning_dataset(data_df):
         
         # Crear aliases para compatibilidad usando el primer grupo como principal
         # Mapeamos las escalas Likert a frecuencias equivalentes
-        data_df['Very_Often_Value'] = data_df['Partly_Strongly_Agree_Value']  # Strongly agree = Very often
-        data_df['Often_Value'] = data_df['Partly_Agree_2_Value']               # Level 2 = Often
-        data_df['Sometimes_Value'] = data_df['Partly_Agree_3_Value']           # Level 3 = Sometimes
-        data_df['Rarely_Value'] = data_df['Partly_Agree_4_Value']              # Level 4 = Rarely
-        data_df['Never_Value'] = data_df['Partly_Disagree_All_Value']          # Disagree all = Never
+        for alias, source in ABANDONING_ALIASES[31].items():
+            data_df[alias] = data_df[source]
         
     else:
         # Estructura simple original
@@ -427,4 +453,8 @@ def _process_generic_impact_dataset(data_df):
     data_df = data_df.reset_index(drop=True)
     data_df = data_df.dropna(subset=['Country'])
     
-    return data_df 
\ No newline at end of file
+    return data_df
+
+
+# Spans de los loaders y builders de este módulo (modules.core.tracing)
+trace_module(__name__)
@@ -0,0 +1,55 @@
+"""
+Carga diferida de los nombres públicos de un paquete
+Permite que `from modules.charts import X` solo importe el submódulo que
+define X (y sus dependencias: plotly, numpy, ...) en el primer acceso
+"""
+
+import importlib
+
+
+def lazy_package(package_name, package_globals, exports=None, star_modules=()):
+    """
+    Crea las funciones __getattr__ y __dir__ de un paquete con carga diferida
+
+    Args:
+        package_name (str): __name__ del paquete
+        package_globals (dict): globals() del paquete (se cachea cada nombre resuelto)
+        exports (dict): Nombre público -> submódulo relativo (ej: '.impact_charts')
+        star_modules (tuple): Submódulos cuyos nombres públicos se exponen
+            completos, como con `from .submodulo import *`, buscados en orden
+
+    Returns:
+        tuple: (__getattr__, __dir__)
+    """
+    exports = dict(exports or {})
+
+    def _public_names(module):
+        names = getattr(module, '__all__', None)
+        if names is None:
+            names = [name for name in vars(module) if not name.startswith('_')]
+        return names
+
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name, package_name), name)
+            package_globals[name] = value
+            return value
+
+        if not name.startswith('_'):
+            for module_name in star_modules:
+                module = importlib.import_module(module_name, package_name)
+                if name in _public_names(module):
+                    value = getattr(module, name)
+                    package_globals[name] = value
+                    return value
+
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        names = set(package_globals) | set(exports)
+        for module_name in star_modules:
+            names.update(_public_names(importlib.import_module(module_name, package_name)))
+        return sorted(names)
+
+    return __getattr__, __dir__
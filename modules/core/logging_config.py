@@ -0,0 +1,63 @@
+"""
+Configuración de los mensajes de diagnóstico del proyecto
+Los módulos escriben sus mensajes con logging (logging.getLogger(__name__))
+en lugar de print, con nivel: DEBUG para el detalle de cada paso, INFO para
+el progreso del servidor y los informes, WARNING para datos que faltan o
+fallos recuperables y ERROR para fallos que dejan una figura sin construir.
+
+configure_logging se llama desde los puntos de entrada (storytelling.py,
+serve.py). El nivel se elige con STORYTELLING_LOG_LEVEL (INFO por defecto) y
+con STORYTELLING_LOG_FORMAT=json cada mensaje se escribe como una línea JSON.
+"""
+
+import json
+import logging
+import os
+import sys
+
+LOG_LEVEL_ENV = 'STORYTELLING_LOG_LEVEL'
+LOG_FORMAT_ENV = 'STORYTELLING_LOG_FORMAT'
+
+# Paquetes cuyos mensajes se configuran (los de Streamlit tienen su propia configuración)
+LOGGER_NAMES = ('modules', '__main__', 'serve', 'build_assets')
+
+TEXT_FORMAT = '%(asctime)s %(levelname)-7s %(name)s: %(message)s'
+
+
+class JsonFormatter(logging.Formatter):
+    """Un objeto JSON por mensaje (fecha, nivel, módulo, mensaje y excepción)"""
+
+    def format(self, record):
+        payload = {
+            'time': self.formatTime(record), 'level': record.levelname,
+            'logger': record.name, 'message': record.getMessage(),
+        }
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def configure_logging(level=None, fmt=None):
+    """
+    Envía los mensajes del proyecto a stderr con el nivel y formato indicados
+
+    Se puede llamar varias veces (en cada rerun): solo la primera añade el
+    manejador.
+
+    Args:
+        level (str): Nivel mínimo ('DEBUG', 'INFO', ...); por defecto STORYTELLING_LOG_LEVEL o INFO
+        fmt (str): 'text' o 'json'; por defecto STORYTELLING_LOG_FORMAT o 'text'
+    """
+    level = (level or os.environ.get(LOG_LEVEL_ENV) or 'INFO').upper()
+    fmt = (fmt or os.environ.get(LOG_FORMAT_ENV) or 'text').lower()
+    for name in LOGGER_NAMES:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        if getattr(logger, '_storytelling_configured', False):
+            continue
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(JsonFormatter() if fmt == 'json' else logging.Formatter(TEXT_FORMAT))
+        logger.addHandler(handler)
+        # Sin propagar: si la raíz tiene manejadores (Streamlit, pytest) no se duplican los mensajes
+        logger.propagate = False
+        logger._storytelling_configured = True
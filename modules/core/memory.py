@@ -0,0 +1,203 @@
+"""
+Perfilado de memoria: tamaño profundo de objetos y fugas entre reruns
+deep_sizeof mide la memoria que retiene un objeto (un DataFrame, una figura,
+el estado de una sesión) recorriendo todo lo que alcanza. Las instantáneas
+de tracemalloc de reruns sucesivos permiten encontrar los puntos del código
+cuya memoria no deja de crecer, que son las fugas.
+
+Se activa con STORYTELLING_MEMPROFILE=1 o con enable_memory_profiling().
+Desactivado no tiene ningún coste.
+"""
+
+import gc
+import linecache
+import os
+import sys
+import tracemalloc
+import types
+
+import numpy as np
+import pandas as pd
+
+MEMORY_ENV = 'STORYTELLING_MEMPROFILE'
+
+# Directorio donde se exporta cada informe de memoria como JSON (opcional)
+MEMORY_DIR = os.environ.get('STORYTELLING_MEMPROFILE_DIR')
+
+# Marcos de pila que guarda tracemalloc por asignación (más marcos, más coste)
+TRACEBACK_FRAMES = int(os.environ.get('STORYTELLING_MEMPROFILE_FRAMES', '1'))
+
+# Reruns entre dos informes completos (instantánea, fugas y reparto por entrada)
+REPORT_EVERY = int(os.environ.get('STORYTELLING_MEMPROFILE_EVERY', '10'))
+
+# Un punto del código es sospechoso de fuga si crece en todas las últimas
+# LEAK_WINDOW instantáneas y en total más de LEAK_MIN_BYTES
+LEAK_WINDOW = 3
+LEAK_MIN_BYTES = 64 * 1024
+
+# Objetos compartidos por todo el proceso: no cuentan en el tamaño de nadie
+_SHARED_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+    types.CodeType, types.FrameType, types.MethodDescriptorType,
+)
+# Validadores de Plotly: instancias cacheadas por clase, compartidas entre figuras
+_SHARED_MODULES = ('_plotly_utils', 'plotly.validators', 'plotly.animation')
+
+_ENABLED = False
+_STARTED_TRACEMALLOC = False
+
+
+def _shared(obj):
+    if isinstance(obj, _SHARED_TYPES) or obj is None or obj is True or obj is False:
+        return True
+    return type(obj).__module__.startswith(_SHARED_MODULES)
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Bytes que retiene un objeto: él y todo lo que alcanza
+
+    Los DataFrames, Series e índices se miden con memory_usage(deep=True)
+    (más sus attrs); los módulos, clases, funciones y validadores de Plotly
+    son del proceso y no se cuentan.
+
+    Args:
+        obj: Objeto a medir
+        seen (set): ids ya contados; se comparte entre llamadas para medir
+            varios objetos sin contar dos veces lo que comparten
+
+    Returns:
+        int: Bytes
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or _shared(current):
+            continue
+        seen.add(id(current))
+        if isinstance(current, pd.DataFrame):
+            total += int(current.memory_usage(index=True, deep=True).sum())
+            stack.extend(current.attrs.values())
+            continue
+        if isinstance(current, (pd.Series, pd.Index)):
+            total += int(current.memory_usage(deep=True))
+            stack.extend(getattr(current, 'attrs', {}).values())
+            continue
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+        if isinstance(current, np.ndarray) and current.dtype != object:
+            # getsizeof ya incluye los datos propios; la base es de quien la creó
+            continue
+        stack.extend(gc.get_referents(current))
+    return total
+
+
+def format_bytes(value):
+    """Bytes en la unidad más legible (ej: '1.5 MB')"""
+    for unit in ('B', 'KB', 'MB'):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.2f} GB"
+
+
+# === INSTANTÁNEAS Y FUGAS ===
+
+def enable_memory_profiling(frames=TRACEBACK_FRAMES):
+    """Activa el perfilado (inicia tracemalloc si no estaba ya activo)"""
+    global _ENABLED, _STARTED_TRACEMALLOC
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+        _STARTED_TRACEMALLOC = True
+    _ENABLED = True
+
+
+def disable_memory_profiling():
+    """Desactiva el perfilado (y tracemalloc si lo inició este módulo)"""
+    global _ENABLED, _STARTED_TRACEMALLOC
+    _ENABLED = False
+    if _STARTED_TRACEMALLOC and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _STARTED_TRACEMALLOC = False
+
+
+def memory_profiling_enabled():
+    return _ENABLED
+
+
+def allocation_sites(limit=None):
+    """
+    Memoria viva por punto del código (archivo:línea) tras recolectar basura
+
+    Se guarda solo el tamaño por punto, no la instantánea completa, para que
+    conservar varias no retenga memoria.
+
+    Returns:
+        dict: 'archivo:línea' -> bytes vivos asignados allí
+    """
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        # El historial de instantáneas que guarda este módulo no es memoria de la aplicación
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    ))
+    stats = snapshot.statistics('lineno')
+    if limit is not None:
+        stats = stats[:limit]
+    return {f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}": stat.size for stat in stats}
+
+
+def growing_sites(history, window=LEAK_WINDOW, min_bytes=LEAK_MIN_BYTES):
+    """
+    Puntos del código cuya memoria crece en todas las últimas instantáneas
+
+    Args:
+        history (list): Resultados sucesivos de allocation_sites
+        window (int): Instantáneas consecutivas en las que debe crecer
+        min_bytes (int): Crecimiento mínimo entre la primera y la última de la ventana
+
+    Returns:
+        list: (punto, bytes de crecimiento en la ventana, bytes actuales),
+            de más a menos crecimiento
+    """
+    if len(history) < window:
+        return []
+    recent = history[-window:]
+    leaks = []
+    for site, size in recent[-1].items():
+        sizes = [sites.get(site, 0) for sites in recent]
+        growth = sizes[-1] - sizes[0]
+        if growth >= min_bytes and all(b > a for a, b in zip(sizes, sizes[1:])):
+            leaks.append((site, growth, size))
+    return sorted(leaks, key=lambda leak: -leak[1])
+
+
+def site_diff(before, after, limit=10):
+    """Puntos del código con más crecimiento entre dos instantáneas: (punto, diferencia, actual)"""
+    diffs = [(site, size - before.get(site, 0), size) for site, size in after.items()]
+    return sorted((diff for diff in diffs if diff[1] > 0), key=lambda diff: -diff[1])[:limit]
+
+
+def site_source(site):
+    """Línea de código de un punto 'archivo:línea' (vacía si no se puede leer)"""
+    filename, _, lineno = site.rpartition(':')
+    return linecache.getline(filename, int(lineno)).strip() if lineno.isdigit() else ''
+
+
+def short_site(site):
+    """Punto del código relativo al proyecto o a site-packages"""
+    for marker in ('site-packages' + os.sep, os.getcwd() + os.sep):
+        if marker in site:
+            return site.split(marker, 1)[1]
+    return site
+
+
+_mode = os.environ.get(MEMORY_ENV, '').strip().lower()
+if _mode not in ('', '0', 'false', 'no', 'off'):
+    enable_memory_profiling()
@@ -0,0 +1,403 @@
+"""
+Métricas del proceso en formato de texto de Prometheus
+Registro de contadores, indicadores (gauges) e histogramas con etiquetas que
+actualizan las cachés, los loaders y los builders (a través de
+tracing.traced) y los reruns de la aplicación. El registro se publica como
+página /metrics en un puerto local (start_metrics_server) o se escribe
+periódicamente en un fichero (start_metrics_file_writer), por ejemplo para
+el textfile collector de node_exporter.
+
+Se activa con STORYTELLING_METRICS=1, STORYTELLING_METRICS_PORT,
+STORYTELLING_METRICS_FILE o con enable_metrics(). Desactivado, cada punto
+instrumentado solo añade una comprobación de un booleano.
+"""
+
+import logging
+import math
+import os
+import threading
+from enum import Enum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENV = 'STORYTELLING_METRICS'
+
+# Puerto de la página /metrics y fichero donde se vuelcan las métricas (opcionales)
+METRICS_PORT = os.environ.get('STORYTELLING_METRICS_PORT')
+METRICS_FILE = os.environ.get('STORYTELLING_METRICS_FILE')
+
+# Segundos entre dos escrituras del fichero de métricas
+METRICS_INTERVAL = float(os.environ.get('STORYTELLING_METRICS_INTERVAL', '15'))
+
+# Límites de los histogramas de latencia en segundos (de 5 ms a 1 minuto)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_ENABLED = False
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    """
+    Métrica con etiquetas: una serie por combinación de valores
+
+    Args:
+        name (str): Nombre en Prometheus (ej: 'storytelling_cache_requests_total')
+        help (str): Descripción que se publica en la línea # HELP
+        labels (tuple): Nombres de las etiquetas
+    """
+
+    type = None
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name}: etiquetas {sorted(labels)}, se esperaban {sorted(self.labels)}")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def samples(self):
+        """Líneas de la métrica en el formato de texto de Prometheus"""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self._lock:
+            series = sorted(self._series.items())
+        for key, value in series:
+            lines.append(f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Contador que solo crece (ej: aciertos de la caché)"""
+
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._series.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Valor que sube y baja (ej: sesiones abiertas)"""
+
+    type = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = value
+
+    def value(self, **labels):
+        return self._series.get(self._key(labels))
+
+
+class Histogram(_Metric):
+    """
+    Distribución de valores en cubetas acumuladas (ej: latencias en segundos)
+
+    Args:
+        buckets (tuple): Límites superiores de las cubetas (+Inf se añade siempre)
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['counts'][i] += 1
+                    break
+            series['sum'] += value
+            series['count'] += 1
+
+    def value(self, **labels):
+        """(número de observaciones, suma) de una serie"""
+        series = self._series.get(self._key(labels))
+        return (series['count'], series['sum']) if series else (0, 0.0)
+
+    def samples(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self._lock:
+            series = sorted((key, dict(value, counts=list(value['counts']))) for key, value in self._series.items())
+        for key, value in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, value['counts']):
+                cumulative += count
+                labels = _format_labels(self.labels, key, [('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, [('le', '+Inf')])} {value['count']}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(value['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {value['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas del proceso
+
+    Los colectores son funciones sin argumentos que se llaman antes de cada
+    exposición para actualizar los indicadores que se leen del estado del
+    proceso (sesiones abiertas, memoria residente...).
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"La métrica {name} ya existe como {metric.type}")
+            return metric
+
+    def counter(self, name, help, labels=()):
+        return self._register(Counter, name, help, labels)
+
+    def gauge(self, name, help, labels=()):
+        return self._register(Gauge, name, help, labels)
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram, name, help, labels, buckets=buckets)
+
+    def add_collector(self, collector):
+        """Registra una función que actualiza indicadores antes de cada exposición"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def collect(self):
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"⚠️ Error en el colector de métricas {getattr(collector, '__name__', collector)}: {e}")
+
+    def exposition(self):
+        """Todas las métricas en el formato de texto de Prometheus"""
+        self.collect()
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return '\n'.join(line for metric in metrics for line in metric.samples()) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+CACHE_REQUESTS = REGISTRY.counter(
+    'storytelling_cache_requests_total',
+    'Consultas a las cachés del proceso por resultado (hit o miss)',
+    ('cache', 'result'),
+)
+CACHE_EVICTIONS = REGISTRY.counter(
+    'storytelling_cache_evictions_total',
+    'Entradas descartadas de las cachés del proceso (sustituidas por una versión más reciente)',
+    ('cache',),
+)
+LOADER_SECONDS = REGISTRY.histogram(
+    'storytelling_loader_duration_seconds',
+    'Tiempo de cada llamada a un loader por dataset',
+    ('loader', 'dataset'),
+)
+BUILDER_SECONDS = REGISTRY.histogram(
+    'storytelling_builder_duration_seconds',
+    'Tiempo de cada llamada a un builder de figuras o tablas',
+    ('builder',),
+)
+CALL_ERRORS = REGISTRY.counter(
+    'storytelling_call_errors_total',
+    'Llamadas a loaders y builders que terminaron con una excepción',
+    ('category', 'name'),
+)
+RERUN_SECONDS = REGISTRY.histogram(
+    'storytelling_rerun_duration_seconds',
+    'Tiempo de cada rerun de la aplicación por capítulo',
+    ('section',),
+)
+
+
+def enable_metrics():
+    """Activa la recogida de métricas en todo el proceso"""
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable_metrics():
+    """Desactiva la recogida de métricas (conserva los valores ya registrados)"""
+    global _ENABLED
+    _ENABLED = False
+
+
+def metrics_enabled():
+    """Indica si se están recogiendo métricas"""
+    return _ENABLED
+
+
+def record_cache(cache, hit):
+    """Cuenta una consulta a una caché ('shared', 'graph', 'derived_memory', 'derived_disk')"""
+    if _ENABLED:
+        CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
+
+def record_eviction(cache, count=1):
+    """Cuenta entradas descartadas de una caché"""
+    if _ENABLED and count:
+        CACHE_EVICTIONS.inc(count, cache=cache)
+
+
+def call_dataset(args):
+    """Dataset de una llamada a un loader: nombre del primer enum de sus argumentos ('' si no hay)"""
+    return next((arg.name for arg in args if isinstance(arg, Enum)), '')
+
+
+def record_call(category, name, args, seconds, failed=False):
+    """
+    Registra la duración de una llamada instrumentada por tracing.traced
+
+    Args:
+        category (str): 'loader' o 'builder' (las demás categorías no se registran)
+        name (str): Nombre de la función (ej: 'data_loaders.read_work_impact_dataset')
+        args (tuple): Argumentos posicionales de la llamada (los loaders se
+            etiquetan con el enum del dataset)
+        seconds (float): Duración
+        failed (bool): La llamada terminó con una excepción
+    """
+    if category == 'loader':
+        LOADER_SECONDS.observe(seconds, loader=name, dataset=call_dataset(args))
+    elif category == 'builder':
+        BUILDER_SECONDS.observe(seconds, builder=name)
+    else:
+        return
+    if failed:
+        CALL_ERRORS.inc(category=category, name=name)
+
+
+def record_rerun(section, seconds):
+    """Registra la duración de un rerun de la aplicación"""
+    if _ENABLED:
+        RERUN_SECONDS.observe(seconds, section=section or '')
+
+
+# === EXPOSICIÓN ===
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics -> métricas del registro en formato de texto de Prometheus"""
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0].rstrip('/') not in ('', '/metrics'):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = REGISTRY.exposition().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port, host='127.0.0.1'):
+    """
+    Publica las métricas en http://host:port/metrics en una hebra de fondo
+
+    Activa la recogida de métricas si no lo estaba.
+
+    Args:
+        port (int): Puerto (distinto del de Streamlit y del de la sonda)
+        host (str): Interfaz de escucha (por defecto solo local)
+
+    Returns:
+        ThreadingHTTPServer: Servidor iniciado
+    """
+    enable_metrics()
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    logger.info(f"📈 Métricas en http://{host}:{port}/metrics")
+    return server
+
+
+def write_metrics_file(path):
+    """Escribe las métricas en path de forma atómica (nunca se lee un fichero a medias)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(REGISTRY.exposition())
+    os.replace(tmp_path, path)
+    return path
+
+
+def start_metrics_file_writer(path, interval=METRICS_INTERVAL):
+    """
+    Vuelca las métricas en un fichero cada interval segundos en una hebra de fondo
+
+    Activa la recogida de métricas si no lo estaba.
+
+    Returns:
+        threading.Event: Al activarlo se detiene la escritura (tras un último volcado)
+    """
+    enable_metrics()
+    stop = threading.Event()
+
+    def write_loop():
+        while True:
+            stopped = stop.wait(interval)
+            try:
+                write_metrics_file(path)
+            except OSError as e:
+                logger.warning(f"⚠️ No se pudieron escribir las métricas en {path}: {e}")
+            if stopped:
+                return
+
+    threading.Thread(target=write_loop, name='metrics-file', daemon=True).start()
+    logger.info(f"📈 Métricas en {path} cada {interval:g}s")
+    return stop
+
+
+_mode = os.environ.get(METRICS_ENV, '').strip().lower()
+if _mode not in ('', '0', 'false', 'no', 'off') or METRICS_PORT or METRICS_FILE:
+    enable_metrics()
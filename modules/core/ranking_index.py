@@ -0,0 +1,206 @@
+"""
+Índice de rankings por país precalculado
+Guarda los órdenes (argsort) de cada indicador para que las consultas de
+posición, top-k y país mínimo/máximo sean búsquedas O(1)
+"""
+
+import numpy as np
+import pandas as pd
+
+# === INDICADORES AGREGADOS ===
+
+# Indicadores derivados que se calculan al cargar (suma de niveles con NaN = 0)
+RANKING_AGGREGATES = {
+    'Need_Work_Total': ['Applies_Totally_Value', 'Applies_Rather_Value', 'Applies_Partially_Value'],
+    'Related_Total': ['Very_Closely_Value', 'Closely_Value', 'Somewhat_Value'],
+    'Abandoning_High_Total': ['Very_Often_Value', 'Often_Value'],
+}
+
+RANKING_INDEX_ATTR = 'ranking_index'
+
+
+class CountryRankingIndex:
+    """
+    Rankings precalculados de un dataset por indicador
+
+    Para cada indicador se guarda el orden de los países (ascendente y
+    descendente, NaN al final) y la posición de cada país en el ranking; los
+    países empatados comparten posición.
+    """
+
+    def __init__(self, countries, indicators):
+        """
+        Args:
+            countries (list): Códigos de país en el orden de las filas
+            indicators (dict): Nombre del indicador -> valores por país
+        """
+        self.countries = np.asarray(countries, dtype=object)
+        self.countries.setflags(write=False)
+        self._row = {country: i for i, country in enumerate(self.countries)}
+        self._values = {}
+        self._order = {}
+        self._position = {}
+
+        for name, values in indicators.items():
+            values = np.asarray(values, dtype=float)
+            valid = int((~np.isnan(values)).sum())
+            # argsort estable deja los NaN al final en ambos sentidos
+            order_asc = np.argsort(values, kind='stable')[:valid]
+            order_desc = np.argsort(-values, kind='stable')[:valid]
+
+            # Ranking de competición (1, 2, 2, 4): los empatados comparten la
+            # mejor posición, 1 + países con un valor estrictamente mejor
+            sorted_values = values[order_asc]
+            position_asc = np.zeros(len(values), dtype=int)
+            position_desc = np.zeros(len(values), dtype=int)
+            position_asc[order_asc] = np.searchsorted(sorted_values, sorted_values, side='left') + 1
+            position_desc[order_asc] = valid - np.searchsorted(sorted_values, sorted_values, side='right') + 1
+
+            for array in (values, order_asc, order_desc, position_asc, position_desc):
+                array.setflags(write=False)
+
+            self._values[name] = values
+            self._order[name] = {True: order_asc, False: order_desc}
+            self._position[name] = {True: position_asc, False: position_desc}
+
+    def __deepcopy__(self, memo):
+        # El índice es inmutable: pandas lo copia en df.attrs sin coste
+        return self
+
+    def __contains__(self, indicator):
+        return indicator in self._values
+
+    def __repr__(self):
+        return f"CountryRankingIndex({len(self.countries)} países, {len(self._values)} indicadores)"
+
+    @property
+    def indicators(self):
+        """Lista de indicadores disponibles en el índice"""
+        return list(self._values)
+
+    def value(self, indicator, country):
+        """Valor del indicador para un país (None si no existe o es NaN)"""
+        row = self._row.get(country)
+        if row is None:
+            return None
+        value = self._values[indicator][row]
+        return None if np.isnan(value) else float(value)
+
+    def indicator_values(self, indicator):
+        """Valores del indicador en el orden de self.countries (solo lectura)"""
+        return self._values[indicator]
+
+    def position(self, indicator, country, ascending=False):
+        """
+        Posición (1 = primero) de un país en el ranking de un indicador
+
+        Los empates comparten la mejor posición (1, 2, 2, 4), como
+        1 + número de países con un valor estrictamente mejor.
+
+        Returns:
+            int: Posición del país, o None si no hay dato
+        """
+        row = self._row.get(country)
+        if row is None:
+            return None
+        position = int(self._position[indicator][ascending][row])
+        return position or None
+
+    def ranked_countries(self, indicator, ascending=False):
+        """Países ordenados por el indicador (sin los que tienen NaN)"""
+        return self.countries[self._order[indicator][ascending]].tolist()
+
+    def ranked_values(self, indicator, ascending=False):
+        """Valores del indicador en el mismo orden que ranked_countries"""
+        return self._values[indicator][self._order[indicator][ascending]].tolist()
+
+    def top_k(self, indicator, k, ascending=False, exclude=()):
+        """
+        Los k primeros países del ranking
+
+        Args:
+            indicator (str): Nombre del indicador
+            k (int): Número de países
+            ascending (bool): True para los valores más bajos primero
+            exclude (iterable): Códigos de país a omitir (ej: ('CH',))
+
+        Returns:
+            list: Lista de tuplas (país, valor)
+        """
+        values = self._values[indicator]
+        result = []
+        for row in self._order[indicator][ascending]:
+            if len(result) >= k:
+                break
+            country = self.countries[row]
+            if country not in exclude:
+                result.append((country, float(values[row])))
+        return result
+
+    def max_country(self, indicator, exclude=()):
+        """Tupla (país, valor) con el valor máximo, o (None, nan) si no hay ningún valor"""
+        top = self.top_k(indicator, 1, ascending=False, exclude=exclude)
+        return top[0] if top else (None, np.nan)
+
+    def min_country(self, indicator, exclude=()):
+        """Tupla (país, valor) con el valor mínimo, o (None, nan) si no hay ningún valor"""
+        top = self.top_k(indicator, 1, ascending=True, exclude=exclude)
+        return top[0] if top else (None, np.nan)
+
+
+# === CONSTRUCCIÓN Y ACCESO ===
+
+def build_country_ranking_index(data_df, country_col='Country', value_cols=None):
+    """
+    Construye el índice de rankings de un DataFrame con una fila por país
+
+    Args:
+        data_df (pd.DataFrame): Dataset ya procesado
+        country_col (str): Columna con los códigos de país
+        value_cols (list): Columnas a indexar; por defecto todas las '*_Value'
+            más los agregados de RANKING_AGGREGATES disponibles
+
+    Returns:
+        CountryRankingIndex: Índice de rankings
+    """
+    if value_cols is None:
+        value_cols = [col for col in data_df.columns if str(col).endswith('_Value')]
+
+    indicators = {}
+    for col in value_cols:
+        indicators[col] = pd.to_numeric(data_df[col], errors='coerce').to_numpy(dtype=float)
+
+    for name, columns in RANKING_AGGREGATES.items():
+        if name not in indicators and all(col in data_df.columns for col in columns):
+            indicators[name] = sum(
+                pd.to_numeric(data_df[col], errors='coerce').fillna(0).to_numpy(dtype=float)
+                for col in columns
+            )
+
+    return CountryRankingIndex(data_df[country_col].tolist(), indicators)
+
+
+def attach_ranking_index(data_df, country_col='Country', value_cols=None):
+    """
+    Calcula el índice de rankings y lo guarda en data_df.attrs
+
+    Returns:
+        pd.DataFrame: El mismo DataFrame, con el índice adjunto
+    """
+    data_df.attrs[RANKING_INDEX_ATTR] = build_country_ranking_index(data_df, country_col, value_cols)
+    return data_df
+
+
+def get_ranking_index(data_df, country_col='Country', value_cols=None):
+    """
+    Devuelve el índice de rankings guardado con el dataset
+
+    Si el DataFrame no lo tiene, o es un subconjunto de otro (pandas copia
+    attrs al filtrar), se construye de nuevo y se guarda.
+    """
+    index = data_df.attrs.get(RANKING_INDEX_ATTR)
+    if index is None or len(index.countries) != len(data_df) or \
+            not np.array_equal(index.countries, data_df[country_col].to_numpy(dtype=object)):
+        attach_ranking_index(data_df, country_col, value_cols)
+        index = data_df.attrs[RANKING_INDEX_ATTR]
+    return index
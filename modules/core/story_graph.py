@@ -0,0 +1,291 @@
+"""
+Ejecutor del grafo de dependencias del storytelling
+Cada nodo (dataset, tabla derivada o figura) declara sus dependencias y los
+ficheros de los que lee; el ejecutor resuelve el orden, ejecuta en paralelo
+los nodos independientes, calcula cada nodo una sola vez y lo memoiza por la
+huella de sus entradas, midiendo el tiempo de cada uno.
+"""
+
+import contextvars
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from .data_cache import data_fingerprint
+from .metrics import record_cache, record_eviction
+from .tracing import span
+
+NODE_KINDS = ('dataset', 'transform', 'figure')
+
+
+class StoryNode:
+    """
+    Nodo del grafo
+
+    Args:
+        name (str): Identificador único
+        func (callable): Función que recibe los valores de deps en orden
+        deps (tuple): Nombres de los nodos de los que depende
+        inputs (tuple): Ficheros que lee directamente (entran en su huella)
+        kind (str): 'dataset', 'transform' o 'figure'
+        section (str): Capítulo con el que se construye (slug); None para las
+            figuras que solo se construyen al pedirlas (ej: pestañas secundarias)
+        country (str): País foco para el que se construye (ISO-2); None si el
+            nodo no depende del país
+    """
+
+    def __init__(self, name, func, deps=(), inputs=(), kind='figure', section=None, country=None):
+        if kind not in NODE_KINDS:
+            raise ValueError(f"Tipo de nodo no soportado: {kind}")
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.inputs = tuple(inputs)
+        self.kind = kind
+        self.section = section
+        self.country = country
+
+    def __repr__(self):
+        return f"StoryNode({self.name!r}, kind={self.kind!r}, deps={self.deps})"
+
+
+class UpstreamError(Exception):
+    """Un nodo no se ha ejecutado porque falló una de sus dependencias"""
+
+    def __init__(self, node, upstream, error):
+        super().__init__(f"{node}: falló la dependencia {upstream}: {error}")
+        self.upstream = upstream
+        self.error = error
+
+
+class StoryGraph:
+    """
+    Grafo de nodos con ejecución paralela y memoización por huella
+
+    Los resultados se conservan entre ejecuciones: al volver a ejecutar solo
+    se recalculan los nodos cuya huella (ficheros de entrada y huellas de sus
+    dependencias) ha cambiado. Varias hebras pueden ejecutar el grafo a la
+    vez (ej: una precarga y un rerun): un nodo que otra ejecución ya está
+    calculando con la misma huella no se vuelve a lanzar, se espera su resultado.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"Nodo duplicado: {node.name}")
+            self.nodes[node.name] = node
+        for node in self.nodes.values():
+            missing = [dep for dep in node.deps if dep not in self.nodes]
+            if missing:
+                raise ValueError(f"{node.name} depende de nodos inexistentes: {missing}")
+        self._order = self._topological_order()
+
+        # Memoización de los nodos correctos: nombre -> (huella, valor)
+        self._memo = {}
+        # Nodos en cálculo en alguna ejecución: nombre -> (huella, Future con (valor, falló))
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+        # Última ejecución de cada hebra (varias hebras pueden ejecutar el grafo a la vez)
+        self._last_run = threading.local()
+
+    def _topological_order(self):
+        """Orden de Kahn; falla si hay ciclos"""
+        pending = {name: len(node.deps) for name, node in self.nodes.items()}
+        dependents = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for dep in node.deps:
+                dependents[dep].append(node.name)
+
+        ready = [name for name, count in pending.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.nodes):
+            cyclic = sorted(name for name, count in pending.items() if count > 0)
+            raise ValueError(f"El grafo tiene ciclos entre: {cyclic}")
+        return order
+
+    def upstream(self, targets):
+        """Nodos necesarios para calcular targets, en orden topológico"""
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in needed:
+                continue
+            if name not in self.nodes:
+                raise KeyError(f"Nodo desconocido: {name}")
+            needed.add(name)
+            stack.extend(self.nodes[name].deps)
+        return [name for name in self._order if name in needed]
+
+    def section_nodes(self, section, country=None):
+        """Figuras de un capítulo (de las que dependen del país, solo las de country)"""
+        return [
+            name for name in self._order
+            if self.nodes[name].section == section and self.nodes[name].country in (None, country)
+        ]
+
+    def country_nodes(self, country):
+        """Nodos que se construyen para un país foco"""
+        return [name for name in self._order if self.nodes[name].country == country]
+
+    def _fingerprint(self, node, fingerprints):
+        digest = hashlib.sha1(node.name.encode())
+        if node.inputs:
+            digest.update(data_fingerprint(node.inputs).encode())
+        for dep in node.deps:
+            digest.update(fingerprints[dep].encode())
+        return digest.hexdigest()
+
+    def _execute(self, node, args):
+        with span(node.name, node.kind, section=node.section, country=node.country) as node_span:
+            start = time.perf_counter()
+            try:
+                return node.func(*args), False, time.perf_counter() - start
+            except Exception as e:
+                node_span.annotate(error=type(e).__name__)
+                return e, True, time.perf_counter() - start
+
+    def run(self, targets=None, max_workers=4, post=None, cancel=None):
+        """
+        Ejecuta los nodos necesarios para targets (todos por defecto)
+
+        Args:
+            targets (iterable): Nodos a calcular
+            max_workers (int): Hebras para los nodos independientes
+            post (callable): Transformación aplicada a cada resultado antes de
+                memoizarlo y pasarlo a sus dependientes (ej: congelarlo)
+            cancel (threading.Event): Si se activa no se lanzan más nodos; los
+                que ya están en ejecución terminan y se memoizan
+
+        Returns:
+            tuple: (resultados, errores) como diccionarios nombre -> valor/excepción.
+                Los nodos cancelados no aparecen en ninguno de los dos.
+        """
+        names = self.upstream(targets) if targets is not None else list(self._order)
+        fingerprints = {}
+        results = {}
+        errors = {}
+        timings = {}
+        remaining = {name: set(self.nodes[name].deps) for name in names}
+        # Nodos lanzados por esta ejecución (Future del pool -> nombre), su
+        # Future compartido con otras ejecuciones, y nodos lanzados por otras
+        running = {}
+        owned = {}
+        waiting = {}
+
+        def finish(name, value, failed, seconds, cached):
+            if failed:
+                errors[name] = value
+            else:
+                results[name] = value
+            timings[name] = {'seconds': seconds, 'cached': cached, 'error': failed}
+            for other in remaining.values():
+                other.discard(name)
+
+        def publish(name, value, failed):
+            shared = owned.pop(name)
+            with self._lock:
+                if self._inflight.get(name, (None, None))[1] is shared:
+                    del self._inflight[name]
+            shared.set_result((value, failed))
+
+        graph_span = span('story_graph.run', 'graph', nodes=len(names))
+        with graph_span, ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='story-node') as pool:
+            try:
+                while remaining or running or waiting:
+                    if cancel is not None and cancel.is_set():
+                        remaining.clear()
+
+                    for name in [n for n, deps in remaining.items() if not deps]:
+                        del remaining[name]
+                        node = self.nodes[name]
+                        fingerprints[name] = self._fingerprint(node, fingerprints)
+
+                        failed_dep = next((dep for dep in node.deps if dep in errors), None)
+                        if failed_dep is not None:
+                            finish(name, UpstreamError(name, failed_dep, errors[failed_dep]), True, 0.0, False)
+                            continue
+
+                        # Memoizado, en cálculo en otra ejecución o por lanzar: se
+                        # decide con el cerrojo tomado para no lanzarlo dos veces
+                        with self._lock:
+                            memo = self._memo.get(name)
+                            hit = memo is not None and memo[0] == fingerprints[name]
+                            inflight = None if hit else self._inflight.get(name)
+                            if not hit and (inflight is None or inflight[0] != fingerprints[name]):
+                                inflight = None
+                                owned[name] = Future()
+                                self._inflight[name] = (fingerprints[name], owned[name])
+                        if hit:
+                            record_cache('graph', True)
+                            finish(name, memo[1], False, 0.0, True)
+                            continue
+                        if inflight is not None:
+                            record_cache('graph', True)
+                            waiting[inflight[1]] = name
+                            continue
+                        record_cache('graph', False)
+
+                        args = [results[dep] for dep in node.deps]
+                        # Cada nodo hereda el contexto de la ejecución para anidar sus spans bajo ella
+                        context = contextvars.copy_context()
+                        running[pool.submit(context.run, self._execute, node, args)] = name
+
+                    if not running and not waiting:
+                        continue
+
+                    done, _ = wait([*running, *waiting], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in waiting:
+                            # Calculado por otra ejecución (ya memoizado si fue correcto)
+                            name = waiting.pop(future)
+                            value, failed = future.result()
+                            finish(name, value, failed, 0.0, not failed)
+                            continue
+
+                        name = running.pop(future)
+                        value, failed, seconds = future.result()
+                        if not failed:
+                            # Los errores no se memoizan: se reintentan en la siguiente ejecución
+                            if post is not None:
+                                value = post(value)
+                            with self._lock:
+                                if name in self._memo:
+                                    # Cambiaron los datos de entrada: se descarta la versión anterior
+                                    record_eviction('graph')
+                                self._memo[name] = (fingerprints[name], value)
+                        publish(name, value, failed)
+                        finish(name, value, failed, seconds, False)
+            finally:
+                # Ejecución interrumpida (ej: el proceso termina y el pool ya no
+                # acepta nodos, o falla post): quien espere un nodo de esta
+                # ejecución recibe un error en lugar de esperar para siempre
+                for name in list(owned):
+                    publish(name, RuntimeError(f"{name}: la ejecución del grafo se interrumpió"), True)
+
+        self._last_run.timings = timings
+        return results, errors
+
+    @property
+    def timings(self):
+        """Última ejecución de esta hebra: nombre -> {'seconds', 'cached', 'error'}"""
+        return getattr(self._last_run, 'timings', {})
+
+    def report(self):
+        """Tabla de tiempos de la última ejecución, de más lento a más rápido"""
+        lines = [f"{'Nodo':<38} {'Tipo':<10} {'Tiempo (s)':>10}  Estado"]
+        for name, timing in sorted(self.timings.items(), key=lambda item: -item[1]['seconds']):
+            status = 'error' if timing['error'] else ('memoizado' if timing['cached'] else 'calculado')
+            lines.append(f"{name:<38} {self.nodes[name].kind:<10} {timing['seconds']:>10.3f}  {status}")
+        return '\n'.join(lines)
@@ -0,0 +1,431 @@
+"""
+Trazas por spans de los loaders, los builders de figuras y los capítulos
+Cada span mide tiempo de reloj, tiempo de CPU de su hebra y memoria neta
+asignada (con tracemalloc) y se anida bajo el span abierto en su contexto.
+tracemalloc cuenta la memoria de todo el proceso: la de un span solo se
+atribuye si mientras duraba no hubo abierto ningún otro span que no sea su
+antecesor o descendiente (los nodos del grafo en paralelo o los reruns de
+otras sesiones la mezclarían).
+Los spans terminados se exportan como JSON de trace events de Chrome
+(chrome://tracing, Perfetto) o como resumen por rerun.
+
+Se activa con STORYTELLING_TRACE=1 (o 'time' para no medir memoria, que
+ralentiza la ejecución) o con enable_tracing(). Desactivado (y sin métricas),
+cada función instrumentada solo añade la comprobación de dos booleanos.
+"""
+
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+from .metrics import metrics_enabled, record_call
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV = 'STORYTELLING_TRACE'
+
+# Directorio donde se exporta la traza de Chrome de cada rerun (opcional)
+TRACE_DIR = os.environ.get('STORYTELLING_TRACE_DIR')
+
+# Spans terminados que se conservan (los más antiguos se descartan)
+MAX_SPANS = int(os.environ.get('STORYTELLING_TRACE_MAX_SPANS', '100000'))
+
+# Prefijo del nombre de función -> categoría del span
+LOADER_PREFIXES = ('read_', 'load_')
+BUILDER_PREFIXES = ('create_', 'get_', 'generate_')
+
+_ENABLED = False
+_MEMORY = False
+_STARTED_TRACEMALLOC = False
+
+_CURRENT = contextvars.ContextVar('storytelling_span', default=None)
+_SPANS = deque(maxlen=MAX_SPANS)
+_IDS = itertools.count(1)
+_EPOCH_NS = time.perf_counter_ns()
+
+# Spans abiertos que miden memoria (id -> span), para detectar los que se solapan
+_OPEN = {}
+_OPEN_LOCK = threading.Lock()
+
+
+class Span:
+    """
+    Intervalo medido de la ejecución
+
+    Args:
+        name (str): Nombre (ej: 'impact_charts.create_financial_abandoning_chart')
+        category (str): 'loader', 'builder', 'section', 'dataset', 'figure', ...
+        args (dict): Atributos adicionales que se exportan con el span
+    """
+
+    __slots__ = (
+        'id', 'name', 'category', 'args', 'parent', 'root', 'depth', 'thread', 'thread_name',
+        'start_ns', 'end_ns', 'cpu_ns', 'alloc_bytes', 'concurrent', 'error',
+        '_token', '_cpu_start', '_mem_start', '_ancestors',
+    )
+
+    def __init__(self, name, category, args=None):
+        self.id = next(_IDS)
+        self.name = name
+        self.category = category
+        self.args = dict(args or {})
+        self.end_ns = None
+        self.cpu_ns = 0
+        self.alloc_bytes = None
+        # True si otra hebra tuvo spans abiertos a la vez: la memoria no es atribuible
+        self.concurrent = False
+        self.error = None
+
+    def annotate(self, **args):
+        """Añade atributos al span (ej: el capítulo del rerun, conocido después de abrirlo)"""
+        self.args.update(args)
+        return self
+
+    def __enter__(self):
+        parent = _CURRENT.get()
+        self.parent = parent.id if parent is not None else None
+        self.root = parent.root if parent is not None else self.id
+        self.depth = parent.depth + 1 if parent is not None else 0
+        thread = threading.current_thread()
+        self.thread = thread.ident
+        self.thread_name = thread.name
+        self._token = _CURRENT.set(self)
+        self._mem_start = None
+        if _MEMORY:
+            self._ancestors = (parent._ancestors | {parent.id}) if parent is not None else frozenset()
+            with _OPEN_LOCK:
+                # Un span abierto que no es antecesor de este se ejecuta en paralelo con él
+                for other in _OPEN.values():
+                    if other.id not in self._ancestors:
+                        other.concurrent = self.concurrent = True
+                _OPEN[self.id] = self
+            self._mem_start = tracemalloc.get_traced_memory()[0]
+        self._cpu_start = time.thread_time_ns()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        self.cpu_ns = time.thread_time_ns() - self._cpu_start
+        if self._mem_start is not None:
+            traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+            with _OPEN_LOCK:
+                _OPEN.pop(self.id, None)
+            if traced is not None and not self.concurrent:
+                self.alloc_bytes = traced - self._mem_start
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        _CURRENT.reset(self._token)
+        _SPANS.append(self)
+        return False
+
+    @property
+    def wall_ms(self):
+        return (self.end_ns - self.start_ns) / 1e6 if self.end_ns is not None else None
+
+    @property
+    def cpu_ms(self):
+        return self.cpu_ns / 1e6
+
+    def __repr__(self):
+        return f"Span({self.name!r}, category={self.category!r}, wall_ms={self.wall_ms})"
+
+
+class _NoopSpan:
+    """Span que no mide nada (trazas desactivadas)"""
+
+    __slots__ = ()
+
+    def annotate(self, **args):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def enable_tracing(memory=True):
+    """
+    Activa las trazas en todo el proceso
+
+    Args:
+        memory (bool): Medir la memoria asignada en cada span (arranca
+            tracemalloc si no estaba en marcha)
+    """
+    global _ENABLED, _MEMORY, _STARTED_TRACEMALLOC
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _STARTED_TRACEMALLOC = True
+    _MEMORY = memory and tracemalloc.is_tracing()
+    _ENABLED = True
+
+
+def disable_tracing():
+    """Desactiva las trazas (conserva los spans ya terminados)"""
+    global _ENABLED, _MEMORY, _STARTED_TRACEMALLOC
+    _ENABLED = False
+    _MEMORY = False
+    if _STARTED_TRACEMALLOC:
+        tracemalloc.stop()
+        _STARTED_TRACEMALLOC = False
+
+
+def tracing_enabled():
+    """Indica si las trazas están activas"""
+    return _ENABLED
+
+
+def span(name, category='app', **args):
+    """
+    Context manager que mide un bloque como span
+
+    Ejemplo:
+        with span('impacto', 'section'):
+            page.run()
+    """
+    if not _ENABLED:
+        return _NOOP
+    return Span(name, category, args)
+
+
+def current_span():
+    """Span abierto en el contexto actual (None si no hay)"""
+    return _CURRENT.get()
+
+
+def traced(func=None, *, name=None, category='builder'):
+    """
+    Decorador que mide cada llamada a una función como span
+
+    Se puede usar como @traced o @traced(category='loader'). Con las
+    métricas activas (modules/core/metrics.py) la duración de cada llamada se
+    registra además en el histograma de loaders o de builders.
+    """
+    if func is None:
+        return functools.partial(traced, name=name, category=category)
+
+    label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _ENABLED and not metrics_enabled():
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        failed = True
+        try:
+            if _ENABLED:
+                with Span(label, category):
+                    result = func(*args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            if metrics_enabled():
+                record_call(category, label, (*args, *kwargs.values()), time.perf_counter() - start, failed)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def _span_category(name):
+    if name.startswith(LOADER_PREFIXES):
+        return 'loader'
+    if name.startswith(BUILDER_PREFIXES):
+        return 'builder'
+    return None
+
+
+def trace_module(module_name):
+    """
+    Instrumenta los loaders y builders definidos en un módulo
+
+    Envuelve con traced las funciones del módulo (y los métodos de sus
+    clases) cuyo nombre empieza por un prefijo de LOADER_PREFIXES o
+    BUILDER_PREFIXES. Se llama al final del módulo, antes de que otros lo
+    importen, para que las llamadas entre módulos y dentro del propio módulo
+    pasen por el span.
+
+    Args:
+        module_name (str): __name__ del módulo
+    """
+    module = sys.modules[module_name]
+
+    def instrument(owner, attribute, func):
+        category = _span_category(attribute)
+        if category is not None and not getattr(func, '__traced__', False):
+            setattr(owner, attribute, traced(func, category=category))
+
+    for attribute, value in list(vars(module).items()):
+        if getattr(value, '__module__', None) != module_name:
+            continue
+        if isinstance(value, type):
+            for method_name, method in list(vars(value).items()):
+                if hasattr(method, '__code__'):
+                    instrument(value, method_name, method)
+        elif callable(value) and hasattr(value, '__code__'):
+            instrument(module, attribute, value)
+
+
+def finished_spans(root=None):
+    """
+    Spans terminados, en orden de finalización
+
+    Args:
+        root (int): Solo los del árbol de este span raíz (ej: un rerun)
+    """
+    spans = list(_SPANS)
+    if root is not None:
+        spans = [s for s in spans if s.root == root]
+    return spans
+
+
+def clear_spans():
+    """Descarta los spans terminados"""
+    _SPANS.clear()
+
+
+def chrome_trace(spans=None):
+    """
+    Spans en formato trace event de Chrome (eventos completos 'X')
+
+    Returns:
+        dict: {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+    """
+    spans = finished_spans() if spans is None else spans
+    pid = os.getpid()
+    events = []
+    for tid, thread_name in sorted({(s.thread, s.thread_name) for s in spans}):
+        events.append({
+            'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name},
+        })
+    for s in sorted(spans, key=lambda s: s.start_ns):
+        args = {**s.args, 'cpu_ms': round(s.cpu_ms, 3)}
+        if s.alloc_bytes is not None:
+            args['alloc_bytes'] = s.alloc_bytes
+        elif s.concurrent:
+            args['alloc_bytes'] = 'n/d (spans en paralelo)'
+        if s.error is not None:
+            args['error'] = s.error
+        events.append({
+            'name': s.name, 'cat': s.category, 'ph': 'X', 'pid': pid, 'tid': s.thread,
+            'ts': (s.start_ns - _EPOCH_NS) / 1e3, 'dur': (s.end_ns - s.start_ns) / 1e3,
+            'args': args,
+        })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def export_chrome_trace(path, spans=None):
+    """Escribe la traza de Chrome en path (se abre en chrome://tracing o ui.perfetto.dev)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(chrome_trace(spans), f)
+    return path
+
+
+def summarize(spans):
+    """
+    Agrega los spans por nombre
+
+    El tiempo propio descuenta el de los hijos que se ejecutan en la misma
+    hebra (los de otras hebras corren en paralelo y no se restan). La memoria
+    suma solo las llamadas sin otras hebras en paralelo; las demás se cuentan
+    en 'concurrent'.
+
+    Returns:
+        list: Filas {'name', 'category', 'calls', 'wall_ms', 'self_ms',
+            'cpu_ms', 'alloc_bytes', 'concurrent', 'errors'}, de más a menos
+            tiempo propio
+    """
+    by_id = {s.id: s for s in spans}
+    children_ns = {}
+    for s in spans:
+        parent = by_id.get(s.parent)
+        if parent is not None and parent.thread == s.thread:
+            children_ns[parent.id] = children_ns.get(parent.id, 0) + (s.end_ns - s.start_ns)
+
+    rows = {}
+    for s in spans:
+        row = rows.setdefault(s.name, {
+            'name': s.name, 'category': s.category, 'calls': 0, 'wall_ms': 0.0,
+            'self_ms': 0.0, 'cpu_ms': 0.0, 'alloc_bytes': None, 'concurrent': 0, 'errors': 0,
+        })
+        wall_ns = s.end_ns - s.start_ns
+        row['calls'] += 1
+        row['wall_ms'] += wall_ns / 1e6
+        row['self_ms'] += (wall_ns - children_ns.get(s.id, 0)) / 1e6
+        row['cpu_ms'] += s.cpu_ms
+        if s.alloc_bytes is not None:
+            row['alloc_bytes'] = (row['alloc_bytes'] or 0) + s.alloc_bytes
+        row['concurrent'] += s.concurrent
+        row['errors'] += s.error is not None
+    return sorted(rows.values(), key=lambda row: -row['self_ms'])
+
+
+def _format_memory(row):
+    """KiB de un span: 'n/d' si todas sus llamadas fueron en paralelo y '*' si solo se midieron algunas"""
+    if row['alloc_bytes'] is None:
+        return 'n/d' if row.get('concurrent') else '-'
+    return f"{row['alloc_bytes'] / 1024:.0f}" + ('*' if row.get('concurrent') else '')
+
+
+def format_summary(rows, limit=25):
+    """Tabla de texto con las filas de summarize"""
+    lines = [f"{'Span':<58} {'Tipo':<9} {'N':>4} {'Total ms':>9} {'Propio ms':>9} {'CPU ms':>8} {'Mem KiB':>9}"]
+    for row in rows[:limit]:
+        memory = f"{_format_memory(row):>9}"
+        lines.append(
+            f"{row['name'][:58]:<58} {row['category']:<9} {row['calls']:>4} {row['wall_ms']:>9.1f} "
+            f"{row['self_ms']:>9.1f} {row['cpu_ms']:>8.1f} {memory}"
+        )
+    if len(rows) > limit:
+        lines.append(f"... {len(rows) - limit} spans más")
+    if any(row.get('concurrent') for row in rows[:limit]):
+        lines.append("Mem KiB: n/d = con otros spans en paralelo (no atribuible); * = solo las llamadas sin paralelo")
+    return '\n'.join(lines)
+
+
+@contextmanager
+def trace_rerun(name='rerun', **args):
+    """
+    Span raíz de un rerun de la aplicación
+
+    Al cerrarse escribe en el log el resumen de los spans del rerun y, con
+    STORYTELLING_TRACE_DIR, exporta su traza de Chrome a ese directorio.
+    """
+    if not _ENABLED:
+        yield _NOOP
+        return
+
+    root = Span(name, 'rerun', args)
+    try:
+        with root:
+            yield root
+    finally:
+        spans = finished_spans(root.id)
+        label = root.args.get('page', name)
+        logger.info(f"🔍 Rerun {label}: {len(spans)} spans en {root.wall_ms:.0f} ms\n{format_summary(summarize(spans))}")
+        if TRACE_DIR:
+            path = export_chrome_trace(os.path.join(TRACE_DIR, f"rerun-{root.id:06d}-{label}.json"), spans)
+            logger.info(f"🔍 Traza exportada en {path}")
+
+
+_mode = os.environ.get(TRACE_ENV, '').strip().lower()
+if _mode not in ('', '0', 'false', 'no', 'off'):
+    enable_tracing(memory=_mode != 'time')
@@ -0,0 +1,6 @@
+"""
+Módulo ui: Maquetación compartida de la aplicación Streamlit
+- Estilos CSS globales
+- Navegación entre capítulos
+- Componentes de presentación (estadísticas, placeholders)
+"""
@@ -0,0 +1,118 @@
+"""
+Métricas de la aplicación para Prometheus
+Añade al registro de modules/core/metrics.py los indicadores que se leen del
+servidor en cada exposición (sesiones abiertas, memoria residente, entradas
+de la caché compartida por tipo y disponibilidad) y mide la duración de cada
+rerun por capítulo.
+
+Con STORYTELLING_METRICS_PORT se publican en http://127.0.0.1:PUERTO/metrics
+y con STORYTELLING_METRICS_FILE se vuelcan cada STORYTELLING_METRICS_INTERVAL
+segundos (15 por defecto) en ese fichero (start_metrics_exporter, una sola
+vez por proceso).
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from modules.core.metrics import (
+    METRICS_FILE,
+    METRICS_PORT,
+    REGISTRY,
+    metrics_enabled,
+    record_rerun,
+    start_metrics_file_writer,
+    start_metrics_server,
+)
+
+from .perf_panel import process_rss_bytes
+from .streamlit_compat import active_session_count
+from .warm_cache import get_graph, is_ready, shared_entries
+
+ACTIVE_SESSIONS = REGISTRY.gauge('storytelling_active_sessions', 'Sesiones abiertas en el servidor')
+RESIDENT_MEMORY = REGISTRY.gauge('storytelling_resident_memory_bytes', 'Memoria residente del proceso')
+SHARED_ENTRIES = REGISTRY.gauge(
+    'storytelling_shared_cache_entries', 'Entradas construidas en la caché compartida por tipo', ('kind',),
+)
+CACHE_READY = REGISTRY.gauge('storytelling_cache_ready', '1 cuando la caché del servidor está caliente')
+
+# Exportadores iniciados en el proceso (servidor HTTP, volcado a fichero)
+_EXPORTER = {}
+_EXPORTER_LOCK = threading.Lock()
+
+
+def active_sessions():
+    """Sesiones abiertas en el Runtime de Streamlit (0 fuera de `streamlit run`, None si no se pueden contar)"""
+    return active_session_count()
+
+
+def collect_app_metrics():
+    """Actualiza los indicadores del servidor (se llama antes de cada exposición)"""
+    sessions = active_sessions()
+    if sessions is not None:
+        ACTIVE_SESSIONS.set(sessions)
+    rss = process_rss_bytes()
+    if rss is not None:
+        RESIDENT_MEMORY.set(rss)
+    graph = get_graph()
+    counts = dict.fromkeys(('dataset', 'transform', 'figure'), 0)
+    for name in shared_entries():
+        node = graph.nodes.get(name)
+        if node is not None:
+            counts[node.kind] += 1
+    for kind, count in counts.items():
+        SHARED_ENTRIES.set(count, kind=kind)
+    CACHE_READY.set(1 if is_ready() else 0)
+
+
+REGISTRY.add_collector(collect_app_metrics)
+
+
+class RerunTiming:
+    """Duración de un rerun; el capítulo se conoce después de empezar"""
+
+    def __init__(self):
+        self.section = ''
+
+    def annotate(self, section):
+        self.section = section
+        return self
+
+
+@contextmanager
+def metrics_rerun():
+    """
+    Registra la duración del rerun ejecutado dentro en el histograma por capítulo
+
+    Yields:
+        RerunTiming: Se le indica el capítulo con annotate(section)
+    """
+    timing = RerunTiming()
+    if not metrics_enabled():
+        yield timing
+        return
+    start = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        record_rerun(timing.section, time.perf_counter() - start)
+
+
+def start_metrics_exporter():
+    """
+    Inicia la página /metrics (STORYTELLING_METRICS_PORT) y el volcado a
+    fichero (STORYTELLING_METRICS_FILE) configurados, una sola vez por proceso
+
+    Se puede llamar en cada rerun; las llamadas siguientes no hacen nada.
+    """
+    with _EXPORTER_LOCK:
+        if _EXPORTER:
+            return
+        _EXPORTER['started'] = True
+        if METRICS_PORT:
+            _EXPORTER['server'] = start_metrics_server(
+                int(METRICS_PORT), os.environ.get('STORYTELLING_METRICS_HOST', '127.0.0.1')
+            )
+        if METRICS_FILE:
+            _EXPORTER['file'] = start_metrics_file_writer(METRICS_FILE)
@@ -0,0 +1,686 @@
+"""
+Maquetación compartida por todos los capítulos del storytelling
+Estilos CSS globales, navegación entre capítulos, pie de página y
+componentes de presentación reutilizados por las páginas de chapters/
+"""
+
+import streamlit as st
+
+from modules.core.countries import DEFAULT_FOCUS_COUNTRY, FOCUS_COUNTRIES, country_label, country_name
+
+from .static_assets import inject_stylesheet, render_image, stylesheet_url
+
+# Capítulos en orden de lectura (slug = ruta de la página)
+CHAPTERS = [
+    {"slug": "contexto-europeo", "title": "Contexto europeo", "path": "chapters/contexto_europeo.py"},
+    {"slug": "perfil-estudiantes", "title": "Perfil de estudiantes", "path": "chapters/perfil_estudiantes.py"},
+    {"slug": "tipos-de-trabajo", "title": "Tipos de trabajo", "path": "chapters/tipos_de_trabajo.py"},
+    {"slug": "impacto", "title": "Impacto y consecuencias", "path": "chapters/impacto.py"},
+    {"slug": "conclusiones", "title": "Conclusiones", "path": "chapters/conclusiones.py"},
+]
+
+GLOBAL_CSS = """
+<style>
+    :root {
+        --primary-blue: #003DA5;        /* Azul Europa */
+        --secondary-blue: #1f77b4;      /* Azul claro datos */
+        --accent-blue: #3498db;         /* Azul accento */
+        --spain-red: #C41E3A;           /* Rojo España */
+        --success-green: #27AE60;       /* Verde éxito */
+        --warning-orange: #F39C12;      /* Naranja advertencia */
+        --danger-red: #E74C3C;          /* Rojo peligro */
+        --neutral-gray: #7F8C8D;        /* Gris neutral */
+        --light-gray: #ECF0F1;          /* Gris claro */
+        --text-dark: #2C3E50;           /* Texto oscuro */
+        --text-medium: #34495E;         /* Texto medio */
+        --bg-light: #F8F9FA;            /* Fondo claro */
+        --border-light: #DEE2E6;        /* Borde claro */
+
+    }
+    .stApp {
+        background-color: #ffffff !important;
+        color: var(--text-dark) !important;
+    }
+    
+    /* Forzar fondo blanco en el contenido principal */
+    .main .block-container {
+        background-color: #ffffff !important;
+        padding-top: 2rem !important;
+    }
+    
+
+    .stApp > div > div > div > div > button,
+    .stApp button[data-testid="collapsedControl"],
+    .stApp button[title="Show sidebar"],
+    .stApp button[title="Hide sidebar"],
+
+    [data-testid="collapsedControl"], 
+    [data-testid="collapsedControl"]:hover,
+    [data-testid="collapsedControl"]:active,
+    [data-testid="collapsedControl"]:focus,
+    button[title="Show sidebar"],
+    button[title="Show sidebar"]:hover,
+    button[title="Hide sidebar"],
+    button[title="Hide sidebar"]:hover {
+        background-color: #ffffff !important;
+        background: #ffffff !important;
+        color: #2C3E50 !important;
+        border: 2px solid #DEE2E6 !important;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.15) !important;
+        border-radius: 8px !important;
+    }
+    
+    .stApp button[data-testid="collapsedControl"] svg,
+    .stApp button[title="Show sidebar"] svg,
+    .stApp button[title="Hide sidebar"] svg,
+
+    [data-testid="collapsedControl"] svg,
+    [data-testid="collapsedControl"] svg path,
+    button[title="Show sidebar"] svg,
+    button[title="Show sidebar"] svg path,
+    button[title="Hide sidebar"] svg,
+    button[title="Hide sidebar"] svg path {
+        color: #2C3E50 !important;
+        fill: #2C3E50 !important;
+        stroke: #2C3E50 !important;
+    }
+    .stSidebar button,
+    .stSidebar button:hover,
+    .stSidebar button:hover {
+        background-color: #ffffff !important;
+        color: #2C3E50 !important;
+        border: 2px solid #DEE2E6 !important;
+    }
+    
+    p, li, span, div {
+        color: var(--text-dark) !important;
+        background-color: transparent !important;
+    }
+    
+    h1, h2, h3, h4, h5, h6 {
+        color: var(--text-dark) !important;
+        background-color: transparent !important;
+    }
+    
+    .stMarkdown {
+        background-color: transparent !important;
+    }
+    
+    .stMarkdown p, .stMarkdown li, .stMarkdown span, .stMarkdown div {
+        color: var(--text-dark) !important;
+        background-color: transparent !important;
+    }
+    .stat-spain { color: var(--spain-red) !important; }
+    .stat-europe { color: var(--primary-blue) !important; }
+    .stat-positive { color: var(--success-green) !important; }
+    .stat-negative { color: var(--danger-red) !important; }
+    .stat-warning { color: var(--warning-orange) !important; }
+    .stat-neutral { color: var(--neutral-gray) !important; }
+    .main-header {
+        font-size: 3.2rem;
+        color: var(--primary-blue);
+        text-align: center;
+        margin-bottom: 2.5rem;
+        font-weight: 700;
+        line-height: 1.2;
+        text-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    
+    .section-header {
+        color: var(--text-dark);
+        font-size: 2.2rem;
+        margin-top: 4rem;
+        margin-bottom: 1.5rem;
+        border-bottom: 4px solid var(--accent-blue);
+        padding-bottom: 0.8rem;
+        font-weight: 600;
+        position: relative;
+    }
+    
+    .section-header::before {
+        content: '';
+        position: absolute;
+        bottom: -4px;
+        left: 0;
+        width: 60px;
+        height: 4px;
+        background: var(--primary-blue);
+    }
+    
+    .subsection-header {
+        color: var(--text-medium);
+        font-size: 1.6rem;
+        margin-top: 2.5rem;
+        margin-bottom: 1.2rem;
+        font-weight: 500;
+        border-left: 4px solid var(--accent-blue);
+        padding-left: 1rem;
+    }
+    
+
+    
+         .insight-box {
+         background: linear-gradient(135deg, #E3F2FD 0%, #F0F8FF 100%) !important;
+         padding: 2rem;
+         border-radius: 15px;
+         border: 1px solid var(--border-light);
+         border-top: 4px solid var(--secondary-blue);
+         margin: 2rem 0;
+         box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+     }
+    
+         .insight-box h4 {
+         color: var(--primary-blue) !important;
+         margin-bottom: 1rem;
+         font-weight: 600;
+     }
+     
+     .insight-box p, .insight-box li {
+         color: var(--text-dark) !important;
+     }
+     
+     .conclusion-box {
+         background: linear-gradient(135deg, #E8F5E8 0%, #F0FFF0 100%) !important;
+         padding: 2rem;
+         border-radius: 15px;
+         border-left: 6px solid var(--success-green);
+         margin: 2rem 0;
+         box-shadow: 0 4px 8px rgba(0,0,0,0.08);
+     }
+     
+     .conclusion-box h4 {
+         color: var(--success-green) !important;
+         margin-bottom: 1rem;
+         font-weight: 600;
+     }
+     
+     .conclusion-box p, .conclusion-box li {
+         color: var(--text-dark) !important;
+     }
+    
+         .warning-box {
+         background: linear-gradient(135deg, #FDF2E9 0%, #FEF9E7 100%) !important;
+         padding: 2rem;
+         border-radius: 15px;
+         border-left: 6px solid var(--warning-orange);
+         margin: 2rem 0;
+         box-shadow: 0 4px 8px rgba(0,0,0,0.08);
+     }
+    
+         .warning-box h4 {
+         color: var(--warning-orange) !important;
+         margin-bottom: 1rem;
+         font-weight: 600;
+     }
+     
+     .warning-box p, .warning-box li {
+         color: var(--text-dark) !important;
+     }
+     
+     .danger-box {
+         background: linear-gradient(135deg, #FDEDEC 0%, #FBEEE6 100%) !important;
+         padding: 2rem;
+         border-radius: 15px;
+         border-left: 6px solid var(--danger-red);
+         margin: 2rem 0;
+         box-shadow: 0 4px 8px rgba(0,0,0,0.08);
+     }
+     
+     .danger-box h4 {
+         color: var(--danger-red) !important;
+         margin-bottom: 1rem;
+         font-weight: 600;
+     }
+     
+     .danger-box p, .danger-box li {
+         color: var(--text-dark) !important;
+     }
+     
+     .spain-box {
+         background: linear-gradient(135deg, #F8E6EA 0%, #FDEEF0 100%) !important;
+         padding: 2rem;
+         border-radius: 15px;
+         border-left: 6px solid var(--spain-red);
+         margin: 2rem 0;
+         box-shadow: 0 4px 8px rgba(0,0,0,0.08);
+     }
+     
+     .spain-box h4 {
+         color: var(--spain-red) !important;
+         margin-bottom: 1rem;
+         font-weight: 600;
+     }
+     
+     .spain-box p, .spain-box li {
+         color: var(--text-dark) !important;
+     }
+    
+        .section-divider {
+        height: 4px;
+        background: linear-gradient(90deg, var(--accent-blue), var(--success-green), var(--primary-blue));
+        margin: 5rem 0 3rem 0;
+        border-radius: 2px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    
+
+    
+         .stat-item {
+         text-align: center;
+         padding: 1.5rem;
+         background: white !important;
+         border-radius: 10px;
+         box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+         min-width: 150px;
+         flex: 1;
+         display: flex !important;
+         flex-direction: column;
+         justify-content: center;
+         margin: 0.5rem;
+     }
+     
+     .stat-number {
+         font-size: 2.5rem;
+         font-weight: 700;
+         margin-bottom: 0.5rem;
+     }
+
+     .stat-title {
+         font-size: 1.2rem;
+         font-weight: 700;
+         margin-bottom: 0.5rem;
+     }
+     
+     .stat-label {
+         font-size: 0.9rem;
+         color: var(--text-medium) !important;
+         font-weight: 500;
+     }
+    
+
+
+    
+    .chart-placeholder {
+         border: 2px dashed var(--border-light);
+         padding: 3rem 2rem;
+         text-align: center;
+         margin: 2rem 0;
+         border-radius: 15px;
+         background: linear-gradient(135deg, #FAFAFA 0%, #F5F5F5 100%) !important;
+         transition: all 0.3s ease;
+     }
+    
+         .chart-placeholder:hover {
+         border-color: var(--accent-blue);
+         background: linear-gradient(135deg, #F0F8FF 0%, #E6F3FF 100%) !important;
+     }
+     
+
+
+    
+         .chart-placeholder h4 {
+         color: var(--primary-blue) !important;
+         margin-bottom: 1rem;
+     }
+     
+     .chart-placeholder p {
+         color: var(--neutral-gray) !important;
+         margin: 0.5rem 0;
+     }
+    
+
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px !important;
+        background: transparent !important;
+        padding: 0.5rem 0 !important;
+        border-bottom: 3px solid var(--border-light) !important;
+        margin-bottom: 1.5rem !important;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background: linear-gradient(135deg, #F8F9FA 0%, #FFFFFF 100%) !important;
+        border: 2px solid var(--border-light) !important;
+        border-radius: 12px !important;
+        padding: 0.8rem 1.5rem !important;
+        color: var(--text-dark) !important;
+        font-weight: 600 !important;
+        font-size: 0.95rem !important;
+        transition: all 0.3s ease !important;
+        cursor: pointer !important;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.08) !important;
+        margin: 0 0.3rem !important;
+        text-align: center !important;
+        min-width: auto !important;
+        white-space: nowrap !important;
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover {
+        background: linear-gradient(135deg, var(--accent-blue) 0%, var(--secondary-blue) 100%) !important;
+        color: white !important;
+        border-color: var(--accent-blue) !important;
+        transform: translateY(-2px) !important;
+        box-shadow: 0 4px 12px rgba(52, 152, 219, 0.3) !important;
+    }
+    
+    .stTabs [data-baseweb="tab"][aria-selected="true"] {
+        background: linear-gradient(135deg, var(--primary-blue) 0%, var(--secondary-blue) 100%) !important;
+        color: white !important;
+        border-color: var(--primary-blue) !important;
+        box-shadow: 0 4px 16px rgba(0, 61, 165, 0.4) !important;
+        transform: translateY(-1px) !important;
+    }
+    
+    .stTabs [data-baseweb="tab"] p,
+    .stTabs [data-baseweb="tab"] span,
+    .stTabs [data-baseweb="tab"] div {
+        color: inherit !important;
+        font-weight: inherit !important;
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    
+    .stTabs [data-baseweb="tab-panel"] {
+        padding: 1.5rem 0 !important;
+        background: transparent !important;
+    }
+
+    
+
+    @media (max-width: 768px) {
+        .main-header {
+            font-size: 2.2rem;
+        }
+        
+        .section-header {
+            font-size: 1.8rem;
+        }
+        
+        .subsection-header {
+            font-size: 1.4rem;
+        }
+        
+        .insight-box, .conclusion-box {
+            padding: 1.5rem;
+        }
+        
+        .stTabs [data-baseweb="tab-list"] {
+            flex-wrap: wrap !important;
+            justify-content: center !important;
+        }
+        
+        .stTabs [data-baseweb="tab"] {
+            font-size: 0.85rem !important;
+            padding: 0.6rem 1rem !important;
+            margin: 0.2rem !important;
+        }
+    }
+</style>
+"""
+
+# Estilos del menú lateral
+SIDEBAR_CSS = """
+    <style>
+    .sidebar-nav {
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin-bottom: 1rem;
+    }
+    .sidebar-nav h3 {
+        color: white !important;
+        margin-bottom: 1rem;
+        text-align: center;
+        font-size: 1.1rem;
+    }
+    .sidebar-nav-item {
+        color: white !important;
+        text-decoration: none;
+        display: block;
+        padding: 0.5rem 0;
+        border-bottom: 1px solid rgba(255,255,255,0.2);
+        transition: all 0.2s ease;
+    }
+    .sidebar-nav-item:hover {
+        color: #FDD835 !important;
+        background: rgba(255,255,255,0.1);
+        padding-left: 0.5rem;
+        border-radius: 5px;
+        text-decoration: none;
+    }
+    .sidebar-nav-item:last-child {
+        border-bottom: none;
+    }
+
+    </style>
+    """
+
+
+def apply_global_styles():
+    """
+    Inyecta los estilos globales
+
+    Con los recursos compilados (build_assets.py) se enlaza la hoja de estilos
+    estática una vez por sesión; sin ellos, o si la hoja compilada no
+    corresponde al CSS actual, se envía el CSS en línea en cada ejecución del
+    script.
+    """
+    url = stylesheet_url(GLOBAL_CSS + SIDEBAR_CSS)
+    if url is not None:
+        inject_stylesheet(url)
+        return
+    st.markdown(GLOBAL_CSS, unsafe_allow_html=True)
+    st.sidebar.markdown(SIDEBAR_CSS, unsafe_allow_html=True)
+
+
+def build_pages():
+    """Páginas de Streamlit de todos los capítulos (la primera es la portada)"""
+    return [
+        st.Page(chapter["path"], title=chapter["title"], url_path=chapter["slug"], default=(i == 0))
+        for i, chapter in enumerate(CHAPTERS)
+    ]
+
+
+def _chapter_index(slug):
+    for i, chapter in enumerate(CHAPTERS):
+        if chapter["slug"] == slug:
+            return i
+    return 0
+
+
+def chapter_slug(url_path):
+    """Slug del capítulo de una página (la portada tiene url_path vacío)"""
+    return CHAPTERS[_chapter_index(url_path)]["slug"]
+
+
+def next_chapter_slug(slug):
+    """Slug del capítulo siguiente en orden de lectura (None en el último)"""
+    index = _chapter_index(slug)
+    if index < len(CHAPTERS) - 1:
+        return CHAPTERS[index + 1]["slug"]
+    return None
+
+
+def render_sidebar_nav():
+    """Menú lateral con un enlace por capítulo"""
+    st.sidebar.markdown(
+        """
+    <div class="sidebar-nav">
+        <h3>Navegación rápida</h3>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+    for chapter in CHAPTERS:
+        st.sidebar.page_link(chapter["path"], label=chapter["title"])
+
+
+def render_country_selector():
+    """
+    Selector del país foco en el menú lateral
+
+    El valor se guarda en la URL (?focus_country=XX) para poder compartir la
+    historia de un país y se conserva al cambiar de capítulo.
+
+    Returns:
+        str: Código ISO-2 del país elegido
+    """
+    return st.sidebar.selectbox(
+        "País foco",
+        FOCUS_COUNTRIES,
+        index=FOCUS_COUNTRIES.index(DEFAULT_FOCUS_COUNTRY),
+        format_func=country_label,
+        key="focus_country",
+        bind="query-params",
+        persist_state="session",
+        help="Las figuras destacan este país frente al promedio europeo",
+    )
+
+
+def focus_country():
+    """País foco de la sesión (el de por defecto si aún no se ha elegido)"""
+    return st.session_state.get("focus_country", DEFAULT_FOCUS_COUNTRY)
+
+
+def render_focus_country_note(country):
+    """Aviso de que los textos y los datos solo de España no cambian con el país foco"""
+    if country == DEFAULT_FOCUS_COUNTRY:
+        return
+    st.info(
+        f"Las figuras comparativas destacan a **{country_name(country)}**. Los comentarios "
+        f"del texto, las trayectorias académicas, la percepción académica y el isotipo por "
+        f"edad se basan en los datos de {country_name(DEFAULT_FOCUS_COUNTRY)}.",
+        icon="🌍",
+    )
+
+
+def render_chapter_navigation(slug):
+    """Enlaces al capítulo anterior y siguiente"""
+    index = _chapter_index(slug)
+
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    prev_col, _, next_col = st.columns([2, 1, 2])
+
+    if index > 0:
+        previous = CHAPTERS[index - 1]
+        with prev_col:
+            st.page_link(previous["path"], label=f"← {previous['title']}")
+
+    if index < len(CHAPTERS) - 1:
+        following = CHAPTERS[index + 1]
+        with next_col:
+            st.page_link(following["path"], label=f"{following['title']} →")
+
+
+def render_footer():
+    """Pie de página con créditos, fuente de datos y logos"""
+    st.markdown(
+        """
+<div style="
+    text-align: center; 
+    color: var(--neutral-gray); 
+    padding: 1rem 2rem;
+">
+    <h4 style="color: var(--primary-blue); margin-bottom: 1rem;">
+        "Trabajar y estudiar en Europa: ¿Oportunidad, sacrificio o desigualdad?"
+    </h4>
+    <div style="display: flex; justify-content: center; gap: 2rem; flex-wrap: wrap; margin: 1rem 0;">
+        <div style="text-align: center;">
+            <div style="font-size: 1.5rem; font-weight: 600; color: var(--europe-blue);">25</div>
+            <div style="font-size: 0.8rem;">Países europeos</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 1.5rem; font-weight: 600; color: var(--spain-red);">9,072</div>
+            <div style="font-size: 0.8rem;">Estudiantes españoles</div>
+        </div>
+        <div style="text-align: center;">
+            <div style="font-size: 1.5rem; font-weight: 600; color: var(--success-green);">8</div>
+            <div style="font-size: 0.8rem;">Dimensiones analizadas</div>
+        </div>
+    </div>
+    <p style="margin-top: 1.5rem; font-size: 0.8rem;">
+        Trabajo realizado por <strong>Daniel Felipe Gómez Aristizábal</strong> con fines académicos, 
+        como parte de la asignatura <em>Visualización de Datos</em> del Máster Universitario en Ciencia de Datos de la <strong>UOC</strong>.
+    </p>
+    <p style="font-size: 0.8rem;">
+        Fuente de datos: <a href="https://www.eurostudent.eu/" target="_blank">EUROSTUDENT</a>, iniciativa que recopila y analiza información comparable 
+        sobre las condiciones de vida y estudio de los estudiantes de educación superior en Europa. 
+        Se ha utilizado su base de datos pública de la <a href="https://database.eurostudent.eu/drm/" target="_blank">Ronda 8</a>, 
+        centrando el análisis en España, con una muestra de <strong>9,072 estudiantes</strong>.
+    </p>
+</div>
+""",
+        unsafe_allow_html=True,
+    )
+
+    logo_col1, logo_col2, logo_col3 = st.columns([1, 2, 1])
+
+    with logo_col2:
+        sub_col1, sub_col2 = st.columns(2)
+
+        with sub_col1:
+            try:
+                render_image(
+                    "assets/logos/eurostudent_logo.png",
+                    caption="EUROSTUDENT - Fuente de datos",
+                    sizes="(max-width: 640px) 100vw, 25vw",
+                )
+            except Exception as e:
+                st.warning("No se pudo cargar el logo de EUROSTUDENT")
+
+        with sub_col2:
+            try:
+                render_image(
+                    "assets/logos/uoc_masterbrand_2linies_posititiu.png",
+                    caption="UOC - Institución académica",
+                    sizes="(max-width: 640px) 100vw, 25vw",
+                )
+            except Exception as e:
+                st.warning("No se pudo cargar el logo de UOC")
+
+
+def show_chart_placeholder(chart_name, description=""):
+    st.markdown(
+        f"""
+    <div class="chart-placeholder">
+        <h4>{chart_name}</h4>
+        <p>{description}</p>
+        <p><em>Gráfico por implementar</em></p>
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+
+def create_stats_display(stats_data):
+    """Crear display de estadísticas usando columnas de Streamlit"""
+    cols = st.columns(len(stats_data))
+
+    for i, stat in enumerate(stats_data):
+        color_class = stat.get("color", "stat-neutral")
+        with cols[i]:
+            st.markdown(
+                f"""
+            <div class="stat-item">
+                <div class="stat-number {color_class}">{stat['number']}</div>
+                <div class="stat-label">{stat['label']}</div>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
+
+
+def create_text_stats_display(stats_data):
+    cols = st.columns(len(stats_data))
+
+    for i, stat in enumerate(stats_data):
+        color_class = stat.get("color", "stat-neutral")
+        with cols[i]:
+            st.markdown(
+                f"""
+            <div class="stat-item">
+                <div class="stat-title {color_class}">{stat['title']}</div>
+                <div class="stat-text">{stat['text']}</div>
+                <div class="stat-subtext">{stat['subtext']}</div>
+            </div>
+            """,
+                unsafe_allow_html=True,
+            )
@@ -0,0 +1,179 @@
+"""
+Vistas enlazadas por país, resueltas en el navegador
+Varias figuras de Plotly comparten un índice de países: al hacer clic en un
+país de cualquiera de ellas se resalta ese país en todas con Plotly.restyle,
+sin volver a ejecutar el script de Streamlit (cero viajes al servidor).
+
+plotly.js sale del paquete plotly instalado, nunca de un CDN: con los
+recursos compilados (build_assets.py) se enlaza su copia con huella de
+static/build/, que el navegador guarda en caché; sin ellos va en línea
+dentro del componente.
+"""
+
+import json
+
+import plotly.io
+import streamlit as st
+from plotly.offline import get_plotlyjs
+
+from .static_assets import plotly_url
+
+# Opacidad de los países no seleccionados y grosor del borde del seleccionado
+DIMMED_OPACITY = 0.3
+HIGHLIGHT_LINE_WIDTH = 3
+HIGHLIGHT_LINE_COLOR = '#2C3E50'
+
+# plotly.js en línea (solo sin recursos compilados), leído una vez por proceso
+_PLOTLY_JS = {}
+
+
+def _trace_countries(trace):
+    """
+    Códigos ISO-2 de los puntos de una traza (None si no es por país)
+
+    Choropleth: locations (ISO-3 o ISO-2); barras: eje de categorías.
+    """
+    # Importación diferida: solo hace falta al construir el componente
+    from modules.charts.geographic_charts import COUNTRY_ISO_MAPPING
+
+    if trace.get('type') == 'choropleth':
+        iso2_by_iso3 = {iso3: iso2 for iso2, iso3 in COUNTRY_ISO_MAPPING.items()}
+        return [iso2_by_iso3.get(code, code) for code in trace.get('locations', ())]
+    if trace.get('type') == 'bar':
+        return list(trace.get('y' if trace.get('orientation') == 'h' else 'x', ()))
+    return None
+
+
+def build_linked_figures(figures, countries=None):
+    """
+    Prepara el HTML de un grupo de figuras enlazadas por país
+
+    El resultado no depende de la sesión: se construye una vez (nodo del grafo
+    del storytelling) y se pinta con render_linked_figures.
+
+    Args:
+        figures (list): Figuras de Plotly, o FrozenFigure de la caché
+            compartida, con trazas por país (barras con el código ISO-2 en el
+            eje de categorías o choropleths)
+        countries (list): Índice de países compartido (ISO-2); por defecto la
+            unión ordenada de los países de todas las figuras
+
+    Returns:
+        tuple: (html, altura en píxeles)
+    """
+    # Ambas ofrecen to_dict; el JSON de Plotly deja los arrays como listas
+    figures = [json.loads(plotly.io.to_json(fig.to_dict(), validate=False)) for fig in figures]
+    trace_countries = [[_trace_countries(trace) for trace in figure['data']] for figure in figures]
+    if countries is None:
+        countries = sorted({
+            country for traces in trace_countries for codes in traces if codes for country in codes
+        })
+    position = {country: i for i, country in enumerate(countries)}
+
+    specs = []
+    for figure, traces in zip(figures, trace_countries):
+        height = figure['layout'].get('height') or 500
+        # El ancho lo decide la rejilla del componente
+        figure['layout'].pop('width', None)
+        specs.append({
+            'figure': figure,
+            'height': height,
+            # Por traza: posición en el índice compartido de cada punto (-1 si no está)
+            'points': [[position.get(code, -1) for code in codes] if codes else None for codes in traces],
+        })
+
+    height = max(spec['height'] for spec in specs) + 40
+    payload = json.dumps({
+        'countries': list(countries),
+        'specs': specs,
+        'dimmed': DIMMED_OPACITY,
+        'lineWidth': HIGHLIGHT_LINE_WIDTH,
+        'lineColor': HIGHLIGHT_LINE_COLOR,
+    }).replace('</', '<\\/')
+
+    html = f"""
+<div id="linked-status" style="font-family: Arial, sans-serif; font-size: 13px; color: #5D6D7E; height: 24px;">
+    Haz clic en un país para resaltarlo en todos los gráficos (doble clic para quitarlo)
+</div>
+<div style="display: grid; grid-template-columns: repeat({len(specs)}, minmax(0, 1fr)); gap: 12px;">
+    {''.join(f'<div id="linked-{i}"></div>' for i in range(len(specs)))}
+</div>
+<script>
+const LINKED = {payload};
+let selected = null;
+
+const divs = LINKED.specs.map((spec, i) => {{
+    const div = document.getElementById('linked-' + i);
+    const layout = Object.assign({{}}, spec.figure.layout, {{height: spec.height, autosize: true}});
+    Plotly.newPlot(div, spec.figure.data, layout, {{responsive: true, displayModeBar: false}});
+    return div;
+}});
+
+function baseLineWidth(trace) {{
+    const line = (trace.marker || {{}}).line || {{}};
+    if (line.width !== undefined) return line.width;
+    return trace.type === 'choropleth' ? 1 : 0;
+}}
+
+function highlight(country) {{
+    selected = country;
+    LINKED.specs.forEach((spec, i) => {{
+        spec.points.forEach((points, traceIndex) => {{
+            if (!points) return;
+            const trace = spec.figure.data[traceIndex];
+            const base = baseLineWidth(trace);
+            if (selected === null) {{
+                const marker = trace.marker || {{}};
+                Plotly.restyle(divs[i], {{
+                    'marker.opacity': [marker.opacity === undefined ? 1 : marker.opacity],
+                    'marker.line.width': [base],
+                    'marker.line.color': [((marker.line || {{}}).color) || null],
+                }}, [traceIndex]);
+                return;
+            }}
+            Plotly.restyle(divs[i], {{
+                'marker.opacity': [points.map(p => p === selected ? 1 : LINKED.dimmed)],
+                'marker.line.width': [points.map(p => p === selected ? LINKED.lineWidth : base)],
+                'marker.line.color': [LINKED.lineColor],
+            }}, [traceIndex]);
+        }});
+    }});
+    document.getElementById('linked-status').textContent = selected === null
+        ? 'Haz clic en un país para resaltarlo en todos los gráficos (doble clic para quitarlo)'
+        : 'Resaltado: ' + LINKED.countries[selected] + ' (doble clic para quitarlo)';
+}}
+
+divs.forEach((div, i) => {{
+    div.on('plotly_click', (event) => {{
+        const point = event.points[0];
+        const points = LINKED.specs[i].points[point.curveNumber];
+        if (!points || points[point.pointNumber] < 0) return;
+        const country = points[point.pointNumber];
+        highlight(country === selected ? null : country);
+    }});
+    div.on('plotly_doubleclick', () => highlight(null));
+}});
+</script>
+"""
+    return html, height
+
+
+def plotly_script():
+    """<script> que carga plotly.js: el fichero compilado o, sin compilar, el código en línea"""
+    url = plotly_url()
+    if url is not None:
+        return f'<script src="{url}"></script>'
+    if 'js' not in _PLOTLY_JS:
+        _PLOTLY_JS['js'] = get_plotlyjs().replace('</script', '<\\/script')
+    return f"<script>{_PLOTLY_JS['js']}</script>"
+
+
+def render_linked_figures(linked):
+    """
+    Pinta un grupo de figuras enlazadas preparado con build_linked_figures
+
+    Args:
+        linked (tuple): (html, altura) de build_linked_figures
+    """
+    html, height = linked
+    st.iframe(plotly_script() + html, height=height)
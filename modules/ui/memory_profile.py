@@ -0,0 +1,203 @@
+"""
+Informe de memoria del proceso servidor
+Reparte la memoria retenida entre las entradas de la caché compartida
+(datasets, transformaciones y figuras de story_spec) y las sesiones abiertas,
+y señala los puntos del código que crecen de un rerun a otro.
+
+Con STORYTELLING_MEMPROFILE=1 cada rerun escribe en el log la memoria
+trazada y la residente, y cada STORYTELLING_MEMPROFILE_EVERY reruns (10 por
+defecto) el informe completo; con STORYTELLING_MEMPROFILE_DIR se exporta
+además como JSON.
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from modules.core.memory import (
+    LEAK_WINDOW,
+    MEMORY_DIR,
+    REPORT_EVERY,
+    allocation_sites,
+    deep_sizeof,
+    format_bytes,
+    growing_sites,
+    memory_profiling_enabled,
+    short_site,
+    site_diff,
+    site_source,
+)
+
+from .perf_panel import process_rss_bytes
+from .streamlit_compat import fragment_storage, session_infos
+from .warm_cache import get_graph, shared_entries
+
+logger = logging.getLogger(__name__)
+
+# Tamaño de los puntos del código en los últimos informes (para detectar fugas)
+_HISTORY = []
+_HISTORY_LOCK = threading.Lock()
+_RERUNS = itertools.count(1)
+
+
+def entry_sizes():
+    """
+    Memoria retenida por cada entrada de la caché compartida
+
+    Returns:
+        list: {'name', 'kind', 'bytes'} de mayor a menor
+    """
+    graph = get_graph()
+    rows = []
+    for name, value in shared_entries().items():
+        node = graph.nodes.get(name)
+        rows.append({'name': name, 'kind': node.kind if node else 'otro', 'bytes': deep_sizeof(value)})
+    return sorted(rows, key=lambda row: -row['bytes'])
+
+
+def session_sizes():
+    """
+    Memoria retenida por el estado de cada sesión abierta del servidor
+
+    Cuenta el session_state (widgets y valores de la sesión) y los
+    fragmentos guardados; los gestores del Runtime son de todo el proceso.
+    Fuera de `streamlit run` (sin Runtime) devuelve una lista vacía.
+
+    Returns:
+        list: {'session', 'reruns', 'bytes'} de mayor a menor, o None si esta
+            versión de Streamlit no permite consultar las sesiones
+    """
+    infos = session_infos()
+    if infos is None:
+        return None
+    rows = []
+    for info in infos:
+        session = info.session
+        retained = deep_sizeof(session.session_state) + deep_sizeof(fragment_storage(session))
+        rows.append({'session': session.id[:8], 'reruns': info.script_run_count, 'bytes': retained})
+    return sorted(rows, key=lambda row: -row['bytes'])
+
+
+def record_sites():
+    """Toma una instantánea de tracemalloc y la añade al historial de fugas"""
+    sites = allocation_sites()
+    with _HISTORY_LOCK:
+        _HISTORY.append(sites)
+        del _HISTORY[:-(LEAK_WINDOW + 1)]
+        return list(_HISTORY)
+
+
+def site_rows(sites):
+    """(punto, crecimiento, tamaño) -> filas del informe con la línea de código"""
+    return [{'site': short_site(site), 'source': site_source(site), 'growth': growth, 'bytes': size}
+            for site, growth, size in sites]
+
+
+def memory_report(history=None, sessions=None):
+    """
+    Informe de memoria del proceso
+
+    Args:
+        history (list): Instantáneas (allocation_sites) de reruns sucesivos;
+            por defecto se toma una nueva y se usa el historial del proceso
+        sessions (list): Filas de sesión ya medidas (por defecto, session_sizes())
+
+    Returns:
+        dict: traced/peak/rss, entries, kinds (total por tipo de entrada),
+            sessions, growth (crecimiento desde la instantánea anterior) y
+            leaks (puntos que crecen en todas las últimas instantáneas)
+    """
+    if history is None:
+        history = record_sites()
+    traced, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (None, None)
+    entries = entry_sizes()
+    kinds = {}
+    for row in entries:
+        total = kinds.setdefault(row['kind'], {'count': 0, 'bytes': 0})
+        total['count'] += 1
+        total['bytes'] += row['bytes']
+
+    return {
+        'timestamp': time.time(),
+        'traced': traced,
+        'peak': peak,
+        'rss': process_rss_bytes(),
+        'entries': entries,
+        'kinds': kinds,
+        'sessions': session_sizes() if sessions is None else sessions,
+        'growth': site_rows(site_diff(history[-2], history[-1])) if len(history) >= 2 else [],
+        'leaks': site_rows(growing_sites(history)),
+    }
+
+
+def format_memory_report(report, limit=10):
+    """Informe de memoria como texto"""
+    lines = []
+    header = [f"RSS {format_bytes(report['rss'])}" if report['rss'] else None,
+              f"trazada {format_bytes(report['traced'])} (pico {format_bytes(report['peak'])})"
+              if report['traced'] is not None else None]
+    lines.append("🧠 Memoria: " + ', '.join(part for part in header if part))
+
+    lines.append("  Caché compartida:")
+    for kind, total in sorted(report['kinds'].items(), key=lambda item: -item[1]['bytes']):
+        lines.append(f"    {kind:<10} {total['count']:>4} entradas {format_bytes(total['bytes']):>10}")
+    for row in report['entries'][:limit]:
+        lines.append(f"    {format_bytes(row['bytes']):>10}  {row['kind']:<10} {row['name']}")
+
+    sessions = report['sessions']
+    if sessions is None:
+        lines.append("  Sesiones: n/d")
+    elif sessions:
+        total = sum(row['bytes'] for row in sessions)
+        lines.append(f"  Sesiones: {len(sessions)} con {format_bytes(total)} de estado")
+        for row in sessions[:limit]:
+            lines.append(f"    {format_bytes(row['bytes']):>10}  {row['session']} ({row['reruns']} reruns)")
+
+    if report['growth']:
+        lines.append("  Crecimiento desde el informe anterior:")
+        for row in report['growth'][:limit]:
+            lines.append(f"    +{format_bytes(row['growth']):>9}  {row['site']}  {row['source'][:60]}")
+    if report['leaks']:
+        lines.append("  ⚠️ Posibles fugas (crecen en todas las últimas instantáneas):")
+        for row in report['leaks'][:limit]:
+            lines.append(f"    +{format_bytes(row['growth']):>9}  {row['site']}  {row['source'][:60]}")
+    return '\n'.join(lines)
+
+
+def export_memory_report(report, directory=MEMORY_DIR):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"memory-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return path
+
+
+@contextmanager
+def memory_rerun():
+    """
+    Mide la memoria del proceso al terminar el rerun ejecutado dentro
+
+    Escribe en el log la memoria trazada y la residente y, cada REPORT_EVERY
+    reruns, el informe completo. No hace nada si el perfilado está desactivado.
+    """
+    if not memory_profiling_enabled():
+        yield
+        return
+    try:
+        yield
+    finally:
+        rerun = next(_RERUNS)
+        traced, peak = tracemalloc.get_traced_memory()
+        rss = process_rss_bytes()
+        logger.info(f"🧠 Rerun {rerun}: {format_bytes(traced)} trazados (pico {format_bytes(peak)})"
+                    + (f", RSS {format_bytes(rss)}" if rss else ''))
+        if rerun % REPORT_EVERY == 0:
+            report = memory_report()
+            logger.info(format_memory_report(report))
+            if MEMORY_DIR:
+                logger.info(f"🧠 Informe exportado en {export_memory_report(report)}")
@@ -0,0 +1,203 @@
+"""
+Panel de rendimiento del menú lateral
+Con STORYTELLING_DEBUG=1 o ?debug=1 en la URL se muestra, para el rerun
+actual, el tiempo de cada fase del capítulo, qué entradas y datasets salieron
+de la caché del proceso y cuáles se leyeron de disco, el tamaño de cada
+figura enviada al navegador y la memoria residente del proceso. Permite
+diagnosticar una instancia lenta sin adjuntar un profiler en producción.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from modules.core.data_cache import cache_stats
+
+from .streamlit_compat import capture_messages
+from .warm_cache import get_graph, record_cache_access, warmup_timings
+
+DEBUG_ENV = 'STORYTELLING_DEBUG'
+DEBUG_QUERY_PARAM = 'debug'
+_TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+_TAG = re.compile(r'<[^>]+>')
+
+
+def debug_enabled():
+    """Indica si el panel está activo (variable de entorno o parámetro de la URL)"""
+    if os.environ.get(DEBUG_ENV, '').strip().lower() in _TRUE_VALUES:
+        return True
+    return st.query_params.get(DEBUG_QUERY_PARAM, '').strip().lower() in _TRUE_VALUES
+
+
+def process_rss_bytes():
+    """Memoria residente del proceso en bytes (el pico si no hay /proc; None si no se puede medir)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en bytes en macOS y en KiB en Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _figure_title(element):
+    """Título de una figura de Plotly a partir de su especificación JSON"""
+    try:
+        title = json.loads(element.plotly_chart.spec).get('layout', {}).get('title', {})
+    except (ValueError, AttributeError):
+        return 'Figura'
+    text = title.get('text', '') if isinstance(title, dict) else str(title)
+    text = _TAG.sub(' ', text).split('  ')[0].strip()
+    return text[:60] or 'Figura sin título'
+
+
+class RerunPerf:
+    """Medidas de un rerun: fases, accesos a la caché y mensajes enviados"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []
+        self.messages = []
+        self.access = {'requested': [], 'built': {}}
+
+    @contextmanager
+    def phase(self, label):
+        """Mide un bloque del rerun (ej: construcción de figuras, ejecución del capítulo)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((label, time.perf_counter() - start))
+
+    def capture(self, msg):
+        """Anota el tamaño de un mensaje enviado al navegador"""
+        msg_type = msg.WhichOneof('type')
+        if msg_type == 'ref_hash':
+            # Streamlit ya había enviado este mensaje: solo viaja su hash
+            self.messages.append(('referencia', 'Mensaje repetido (caché del navegador)', msg.ByteSize()))
+        elif msg_type == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+            element = msg.delta.new_element
+            kind = element.WhichOneof('type')
+            label = _figure_title(element) if kind == 'plotly_chart' else kind
+            self.messages.append((kind, label, msg.ByteSize()))
+
+
+class _NoopPerf:
+    """Medidas desactivadas"""
+
+    def phase(self, label):
+        return nullcontext()
+
+
+_NOOP_PERF = _NoopPerf()
+
+
+@contextmanager
+def perf_panel():
+    """
+    Mide el rerun ejecutado dentro y, si termina sin interrumpirse, muestra
+    el panel en el menú lateral
+
+    Los tamaños son los de los mensajes que la sesión envía al navegador:
+    se interceptan en la cola de salida del contexto del script.
+
+    Yields:
+        RerunPerf: Medidas del rerun (o un objeto que no mide nada si el
+            panel está desactivado)
+    """
+    if not debug_enabled():
+        yield _NOOP_PERF
+        return
+
+    perf = RerunPerf()
+    with capture_messages(get_script_run_ctx(), perf.capture) as payload_measured:
+        with record_cache_access() as access:
+            perf.access = access
+            yield perf
+
+    render_perf_panel(perf, payload_measured=payload_measured)
+
+
+def _entry_rows(perf):
+    """Entradas de la caché que ha necesitado el rerun y su origen"""
+    graph = get_graph()
+    requested = list(dict.fromkeys(perf.access['requested']))
+    built = perf.access['built']
+    timings = warmup_timings()
+    rows = []
+    for name in graph.upstream(requested) if requested else []:
+        node = graph.nodes[name]
+        rows.append({
+            'Entrada': name,
+            'Tipo': node.kind,
+            'Origen': 'construida ahora' if name in built else 'caché del proceso',
+            'Construcción (s)': round(built.get(name, timings.get(name, float('nan'))), 3),
+        })
+    return rows
+
+
+def render_perf_panel(perf, payload_measured=True):
+    """Muestra las medidas de un rerun en el menú lateral"""
+    total = time.perf_counter() - perf.start
+    rss = process_rss_bytes()
+    entries = _entry_rows(perf)
+
+    with st.sidebar.expander("⏱️ Rendimiento del rerun", expanded=True):
+        col_time, col_rss = st.columns(2)
+        col_time.metric("Rerun", f"{total * 1000:.0f} ms")
+        col_rss.metric("RSS", f"{rss / 2**20:.0f} MB" if rss is not None else "n/d")
+
+        st.markdown("**Fases**")
+        st.dataframe(
+            pd.DataFrame([{'Fase': label, 'ms': round(seconds * 1000, 1)} for label, seconds in perf.phases]),
+            hide_index=True,
+        )
+
+        if entries:
+            hits = sum(row['Origen'] == 'caché del proceso' for row in entries)
+            st.markdown("**Caché del proceso**")
+            st.caption(f"{hits}/{len(entries)} entradas servidas desde memoria ({hits / len(entries):.0%})")
+            st.dataframe(pd.DataFrame(entries), hide_index=True)
+
+            datasets = [row for row in entries if row['Tipo'] == 'dataset']
+            if datasets:
+                st.caption(
+                    "Datasets: " + ", ".join(
+                        f"{row['Entrada']} ({'disco' if row['Origen'] == 'construida ahora' else 'memoria'})"
+                        for row in datasets
+                    )
+                )
+
+        disk = cache_stats()
+        served = sum(disk.values())
+        if served:
+            st.caption(
+                f"Caché de análisis en disco (proceso): {disk['memoria']} desde memoria, "
+                f"{disk['disco']} desde disco, {disk['calculado']} recalculados"
+            )
+
+        st.markdown("**Enviado al navegador**")
+        if not payload_measured:
+            st.caption("No se pueden medir los mensajes en este entorno")
+        elif perf.messages:
+            figures = [
+                {'Figura': label, 'KB': round(size / 1024, 1)}
+                for kind, label, size in perf.messages if kind == 'plotly_chart'
+            ]
+            sent = sum(size for _, _, size in perf.messages)
+            st.caption(f"{len(perf.messages)} elementos, {sent / 1024:.0f} KB en total")
+            if figures:
+                st.dataframe(pd.DataFrame(figures), hide_index=True)
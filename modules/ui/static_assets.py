@@ -0,0 +1,453 @@
+"""
+Recursos estáticos compilados (imágenes y hoja de estilos)
+El paso de compilación (build_assets.py) genera, a partir de assets/, varias
+anchuras de cada imagen en AVIF, WebP y PNG, una hoja de estilos con el CSS
+global y una copia de plotly.js (para las vistas enlazadas), todo con la
+huella del contenido en el nombre, en static/build/. La
+aplicación los sirve como ficheros estáticos de Streamlit (/app/static/) y,
+al ser inmutables, app.py los publica con caché de larga duración.
+
+Si no se ha compilado nada, las funciones de este módulo recurren a st.image
+y al CSS en línea de siempre.
+"""
+
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+
+import streamlit as st
+
+from modules.core.data_cache import data_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Carpeta estática de Streamlit (junto a storytelling.py) y subcarpeta compilada
+STATIC_DIR = 'static'
+BUILD_DIR = os.path.join(STATIC_DIR, 'build')
+MANIFEST_PATH = os.path.join(BUILD_DIR, 'manifest.json')
+
+# URL relativa con la que Streamlit sirve BUILD_DIR (server.enableStaticServing)
+BUILD_URL = 'app/static/build'
+
+# Carpetas de imágenes de origen
+SOURCE_DIRS = ('assets/images', 'assets/logos')
+
+# Anchuras generadas (sin superar la original) y formatos, del más ligero al
+# de reserva; 720 cubre un móvil de 360 px a densidad 2x y 1024 las columnas
+# más anchas
+IMAGE_WIDTHS = (360, 720, 1024)
+IMAGE_FORMATS = {
+    'avif': {'quality': 50},
+    'webp': {'quality': 80, 'method': 4},
+    'png': {'compress_level': 6},
+}
+FALLBACK_FORMAT = 'png'
+
+# Ficheros compilados: nombre.<huella de 12 caracteres>.ext
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.[a-z0-9]+$')
+
+# Cabecera para los ficheros con huella: su contenido nunca cambia
+IMMUTABLE_CACHE_CONTROL = b'public, max-age=31536000, immutable'
+
+# Manifiesto cargado: (mtime, contenido)
+_MANIFEST = {}
+
+# Huellas del CSS de origen con las que ya se ha avisado de una hoja obsoleta
+_STALE_WARNED = set()
+
+
+def _hashed_name(stem, data, ext):
+    return f"{stem}.{hashlib.sha1(data).hexdigest()[:12]}.{ext}"
+
+
+def _write(output_dir, name, data):
+    path = os.path.join(output_dir, name)
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(data)
+    return name
+
+
+def _encode(image, fmt):
+    """Imagen PIL -> bytes en el formato pedido"""
+    from io import BytesIO
+
+    buffer = BytesIO()
+    image.save(buffer, format=fmt.upper(), **IMAGE_FORMATS[fmt])
+    return buffer.getvalue()
+
+
+def _supported_formats():
+    """Formatos de IMAGE_FORMATS que esta instalación de Pillow puede escribir"""
+    from PIL import features
+
+    formats = []
+    for fmt in IMAGE_FORMATS:
+        if fmt in ('avif', 'webp') and not features.check(fmt):
+            logger.warning(f"⚠️ Pillow no soporta {fmt.upper()}: se omiten sus variantes")
+            continue
+        formats.append(fmt)
+    return formats
+
+
+def build_image(path, output_dir, formats):
+    """
+    Genera las variantes de una imagen
+
+    Args:
+        path (str): Imagen de origen
+        output_dir (str): Carpeta de salida
+        formats (list): Formatos a generar
+
+    Returns:
+        dict: Entrada del manifiesto (tamaño original y ficheros por formato)
+    """
+    from PIL import Image
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with Image.open(path) as source:
+        source.load()
+        width, height = source.size
+        widths = sorted({min(w, width) for w in IMAGE_WIDTHS})
+
+        variants = {fmt: [] for fmt in formats}
+        for target in widths:
+            resized = source if target == width else source.resize(
+                (target, round(height * target / width)), Image.LANCZOS
+            )
+            for fmt in formats:
+                data = _encode(resized, fmt)
+                name = _write(output_dir, _hashed_name(f"{stem}-{target}w", data, fmt), data)
+                variants[fmt].append({'file': name, 'width': target, 'bytes': len(data)})
+
+    return {
+        'width': width,
+        'height': height,
+        'source_bytes': os.path.getsize(path),
+        'variants': variants,
+    }
+
+
+def css_source_hash(css):
+    """Huella del CSS de origen (se guarda en el manifiesto para detectar hojas obsoletas)"""
+    return hashlib.sha1(css.encode('utf-8')).hexdigest()[:12]
+
+
+def build_stylesheet(css, output_dir):
+    """
+    Escribe la hoja de estilos global con huella
+
+    Args:
+        css (str): Bloques <style> del CSS global
+        output_dir (str): Carpeta de salida
+
+    Returns:
+        str: Nombre del fichero generado
+    """
+    body = re.sub(r'</?style>', '', css).strip() + '\n'
+    data = body.encode('utf-8')
+    return _write(output_dir, _hashed_name('styles', data, 'css'), data)
+
+
+def build_plotly_js(output_dir):
+    """
+    Escribe el plotly.js del paquete plotly instalado con huella
+
+    Returns:
+        str: Nombre del fichero generado
+    """
+    from plotly.offline import get_plotlyjs
+
+    data = get_plotlyjs().encode('utf-8')
+    return _write(output_dir, _hashed_name('plotly', data, 'js'), data)
+
+
+def build_assets(source_dirs=SOURCE_DIRS, output_dir=BUILD_DIR, force=False):
+    """
+    Compila los recursos estáticos y escribe el manifiesto
+
+    Solo se regeneran las imágenes cuyo contenido (o la configuración de
+    anchuras y formatos) ha cambiado; los ficheros que ya no aparecen en el
+    manifiesto se borran.
+
+    Args:
+        source_dirs (tuple): Carpetas con las imágenes de origen
+        output_dir (str): Carpeta de salida (servida como estática)
+        force (bool): Regenerar todas las imágenes
+
+    Returns:
+        dict: Manifiesto generado
+    """
+    # Importación diferida: layout importa este módulo para inyectar la hoja
+    from plotly.offline import get_plotlyjs_version
+
+    from .layout import GLOBAL_CSS, SIDEBAR_CSS
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, 'manifest.json')
+    previous = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, encoding='utf-8') as f:
+            previous = json.load(f).get('images', {})
+
+    formats = _supported_formats()
+    settings = json.dumps({'widths': IMAGE_WIDTHS, 'formats': {fmt: IMAGE_FORMATS[fmt] for fmt in formats}},
+                          sort_keys=True)
+
+    images = {}
+    for source_dir in source_dirs:
+        for name in sorted(os.listdir(source_dir)):
+            if not name.lower().endswith(('.png', '.jpg', '.jpeg')):
+                continue
+            path = f"{source_dir}/{name}"
+            fingerprint = data_fingerprint([path], extra=settings)
+            entry = previous.get(path)
+            if entry is not None and entry.get('fingerprint') == fingerprint and all(
+                os.path.exists(os.path.join(output_dir, variant['file']))
+                for variants in entry['variants'].values() for variant in variants
+            ):
+                images[path] = entry
+                continue
+            images[path] = {'fingerprint': fingerprint, **build_image(path, output_dir, formats)}
+            logger.info(f"🖼️ {path}: {len(images[path]['variants'])} formatos x "
+                        f"{len(images[path]['variants'][FALLBACK_FORMAT])} anchuras")
+
+    css = GLOBAL_CSS + SIDEBAR_CSS
+    manifest = {
+        'images': images,
+        'stylesheet': build_stylesheet(css, output_dir),
+        'stylesheet_source': css_source_hash(css),
+        'plotly': build_plotly_js(output_dir),
+        'plotly_version': get_plotlyjs_version(),
+    }
+
+    # Borrar los ficheros de compilaciones anteriores
+    keep = {manifest['stylesheet'], manifest['plotly'], 'manifest.json'}
+    keep.update(variant['file'] for entry in images.values()
+                for variants in entry['variants'].values() for variant in variants)
+    for name in os.listdir(output_dir):
+        if name not in keep and HASHED_NAME.search(name):
+            os.remove(os.path.join(output_dir, name))
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+
+def asset_report(manifest, mobile_width=360, pixel_ratio=2):
+    """
+    Tabla de pesos: original frente a la variante que descarga un móvil
+
+    Args:
+        manifest (dict): Manifiesto de build_assets
+        mobile_width (int): Ancho de pantalla en píxeles CSS
+        pixel_ratio (int): Densidad de píxeles del dispositivo
+
+    Returns:
+        str: Tabla de texto
+    """
+    needed = mobile_width * pixel_ratio
+    best = next(fmt for fmt in IMAGE_FORMATS if fmt in next(iter(manifest['images'].values()))['variants'])
+    lines = [f"{'Imagen':<48} {'Original':>10} {best.upper() + ' móvil':>12} {'Ahorro':>8}"]
+    total_source = total_mobile = 0
+    for path, entry in manifest['images'].items():
+        variants = entry['variants'][best]
+        chosen = next((v for v in variants if v['width'] >= needed), variants[-1])
+        total_source += entry['source_bytes']
+        total_mobile += chosen['bytes']
+        lines.append(f"{path:<48} {entry['source_bytes'] / 1024:>8.0f}KB {chosen['bytes'] / 1024:>10.0f}KB "
+                     f"{1 - chosen['bytes'] / entry['source_bytes']:>8.0%}")
+    lines.append(f"{'Total':<48} {total_source / 1024:>8.0f}KB {total_mobile / 1024:>10.0f}KB "
+                 f"{1 - total_mobile / total_source:>8.0%}")
+    return '\n'.join(lines)
+
+
+def load_manifest():
+    """
+    Manifiesto compilado (se relee si cambia en disco)
+
+    Devuelve None si no se ha compilado o si Streamlit no sirve la carpeta
+    estática (server.enableStaticServing desactivado).
+    """
+    if not st.get_option('server.enableStaticServing'):
+        return None
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _MANIFEST.get('mtime') != mtime:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            _MANIFEST.update(mtime=mtime, data=json.load(f))
+    return _MANIFEST['data']
+
+
+def stylesheet_url(css):
+    """
+    URL de la hoja de estilos compilada
+
+    La hoja solo se usa si se compiló a partir de este mismo CSS: si se ha
+    editado GLOBAL_CSS o SIDEBAR_CSS después de compilar (o el manifiesto es
+    anterior a la huella del origen), se avisa y se vuelve al CSS en línea
+    hasta que se recompile.
+
+    Args:
+        css (str): CSS global de origen (bloques <style>)
+
+    Returns:
+        str: URL, o None si no se ha compilado o la hoja está obsoleta
+    """
+    manifest = load_manifest()
+    if manifest is None:
+        return None
+    source = css_source_hash(css)
+    if manifest.get('stylesheet_source') != source:
+        if source not in _STALE_WARNED:
+            _STALE_WARNED.add(source)
+            logger.warning("⚠️ La hoja de estilos compilada no corresponde al CSS actual: "
+                           "se usa el CSS en línea (ejecuta python build_assets.py)")
+        return None
+    return f"{BUILD_URL}/{manifest['stylesheet']}"
+
+
+def plotly_url():
+    """
+    URL del plotly.js compilado
+
+    Solo si corresponde a la versión de plotly instalada: las figuras se
+    serializan con ella.
+
+    Returns:
+        str: URL, o None si no se ha compilado o es de otra versión
+    """
+    from plotly.offline import get_plotlyjs_version
+
+    manifest = load_manifest()
+    if manifest is None or 'plotly' not in manifest or manifest.get('plotly_version') != get_plotlyjs_version():
+        return None
+    return f"{BUILD_URL}/{manifest['plotly']}"
+
+
+def inject_stylesheet(url):
+    """
+    Añade la hoja de estilos al <head> de la página (una vez por sesión)
+
+    El enlace queda en el <head> aunque el elemento desaparezca en las
+    siguientes ejecuciones del script, así que no se vuelve a enviar.
+    """
+    if st.session_state.get('_stylesheet_url') == url:
+        return
+    st.session_state['_stylesheet_url'] = url
+    st.html(
+        f"""
+<script>
+(() => {{
+    const href = new URL({json.dumps(url)}, document.baseURI).href;
+    if ([...document.querySelectorAll('link[rel="stylesheet"]')].some(link => link.href === href)) return;
+    const link = document.createElement('link');
+    link.rel = 'stylesheet';
+    link.href = href;
+    document.head.appendChild(link);
+}})();
+</script>
+""",
+        unsafe_allow_javascript=True,
+    )
+
+
+def picture_html(path, alt, width=None, sizes=None, caption=None):
+    """
+    <picture> con srcset AVIF/WebP/PNG de una imagen compilada
+
+    Args:
+        path (str): Imagen de origen (ej: 'assets/images/x.png')
+        alt (str): Texto alternativo
+        width (int): Ancho máximo mostrado en píxeles CSS (None: el del contenedor)
+        sizes (str): Atributo sizes (por defecto se deduce de width)
+        caption (str): Pie de imagen
+
+    Returns:
+        str: HTML, o None si la imagen no está en el manifiesto
+    """
+    manifest = load_manifest()
+    entry = manifest['images'].get(path) if manifest else None
+    if entry is None:
+        return None
+
+    if sizes is None:
+        sizes = f"(max-width: {width}px) 100vw, {width}px" if width else "100vw"
+
+    def srcset(fmt):
+        return ', '.join(f"{BUILD_URL}/{v['file']} {v['width']}w" for v in entry['variants'][fmt])
+
+    sources = ''.join(
+        f'<source type="image/{fmt}" srcset="{srcset(fmt)}" sizes="{sizes}">'
+        for fmt in entry['variants'] if fmt != FALLBACK_FORMAT
+    )
+    fallback = entry['variants'][FALLBACK_FORMAT]
+    max_width = f"max-width: {width}px; " if width else ""
+    img = (
+        f'<img src="{BUILD_URL}/{fallback[-1]["file"]}" srcset="{srcset(FALLBACK_FORMAT)}" sizes="{sizes}" '
+        f'width="{entry["width"]}" height="{entry["height"]}" alt="{html.escape(alt, quote=True)}" '
+        f'loading="lazy" decoding="async" style="{max_width}width: 100%; height: auto;">'
+    )
+    figcaption = (
+        f'<figcaption style="text-align: center; color: var(--neutral-gray, #808495); font-size: 0.875rem; '
+        f'margin-top: 0.375rem;">{html.escape(caption)}</figcaption>'
+        if caption else ''
+    )
+    return f'<figure style="margin: 0;"><picture>{sources}{img}</picture>{figcaption}</figure>'
+
+
+def render_image(path, caption=None, width=None, sizes=None):
+    """
+    Muestra una imagen de assets/ con sus variantes compiladas
+
+    Sin compilación (o si la imagen no está en el manifiesto) usa st.image
+    con la imagen original.
+
+    Args:
+        path (str): Imagen de origen
+        caption (str): Pie de imagen (también texto alternativo)
+        width (int): Ancho máximo en píxeles CSS (None: ancho del contenedor)
+        sizes (str): Atributo sizes del srcset
+    """
+    picture = picture_html(path, alt=caption or '', width=width, sizes=sizes, caption=caption)
+    if picture is None:
+        if width:
+            st.image(path, width=width, caption=caption)
+        else:
+            st.image(path, caption=caption, use_container_width=True)
+        return
+    st.html(picture)
+
+
+class ImmutableStaticCache:
+    """
+    Middleware ASGI: caché de un año para los ficheros con huella de /app/static/
+
+    Streamlit sirve la carpeta estática sin Cache-Control; como los nombres
+    compilados cambian con el contenido, el navegador puede guardarlos
+    indefinidamente sin volver a validarlos.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get('path', '') if scope['type'] == 'http' else ''
+        if '/app/static/' not in path or not HASHED_NAME.search(path):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache(message):
+            if message['type'] == 'http.response.start' and message.get('status') == 200:
+                headers = [(key, value) for key, value in message.get('headers', [])
+                           if key.lower() != b'cache-control']
+                headers.append((b'cache-control', IMMUTABLE_CACHE_CONTROL))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache)
@@ -0,0 +1,203 @@
+"""
+Especificación declarativa del storytelling
+Declara, para cada capítulo, las figuras que muestra y los datasets y tablas
+derivadas de los que dependen. El ejecutor de modules.core.story_graph
+resuelve el grafo: cada dataset se carga una sola vez y se comparte entre
+todas las figuras que lo usan.
+
+Las figuras que destacan un país se declaran una vez por país foco, con el
+nombre 'figura@XX' (ver country_node); los datasets y las figuras con datos
+solo de España son comunes a todos los países.
+"""
+
+import glob
+from functools import partial
+
+from modules.core.countries import FOCUS_COUNTRIES
+from modules.core.story_graph import StoryGraph, StoryNode
+
+# Ficheros leídos directamente por builders que cargan sus propios datos
+SANKEY_FILES = tuple(sorted(glob.glob('data/sankey_excels/*.xlsx')))
+HAPPINESS_FILES = (
+    'data/preprocessed_relationship_study_job/E8_happiness_5__s_relationship_job_study__all_contries_not_spain.xlsx',
+    'data/preprocessed_relationship_study_job/E8_happiness_5__studients_work_or_not__all_contries.xlsx',
+)
+ACADEMIC_PERCEPTION_FILES = (
+    'data/preprocessed_impact_by_job/E8_selfevaluation__s_performance_self_assessment__ES.xlsx',
+)
+AGE_ISOTYPE_FILES = (
+    'data/preprocessed_relationship_study_job/E8_age__relationship_job_study__ES.xlsx',
+)
+
+
+def country_node(name, country):
+    """Nombre del nodo de una figura para un país foco (ej: 'gender_chart@PT')"""
+    return f"{name}@{country}"
+
+
+def build_story_spec(countries=FOCUS_COUNTRIES):
+    """
+    Nodos del storytelling
+
+    Args:
+        countries (iterable): Países foco para los que se declaran las figuras
+            que dependen del país
+
+    Returns:
+        list: StoryNode de datasets, transformaciones y figuras
+    """
+    # Importación diferida: la especificación solo carga los módulos de gráficos al usarse
+    from modules.core.data_loaders import (
+        read_work_motive_afford_study_dataset,
+        read_work_study_relationship_dataset,
+        read_work_impact_dataset,
+        PreprocessedDatasetsNamesWorkMotiveAffordStudy,
+        PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy,
+        PreprocessedDatasetsNamesImpactsOnStudyForWork,
+    )
+    from modules.charts.geographic_charts import (
+        COST_DATASET_PATH,
+        read_cost_dataset,
+        generate_europe_cost_heatmap,
+        get_cost_statistics,
+    )
+    from modules.charts.demographic_charts import (
+        read_demographic_dataset_detailed,
+        create_field_of_study_comparison_chart,
+        create_living_with_parents_comparison_chart,
+        create_gender_comparison_chart,
+        create_age_comparison_chart,
+        create_combined_demographic_chart,
+        DEMOGRAPHIC_BREAKDOWNS,
+    )
+    from modules.charts.work_study_charts import create_storytelling_work_study_charts, generate_storytelling_summary
+    from modules.charts.impact_charts import (
+        create_financial_abandoning_chart,
+        create_work_afford_abandoning_chart,
+        create_spain_europe_impact_comparison,
+    )
+    from modules.charts.perception_charts import (
+        generate_academic_perception_analysis,
+        generate_happiness_work_relation_analysis,
+    )
+    from modules.analysis.storytelling_module import WorkStudyStorytellingCharts
+    from modules.analysis.sankey_analysis import get_sankey_for_streamlit
+    from modules.analysis.isotype_analysis import create_age_isotype_for_streamlit
+    from modules.ui.linked_figures import build_linked_figures
+
+    def demographic(dataset_enum):
+        return StoryNode(
+            f"{dataset_enum.name.lower().replace('work_motive_afford_study_', 'demographic_')}_dataset",
+            lambda: read_demographic_dataset_detailed(dataset_enum),
+            inputs=(dataset_enum.value,), kind='dataset'
+        )
+
+    # Nodos declarados por país: sus dependientes usan la versión del mismo país
+    per_country = set()
+
+    def by_country(name, func, deps=(), kind='figure', section=None):
+        """Un nodo por país foco; func recibe el país y los valores de deps"""
+        per_country.add(name)
+        return [
+            StoryNode(
+                country_node(name, country),
+                partial(func, country),
+                deps=tuple(country_node(dep, country) if dep in per_country else dep for dep in deps),
+                kind=kind, section=section, country=country
+            )
+            for country in countries
+        ]
+
+    # Un dataset por desglose demográfico, compartido por su gráfico y por la figura combinada
+    breakdowns = {key: demographic(dataset_enum) for key, (_, _, dataset_enum) in DEMOGRAPHIC_BREAKDOWNS.items()}
+    gender = breakdowns['gender']
+    age = breakdowns['age']
+    living = breakdowns['living_with_parents']
+    field = breakdowns['field_of_study']
+
+    impact_financial = PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__E_FINANCIAL_DIFFICULTIES
+    impact_work_afford = PreprocessedDatasetsNamesImpactsOnStudyForWork.IMPACT_ON_STUDY_ABANDONING_ALL_T__S_WORK_TO_AFFORD_TO_STUDY
+
+    return [
+        # === DATASETS ===
+        StoryNode('work_motive_dataset', read_work_motive_afford_study_dataset, kind='dataset',
+                  inputs=(PreprocessedDatasetsNamesWorkMotiveAffordStudy.WORK_MOTIVE_AFFORD_STUDY.value,)),
+        StoryNode('work_study_dataset', read_work_study_relationship_dataset, kind='dataset',
+                  inputs=(PreprocessedDatasetsNamesRelationshipBetweenWorkAndStudy.RELATIONSHIP_BETWEEN_WORK_AND_STUDY.value,)),
+        StoryNode('cost_dataset', read_cost_dataset, kind='dataset', inputs=(COST_DATASET_PATH,)),
+        StoryNode('impact_financial_dataset', lambda: read_work_impact_dataset(impact_financial), kind='dataset',
+                  inputs=(impact_financial.value,)),
+        StoryNode('impact_work_afford_dataset', lambda: read_work_impact_dataset(impact_work_afford), kind='dataset',
+                  inputs=(impact_work_afford.value,)),
+        *breakdowns.values(),
+
+        # === TRANSFORMACIONES ===
+        StoryNode('storytelling_charts', WorkStudyStorytellingCharts, deps=('work_motive_dataset',), kind='transform'),
+        *by_country('work_study_charts',
+                    lambda country, df: create_storytelling_work_study_charts(df, focus_country=country),
+                    deps=('work_study_dataset',), kind='transform', section='tipos-de-trabajo'),
+
+        # === CAPÍTULO 1: CONTEXTO EUROPEO ===
+        *by_country('chart_need_vs_no_need',
+                    lambda country, charts: charts.get_chart_need_vs_no_need(focus_country=country),
+                    deps=('storytelling_charts',), section='contexto-europeo'),
+        *by_country('key_insights', lambda country, charts: charts.get_key_insights(focus_country=country),
+                    deps=('storytelling_charts',), section='contexto-europeo'),
+        *by_country('chart_spain_vs_europe',
+                    lambda country, charts: charts.get_chart_spain_vs_europe(focus_country=country),
+                    deps=('storytelling_charts',), section='contexto-europeo'),
+
+        # === CAPÍTULO 2: PERFIL DE ESTUDIANTES ===
+        *by_country('cost_heatmap', lambda country, df: generate_europe_cost_heatmap(df=df, focus_country=country),
+                    deps=('cost_dataset',), section='perfil-estudiantes'),
+        *by_country('cost_statistics', lambda country, df: get_cost_statistics(df, focus_country=country),
+                    deps=('cost_dataset',), section='perfil-estudiantes'),
+        *by_country('gender_chart', lambda country, df: create_gender_comparison_chart(df, focus_country=country),
+                    deps=(gender.name,), section='perfil-estudiantes'),
+        *by_country('age_chart', lambda country, df: create_age_comparison_chart(df, focus_country=country),
+                    deps=(age.name,), section='perfil-estudiantes'),
+        *by_country('living_with_parents_chart',
+                    lambda country, df: create_living_with_parents_comparison_chart(df, focus_country=country),
+                    deps=(living.name,), section='perfil-estudiantes'),
+        *by_country('field_of_study_chart',
+                    lambda country, df: create_field_of_study_comparison_chart(df, focus_country=country),
+                    deps=(field.name,), section='perfil-estudiantes'),
+        *by_country('combined_demographic_chart',
+                    lambda country, *data: create_combined_demographic_chart(dict(zip(breakdowns, data)),
+                                                                             focus_country=country),
+                    deps=tuple(node.name for node in breakdowns.values()), section='perfil-estudiantes'),
+        # Trayectorias de los microdatos de España: comunes a todos los países
+        StoryNode('sankey', get_sankey_for_streamlit, inputs=SANKEY_FILES, section='perfil-estudiantes'),
+
+        # === CAPÍTULO 3: TIPOS DE TRABAJO ===
+        *by_country('work_study_summary',
+                    lambda country, charts: generate_storytelling_summary(charts[1], focus_country=country),
+                    deps=('work_study_charts',), section='tipos-de-trabajo'),
+        *by_country('linked_country_views',
+                    lambda country, charts, cost_map: build_linked_figures([charts[0]['ranking_chart'], cost_map]),
+                    deps=('work_study_charts', 'cost_heatmap'), section='tipos-de-trabajo'),
+
+        # === CAPÍTULO 4: IMPACTO ===
+        # Pestañas: solo la primera se construye con el capítulo; las demás al abrirlas
+        *by_country('impact_abandono_financiero',
+                    lambda country, df: create_financial_abandoning_chart(df, focus_country=country),
+                    deps=('impact_financial_dataset',), section='impacto'),
+        *by_country('impact_abandono_trabajo',
+                    lambda country, df: create_work_afford_abandoning_chart(df, focus_country=country),
+                    deps=('impact_work_afford_dataset',)),
+        *by_country('impact_espana_vs_europa',
+                    lambda country, financial, work_afford: create_spain_europe_impact_comparison(
+                        financial, work_afford, focus_country=country),
+                    deps=('impact_financial_dataset', 'impact_work_afford_dataset')),
+        # Percepción académica e isotipo: ficheros solo de España; felicidad: promedio europeo
+        StoryNode('academic_perception', generate_academic_perception_analysis, inputs=ACADEMIC_PERCEPTION_FILES,
+                  section='impacto'),
+        StoryNode('happiness_work_relation', generate_happiness_work_relation_analysis, inputs=HAPPINESS_FILES,
+                  section='impacto'),
+        StoryNode('age_isotype', create_age_isotype_for_streamlit, inputs=AGE_ISOTYPE_FILES, section='impacto'),
+    ]
+
+
+def build_story_graph(countries=FOCUS_COUNTRIES):
+    """Grafo del storytelling listo para ejecutar"""
+    return StoryGraph(build_story_spec(countries))
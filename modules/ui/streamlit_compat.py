@@ -0,0 +1,125 @@
+"""
+Acceso a los detalles internos de Streamlit
+El panel de rendimiento, el informe de memoria y las métricas del servidor
+necesitan datos que Streamlit no publica en su API: la cola de mensajes del
+contexto del script (ctx._enqueue), el gestor de sesiones del Runtime
+(Runtime._session_mgr) y los fragmentos guardados de cada sesión
+(session._fragment_storage). Todos esos accesos están en este módulo y solo
+se hacen con las versiones de Streamlit en las que se han comprobado
+(SUPPORTED_VERSIONS); con otra versión, o si el atributo ya no existe, las
+funciones devuelven None y quien las usa muestra "n/d".
+"""
+
+import logging
+import re
+from contextlib import contextmanager
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# Versiones (mayor, menor) comprobadas: desde la primera, incluida, hasta la
+# segunda, excluida
+SUPPORTED_VERSIONS = ((1, 66), (2, 0))
+
+# Accesos privados que ya han avisado de que no están disponibles
+_WARNED = set()
+
+
+def streamlit_version():
+    """Versión de Streamlit como tupla (mayor, menor)"""
+    match = re.match(r'(\d+)\.(\d+)', st.__version__)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+def private_api_supported():
+    """True si la versión instalada de Streamlit está entre SUPPORTED_VERSIONS"""
+    low, high = SUPPORTED_VERSIONS
+    return low <= streamlit_version() < high
+
+
+def _private(obj, attribute):
+    """
+    Atributo privado de Streamlit, o None si no se puede usar
+
+    Avisa una vez por atributo de que el dato correspondiente queda como n/d.
+    """
+    if private_api_supported():
+        value = getattr(obj, attribute, None)
+        if value is not None:
+            return value
+        reason = f"no existe {type(obj).__name__}.{attribute}"
+    else:
+        reason = f"Streamlit {st.__version__} no está comprobado"
+    if attribute not in _WARNED:
+        _WARNED.add(attribute)
+        logger.warning(f"⚠️ Diagnóstico no disponible ({reason}): se muestra como n/d")
+    return None
+
+
+@contextmanager
+def capture_messages(ctx, callback):
+    """
+    Llama a callback con cada mensaje que el script envía al navegador
+
+    Sustituye la cola de salida del contexto del script mientras dura el
+    bloque y la restaura al salir.
+
+    Args:
+        ctx: Contexto del script (get_script_run_ctx())
+        callback (callable): Recibe cada mensaje antes de encolarlo
+
+    Yields:
+        bool: True si los mensajes se están capturando
+    """
+    enqueue = _private(ctx, '_enqueue') if ctx is not None else None
+    if enqueue is None:
+        yield False
+        return
+
+    def capture(msg):
+        callback(msg)
+        enqueue(msg)
+
+    ctx._enqueue = capture
+    try:
+        yield True
+    finally:
+        ctx._enqueue = enqueue
+
+
+def session_manager():
+    """
+    Gestor de sesiones del Runtime
+
+    Returns:
+        El gestor, False fuera de `streamlit run` (sin Runtime) o None si no
+        se puede consultar en esta versión de Streamlit
+    """
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return False
+    return _private(Runtime.instance(), '_session_mgr')
+
+
+def active_session_count():
+    """Sesiones abiertas (0 sin Runtime, None si no se puede consultar)"""
+    manager = session_manager()
+    if manager is False:
+        return 0
+    return manager.num_active_sessions() if manager is not None else None
+
+
+def session_infos():
+    """Información de las sesiones abiertas ([] sin Runtime, None si no se puede consultar)"""
+    manager = session_manager()
+    if manager is False:
+        return []
+    infos = manager.list_sessions() if manager is not None else None
+    return infos if isinstance(infos, list) else None
+
+
+def fragment_storage(session):
+    """Fragmentos guardados de una sesión (None si no se pueden consultar)"""
+    return _private(session, '_fragment_storage')
@@ -0,0 +1,55 @@
+"""
+Pestañas de figuras con construcción bajo demanda
+Solo se ejecuta la pestaña seleccionada: su figura se construye la primera
+vez que se abre y queda en la caché compartida del proceso, de modo que las
+pestañas que el lector nunca abre no cuestan nada.
+"""
+
+import logging
+
+import streamlit as st
+
+from modules.core.countries import DEFAULT_FOCUS_COUNTRY
+
+from .layout import show_chart_placeholder
+from .warm_cache import get_shared
+
+logger = logging.getLogger(__name__)
+
+
+def render_figure_tabs(tabs, key, country=DEFAULT_FOCUS_COUNTRY):
+    """
+    Muestra un grupo de pestañas con una figura cada una
+
+    Args:
+        tabs (list): Una entrada por pestaña, diccionarios con:
+            - label: Título de la pestaña
+            - figure: Nombre de la figura en la caché compartida (story_spec)
+            - title: Encabezado sobre la figura
+            - description: Texto markdown bajo el encabezado (opcional)
+            - placeholder: Nombre mostrado si la figura no se puede construir
+        key (str): Clave de la pestaña activa en st.session_state
+        country (str): País foco de las figuras que dependen del país
+    """
+    # on_change="rerun" activa el seguimiento de la pestaña activa (.open) y
+    # vuelve a ejecutar el script al cambiar de pestaña
+    containers = st.tabs([tab["label"] for tab in tabs], key=key, on_change="rerun")
+
+    for tab, container in zip(tabs, containers):
+        if not container.open:
+            continue
+
+        with container:
+            st.markdown(f"### {tab['title']}")
+            if tab.get("description"):
+                st.markdown(tab["description"])
+
+            try:
+                st.plotly_chart(
+                    get_shared(tab["figure"], country),
+                    use_container_width=True,
+                    key=f"{key}_{tab['figure']}",
+                )
+            except Exception as e:
+                logger.error(f"⚠️ Error construyendo {tab['figure']}: {e}")
+                show_chart_placeholder(tab.get("placeholder", tab["title"]), "Error cargando datos")
@@ -0,0 +1,525 @@
+"""
+Caché caliente del proceso servidor
+Carga todos los datasets y construye todas las figuras estáticas (el grafo de
+modules/ui/story_spec.py) una sola vez por proceso y las comparte entre
+sesiones como referencias de solo lectura, de modo que una sesión nueva no
+hace E/S ni trabajo con pandas. Con serve.py se construye todo al arrancar;
+con `streamlit run` cada capítulo se construye al visitarlo y el siguiente
+en orden de lectura se precarga en segundo plano.
+
+Las figuras que dependen del país foco se guardan por país: warm_up construye
+las del país por defecto y prerender_countries las del resto en procesos
+paralelos, de modo que cambiar de país es una consulta a la caché.
+
+Expone además un indicador de disponibilidad (is_ready) que puede publicarse
+por HTTP o como fichero para que el balanceador solo envíe tráfico a procesos
+ya calentados.
+"""
+
+import contextvars
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+from plotly.basedatatypes import BaseFigure
+
+from modules.core.countries import DEFAULT_FOCUS_COUNTRY, FOCUS_COUNTRIES
+from modules.core.metrics import record_cache
+from modules.core.tracing import span
+
+from .story_spec import build_story_graph, country_node
+
+logger = logging.getLogger(__name__)
+
+# Hebras para construir en paralelo los nodos independientes del grafo
+WARMUP_WORKERS = int(os.environ.get('STORYTELLING_WARMUP_WORKERS', '4'))
+
+# Procesos para prerenderizar las figuras de los demás países
+PRERENDER_WORKERS = int(os.environ.get('STORYTELLING_PRERENDER_WORKERS', str(os.cpu_count() or 1)))
+
+# Fichero que se crea cuando la caché está lista (opcional, para sondas exec)
+READY_FILE = os.environ.get('STORYTELLING_READY_FILE')
+
+# Resultados compartidos: nombre -> valor congelado
+_SHARED = {}
+
+# Errores de construcción: nombre -> excepción (se relanza al pedir el valor)
+_ERRORS = {}
+
+# Tiempo de construcción de cada entrada en segundos
+_TIMINGS = {}
+
+# Grafo del proceso (se conserva para memoizar entre construcciones parciales)
+_GRAPH = None
+_GRAPH_LOCK = threading.Lock()
+
+# Precarga en segundo plano en curso: sección, evento de cancelación y hebra
+_PREFETCH = {}
+_PREFETCH_LOCK = threading.Lock()
+
+_READY = threading.Event()
+# Construcciones en primer plano (una a la vez, para no repetir trabajo entre
+# sesiones) y volcado de resultados en _SHARED/_ERRORS; la precarga solo lo
+# toma para el volcado, así que nunca hace esperar a un rerun
+_LOCK = threading.RLock()
+
+
+# Arrays de pandas con datos y máscara de faltantes en arrays de numpy
+_MASKED_ARRAYS = (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+
+
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+
+def _readonly_column(column):
+    """Datos de una columna en arrays de numpy de solo lectura (copiados una vez)"""
+    if isinstance(column.dtype, np.dtype):
+        return _readonly(column.to_numpy(copy=True))
+    array = column.array
+    if isinstance(array, _MASKED_ARRAYS):
+        values = array.to_numpy(dtype=array.dtype.numpy_dtype, na_value=0)
+        return type(array)(_readonly(values), _readonly(np.asarray(array.isna())), copy=False)
+    # Cadenas de pyarrow, categorías...: no se guardan en arrays de numpy
+    return array
+
+
+def freeze_frame(df):
+    """
+    Copia de un DataFrame con los arrays de solo lectura
+
+    Cualquier asignación in situ sobre el DataFrame compartido falla con
+    ValueError en lugar de modificar los datos de todas las sesiones. Se
+    protegen las columnas numpy y las nullable (Int64, Float64, boolean); las
+    de tipos de extensión sin arrays de numpy, como las cadenas de pyarrow,
+    se comparten tal cual.
+    """
+    # pandas no ofrece una API pública para congelar un DataFrame: se
+    # reconstruye columna a columna sin copiar los arrays ya congelados
+    columns = {i: _readonly_column(column) for i, (_, column) in enumerate(df.items())}
+    frozen = pd.DataFrame(columns, index=df.index, copy=False)
+    frozen.columns = df.columns
+    frozen.attrs = dict(df.attrs)
+    return frozen
+
+
+class FrozenFigure:
+    """
+    Figura de Plotly compartida entre sesiones
+
+    Guarda el diccionario de la figura (fig.to_dict()) congelado con freeze.
+    to_dict devuelve una copia editable de esa estructura: es lo que entrega
+    get_shared, y st.plotly_chart la acepta igual que una figura.
+    """
+
+    __slots__ = ('_spec',)
+
+    def __init__(self, fig):
+        self._spec = freeze(fig.to_dict())
+
+    def to_dict(self):
+        """Diccionario de la figura, propio de quien lo pide"""
+        return _thaw(self._spec)
+
+    def __repr__(self):
+        return f"FrozenFigure({len(self._spec.get('data', ()))} trazas)"
+
+
+def _thaw(value):
+    """Copia editable de la estructura congelada de una figura"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def freeze(value):
+    """
+    Convierte un resultado en una estructura de solo lectura
+
+    Diccionarios -> MappingProxyType, listas -> tuplas, DataFrames -> copia
+    con arrays de solo lectura y figuras de Plotly -> FrozenFigure. Quien
+    necesite editar una figura compartida la recibe ya copiada de get_shared.
+    """
+    if isinstance(value, pd.DataFrame):
+        return freeze_frame(value)
+    if isinstance(value, BaseFigure):
+        return FrozenFigure(value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
+
+
+def _hand_out(value):
+    """Entrada de la caché para una sesión: cada figura como un diccionario propio"""
+    if isinstance(value, FrozenFigure):
+        return value.to_dict()
+    if isinstance(value, MappingProxyType):
+        return MappingProxyType({key: _hand_out(item) for key, item in value.items()})
+    if isinstance(value, tuple):
+        return tuple(_hand_out(item) for item in value)
+    return value
+
+
+def get_graph():
+    """Grafo del storytelling del proceso (se construye en el primer uso)"""
+    global _GRAPH
+    with _GRAPH_LOCK:
+        if _GRAPH is None:
+            _GRAPH = build_story_graph()
+        return _GRAPH
+
+
+# Registro de accesos a la caché del rerun en curso (panel de rendimiento);
+# None fuera de record_cache_access
+_ACCESS_LOG = contextvars.ContextVar('storytelling_cache_access', default=None)
+
+
+@contextmanager
+def record_cache_access():
+    """
+    Registra las entradas que pide y construye el código ejecutado dentro
+
+    Solo cuenta lo que ocurre en el contexto actual (la hebra del rerun), no
+    las precargas en segundo plano.
+
+    Yields:
+        dict: 'requested' (entradas pedidas con get_shared, en orden) y
+            'built' (entrada -> segundos de las construidas en este contexto)
+    """
+    log = {'requested': [], 'built': {}}
+    token = _ACCESS_LOG.set(log)
+    try:
+        yield log
+    finally:
+        _ACCESS_LOG.reset(token)
+
+
+def _pending(names):
+    """Entradas de names que aún no se han construido (ni han fallado)"""
+    return [name for name in names if name not in _SHARED and name not in _ERRORS]
+
+
+def resolve(name, country=DEFAULT_FOCUS_COUNTRY):
+    """Nombre en la caché de una entrada para un país foco ('figura@XX' si depende del país)"""
+    graph = get_graph()
+    per_country = country_node(name, country)
+    if per_country in graph.nodes:
+        return per_country
+    if name not in graph.nodes:
+        raise KeyError(f"Entrada desconocida: {name} (país {country})")
+    return name
+
+
+def _build(targets=None, cancel=None, max_workers=WARMUP_WORKERS):
+    """
+    Ejecuta el grafo y vuelca sus resultados en la caché compartida
+
+    La ejecución no necesita _LOCK (el grafo protege su memoización); solo el
+    volcado se hace con él tomado. Las dependencias ya calculadas no se
+    repiten: el grafo las memoiza por huella.
+    """
+    graph = get_graph()
+    if targets is not None:
+        targets = _pending(targets)
+        if not targets:
+            return graph
+
+    results, errors = graph.run(targets, max_workers=max_workers, post=freeze, cancel=cancel)
+    built = {name: timing['seconds'] for name, timing in graph.timings.items() if not timing['cached']}
+    with _LOCK:
+        _SHARED.update(results)
+        _ERRORS.update(errors)
+        _TIMINGS.update(built)
+    for name, error in errors.items():
+        logger.error(f"⚠️ Error construyendo {name}: {error}")
+    log = _ACCESS_LOG.get()
+    if log is not None:
+        log['built'].update(built)
+    return graph
+
+
+def warm_up():
+    """
+    Construye las entradas de la caché del país por defecto y las comunes a
+    todos los países (una sola vez por proceso)
+
+    Si otra hebra ya está construyendo entradas, espera a que termine. Las
+    figuras de los demás países se construyen con prerender_countries.
+
+    Returns:
+        dict: Tiempo de construcción por entrada en segundos
+    """
+    with _LOCK:
+        if _READY.is_set():
+            return dict(_TIMINGS)
+
+        start = time.perf_counter()
+        logger.info("🔥 Calentando la caché del servidor...")
+        graph = get_graph()
+        graph = _build(graph.country_nodes(None) + graph.country_nodes(DEFAULT_FOCUS_COUNTRY))
+        logger.info(graph.report())
+
+        _READY.set()
+        if READY_FILE:
+            with open(READY_FILE, 'w') as f:
+                f.write(f"{os.getpid()}\n")
+        logger.info(f"✅ Caché caliente lista: {len(_SHARED)} entradas en {time.perf_counter() - start:.1f}s")
+        return dict(_TIMINGS)
+
+
+def is_ready():
+    """Indica si la caché del proceso ya está construida"""
+    return _READY.is_set()
+
+
+def get_shared(name, country=DEFAULT_FOCUS_COUNTRY):
+    """
+    Devuelve una entrada de la caché compartida (de solo lectura)
+
+    Si la entrada aún no existe se construye en este momento (con sus
+    dependencias); si falló al construirse se relanza la excepción original.
+    Las figuras se entregan como diccionarios propios de quien las pide
+    (FrozenFigure.to_dict), listos para st.plotly_chart.
+
+    Args:
+        name (str): Nombre de la entrada en story_spec (sin el sufijo de país)
+        country (str): País foco; se ignora en las entradas comunes
+    """
+    name = resolve(name, country)
+    log = _ACCESS_LOG.get()
+    if log is not None:
+        log['requested'].append(name)
+    hit = name in _SHARED
+    record_cache('shared', hit)
+    if not hit and name not in _ERRORS:
+        with _LOCK:
+            _build([name])
+    if name in _ERRORS:
+        raise _ERRORS[name]
+    return _hand_out(_SHARED[name])
+
+
+def warmup_timings():
+    """Tiempo de construcción por entrada en segundos"""
+    return dict(_TIMINGS)
+
+
+def shared_entries():
+    """Entradas ya construidas de la caché compartida: nombre -> valor (de solo lectura)"""
+    return dict(_SHARED)
+
+
+def load_chapter(section, country=DEFAULT_FOCUS_COUNTRY):
+    """
+    Construye las figuras de un capítulo antes de mostrarlo
+
+    Si faltan figuras se cancela la precarga en curso, también la de este
+    mismo capítulo: lo que ya haya construido queda en la caché y el resto se
+    construye aquí en paralelo, sin competir con ella.
+
+    Args:
+        section (str): Slug del capítulo
+        country (str): País foco
+    """
+    names = _pending(get_graph().section_nodes(section, country))
+    if not names:
+        return
+    cancel_prefetch()
+    with span(f"load_chapter:{section}", 'section', country=country, nodes=len(names)), _LOCK:
+        _build(names)
+
+
+def prefetch_chapter(section, country=DEFAULT_FOCUS_COUNTRY):
+    """
+    Construye en segundo plano las figuras de un capítulo
+
+    Se llama al terminar de mostrar un capítulo con el siguiente en orden de
+    lectura, de modo que al avanzar sus figuras ya estén en la caché.
+
+    Args:
+        section (str): Slug del capítulo (None no hace nada)
+        country (str): País foco
+
+    Returns:
+        threading.Thread: Hebra de la precarga, o None si no hay nada que construir
+    """
+    if section is None:
+        return None
+    names = _pending(get_graph().section_nodes(section, country))
+    if not names:
+        return None
+
+    key = (section, country)
+    with _PREFETCH_LOCK:
+        thread = _PREFETCH.get('thread')
+        if _PREFETCH.get('section') == key and thread is not None and thread.is_alive():
+            return thread
+        if _PREFETCH.get('cancel') is not None:
+            _PREFETCH['cancel'].set()
+        cancel = threading.Event()
+        thread = threading.Thread(
+            target=_prefetch, args=(section, names, cancel), name=f'prefetch-{section}-{country}', daemon=True
+        )
+        _PREFETCH.update(section=key, cancel=cancel, thread=thread)
+        thread.start()
+        return thread
+
+
+def _prefetch(section, names, cancel):
+    """
+    Construye los nodos de un capítulo de uno en uno, sin tomar _LOCK
+
+    Entre nodo y nodo se comprueba la cancelación, de modo que un rerun que
+    cancela la precarga espera como mucho a que termine el nodo en curso.
+    """
+    with span(f"prefetch:{section}", 'section', nodes=len(names)):
+        start = time.perf_counter()
+        for name in get_graph().upstream(names):
+            if cancel.is_set():
+                break
+            try:
+                _build([name], cancel=cancel, max_workers=1)
+            except RuntimeError:
+                # El proceso termina mientras se precarga: el ejecutor ya no acepta nodos
+                return
+        if cancel.is_set():
+            logger.info(f"⏹️ Precarga de {section} cancelada")
+        else:
+            logger.info(f"⏩ Capítulo {section} precargado en {time.perf_counter() - start:.1f}s")
+
+
+def cancel_prefetch():
+    """
+    Cancela la precarga en curso
+
+    El nodo que se está ejecutando termina (y queda en la caché); no se lanza
+    ninguno más.
+    """
+    with _PREFETCH_LOCK:
+        cancel = _PREFETCH.get('cancel')
+        if cancel is not None:
+            cancel.set()
+
+
+def _prerender_country(country):
+    """
+    Construye en un proceso de trabajo las figuras de un país
+
+    Cada proceso conserva su propio grafo, de modo que los datasets se leen
+    una sola vez por proceso aunque reciba varios países. Los resultados se
+    devuelven sin congelar (MappingProxyType no se puede serializar) y los
+    errores como RuntimeError con el mensaje original.
+    """
+    graph = get_graph()
+    names = graph.country_nodes(country)
+    results, errors = graph.run(names, max_workers=1)
+    timings = {name: graph.timings[name]['seconds'] for name in names if name in graph.timings}
+    return (
+        {name: results[name] for name in names if name in results},
+        {name: RuntimeError(f"{type(errors[name]).__name__}: {errors[name]}") for name in names if name in errors},
+        timings,
+    )
+
+
+def prerender_countries(countries=FOCUS_COUNTRIES, max_workers=PRERENDER_WORKERS):
+    """
+    Llena la caché con las figuras de varios países foco en paralelo
+
+    Cada país se construye en un proceso de un pool (sin competir por el GIL
+    con las sesiones) y sus figuras se añaden a la caché según terminan; los
+    países ya construidos se omiten.
+
+    Args:
+        countries (iterable): Países foco (ISO-2)
+        max_workers (int): Procesos del pool (0 desactiva el prerenderizado)
+
+    Returns:
+        dict: Tiempo total de construcción por país en segundos
+    """
+    graph = get_graph()
+    pending = [country for country in countries if _pending(graph.country_nodes(country))]
+    if not pending or max_workers < 1:
+        return {}
+
+    start = time.perf_counter()
+    workers = min(max_workers, len(pending))
+    logger.info(f"🌍 Prerenderizando {len(pending)} países con {workers} procesos...")
+
+    seconds_by_country = {}
+    # spawn: los procesos no heredan hebras ni cerrojos del servidor
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(_prerender_country, country): country for country in pending}
+        for future in as_completed(futures):
+            country = futures[future]
+            try:
+                results, errors, timings = future.result()
+            except Exception as e:
+                logger.error(f"⚠️ Error prerenderizando {country}: {e}")
+                continue
+
+            with _LOCK:
+                for name, value in results.items():
+                    if name not in _SHARED:
+                        _SHARED[name] = freeze(value)
+                for name, error in errors.items():
+                    if name not in _SHARED:
+                        _ERRORS[name] = error
+                        logger.error(f"⚠️ Error construyendo {name}: {error}")
+                _TIMINGS.update(timings)
+            seconds_by_country[country] = sum(timings.values())
+
+    logger.info(f"✅ {len(seconds_by_country)} países prerenderizados en {time.perf_counter() - start:.1f}s")
+    return seconds_by_country
+
+
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    """GET /ready -> 200 si la caché está lista, 503 mientras se calienta"""
+
+    def do_GET(self):
+        if self.path.rstrip('/') not in ('', '/ready'):
+            self.send_response(404)
+            self.end_headers()
+            return
+        ready = is_ready()
+        body = b'ready\n' if ready else b'warming\n'
+        self.send_response(200 if ready else 503)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_readiness_server(port, host='0.0.0.0'):
+    """
+    Publica el indicador de disponibilidad por HTTP en una hebra de fondo
+
+    Args:
+        port (int): Puerto de la sonda (distinto del de Streamlit)
+        host (str): Interfaz de escucha
+
+    Returns:
+        ThreadingHTTPServer: Servidor iniciado
+    """
+    server = ThreadingHTTPServer((host, port), _ReadinessHandler)
+    threading.Thread(target=server.serve_forever, name='readiness-probe', daemon=True).start()
+    logger.info(f"🩺 Sonda de disponibilidad en http://{host}:{port}/ready")
+    return server
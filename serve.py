@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Arranque del servidor con caché caliente
+Construye todos los datasets y figuras en este proceso antes de servir la
+aplicación, de modo que ninguna sesión paga la carga inicial.
+
+Uso:
+    python serve.py [opciones de streamlit run]
+    STORYTELLING_READINESS_PORT=8502 python serve.py --server.port 8501
+
+Con STORYTELLING_READINESS_PORT se publica GET /ready (200 cuando la caché
+está lista, 503 mientras se calienta) para la sonda del balanceador; con
+STORYTELLING_READY_FILE se crea además un fichero al terminar. Con
+STORYTELLING_METRICS_PORT se publican las métricas de Prometheus en
+/metrics desde el arranque, calentamiento incluido.
+
+Tras calentar la caché del país por defecto se compilan los recursos
+estáticos que falten (build_assets.py) y se prerenderizan en segundo plano
+las figuras de los demás países foco (STORYTELLING_PRERENDER_WORKERS
+procesos; 0 lo desactiva). La sonda no espera a estos pasos.
+
+La aplicación se sirve desde app.py, que publica los recursos compilados
+con caché de larga duración.
+"""
+
+import os
+import sys
+import threading
+
+from streamlit.web import cli as stcli
+
+from modules.core.logging_config import configure_logging
+from modules.ui.app_metrics import start_metrics_exporter
+from modules.ui.static_assets import build_assets
+from modules.ui.warm_cache import warm_up, prerender_countries, start_readiness_server
+
+
+def warm_up_all():
+    """Calienta la caché del país por defecto, compila los recursos estáticos y prerenderiza los demás países"""
+    warm_up()
+    build_assets()
+    prerender_countries()
+
+
+def main():
+    configure_logging()
+    start_metrics_exporter()
+    readiness_port = os.environ.get('STORYTELLING_READINESS_PORT')
+    if readiness_port:
+        start_readiness_server(int(readiness_port))
+
+    # El servidor arranca mientras se calienta la caché; la sonda responde 503
+    # hasta que termina y las sesiones que lleguen antes esperan al calentamiento
+    threading.Thread(target=warm_up_all, name='warm-up', daemon=True).start()
+
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+    sys.argv = ['streamlit', 'run', script, *sys.argv[1:]]
+    sys.exit(stcli.main())
+
+
+if __name__ == '__main__':
+    main()
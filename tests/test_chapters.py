@@ -0,0 +1,46 @@
+"""
+Render de los capítulos sin navegador (AppTest)
+Cada capítulo debe pintarse sin excepciones ni mensajes de error de carga
+para el país foco por defecto y para otro país: así se detecta, por ejemplo,
+un capítulo que lee una clave que su builder ya no devuelve.
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from modules.ui.layout import CHAPTERS
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'storytelling.py')
+
+
+def render(chapter, country):
+    """AppTest con el capítulo pintado para un país foco"""
+    at = AppTest.from_file(APP, default_timeout=600)
+    # Primero la portada: cambiar de página antes del primer run pinta la página por defecto
+    at.run()
+    at.sidebar.selectbox(key='focus_country').set_value(country).run()
+    at.switch_page(chapter['path']).run()
+    return at
+
+
+@pytest.mark.parametrize('country', ['ES', 'PT'])
+@pytest.mark.parametrize('chapter', CHAPTERS, ids=[chapter['slug'] for chapter in CHAPTERS])
+def test_chapter_renders_without_errors(chapter, country):
+    at = render(chapter, country)
+    assert not at.exception, [e.message for e in at.exception]
+    assert not at.error, [e.value for e in at.error]
+
+
+def test_work_types_chapter_shows_focus_summary():
+    from modules.charts.work_study_charts import generate_storytelling_summary, read_work_study_relationship_dataset
+
+    summary = generate_storytelling_summary(read_work_study_relationship_dataset(), focus_country='PT')
+    at = render(next(chapter for chapter in CHAPTERS if chapter['slug'] == 'tipos-de-trabajo'), 'PT')
+    page = ' '.join(str(block.value) for block in at.markdown)
+    assert f"{summary['focus_percentage']:.1f}%" in page
+    assert f"{summary['focus_rank']}/{summary['total_countries']}" in page
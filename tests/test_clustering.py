@@ -0,0 +1,67 @@
+"""
+Comprobaciones con resultado conocido de modules/analysis/clustering_analysis.py
+- k-means++, enlace de Ward (Lance-Williams) y corte del árbol
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+from modules.analysis.clustering_analysis import cut_linkage, kmeans, ward_linkage
+
+
+def test_kmeans_recovers_separated_blobs():
+    rng = np.random.default_rng(0)
+    centers = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]])
+    points = np.vstack([center + rng.normal(scale=0.3, size=(10, 2)) for center in centers])
+
+    labels, centroids, inertia = kmeans(points, 3)
+
+    truth = np.repeat(np.arange(3), 10)
+    # Misma partición salvo el nombre de las etiquetas
+    assert len({(label, true) for label, true in zip(labels, truth)}) == 3
+    for cluster in range(3):
+        np.testing.assert_allclose(centroids[cluster], points[labels == cluster].mean(axis=0))
+    assert inertia == pytest.approx(sum(
+        ((points[labels == cluster] - centroids[cluster]) ** 2).sum() for cluster in range(3)))
+
+
+def test_kmeans_one_cluster_per_point_has_zero_inertia():
+    points = np.array([[0.0], [1.0], [3.0], [7.0]])
+    labels, _, inertia = kmeans(points, 4)
+    assert sorted(labels) == [0, 1, 2, 3]
+    assert inertia == pytest.approx(0.0)
+
+
+def test_ward_linkage_known_tree():
+    # Dos parejas a distancia 1; Ward entre ellas: sqrt(2·2·2 / 4) · |0.5 - 5.5|
+    points = np.array([[0.0], [1.0], [5.0], [6.0]])
+    np.testing.assert_allclose(ward_linkage(points), [
+        [0, 1, 1.0, 2],
+        [2, 3, 1.0, 2],
+        [4, 5, np.sqrt(2) * 5, 4],
+    ])
+
+
+def test_ward_linkage_matches_closed_form():
+    # Lance-Williams debe dar la distancia de Ward entre los clusters fusionados:
+    # sqrt(2 n_a n_b / (n_a + n_b)) · ||c_a - c_b||
+    points = np.random.default_rng(1).normal(size=(12, 3))
+    linkage = ward_linkage(points)
+    members = {i: [i] for i in range(len(points))}
+    for step, (a, b, distance, size) in enumerate(linkage):
+        left, right = members.pop(int(a)), members.pop(int(b))
+        n_a, n_b = len(left), len(right)
+        gap = np.linalg.norm(points[left].mean(axis=0) - points[right].mean(axis=0))
+        assert distance == pytest.approx(np.sqrt(2 * n_a * n_b / (n_a + n_b)) * gap)
+        assert size == n_a + n_b
+        members[len(points) + step] = left + right
+
+
+def test_cut_linkage():
+    linkage = ward_linkage(np.array([[0.0], [1.0], [5.0], [6.0]]))
+    assert list(cut_linkage(linkage, 4, 1)) == [0, 0, 0, 0]
+    assert list(cut_linkage(linkage, 4, 2)) == [0, 0, 1, 1]
+    assert len(set(cut_linkage(linkage, 4, 4))) == 4
@@ -0,0 +1,43 @@
+"""
+Comprobaciones con resultado conocido de benchmarks/compare.py
+- Prueba U de Mann-Whitney frente a la distribución exacta de permutaciones
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import itertools
+
+import pytest
+
+from benchmarks.compare import mann_whitney_greater
+
+
+def _permutation_p_value(sample, reference):
+    """p-valor exacto por fuerza bruta: todas las formas de repartir las muestras"""
+    def u(a, b):
+        return sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in a for y in b)
+
+    pooled = list(sample) + list(reference)
+    observed = u(sample, reference)
+    splits = list(itertools.combinations(range(len(pooled)), len(sample)))
+    extreme = sum(
+        u([pooled[i] for i in chosen], [pooled[i] for i in range(len(pooled)) if i not in chosen]) >= observed
+        for chosen in splits
+    )
+    return extreme / len(splits)
+
+
+@pytest.mark.parametrize('sample, reference', [
+    ([5.1, 6.3, 7.2], [1.0, 2.2, 3.4]),
+    ([1.0, 2.2, 3.4], [5.1, 6.3, 7.2]),
+    ([3.0, 8.5, 9.1, 4.4], [2.5, 7.7, 1.2]),
+    ([10.2, 11.4, 9.9, 12.8, 10.7], [9.8, 10.1, 11.0, 10.4, 9.5, 10.9]),
+    ([0.5], [0.1, 0.2, 0.3, 0.4]),
+])
+def test_mann_whitney_matches_permutations(sample, reference):
+    assert mann_whitney_greater(sample, reference) == pytest.approx(_permutation_p_value(sample, reference))
+
+
+def test_mann_whitney_without_samples():
+    assert mann_whitney_greater([], [1.0]) is None
@@ -0,0 +1,59 @@
+"""
+Comprobaciones de modules/analysis/correlation_analysis.py
+- Pearson y Spearman par a par frente a pandas.DataFrame.corr con valores faltantes
+- Mínimo de países comunes e indicadores constantes
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.analysis.correlation_analysis import MIN_COMMON_COUNTRIES, compute_indicator_correlations
+
+
+def _matrix_with_gaps():
+    """Matriz país × indicador con huecos de distintos patrones y columnas relacionadas"""
+    rng = np.random.default_rng(3)
+    base = rng.normal(size=30)
+    matrix = pd.DataFrame({
+        'a': base,
+        'b': 2 * base + rng.normal(scale=0.5, size=30),
+        'c': -base + rng.normal(scale=1.0, size=30),
+        'd': rng.normal(size=30),
+        'e': np.round(rng.normal(size=30)),
+    }, index=[f'P{i}' for i in range(30)])
+    matrix.iloc[:8, 1] = np.nan
+    matrix.iloc[20:, 2] = np.nan
+    matrix.iloc[::3, 3] = np.nan
+    matrix.iloc[5:12, 4] = np.nan
+    return matrix
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_correlations_match_pandas(method):
+    matrix = _matrix_with_gaps()
+    expected = matrix.corr(method=method, min_periods=MIN_COMMON_COUNTRIES)
+    pd.testing.assert_frame_equal(compute_indicator_correlations(matrix, method), expected, atol=1e-10)
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_correlations_need_common_countries_and_variance(method):
+    matrix = pd.DataFrame({
+        'a': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        'b': [2.0, 1.0, 4.0, 3.0, 6.0, 5.0],
+        'pocos': [1.0, 2.0, 3.0, 4.0, np.nan, np.nan],
+        'constante': [7.0] * 6,
+    })
+    corr = compute_indicator_correlations(matrix, method)
+    assert corr.loc['a', 'b'] == pytest.approx(matrix[['a', 'b']].corr(method=method).loc['a', 'b'])
+    assert corr.loc['a', 'a'] == pytest.approx(1.0)
+    assert np.isnan(corr.loc['a', 'pocos']) and np.isnan(corr.loc['pocos', 'pocos'])
+    assert np.isnan(corr.loc['a', 'constante'])
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        compute_indicator_correlations(_matrix_with_gaps(), 'kendall')
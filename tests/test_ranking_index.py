@@ -0,0 +1,70 @@
+"""
+Comprobaciones con resultado conocido de modules/core/ranking_index.py
+- Posiciones con empates (ranking de competición) y países sin dato
+- Orden, top-k y países mínimo/máximo
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.core.ranking_index import CountryRankingIndex, build_country_ranking_index
+
+COUNTRIES = ['AA', 'BB', 'CC', 'DD', 'EE', 'FF']
+VALUES = [30.0, 50.0, 30.0, np.nan, 10.0, 50.0]
+
+
+@pytest.fixture
+def index():
+    return CountryRankingIndex(COUNTRIES, {'x': VALUES})
+
+
+def test_positions_with_ties(index):
+    # Descendente: 50, 50, 30, 30, 10 -> 1, 1, 3, 3, 5
+    assert [index.position('x', c) for c in COUNTRIES] == [3, 1, 3, None, 5, 1]
+    # Ascendente: 10, 30, 30, 50, 50 -> 1, 2, 2, 4, 4
+    assert [index.position('x', c, ascending=True) for c in COUNTRIES] == [2, 4, 2, None, 1, 4]
+    assert index.position('x', 'ZZ') is None
+
+
+def test_positions_match_count_of_better_values():
+    values = np.round(np.random.default_rng(5).normal(size=40), 1)
+    values[::7] = np.nan
+    countries = [f'P{i}' for i in range(len(values))]
+    index = CountryRankingIndex(countries, {'x': values})
+    valid = values[~np.isnan(values)]
+    for country, value in zip(countries, values):
+        if np.isnan(value):
+            assert index.position('x', country) is None
+        else:
+            assert index.position('x', country) == (valid > value).sum() + 1
+            assert index.position('x', country, ascending=True) == (valid < value).sum() + 1
+
+
+def test_order_top_k_and_extremes(index):
+    # Orden estable: los empatados en el orden de las filas, sin los NaN
+    assert index.ranked_countries('x') == ['BB', 'FF', 'AA', 'CC', 'EE']
+    assert index.ranked_values('x', ascending=True) == [10.0, 30.0, 30.0, 50.0, 50.0]
+    assert index.top_k('x', 2, exclude=('BB',)) == [('FF', 50.0), ('AA', 30.0)]
+    assert index.max_country('x') == ('BB', 50.0)
+    assert index.min_country('x', exclude=('EE',)) == ('AA', 30.0)
+
+    empty = CountryRankingIndex(['AA'], {'x': [np.nan]})
+    country, value = empty.max_country('x')
+    assert country is None and np.isnan(value)
+
+
+def test_build_adds_aggregates():
+    df = pd.DataFrame({
+        'Country': ['AA', 'BB'],
+        'Very_Closely_Value': [10.0, 20.0],
+        'Closely_Value': [5.0, np.nan],
+        'Somewhat_Value': [1.0, 2.0],
+    })
+    index = build_country_ranking_index(df)
+    assert index.value('Related_Total', 'AA') == 16.0
+    assert index.value('Related_Total', 'BB') == 22.0
+    assert index.position('Related_Total', 'BB') == 1
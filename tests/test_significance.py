@@ -0,0 +1,51 @@
+"""
+Comprobaciones con resultado conocido de modules/analysis/significance_analysis.py
+- Supervivencia de la chi-cuadrado frente a los valores críticos de las tablas
+- q-valores de Benjamini-Hochberg
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+from modules.analysis.significance_analysis import benjamini_hochberg, chi2_sf
+
+
+@pytest.mark.parametrize('critical, dof, p', [
+    # Valores críticos de las tablas de la chi-cuadrado
+    (3.841459, 1, 0.05),
+    (5.991465, 2, 0.05),
+    (7.814728, 3, 0.05),
+    (9.487729, 4, 0.05),
+    (11.070498, 5, 0.05),
+    (18.307038, 10, 0.05),
+    (6.634897, 1, 0.01),
+    (9.210340, 2, 0.01),
+    (15.086272, 5, 0.01),
+])
+def test_chi2_sf_critical_values(critical, dof, p):
+    assert chi2_sf(np.array([critical]), np.array([dof]))[0] == pytest.approx(p, rel=1e-5)
+
+
+def test_chi2_sf_edges():
+    p_values = chi2_sf(np.array([0.0, np.nan, 1e4]), np.array([3, 3, 3]))
+    assert p_values[0] == pytest.approx(1.0)
+    assert np.isnan(p_values[1])
+    assert p_values[2] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_benjamini_hochberg_known_answer():
+    # Ordenados: 0.005, 0.01, 0.03, 0.04 -> p·4/rango = 0.02, 0.02, 0.04, 0.04
+    q_values = benjamini_hochberg([0.01, 0.04, 0.03, 0.005, np.nan])
+    np.testing.assert_allclose(q_values[:4], [0.02, 0.04, 0.04, 0.02])
+    assert np.isnan(q_values[4])
+
+
+def test_benjamini_hochberg_is_monotone_and_capped():
+    p_values = np.random.default_rng(2).uniform(size=50)
+    q_values = benjamini_hochberg(p_values)
+    order = np.argsort(p_values)
+    assert np.all(np.diff(q_values[order]) >= 0)
+    assert np.all(q_values >= p_values - 1e-12) and np.all(q_values <= 1.0)
@@ -0,0 +1,88 @@
+"""
+Comprobaciones con resultado conocido de modules/analysis/similarity_analysis.py
+- Perfiles normalizados (z-score) y descarte de indicadores
+- Distancias coseno y euclídea par a par frente a un cálculo por bucles
+- Vecinos más cercanos del índice
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.analysis.similarity_analysis import (
+    CountrySimilarityIndex,
+    build_country_profiles,
+    pairwise_country_distances,
+)
+
+
+def _brute_force_distances(values, min_common):
+    """Distancias de cada par sobre los indicadores presentes en ambos países"""
+    n, dimension = values.shape
+    cosine = np.full((n, n), np.nan)
+    euclidean = np.full((n, n), np.nan)
+    for i in range(n):
+        for j in range(n):
+            common = ~np.isnan(values[i]) & ~np.isnan(values[j])
+            if i == j:
+                cosine[i, j] = euclidean[i, j] = 0.0
+            elif common.sum() >= min_common:
+                a, b = values[i, common], values[j, common]
+                cosine[i, j] = 1.0 - a @ b / np.sqrt((a @ a) * (b @ b))
+                euclidean[i, j] = np.sqrt(((a - b) ** 2).sum() * dimension / common.sum())
+    return cosine, euclidean
+
+
+def test_profiles_are_z_scores_of_covered_indicators():
+    matrix = pd.DataFrame({
+        'x': [1.0, 2.0, 3.0, 4.0],
+        'constante': [5.0, 5.0, 5.0, 5.0],
+        'escaso': [1.0, np.nan, np.nan, np.nan],
+    }, index=['AA', 'BB', 'CC', 'DD'])
+    profiles = build_country_profiles(matrix, min_coverage=0.5)
+    assert list(profiles.columns) == ['x']
+    # Media 2.5 y desviación típica poblacional sqrt(1.25)
+    np.testing.assert_allclose(profiles['x'], np.array([-1.5, -0.5, 0.5, 1.5]) / np.sqrt(1.25))
+
+
+def test_distances_known_answer():
+    profiles = pd.DataFrame([[1.0, 0.0], [0.0, 1.0], [2.0, 0.0]], index=['AA', 'BB', 'CC'])
+    distances = pairwise_country_distances(profiles, min_common=1)
+    # AA y CC tienen la misma dirección; AA y BB son ortogonales
+    np.testing.assert_allclose(distances['cosine'], [[0, 1, 0], [1, 0, 1], [0, 1, 0]], atol=1e-12)
+    np.testing.assert_allclose(distances['euclidean'], [
+        [0, np.sqrt(2), 1],
+        [np.sqrt(2), 0, np.sqrt(5)],
+        [1, np.sqrt(5), 0],
+    ])
+
+
+def test_distances_with_gaps_match_brute_force():
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=(8, 6))
+    values[rng.uniform(size=values.shape) < 0.3] = np.nan
+    distances = pairwise_country_distances(pd.DataFrame(values), min_common=3)
+    cosine, euclidean = _brute_force_distances(values, min_common=3)
+    np.testing.assert_allclose(distances['cosine'], cosine, atol=1e-10)
+    np.testing.assert_allclose(distances['euclidean'], euclidean, atol=1e-10)
+
+
+def test_index_nearest_neighbours():
+    profiles = pd.DataFrame(
+        [[0.0, 0.0], [1.0, 0.0], [3.0, 0.0], [np.nan, 5.0]],
+        index=['AA', 'BB', 'CC', 'DD'],
+    )
+    index = CountrySimilarityIndex(profiles.index, pairwise_country_distances(profiles, min_common=2), 2)
+
+    assert index.nearest('AA', k=2, metric='euclidean') == [('BB', 1.0), ('CC', 3.0)]
+    assert index.nearest('BB', k=5, metric='euclidean') == [('AA', 1.0), ('CC', 2.0)]
+    # DD solo tiene un indicador: no se compara con nadie
+    assert index.nearest('DD', metric='euclidean') == []
+    assert index.distance('AA', 'DD', metric='euclidean') is None
+    assert index.distance('AA', 'ZZ') is None
+    assert index.nearest('ZZ') == []
+    with pytest.raises(ValueError):
+        index.nearest('AA', metric='manhattan')
@@ -0,0 +1,148 @@
+"""
+Comprobaciones de modules/core/story_graph.py
+- Orden de Kahn, ciclos y dependencias inexistentes
+- Memoización por huella de las entradas y reintento de los nodos con error
+- Ejecuciones simultáneas que comparten los nodos en cálculo
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import threading
+import time
+
+import pytest
+
+from modules.core.story_graph import StoryGraph, StoryNode, UpstreamError
+
+
+def _diamond(calls):
+    def node(name, deps=()):
+        def func(*args):
+            calls.append(name)
+            return name + ''.join(args)
+        return StoryNode(name, func, deps=deps, kind='transform')
+
+    # Declarados en desorden: el orden de Kahn no depende de la declaración
+    return StoryGraph([node('d', ('b', 'c')), node('b', ('a',)), node('c', ('a',)), node('a')])
+
+
+def test_kahn_order_respects_dependencies():
+    graph = _diamond([])
+    order = graph.upstream(['d'])
+    assert order[0] == 'a' and order[-1] == 'd'
+    assert set(order[1:3]) == {'b', 'c'}
+    assert graph.upstream(['b']) == ['a', 'b']
+
+
+def test_graph_rejects_cycles_and_missing_nodes():
+    with pytest.raises(ValueError, match='ciclos'):
+        StoryGraph([StoryNode('x', str, deps=('y',)), StoryNode('y', str, deps=('x',))])
+    with pytest.raises(ValueError, match='inexistentes'):
+        StoryGraph([StoryNode('x', str, deps=('z',))])
+
+
+def test_graph_memoizes_by_fingerprint(tmp_path):
+    source = tmp_path / 'datos.txt'
+    source.write_text('1')
+    calls = []
+
+    def read():
+        calls.append('read')
+        return source.read_text()
+
+    graph = StoryGraph([
+        StoryNode('dataset', read, inputs=(str(source),), kind='dataset'),
+        StoryNode('figure', lambda value: value * 2, deps=('dataset',)),
+    ])
+
+    results, errors = graph.run(max_workers=1)
+    assert results == {'dataset': '1', 'figure': '11'} and errors == {}
+    graph.run(max_workers=1)
+    assert calls == ['read']
+    assert all(timing['cached'] for timing in graph.timings.values())
+
+    # Cambia el fichero: se recalculan el nodo y sus dependientes
+    source.write_text('22')
+    results, _ = graph.run(max_workers=1)
+    assert calls == ['read', 'read']
+    assert results['figure'] == '2222'
+
+
+def test_graph_runs_each_node_once_and_retries_errors():
+    calls = []
+    graph = _diamond(calls)
+    results, _ = graph.run(['d'], max_workers=4)
+    assert results['d'] == 'dbaca'
+    assert sorted(calls) == ['a', 'b', 'c', 'd']
+
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        raise RuntimeError('fallo')
+
+    graph = StoryGraph([StoryNode('x', flaky, kind='dataset'), StoryNode('y', str, deps=('x',))])
+    _, errors = graph.run(max_workers=1)
+    assert isinstance(errors['y'], UpstreamError)
+    graph.run(max_workers=1)
+    assert len(attempts) == 2
+
+
+def test_concurrent_runs_share_nodes_in_flight():
+    calls = []
+    started, release = threading.Event(), threading.Event()
+
+    def load():
+        calls.append('load')
+        started.set()
+        release.wait(5)
+        return 'datos'
+
+    graph = StoryGraph([
+        StoryNode('dataset', load, kind='dataset'),
+        StoryNode('figure', lambda value: value.upper(), deps=('dataset',)),
+    ])
+    outcomes = {}
+
+    def run(key):
+        outcomes[key] = graph.run(['figure'], max_workers=2)
+
+    # Una precarga empieza a leer el dataset y un rerun pide la misma figura
+    prefetch = threading.Thread(target=run, args=('prefetch',))
+    prefetch.start()
+    assert started.wait(5)
+    rerun = threading.Thread(target=run, args=('rerun',))
+    rerun.start()
+    time.sleep(0.2)
+    assert calls == ['load'] and rerun.is_alive()
+
+    release.set()
+    prefetch.join(5)
+    rerun.join(5)
+    assert calls == ['load']
+    for results, errors in outcomes.values():
+        assert results == {'dataset': 'datos', 'figure': 'DATOS'} and errors == {}
+
+
+def test_waiting_run_gets_errors_of_the_node_in_flight():
+    started, release = threading.Event(), threading.Event()
+
+    def load():
+        started.set()
+        release.wait(5)
+        raise RuntimeError('fallo')
+
+    graph = StoryGraph([StoryNode('dataset', load, kind='dataset')])
+    outcomes = {}
+    first = threading.Thread(target=lambda: outcomes.setdefault('first', graph.run(max_workers=1)))
+    first.start()
+    assert started.wait(5)
+    second = threading.Thread(target=lambda: outcomes.setdefault('second', graph.run(max_workers=1)))
+    second.start()
+    time.sleep(0.2)
+    release.set()
+    first.join(5)
+    second.join(5)
+    assert str(outcomes['first'][1]['dataset']) == 'fallo'
+    assert outcomes['second'][1]['dataset'] is outcomes['first'][1]['dataset']
@@ -0,0 +1,52 @@
+"""
+Comprobaciones de la congelación de modules/ui/warm_cache.py
+- DataFrames compartidos con arrays de solo lectura
+- Figuras compartidas que cada sesión recibe como copia propia
+
+Uso (desde la raíz del proyecto):
+    python -m pytest -q
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from modules.ui.warm_cache import FrozenFigure, _hand_out, freeze
+
+
+def test_frozen_frame_rejects_in_place_writes():
+    df = pd.DataFrame({
+        'Country': ['ES', 'PT'],
+        'Value': [1.5, 2.5],
+        'Count': pd.array([3, None], dtype='Int64'),
+    })
+    df.attrs['fuente'] = 'prueba'
+    frozen = freeze(df)
+
+    pd.testing.assert_frame_equal(frozen, df)
+    assert frozen.attrs == {'fuente': 'prueba'}
+    for column in ('Value', 'Count'):
+        with pytest.raises(ValueError):
+            frozen.loc[0, column] = 0
+    # Las copias sí se pueden editar
+    copy = frozen.copy()
+    copy.loc[0, 'Value'] = 0
+    assert frozen.loc[0, 'Value'] == 1.5
+
+
+def test_shared_figures_are_handed_out_as_copies():
+    fig = go.Figure(go.Bar(x=['ES', 'PT'], y=np.array([1.0, 2.0])), layout={'title': {'text': 'Original'}})
+    shared = freeze({'figure': fig, 'insights': ['a']})
+    assert isinstance(shared['figure'], FrozenFigure)
+    with pytest.raises(TypeError):
+        shared['figure']._spec['layout']['title'] = {}
+
+    first = _hand_out(shared)
+    first['figure']['layout']['title']['text'] = 'Editada'
+    first['figure']['data'][0]['x'].append('FR')
+    second = _hand_out(shared)
+    assert second['figure']['layout']['title']['text'] == 'Original'
+    assert second['figure']['data'][0]['x'] == ['ES', 'PT']
+    assert second['insights'] == ('a',)
+    assert go.Figure(second['figure']).to_dict() == fig.to_dict()